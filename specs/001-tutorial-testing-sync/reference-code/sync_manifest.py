@@ -0,0 +1,342 @@
+#!/usr/bin/env python3
+"""
+Manifest-based incremental sync from production to tutorial-testing.
+
+Builds a manifest of (path, size, BLAKE2 hash) for the synced parts of
+each repository, diffs production against testing and applies only the
+added, changed and deleted files:
+
+- `tc-*` folders are mirrored: files missing from production are deleted
+- `guid_cache.json` and `.github/workflows/*.yml` are copied over, never
+  deleted (the sync workflow itself only exists in testing)
+- `tools/`, `template/`, `_test-fixtures/` and `README.md` are never touched
+
+Hashes are computed in a thread pool and cached per repository with the
+file's size and mtime, so unchanged files are not read again and a no-op
+sync of a persistent checkout takes a fraction of a second.
+
+Usage:
+    # Preview what would change
+    python tools/sync_manifest.py ../ciscou-tutorial-content . --dry-run
+
+    # Sync and report every added, changed and deleted file
+    python tools/sync_manifest.py ../ciscou-tutorial-content .
+
+    # Machine-readable report
+    python tools/sync_manifest.py ../ciscou-tutorial-content . --json
+
+Exit codes:
+    0 - Sync applied (or nothing to do)
+    1 - Changes pending (--dry-run only)
+    2 - Error (repository not found, copy failed)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+MIRRORED_PREFIX = "tc-"
+
+OVERLAY_PATTERNS = ("guid_cache.json", ".github/workflows/*.yml")
+
+PROTECTED = ("tools", "template", "_test-fixtures", "README.md", ".git")
+
+MANIFEST_VERSION = 1
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "tutorial-testing"
+
+HASH_CHUNK = 1 << 20
+
+
+# =============================================================================
+# Manifests
+# =============================================================================
+
+def top_level(path: str) -> str:
+    return path.split("/", 1)[0]
+
+
+def is_mirrored(path: str) -> bool:
+    return top_level(path).startswith(MIRRORED_PREFIX)
+
+
+def is_protected(path: str) -> bool:
+    return top_level(path) in PROTECTED
+
+
+def _walk(root: Path, directory: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk(root, Path(entry.path))
+            elif entry.is_file(follow_symlinks=False):
+                yield Path(entry.path).relative_to(root).as_posix(), entry.stat(follow_symlinks=False)
+
+
+def scan_files(root: Path) -> Iterator[Tuple[str, os.stat_result]]:
+    """(relative path, stat) for every file in sync scope under `root`."""
+    root = Path(root)
+    with os.scandir(root) as entries:
+        folders = sorted(e.path for e in entries
+                         if e.name.startswith(MIRRORED_PREFIX) and e.is_dir(follow_symlinks=False))
+    for folder in folders:
+        yield from _walk(root, Path(folder))
+    for pattern in OVERLAY_PATTERNS:
+        for path in sorted(root.glob(pattern)):
+            if path.is_file() and not path.is_symlink():
+                yield path.relative_to(root).as_posix(), path.stat()
+
+
+def hash_file(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as f:
+        while chunk := f.read(HASH_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def default_cache_path(root: Path) -> Path:
+    key = hashlib.blake2b(str(Path(root).resolve()).encode("utf-8"), digest_size=6).hexdigest()
+    return CACHE_DIR / f"sync-manifest-{key}.json"
+
+
+def load_manifest_cache(cache_path: Optional[Path]) -> dict:
+    """Cached manifest {"written_ns": ..., "files": {path: [size, mtime_ns, hash]}}, or an empty one."""
+    empty = {"written_ns": 0, "files": {}}
+    if not cache_path or not Path(cache_path).exists():
+        return empty
+    try:
+        with open(cache_path) as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return empty
+    return cache if cache.get("version") == MANIFEST_VERSION else empty
+
+
+def save_manifest_cache(cache_path: Path, root: Path, files: dict):
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump({"version": MANIFEST_VERSION, "root": str(Path(root).resolve()),
+                   "written_ns": time.time_ns(), "files": files}, f, separators=(",", ":"))
+    os.replace(tmp_path, cache_path)
+
+
+def build_manifest(root: Path, cache: Optional[dict] = None, jobs: Optional[int] = None) -> Tuple[dict, dict]:
+    """
+    Manifest {path: [size, mtime_ns, hash]} of the files in sync scope.
+
+    Files whose size and mtime match the cache reuse its hash, unless the
+    file was modified at or after the cache was written (the mtime may not
+    have ticked since). The rest are hashed in a thread pool. Returns
+    (manifest, {"cached": n, "hashed": n}).
+    """
+    root = Path(root)
+    cache = cache or {"written_ns": 0, "files": {}}
+    cached_files, written_ns = cache["files"], cache["written_ns"]
+    manifest, pending = {}, []
+
+    for path, st in scan_files(root):
+        cached = cached_files.get(path)
+        if cached and cached[0] == st.st_size and cached[1] == st.st_mtime_ns and st.st_mtime_ns < written_ns:
+            manifest[path] = cached
+        else:
+            pending.append((path, st))
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=jobs) as pool:
+            hashes = pool.map(hash_file, (root / path for path, _ in pending))
+            for (path, st), digest in zip(pending, hashes):
+                manifest[path] = [st.st_size, st.st_mtime_ns, digest]
+
+    return manifest, {"cached": len(manifest) - len(pending), "hashed": len(pending)}
+
+
+# =============================================================================
+# Sync Plan
+# =============================================================================
+
+@dataclass
+class SyncPlan:
+    """Files to copy from production and to delete from testing."""
+    added: List[str] = field(default_factory=list)
+    changed: List[str] = field(default_factory=list)
+    deleted: List[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.deleted)
+
+    def to_dict(self) -> dict:
+        return {
+            "added": self.added,
+            "changed": self.changed,
+            "deleted": self.deleted,
+            "summary": {"added": len(self.added), "changed": len(self.changed), "deleted": len(self.deleted)},
+        }
+
+
+def diff_manifests(source: dict, target: dict) -> SyncPlan:
+    """
+    Plan that makes `target` match `source` within sync scope.
+
+    Files are compared by size and hash. Only files in tc-* folders are
+    deleted; overlay files missing from production are left alone.
+    """
+    plan = SyncPlan()
+    for path in sorted(source):
+        if is_protected(path):
+            continue
+        if path not in target:
+            plan.added.append(path)
+        elif source[path][0] != target[path][0] or source[path][2] != target[path][2]:
+            plan.changed.append(path)
+    plan.deleted = sorted(p for p in target.keys() - source.keys() if is_mirrored(p) and not is_protected(p))
+    return plan
+
+
+def tutorial_changes(source: dict, target: dict) -> Dict[str, List[str]]:
+    """Whole tc-* folders added to or removed from testing."""
+    source_folders = {top_level(p) for p in source if is_mirrored(p)}
+    target_folders = {top_level(p) for p in target if is_mirrored(p)}
+    return {
+        "added": sorted(source_folders - target_folders),
+        "removed": sorted(target_folders - source_folders),
+    }
+
+
+def _prune_empty_dirs(target_root: Path, directory: Path):
+    while directory != target_root:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
+def apply_plan(plan: SyncPlan, source_root: Path, target_root: Path, source: dict, target: dict) -> dict:
+    """
+    Copy added and changed files (atomic replace), delete removed ones,
+    and return the updated target manifest. Copied files take their hash
+    from the source manifest instead of being read again.
+    """
+    source_root, target_root = Path(source_root), Path(target_root)
+    manifest = dict(target)
+
+    for path in plan.added + plan.changed:
+        dest = target_root / path
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = dest.with_name(f".{dest.name}.sync-tmp")
+        shutil.copy2(source_root / path, tmp_path)
+        os.replace(tmp_path, dest)
+        st = dest.stat()
+        manifest[path] = [st.st_size, st.st_mtime_ns, source[path][2]]
+
+    for path in plan.deleted:
+        dest = target_root / path
+        dest.unlink(missing_ok=True)
+        manifest.pop(path, None)
+        _prune_empty_dirs(target_root, dest.parent)
+
+    return manifest
+
+
+def sync(source_root: Path, target_root: Path, dry_run: bool = False, jobs: Optional[int] = None,
+         use_cache: bool = True) -> dict:
+    """
+    Diff production against testing and apply the result.
+
+    Returns a report: the plan, whole tutorials added/removed, and hash
+    statistics for both manifests.
+    """
+    source_root, target_root = Path(source_root), Path(target_root)
+    caches = {root: default_cache_path(root) if use_cache else None for root in (source_root, target_root)}
+
+    source, source_stats = build_manifest(source_root, load_manifest_cache(caches[source_root]), jobs)
+    target, target_stats = build_manifest(target_root, load_manifest_cache(caches[target_root]), jobs)
+    plan = diff_manifests(source, target)
+    tutorials = tutorial_changes(source, target)
+
+    if use_cache:
+        save_manifest_cache(caches[source_root], source_root, source)
+    if plan.has_changes and not dry_run:
+        target = apply_plan(plan, source_root, target_root, source, target)
+    if use_cache and not dry_run:
+        save_manifest_cache(caches[target_root], target_root, target)
+
+    report = plan.to_dict()
+    report["tutorials_added"] = tutorials["added"]
+    report["tutorials_removed"] = tutorials["removed"]
+    report["dry_run"] = dry_run
+    report["stats"] = {"source": source_stats, "target": target_stats}
+    return report
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def format_report(report: dict) -> str:
+    """git --name-status style listing grouped by top-level folder."""
+    summary = report["summary"]
+    verb = "Would sync" if report["dry_run"] else "Synced"
+    lines = [f"{verb}: {summary['added']} added, {summary['changed']} changed, {summary['deleted']} deleted"]
+    for label, key in (("New tutorials", "tutorials_added"), ("Removed tutorials", "tutorials_removed")):
+        if report[key]:
+            lines.append(f"{label}: {', '.join(report[key])}")
+
+    changes = [("A", p) for p in report["added"]] + [("M", p) for p in report["changed"]] + \
+              [("D", p) for p in report["deleted"]]
+    current = None
+    for status, path in sorted(changes, key=lambda c: c[1]):
+        folder = top_level(path) if "/" in path else "."
+        if folder != current:
+            lines.append(f"{folder}/")
+            current = folder
+        lines.append(f"  {status} {path}")
+    return "\n".join(lines)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Incrementally sync production tutorials into tutorial-testing")
+    parser.add_argument("source", help="Production repository (ciscou-tutorial-content) checkout")
+    parser.add_argument("target", help="Testing repository (tutorial-testing) checkout")
+    parser.add_argument("--dry-run", action="store_true", help="Report changes without applying them")
+    parser.add_argument("--json", action="store_true", help="Output the report as JSON")
+    parser.add_argument("--jobs", "-j", type=int, help="Hashing threads (default: Python's default)")
+    parser.add_argument("--no-cache", action="store_true", help="Hash every file; don't read or write manifest caches")
+
+    args = parser.parse_args()
+
+    for root in (args.source, args.target):
+        if not Path(root).is_dir():
+            print(f"Error: Repository not found: {root}", file=sys.stderr)
+            sys.exit(2)
+
+    try:
+        report = sync(Path(args.source), Path(args.target), args.dry_run, args.jobs, not args.no_cache)
+    except OSError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print(format_report(report))
+
+    pending = report["summary"]["added"] + report["summary"]["changed"] + report["summary"]["deleted"]
+    sys.exit(1 if args.dry_run and pending else 0)
+
+
+if __name__ == "__main__":
+    main()
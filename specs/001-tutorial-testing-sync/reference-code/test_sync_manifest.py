@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+Tests for sync_manifest.py - manifest-based production to testing sync.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import sync_manifest
+from sync_manifest import build_manifest, diff_manifests, scan_files, sync
+
+
+def write(root: Path, files: dict):
+    for path, text in files.items():
+        (root / path).parent.mkdir(parents=True, exist_ok=True)
+        (root / path).write_text(text)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(sync_manifest, "CACHE_DIR", tmp_path / "cache")
+
+
+@pytest.fixture
+def repos(tmp_path):
+    production, testing = tmp_path / "production", tmp_path / "testing"
+    write(production, {
+        "tc-alpha/sidecar.json": "{}",
+        "tc-alpha/step-1.md": "# Alpha v2\n",
+        "tc-alpha/images/topology.png": "png",
+        "tc-new/step-1.md": "# New\n",
+        "guid_cache.json": '{"a": 1}',
+        ".github/workflows/tutorial-linting.yml": "on: push\n",
+        "tools/clean_markdown.py": "# production copy\n",
+        "README.md": "# Production\n",
+    })
+    write(testing, {
+        "tc-alpha/sidecar.json": "{}",
+        "tc-alpha/step-1.md": "# Alpha v1\n",
+        "tc-alpha/images/old.png": "png",
+        "tc-retired/step-1.md": "# Retired\n",
+        "guid_cache.json": "{}",
+        ".github/workflows/sync-from-production.yml": "on: schedule\n",
+        "tools/clean_markdown.py": "# testing copy\n",
+        "_test-fixtures/tc-avocado-test/step-1.md": "# Fixture\n",
+        "README.md": "# Testing\n",
+    })
+    return production, testing
+
+
+class TestManifest:
+    """Tests for scanning and hashing"""
+
+    def test_scope(self, repos):
+        production, testing = repos
+        assert sorted(path for path, _ in scan_files(testing)) == [
+            ".github/workflows/sync-from-production.yml",
+            "guid_cache.json",
+            "tc-alpha/images/old.png",
+            "tc-alpha/sidecar.json",
+            "tc-alpha/step-1.md",
+            "tc-retired/step-1.md",
+        ]
+
+    def test_cache_short_circuits_unchanged_files(self, repos, tmp_path):
+        production, _ = repos
+        cache_path = tmp_path / "manifest.json"
+        manifest, stats = build_manifest(production, sync_manifest.load_manifest_cache(cache_path))
+        assert stats == {"cached": 0, "hashed": 6}
+        sync_manifest.save_manifest_cache(cache_path, production, manifest)
+
+        step = production / "tc-alpha" / "step-1.md"
+        step.write_text("# Alpha v3\n")
+        os.utime(step, ns=(step.stat().st_atime_ns, step.stat().st_mtime_ns + 1_000_000_000))
+        again, stats = build_manifest(production, sync_manifest.load_manifest_cache(cache_path))
+        assert stats == {"cached": 5, "hashed": 1}
+        assert again["tc-alpha/step-1.md"][2] != manifest["tc-alpha/step-1.md"][2]
+
+    def test_diff(self, repos):
+        production, testing = repos
+        plan = diff_manifests(build_manifest(production)[0], build_manifest(testing)[0])
+        assert plan.added == [".github/workflows/tutorial-linting.yml", "tc-alpha/images/topology.png",
+                              "tc-new/step-1.md"]
+        assert plan.changed == ["guid_cache.json", "tc-alpha/step-1.md"]
+        # The testing-only workflow is an overlay file: never deleted
+        assert plan.deleted == ["tc-alpha/images/old.png", "tc-retired/step-1.md"]
+
+
+class TestSync:
+    """Tests for applying a sync"""
+
+    def test_applies_changes_and_preserves_testing_content(self, repos):
+        production, testing = repos
+        report = sync(production, testing)
+
+        assert report["summary"] == {"added": 3, "changed": 2, "deleted": 2}
+        assert report["tutorials_added"] == ["tc-new"]
+        assert report["tutorials_removed"] == ["tc-retired"]
+        assert (testing / "tc-alpha" / "step-1.md").read_text() == "# Alpha v2\n"
+        assert not (testing / "tc-retired").exists()
+        assert not (testing / "tc-alpha" / "images" / "old.png").exists()
+        assert (testing / "tools" / "clean_markdown.py").read_text() == "# testing copy\n"
+        assert (testing / "README.md").read_text() == "# Testing\n"
+        assert (testing / "_test-fixtures" / "tc-avocado-test" / "step-1.md").exists()
+        assert (testing / ".github" / "workflows" / "sync-from-production.yml").exists()
+
+    def test_noop_sync_reads_nothing(self, repos):
+        production, testing = repos
+        sync(production, testing)
+        report = sync(production, testing)
+        assert report["summary"] == {"added": 0, "changed": 0, "deleted": 0}
+        assert report["stats"]["source"]["hashed"] == 0
+        assert report["stats"]["target"]["hashed"] == 0
+
+    def test_dry_run_cli(self, repos, monkeypatch, capsys):
+        production, testing = repos
+        monkeypatch.setattr(sys, "argv", ["sync_manifest.py", str(production), str(testing), "--dry-run", "--json"])
+        with pytest.raises(SystemExit) as exit_info:
+            sync_manifest.main()
+        assert exit_info.value.code == 1
+        report = json.loads(capsys.readouterr().out)
+        assert "tc-new/step-1.md" in report["added"]
+        assert (testing / "tc-retired" / "step-1.md").exists()
+
+    def test_text_report_lists_every_file(self, repos):
+        production, testing = repos
+        text = sync_manifest.format_report(sync(production, testing))
+        assert text.splitlines()[0] == "Synced: 3 added, 2 changed, 2 deleted"
+        assert "  D tc-retired/step-1.md" in text
+        assert "  M guid_cache.json" in text
+        assert "New tutorials: tc-new" in text
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
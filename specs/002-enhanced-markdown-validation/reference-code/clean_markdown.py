@@ -7,20 +7,39 @@ Part of the CI/CD pipeline for Cisco U. tutorial validation.
 Usage:
     python clean_markdown.py [OPTIONS] <folder_path>
 
+    folder_path is a tutorial folder, or a folder of tc-* tutorials.
+
 Options:
     --no-fix        Disable auto-fix; report issues only
     --json-output   Output results as JSON instead of text
     --verbose       Show detailed processing information
     --strict        Fail on warnings (not just blockers)
+    --rev REV       Validate the folder as of a git revision (report only)
+    --changed-only BASE
+                    Report only issues on lines changed since BASE (report only)
+    --baseline FILE Report only issues not recorded in FILE (--write-baseline)
+    --expand        List every issue instead of collapsing repeats into line ranges
+    --emit-patch [FILE]
+                    Write all fixes as one patch (stdout by default), not to the files
 """
 import os
+import posixpath
 import re
 import json
 import argparse
-from dataclasses import dataclass, field
-from typing import List, Optional, Pattern, Callable
+import bisect
+import difflib
+import hashlib
+import sys
+from collections import Counter
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Optional, Pattern, Callable, Tuple
 from enum import Enum
 
+from file_source import DiskSource, GitError, open_source
+from file_writer import WriteBatch
+from git_corpus import git
+
 
 # =============================================================================
 # Data Classes (T003)
@@ -68,30 +87,74 @@ class ValidationIssue:
     fix_suggestion: str = ""
 
 
+@dataclass
+class IssueGroup:
+    """Issues of one rule in one file, collapsed into runs of lines"""
+    rule_id: str
+    file_path: str
+    severity: Severity
+    fixed: bool
+    first: ValidationIssue  # Earliest issue; supplies the message
+    ranges: List[Tuple[int, int]] = field(default_factory=list)
+    count: int = 0
+    issues: List[ValidationIssue] = field(default_factory=list)  # Full detail, kept with expand
+
+    @property
+    def line_number(self) -> int:
+        return self.ranges[0][0]
+
+    @property
+    def fix_suggestion(self) -> str:
+        return self.first.fix_suggestion
+
+    def format_lines(self) -> str:
+        """"3-40, 52" """
+        return ', '.join(str(a) if a == b else f"{a}-{b}" for a, b in self.ranges)
+
+    @property
+    def message(self) -> str:
+        """The first issue's message, with the group's lines and count."""
+        first = self.first.message
+        if self.count == 1 or not MESSAGE_LINE_PATTERN.match(first):
+            return first
+        label = "Line" if self.ranges == [(self.line_number, self.line_number)] else "Lines"
+        return f"{label} {self.format_lines()}: {first.split(': ', 1)[-1]} ({self.count} issues)"
+
+
 @dataclass
 class ValidationResult:
     """Aggregated result from validating one or more files"""
-    issues: List[ValidationIssue] = field(default_factory=list)
+    issues: List[ValidationIssue] = field(default_factory=list)  # Every issue, kept with expand
+    groups: List[IssueGroup] = field(default_factory=list)  # Issues collapsed per file and rule
     blocking_count: int = 0
     warning_count: int = 0
     files_scanned: List[str] = field(default_factory=list)
     files_modified: List[str] = field(default_factory=list)
     auto_fix_enabled: bool = True
     summary: str = ""
+    baseline_suppressed: int = 0  # Known issues dropped by the baseline
+    expand: bool = True  # Keep every issue, not only the groups
 
     def add_issue(self, issue: ValidationIssue):
         """Add an issue and update counts"""
-        self.issues.append(issue)
-        if issue.severity == Severity.BLOCKING:
-            self.blocking_count += 1
-        else:
-            self.warning_count += 1
+        self.add_issues([issue])
+
+    def add_issues(self, issues: List[ValidationIssue]):
+        """Add one file's issues, collapsed into groups, and update counts"""
+        for issue in issues:
+            if issue.severity == Severity.BLOCKING:
+                self.blocking_count += 1
+            else:
+                self.warning_count += 1
+        if self.expand:
+            self.issues.extend(issues)
+        self.groups.extend(aggregate_issues(issues, self.expand))
 
     def has_blocking_issues(self) -> bool:
         """Check if there are any unfixed blocking issues"""
         return any(
-            i.severity == Severity.BLOCKING and not i.fixed
-            for i in self.issues
+            g.severity == Severity.BLOCKING and not g.fixed
+            for g in self.groups
         )
 
 
@@ -522,6 +585,19 @@ def check_double_space(content: str, file_path: str = "") -> List[ValidationIssu
     return issues
 
 
+# Detection checks in the order validate_file runs them
+DETECTION_CHECKS = [
+    check_html_tags,
+    check_link_spacing_before,
+    check_link_spacing_after,
+    check_link_broken,
+    check_list_indent,
+    check_code_block_in_list,
+    check_trailing_whitespace,
+    check_double_space,
+]
+
+
 # =============================================================================
 # Auto-Fix Functions (T030-T033)
 # =============================================================================
@@ -974,13 +1050,14 @@ def parse_commit_flags(commit_message: str) -> dict:
 # PR Comment Generation (T044-T045)
 # =============================================================================
 
-def generate_pr_comment(result: ValidationResult, fixes_applied: list) -> str:
+def generate_pr_comment(result: ValidationResult, fixes_applied: list, expand: bool = False) -> str:
     """
     Generate PR comment body with before/after diffs (T044).
 
     Args:
         result: ValidationResult with issues found
         fixes_applied: List of (file_path, rule_id, original, fixed) tuples
+        expand: List every issue instead of one line per file and rule
 
     Returns:
         Markdown-formatted PR comment
@@ -1004,6 +1081,8 @@ def generate_pr_comment(result: ValidationResult, fixes_applied: list) -> str:
     lines.append(f"- **Warnings:** {result.warning_count}")
     lines.append(f"- **Files scanned:** {len(result.files_scanned)}")
     lines.append(f"- **Files modified:** {len(result.files_modified)}")
+    if result.baseline_suppressed:
+        lines.append(f"- **Known issues (baseline):** {result.baseline_suppressed}")
     lines.append("")
 
     # Auto-fix details
@@ -1028,12 +1107,13 @@ def generate_pr_comment(result: ValidationResult, fixes_applied: list) -> str:
             lines.append("")
 
     # Issues that weren't auto-fixed
-    unfixed_blocking = [i for i in result.issues if i.severity == Severity.BLOCKING and not i.fixed]
+    unfixed_blocking = [i for i in report_entries(result, expand) if i.severity == Severity.BLOCKING and not i.fixed]
     if unfixed_blocking:
         lines.append("### Remaining Blocking Issues")
         lines.append("")
         for issue in unfixed_blocking[:10]:  # Limit to 10
-            lines.append(f"- **{os.path.basename(issue.file_path)}:{issue.line_number}** - {issue.message}")
+            where = issue.format_lines() if isinstance(issue, IssueGroup) else issue.line_number
+            lines.append(f"- **{os.path.basename(issue.file_path)}:{where}** - {issue.message}")
             if issue.fix_suggestion:
                 lines.append(f"  - Fix: {issue.fix_suggestion}")
         lines.append("")
@@ -1050,11 +1130,363 @@ def generate_pr_comment(result: ValidationResult, fixes_applied: list) -> str:
     return '\n'.join(lines)
 
 
+# =============================================================================
+# Diff-Scoped Validation
+# =============================================================================
+
+HUNK_HEADER_PATTERN = re.compile(r'^@@ -\d+(?:,\d+)? \+(\d+)(?:,(\d+))? @@')
+LIST_ITEM_PATTERN = re.compile(r'^(\s*)([-*+]|\d+\.)\s')
+# "Line 12:" / "Lines 12-15:" at the start of every rule message
+MESSAGE_LINE_PATTERN = re.compile(r'^(Lines? )(\d+)(?:-(\d+))?')
+
+# Range for files git doesn't track yet: every line counts as changed
+WHOLE_FILE = (1, 1 << 31)
+
+# Checks whose matches can run across a blank line (a link text broken
+# over paragraphs): a block window could cut them, so they scan the file
+CROSS_BLOCK_CHECKS = [check_link_broken]
+
+# C escapes git uses in quoted paths, besides \ooo octal bytes
+GIT_QUOTE_ESCAPES = {'a': 7, 'b': 8, 't': 9, 'n': 10, 'v': 11, 'f': 12, 'r': 13, '"': 34, '\\': 92}
+
+
+def _diff_header_path(field: str) -> Optional[str]:
+    """
+    Path named by a `---`/`+++` header, without its a/ or b/ prefix (None
+    for /dev/null). Git appends a tab to names with spaces and C-quotes
+    names with unusual bytes: "b/str\\303\\266m.md".
+    """
+    field = field.rstrip('\t')
+    if field == '/dev/null':
+        return None
+    if field.startswith('"'):
+        data = bytearray()
+        i = 1
+        while field[i] != '"':
+            if field[i] != '\\':
+                data.extend(field[i].encode('utf-8'))
+                i += 1
+            elif field[i + 1] in '01234567':
+                data.append(int(field[i + 1:i + 4], 8))
+                i += 4
+            else:
+                data.append(GIT_QUOTE_ESCAPES[field[i + 1]])
+                i += 2
+        field = data.decode('utf-8', 'surrogateescape')
+    return field[2:]
+
+
+def parse_changed_lines(diff: str) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    {new path: [(first, last), ...]} from `git diff --unified=0` output.
+
+    The path comes from the `+++` line of each file's header (between
+    `diff --git` and its first hunk); in a hunk, a `+++` line is an added
+    line starting with "++". A pure deletion becomes the lines on either
+    side of it, so the block it was removed from is checked again.
+    """
+    changes = {}
+    ranges = None
+    in_header = False
+    for line in diff.split('\n'):
+        if line.startswith('diff --git '):
+            in_header, ranges = True, None
+        elif in_header and line.startswith('+++ '):
+            path = _diff_header_path(line[4:])
+            ranges = None if path is None else changes.setdefault(path, [])
+        elif line.startswith('@@'):
+            in_header = False
+            if ranges is None:
+                continue
+            match = HUNK_HEADER_PATTERN.match(line)
+            start = int(match.group(1))
+            count = 1 if match.group(2) is None else int(match.group(2))
+            ranges.append((start, start + count - 1) if count else (max(start, 1), start + 1))
+    return changes
+
+
+def changed_lines(folder_path: str, base: str, source=None) -> Dict[str, List[Tuple[int, int]]]:
+    """
+    Line ranges of folder_path's files changed since the revision `base`.
+
+    For a commit source the diff is base..commit; on disk it is base
+    against the working tree, and untracked files count as entirely
+    changed. Keys are the paths validate_folder uses for the files.
+    """
+    if source is not None and not source.writable:
+        folder = source.normalize(folder_path)
+        diff = git(source.repo, "diff", "--unified=0", "--no-color", "--no-ext-diff",
+                   "--src-prefix=a/", "--dst-prefix=b/", base, source.commit, "--", folder or ".")
+        return parse_changed_lines(diff)
+
+    toplevel = git(folder_path, "rev-parse", "--show-toplevel").strip()
+    folder = os.path.relpath(os.path.abspath(folder_path), toplevel)
+    diff = git(toplevel, "diff", "--unified=0", "--no-color", "--no-ext-diff",
+               "--src-prefix=a/", "--dst-prefix=b/", base, "--", folder)
+    changes = parse_changed_lines(diff)
+    untracked = git(toplevel, "ls-files", "--others", "--exclude-standard", "-z", "--", folder)
+    changes.update((path, [WHOLE_FILE]) for path in untracked.split('\0') if path)
+    return {os.path.join(folder_path, os.path.relpath(path, folder)): ranges for path, ranges in changes.items()}
+
+
+def _is_block_start(lines: List[str], fences: List[int], idx: int) -> bool:
+    """
+    True if detection can start fresh at lines[idx]: an unindented,
+    non-list line after a blank line, outside any code block. Every
+    check's list and code-block state is reset there.
+    """
+    if idx == 0:
+        return True
+    line = lines[idx]
+    if lines[idx - 1].strip() or not line.strip() or line[0].isspace() or LIST_ITEM_PATTERN.match(line):
+        return False
+    return bisect.bisect_left(fences, idx) % 2 == 0
+
+
+def changed_windows(lines: List[str], changed: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
+    """
+    Merged (start, end) line-index windows covering each changed range
+    and the blocks around it (end exclusive).
+    """
+    fences = [i for i, line in enumerate(lines) if line.strip().startswith('```')]
+    windows = []
+    for first, last in sorted(changed):
+        start = min(max(first, 1), len(lines)) - 1
+        end = min(last, len(lines))
+        while not _is_block_start(lines, fences, start):
+            start -= 1
+        while end < len(lines) and not _is_block_start(lines, fences, end):
+            end += 1
+        if windows and start <= windows[-1][1]:
+            windows[-1] = (windows[-1][0], max(end, windows[-1][1]))
+        else:
+            windows.append((start, end))
+    return windows
+
+
+def shift_issue(issue: ValidationIssue, offset: int) -> ValidationIssue:
+    """Move an issue found in a window down by `offset` lines, message included."""
+    def shift(match):
+        lines = str(int(match.group(2)) + offset)
+        if match.group(3):
+            lines += f"-{int(match.group(3)) + offset}"
+        return match.group(1) + lines
+
+    return replace(issue, line_number=issue.line_number + offset,
+                   message=MESSAGE_LINE_PATTERN.sub(shift, issue.message, count=1))
+
+
+def detect_changed_issues(content: str, file_path: str, changed: List[Tuple[int, int]]) -> List[ValidationIssue]:
+    """
+    Issues on changed lines only. The checks run over the blocks around
+    each change rather than the whole file, so the cost follows the
+    size of the diff; only CROSS_BLOCK_CHECKS read the whole file.
+    """
+    def on_changed_line(issue, offset=0):
+        first = issue.line_number + offset
+        last = first + issue.match.count('\n')
+        return any(first <= high and low <= last for low, high in changed)
+
+    lines = content.split('\n')
+    issues = [issue for check in CROSS_BLOCK_CHECKS for issue in check(content, file_path) if on_changed_line(issue)]
+    block_checks = [check for check in DETECTION_CHECKS if check not in CROSS_BLOCK_CHECKS]
+    for start, end in changed_windows(lines, changed):
+        window = '\n'.join(lines[start:end])
+        for check in block_checks:
+            for issue in check(window, file_path):
+                if on_changed_line(issue, start):
+                    issues.append(shift_issue(issue, start))
+    issues.sort(key=lambda issue: issue.line_number)
+    return issues
+
+
+# =============================================================================
+# Baseline
+# =============================================================================
+
+BASELINE_VERSION = 1
+
+
+def baseline_file_key(file_path: str) -> str:
+    """
+    "tc-x/step-1.md": tutorial folder and file name of the absolute path,
+    so running on "." inside tc-x and on tc-x from the root agree.
+    """
+    return '/'.join(os.path.abspath(file_path).replace('\\', '/').split('/')[-2:])
+
+
+def issue_fingerprint(issue: ValidationIssue) -> Tuple[str, str, str]:
+    """
+    (file, rule, digest) identifying an issue across runs.
+
+    The file is baseline_file_key(), so a baseline doesn't depend on
+    where the repository is checked out. The digest hashes the
+    whitespace-normalized line (or block) the issue is on; line numbers
+    are left out, so edits elsewhere in the file don't invalidate it.
+    """
+    text = issue.original_text or MESSAGE_LINE_PATTERN.sub('', issue.message)
+    digest = hashlib.blake2b(' '.join(text.split()).encode('utf-8'), digest_size=6).hexdigest()
+    return baseline_file_key(issue.file_path), issue.rule_id, digest
+
+
+def write_baseline(path: str, result: ValidationResult) -> int:
+    """
+    Record the unfixed issues of result as {file: {rule: [digest, ...]}}.
+    A digest is repeated once per occurrence. Entries of files result
+    didn't scan are kept from an existing baseline, so tutorials can be
+    recorded one at a time. Returns the issue count. result must be
+    validated with expand, as groups don't keep every issue.
+    """
+    if not result.expand:
+        raise ValueError("write_baseline needs every issue; validate with expand=True")
+    try:
+        with open(path, encoding='utf-8') as f:
+            existing = json.load(f)
+    except (OSError, ValueError):
+        existing = {}
+    issues = {}
+    if isinstance(existing, dict) and existing.get("version") == BASELINE_VERSION:
+        scanned = {baseline_file_key(file_path) for file_path in result.files_scanned}
+        issues = {file_key: rules for file_key, rules in existing["issues"].items() if file_key not in scanned}
+
+    for issue in result.issues:
+        if not issue.fixed:
+            file_key, rule_id, digest = issue_fingerprint(issue)
+            issues.setdefault(file_key, {}).setdefault(rule_id, []).append(digest)
+    for rules in issues.values():
+        for digests in rules.values():
+            digests.sort()
+
+    with WriteBatch() as batch:
+        batch.write_json(path, {"version": BASELINE_VERSION, "issues": issues}, indent=1, sort_keys=True)
+    return sum(len(digests) for rules in issues.values() for digests in rules.values())
+
+
+def load_baseline(path: str) -> Counter:
+    """Fingerprint -> occurrences from a baseline file; raises ValueError for other files."""
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    if not isinstance(data, dict) or data.get("version") != BASELINE_VERSION:
+        raise ValueError(f"{path} is not a version {BASELINE_VERSION} baseline")
+    return Counter(
+        (file_key, rule_id, digest)
+        for file_key, rules in data["issues"].items()
+        for rule_id, digests in rules.items()
+        for digest in digests
+    )
+
+
+def drop_known(issues: List[ValidationIssue], remaining: Counter) -> Tuple[List[ValidationIssue], int]:
+    """
+    The unfixed issues of issues not recorded in remaining, and how many
+    were dropped. Each recorded occurrence suppresses one issue and is
+    used up, so a known line repeated once more is reported.
+    """
+    kept = []
+    for issue in issues:
+        if not issue.fixed:
+            fingerprint = issue_fingerprint(issue)
+            if remaining[fingerprint] > 0:
+                remaining[fingerprint] -= 1
+                continue
+        kept.append(issue)
+    return kept, len(issues) - len(kept)
+
+
+def apply_baseline(result: ValidationResult, baseline: Counter) -> ValidationResult:
+    """
+    Drop unfixed issues recorded in the baseline, in place. Counts and
+    summary cover new issues only. result must be validated with expand;
+    otherwise pass the baseline to validate_folder instead.
+    """
+    if not result.expand:
+        raise ValueError("apply_baseline needs every issue; pass baseline to validate_folder")
+    issues, suppressed = drop_known(result.issues, Counter(baseline))
+    result.baseline_suppressed += suppressed
+    result.issues, result.groups = [], []
+    result.blocking_count = result.warning_count = 0
+    result.add_issues(issues)
+    result.summary = generate_summary(result)
+    return result
+
+
+# =============================================================================
+# Patch Output
+# =============================================================================
+
+# path -> (original content, fixed content), filled by validate_file
+ChangeSet = Dict[str, Tuple[str, str]]
+
+
+def patch_root(folder_path: str, source=None) -> Optional[str]:
+    """
+    Directory patch paths are relative to: the repository root of
+    folder_path on disk (the current directory outside a repository), or
+    None for a commit source, whose paths are already repository-relative.
+    """
+    if source is not None and not source.writable:
+        return None
+    try:
+        return git(os.path.abspath(folder_path), "rev-parse", "--show-toplevel").strip()
+    except GitError:
+        return os.getcwd()
+
+
+def _patch_path(path: str, root: Optional[str] = None) -> str:
+    """Path as it appears in a patch: relative to root, forward slashes, no leading './'."""
+    if root is not None:
+        # git reports the root with symlinks resolved
+        path = os.path.relpath(os.path.realpath(path), os.path.realpath(root))
+    return posixpath.normpath(path.replace('\\', '/'))
+
+
+def format_patch(changes: ChangeSet, root: Optional[str] = None) -> str:
+    """
+    One unified diff of every file in a change set, in path order, with
+    git-style a/ and b/ prefixes. Paths are made relative to root (see
+    patch_root), so `git apply` (or `patch -p1`) at the repository root
+    applies all fixes at once, wherever the folder was given from.
+    """
+    out = []
+    for name, path in sorted((_patch_path(path, root), path) for path in changes):
+        original, fixed = changes[path]
+        out.append(f"diff --git a/{name} b/{name}\n")
+        for line in difflib.unified_diff(original.splitlines(keepends=True), fixed.splitlines(keepends=True),
+                                         f"a/{name}", f"b/{name}"):
+            out.append(line if line.endswith('\n') else line + "\n\\ No newline at end of file\n")
+    return ''.join(out)
+
+
 # =============================================================================
 # Main Validation Functions
 # =============================================================================
 
-def validate_file(file_path: str, auto_fix: bool = True, skip_ai: bool = False, verbose: bool = False) -> ValidationResult:
+# Detection results by git blob id. Blobs are immutable, so content seen
+# before (same file in base and head, or re-read from disk) is checked once.
+_detection_cache: Dict[str, List[ValidationIssue]] = {}
+
+
+def detect_issues(content: str, file_path: str, blob_id: Optional[str] = None) -> List[ValidationIssue]:
+    """
+    Run all detection checks on content.
+
+    With a blob_id, results are cached for the process and returned as
+    fresh copies naming file_path, since callers mark issues fixed.
+    """
+    cached = _detection_cache.get(blob_id) if blob_id else None
+    if cached is None:
+        cached = []
+        for check in DETECTION_CHECKS:
+            cached.extend(check(content, file_path))
+        if blob_id:
+            _detection_cache[blob_id] = cached
+    return [replace(issue, file_path=file_path) for issue in cached]
+
+
+def validate_file(file_path: str, auto_fix: bool = True, skip_ai: bool = False, verbose: bool = False,
+                  source=None, changed: Optional[List[Tuple[int, int]]] = None,
+                  patch: Optional[ChangeSet] = None, batch: Optional[WriteBatch] = None,
+                  baseline: Optional[Counter] = None, expand: bool = True) -> ValidationResult:
     """
     Validate a single markdown file for all rules.
 
@@ -1063,16 +1495,31 @@ def validate_file(file_path: str, auto_fix: bool = True, skip_ai: bool = False,
         auto_fix: Whether to apply auto-fixes (default True)
         skip_ai: Whether to skip AI-powered fixes (default False)
         verbose: Whether to print debug info (default False)
+        source: Where to read from (file_source.py; default: disk). Sources
+            that aren't writable, such as a git commit, are validated
+            without auto-fixes.
+        changed: Changed (first, last) line ranges (see changed_lines); only
+            issues on them are reported, and no fixes are applied
+        patch: Change set to record fixes in (see format_patch) instead of
+            writing the file; any source can be fixed this way
+        batch: Stage the fixed file here (file_writer.py) to be written
+            when the batch commits, rather than right away
+        baseline: Known issues to drop (load_baseline); those found are
+            used up, so one Counter can be shared across files
+        expand: Keep every issue in result.issues; otherwise only the
+            groups (one per rule and run of lines) outlive the file
 
     Returns:
         ValidationResult with all issues found
     """
-    result = ValidationResult(auto_fix_enabled=auto_fix)
+    source = source or DiskSource()
+    auto_fix = auto_fix and (source.writable or patch is not None) and changed is None
+    result = ValidationResult(auto_fix_enabled=auto_fix, expand=expand)
     result.files_scanned.append(file_path)
 
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            original_content = f.read()
+        blob_id, data = source.read_blob(file_path)
+        original_content = data.decode('utf-8')
     except Exception as e:
         result.add_issue(ValidationIssue(
             rule_id="FILE_ERROR",
@@ -1085,6 +1532,7 @@ def validate_file(file_path: str, auto_fix: bool = True, skip_ai: bool = False,
 
     content = original_content
     file_modified = False
+    issues = []
 
     # Apply regex-based auto-fixes first if enabled
     if auto_fix:
@@ -1093,7 +1541,7 @@ def validate_file(file_path: str, auto_fix: bool = True, skip_ai: bool = False,
             file_modified = True
             # Mark corresponding issues as fixed
             for rule_id, count in fixes_applied:
-                result.add_issue(ValidationIssue(
+                issues.append(ValidationIssue(
                     rule_id=rule_id,
                     file_path=file_path,
                     line_number=0,
@@ -1103,15 +1551,10 @@ def validate_file(file_path: str, auto_fix: bool = True, skip_ai: bool = False,
                 ))
 
     # Run all detection checks on (potentially fixed) content
-    all_issues = []
-    all_issues.extend(check_html_tags(content, file_path))
-    all_issues.extend(check_link_spacing_before(content, file_path))
-    all_issues.extend(check_link_spacing_after(content, file_path))
-    all_issues.extend(check_link_broken(content, file_path))
-    all_issues.extend(check_list_indent(content, file_path))
-    all_issues.extend(check_code_block_in_list(content, file_path))
-    all_issues.extend(check_trailing_whitespace(content, file_path))
-    all_issues.extend(check_double_space(content, file_path))
+    if changed is not None:
+        all_issues = detect_changed_issues(content, file_path, changed)
+    else:
+        all_issues = detect_issues(content, file_path, blob_id if content == original_content else None)
 
     # Apply AI fixes for complex issues if enabled
     if auto_fix and not skip_ai:
@@ -1133,15 +1576,25 @@ def validate_file(file_path: str, auto_fix: bool = True, skip_ai: bool = False,
                     issue.fixed_text = reformatted
                     file_modified = True
 
-    # Add all remaining issues to result
-    for issue in all_issues:
-        result.add_issue(issue)
-
-    # Write fixed content back to file if modified
-    if file_modified and content != original_content:
+    # Drop known issues, then add the rest to result collapsed into groups
+    issues.extend(all_issues)
+    if baseline is not None:
+        issues, result.baseline_suppressed = drop_known(issues, baseline)
+    result.add_issues(issues)
+
+    # Write fixed content back to file (or the patch) if modified
+    if file_modified and content != original_content and patch is not None:
+        patch[file_path] = (original_content, content)
+        result.files_modified.append(file_path)
+    elif file_modified and content != original_content:
         try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Staged as a new file renamed over the old one, so a hardlinked
+            # copy (integration test work directories) is never written through
+            if batch is not None:
+                batch.write_text(file_path, content)
+            else:
+                with WriteBatch() as own:
+                    own.write_text(file_path, content)
             result.files_modified.append(file_path)
         except Exception as e:
             result.add_issue(ValidationIssue(
@@ -1158,7 +1611,10 @@ def validate_file(file_path: str, auto_fix: bool = True, skip_ai: bool = False,
     return result
 
 
-def validate_folder(folder_path: str, auto_fix: bool = True, skip_ai: bool = False, verbose: bool = False) -> ValidationResult:
+def validate_folder(folder_path: str, auto_fix: bool = True, skip_ai: bool = False, verbose: bool = False,
+                    source=None, changes: Optional[Dict[str, List[Tuple[int, int]]]] = None,
+                    patch: Optional[ChangeSet] = None, baseline: Optional[Counter] = None,
+                    expand: bool = True) -> ValidationResult:
     """
     Validate all markdown files in a folder.
 
@@ -1167,13 +1623,24 @@ def validate_folder(folder_path: str, auto_fix: bool = True, skip_ai: bool = Fal
         auto_fix: Whether to apply auto-fixes
         skip_ai: Whether to skip AI-powered fixes
         verbose: Whether to print debug info
+        source: Where to read from (default: disk); see validate_file
+        changes: {file path: changed line ranges} from changed_lines; files
+            without changes are skipped unread
+        patch: Change set collecting every file's fixes; nothing is written
+        baseline: Known issues to drop; see validate_file
+        expand: Keep every issue, not only the groups; see validate_file
+
+    Fixed files are staged and replaced together once the whole folder is
+    validated. If any of them can't be written, none is.
 
     Returns:
         ValidationResult with all issues found
     """
-    result = ValidationResult(auto_fix_enabled=auto_fix)
+    source = source or DiskSource()
+    result = ValidationResult(auto_fix_enabled=auto_fix and (source.writable or patch is not None)
+                              and changes is None, expand=expand)
 
-    if not os.path.isdir(folder_path):
+    if not source.is_dir(folder_path):
         result.add_issue(ValidationIssue(
             rule_id="FOLDER_ERROR",
             file_path=folder_path,
@@ -1183,34 +1650,83 @@ def validate_folder(folder_path: str, auto_fix: bool = True, skip_ai: bool = Fal
         ))
         return result
 
-    for filename in os.listdir(folder_path):
-        if filename.endswith('.md'):
-            file_path = os.path.join(folder_path, filename)
-            file_result = validate_file(file_path, auto_fix, skip_ai, verbose)
-
-            # Merge results
-            result.issues.extend(file_result.issues)
-            result.blocking_count += file_result.blocking_count
-            result.warning_count += file_result.warning_count
-            result.files_scanned.extend(file_result.files_scanned)
-            result.files_modified.extend(file_result.files_modified)
+    batch = WriteBatch()
+    try:
+        for file_path in source.list_files(folder_path, '*.md'):
+            changed = None
+            if changes is not None:
+                changed = changes.get(file_path)
+                if not changed:
+                    continue
+            file_result = validate_file(file_path, auto_fix, skip_ai, verbose, source, changed, patch, batch,
+                                        baseline, expand)
+
+            merge_result(result, file_result)
+    except BaseException:
+        batch.abort()
+        raise
+
+    # Replace every fixed file at once, or none if any can't be written
+    if any(g.rule_id == "WRITE_ERROR" for g in result.groups):
+        batch.abort()
+        result.files_modified = []
+    else:
+        try:
+            batch.commit()
+        except OSError as e:
+            result.files_modified = []
+            result.add_issue(ValidationIssue(
+                rule_id="WRITE_ERROR",
+                file_path=folder_path,
+                line_number=0,
+                message=f"Could not write fixed files: {e}",
+                severity=Severity.WARNING,
+            ))
 
     result.summary = generate_summary(result)
     return result
 
 
+def merge_result(result: ValidationResult, other: ValidationResult):
+    """Add the issues, groups, counts and files of other to result."""
+    result.issues.extend(other.issues)
+    result.groups.extend(other.groups)
+    result.baseline_suppressed += other.baseline_suppressed
+    result.blocking_count += other.blocking_count
+    result.warning_count += other.warning_count
+    result.files_scanned.extend(other.files_scanned)
+    result.files_modified.extend(other.files_modified)
+
+
+def tutorial_folders(path: str, source=None) -> List[str]:
+    """
+    The folders to validate for path: path itself when it holds markdown
+    files (a tutorial), otherwise its tc-* folders (a content root).
+    """
+    source = source or DiskSource()
+    if not source.is_dir(path) or source.list_files(path, '*.md'):
+        return [path]
+    return source.list_dirs(path, 'tc-*') or [path]
+
+
 def generate_summary(result: ValidationResult) -> str:
     """Generate a human-readable summary"""
     lines = []
+    known = f"{result.baseline_suppressed} known issue(s) suppressed by baseline"
 
-    if not result.issues:
+    if not result.groups:
         lines.append("No markdown issues found!")
+        if result.baseline_suppressed:
+            lines.append(known)
         return '\n'.join(lines)
 
-    lines.append(f"Found {len(result.issues)} issue(s):")
+    lines.append(f"Found {result.blocking_count + result.warning_count} issue(s):")
     lines.append(f"  - BLOCKING: {result.blocking_count}")
     lines.append(f"  - WARNING: {result.warning_count}")
 
+    if result.baseline_suppressed:
+        lines.append(known)
+
     if result.files_modified:
         lines.append(f"Files modified: {', '.join(result.files_modified)}")
 
@@ -1221,6 +1737,42 @@ def generate_summary(result: ValidationResult) -> str:
 # Output Formatting
 # =============================================================================
 
+def aggregate_issues(issues: List[ValidationIssue], expand: bool = True) -> List[IssueGroup]:
+    """
+    Collapse issues with the same file, rule and fixed state into one
+    group whose adjacent lines merge into ranges (run-length encoding).
+    Groups keep the order in which they first appear. With expand each
+    keeps its issues, so the full detail can still be listed (--expand);
+    otherwise only the first is kept.
+    """
+    members = {}
+    for issue in issues:
+        members.setdefault((issue.file_path, issue.rule_id, issue.fixed), []).append(issue)
+
+    groups = []
+    for run in members.values():
+        run.sort(key=lambda i: i.line_number)
+        first = run[0]
+        group = IssueGroup(first.rule_id, first.file_path, first.severity, first.fixed, first,
+                           count=len(run), issues=run if expand else [])
+        for issue in run:
+            line = issue.line_number
+            if group.ranges and line <= group.ranges[-1][1] + 1:
+                group.ranges[-1] = (group.ranges[-1][0], max(line, group.ranges[-1][1]))
+            else:
+                group.ranges.append((line, line))
+        groups.append(group)
+    return groups
+
+
+def report_entries(result: ValidationResult, expand: bool = False) -> list:
+    """
+    What the formatters list: issue groups, or every issue with expand
+    (when result was validated with expand, so it still has them).
+    """
+    return list(result.issues) if expand and result.expand else list(result.groups)
+
+
 # ANSI color codes for terminal output (T056)
 class Colors:
     """ANSI color codes for terminal output"""
@@ -1231,7 +1783,8 @@ class Colors:
     BOLD = '\033[1m'
 
 
-def format_text_output(result: ValidationResult, verbose: bool = False, use_color: bool = True) -> str:
+def format_text_output(result: ValidationResult, verbose: bool = False, use_color: bool = True,
+                       expand: bool = False) -> str:
     """Format validation result as human-readable text with color coding (T056)"""
     lines = []
 
@@ -1247,13 +1800,14 @@ def format_text_output(result: ValidationResult, verbose: bool = False, use_colo
         reset = Colors.RESET
         bold = Colors.BOLD
 
-    if not result.issues:
+    if not result.groups:
         lines.append(f"{green}No markdown issues found!{reset}")
         return '\n'.join(lines)
 
-    # Group issues by severity
-    blocking = [i for i in result.issues if i.severity == Severity.BLOCKING]
-    warnings = [i for i in result.issues if i.severity == Severity.WARNING]
+    # Group issues by severity (repeats collapsed into line ranges unless expand)
+    entries = report_entries(result, expand)
+    blocking = [i for i in entries if i.severity == Severity.BLOCKING]
+    warnings = [i for i in entries if i.severity == Severity.WARNING]
 
     if blocking:
         lines.append(f"\n{bold}{red}BLOCKING:{reset}")
@@ -1277,13 +1831,14 @@ def format_text_output(result: ValidationResult, verbose: bool = False, use_colo
     return '\n'.join(lines)
 
 
-def format_json_output(result: ValidationResult) -> str:
-    """Format validation result as JSON"""
-    return json.dumps({
-        "success": not result.has_blocking_issues(),
-        "blocking_count": result.blocking_count,
-        "warning_count": result.warning_count,
-        "issues": [
+def format_json_output(result: ValidationResult, expand: bool = False) -> str:
+    """
+    Format validation result as JSON. Issues are grouped per file and rule
+    with their line ranges and count; expand lists each one with its text
+    (when result was validated with expand).
+    """
+    if expand and result.expand:
+        issues = [
             {
                 "rule_id": i.rule_id,
                 "file": i.file_path,
@@ -1295,10 +1850,31 @@ def format_json_output(result: ValidationResult) -> str:
                 "fixed_text": i.fixed_text,
             }
             for i in result.issues
-        ],
+        ]
+    else:
+        issues = [
+            {
+                "rule_id": g.rule_id,
+                "file": g.file_path,
+                "line": g.line_number,
+                "lines": [list(r) for r in g.ranges],
+                "count": g.count,
+                "severity": g.severity.value,
+                "message": g.message,
+                "fixed": g.fixed,
+            }
+            for g in result.groups
+        ]
+
+    return json.dumps({
+        "success": not result.has_blocking_issues(),
+        "blocking_count": result.blocking_count,
+        "warning_count": result.warning_count,
+        "issues": issues,
         "files_scanned": result.files_scanned,
         "files_modified": result.files_modified,
         "auto_fix_enabled": result.auto_fix_enabled,
+        "baseline_suppressed": result.baseline_suppressed,
     }, indent=2)
 
 
@@ -1315,7 +1891,7 @@ def parse_args():
         "folder_path",
         nargs="?",
         default=os.environ.get("FOLDER_NAME"),
-        help="Path to folder containing markdown files"
+        help="Tutorial folder, or a content root: each of its tc-* folders is validated"
     )
     parser.add_argument(
         "--no-fix",
@@ -1353,6 +1929,43 @@ def parse_args():
         action="store_true",
         help="Output PR comment format instead of plain text"
     )
+    parser.add_argument(
+        "--rev",
+        help="Validate folder_path as of this git revision, read from git objects (no checkout, no fixes)"
+    )
+    parser.add_argument(
+        "--repo",
+        default=".",
+        help="Repository for --rev; folder_path is relative to its root (default: current directory)"
+    )
+    parser.add_argument(
+        "--changed-only",
+        metavar="BASE",
+        help="Report only issues on lines changed since revision BASE, e.g. the PR base (no fixes)"
+    )
+    parser.add_argument(
+        "--baseline",
+        metavar="FILE",
+        help="Report only issues not recorded in this baseline file"
+    )
+    parser.add_argument(
+        "--write-baseline",
+        metavar="FILE",
+        help="Record every remaining issue in FILE as known, then exit 0"
+    )
+    parser.add_argument(
+        "--expand",
+        action="store_true",
+        help="List every issue; by default repeats of a rule in a file are collapsed into line ranges"
+    )
+    parser.add_argument(
+        "--emit-patch",
+        nargs="?",
+        const="-",
+        metavar="FILE",
+        help="Collect all fixes into one patch for `git apply` instead of writing files; "
+             "to FILE, or stdout with the report on stderr"
+    )
 
     return parser.parse_args()
 
@@ -1372,17 +1985,53 @@ def main():
     auto_fix = not args.no_fix and not commit_flags['skip_all_fixes']
     skip_ai = args.no_ai_fix or commit_flags['skip_ai_fixes']
 
-    result = validate_folder(args.folder_path, auto_fix=auto_fix, skip_ai=skip_ai, verbose=args.verbose)
+    try:
+        source = open_source(args.rev, args.repo)
+        changes = changed_lines(args.folder_path, args.changed_only, source) if args.changed_only else None
+        baseline = load_baseline(args.baseline) if args.baseline else None
+    except (GitError, OSError, ValueError) as e:
+        print(f"Error: {e}")
+        exit(2)
+
+    patch = {} if args.emit_patch else None
+    with source:
+        folders = tutorial_folders(args.folder_path, source)
+        # Per-line detail is kept only to list it or record it as a baseline
+        result = ValidationResult(expand=args.expand or bool(args.write_baseline))
+        if args.write_baseline:
+            baseline = None
+        for folder in folders:
+            folder_result = validate_folder(folder, auto_fix=auto_fix, skip_ai=skip_ai, verbose=args.verbose,
+                                            source=source, changes=changes, patch=patch,
+                                            baseline=baseline, expand=result.expand)
+            result.auto_fix_enabled = folder_result.auto_fix_enabled
+            merge_result(result, folder_result)
+        result.summary = generate_summary(result)
+
+    report = sys.stdout
+    if patch is not None:
+        text = format_patch(patch, patch_root(args.folder_path, source))
+        if args.emit_patch == "-":
+            sys.stdout.write(text)
+            report = sys.stderr
+        else:
+            with open(args.emit_patch, 'w', encoding='utf-8') as f:
+                f.write(text)
+
+    if args.write_baseline:
+        count = write_baseline(args.write_baseline, result)
+        print(f"Recorded {count} known issue(s) in {args.write_baseline}")
+        exit(0)
 
     # Output results
     if args.pr_comment:
         # Generate PR comment format
         fixes_applied = []  # Would need to track these during validation
-        print(generate_pr_comment(result, fixes_applied))
+        print(generate_pr_comment(result, fixes_applied, expand=args.expand), file=report)
     elif args.json_output:
-        print(format_json_output(result))
+        print(format_json_output(result, expand=args.expand), file=report)
     else:
-        print(format_text_output(result, verbose=args.verbose))
+        print(format_text_output(result, verbose=args.verbose, expand=args.expand), file=report)
 
     # Determine exit code
     if result.has_blocking_issues():
@@ -0,0 +1,3 @@
+"""Shared fixtures for the reference-code tests."""
+
+pytest_plugins = ["git_fixtures"]
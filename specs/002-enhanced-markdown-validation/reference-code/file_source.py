@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+File Sources for Validation Tools
+
+Where clean_markdown.py and the sidecar tools read tutorial files from:
+the working tree (DiskSource) or one commit (git_corpus.GitCorpus),
+read from the object database without a checkout. Both offer the same
+interface:
+
+    read_blob(path)   -> (git blob id, bytes)
+    read_bytes(path), read_text(path)
+    exists(path), is_dir(path), list_files(folder, pattern), list_dirs(folder, pattern)
+    describe(path)    -> path for messages ("HEAD~1:tc-x/step-1.md")
+    writable          -> False for commits: fixes are reported, not written
+
+Commits opened on one BlobCache share a single `git cat-file --batch`
+process and an in-memory cache keyed by blob id, so comparing a PR's
+base and head reads each unchanged file once and touches no files on
+disk. clean_markdown.py also keys its detection results by blob id, so
+an unchanged blob is validated once per process, whichever revision or
+source it is read from.
+
+Usage:
+    from clean_markdown import validate_folder
+    from file_source import BlobCache, open_source
+
+    with BlobCache(".") as blobs:
+        base = open_source("origin/main", ".", blobs)
+        head = open_source("HEAD", ".", blobs)
+        before = validate_folder("tc-example", auto_fix=False, source=base)
+        after = validate_folder("tc-example", auto_fix=False, source=head)
+"""
+
+import fnmatch
+import os
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from git_corpus import BlobCache, GitCorpus, GitError, hash_blob  # noqa: F401 (re-exported)
+
+
+class DiskSource:
+    """
+    Files on disk. Paths are used as given (relative to the current
+    directory), so results name files exactly as before.
+    """
+
+    writable = True
+
+    def read_bytes(self, path: str) -> bytes:
+        with open(path, "rb") as f:
+            return f.read()
+
+    def read_blob(self, path: str) -> Tuple[str, bytes]:
+        data = self.read_bytes(path)
+        return hash_blob(data), data
+
+    def read_text(self, path: str) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    def exists(self, path: str) -> bool:
+        return os.path.exists(path)
+
+    def is_dir(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def list_files(self, folder: str, pattern: str = "*") -> List[str]:
+        """Files directly inside `folder` whose name matches `pattern`."""
+        return sorted(
+            os.path.join(folder, name) for name in os.listdir(folder)
+            if fnmatch.fnmatch(name, pattern) and os.path.isfile(os.path.join(folder, name))
+        )
+
+    def list_dirs(self, folder: str, pattern: str = "*") -> List[str]:
+        """Folders directly inside `folder` whose name matches `pattern`."""
+        return sorted(
+            os.path.join(folder, name) for name in os.listdir(folder)
+            if fnmatch.fnmatch(name, pattern) and os.path.isdir(os.path.join(folder, name))
+        )
+
+    def describe(self, path: str) -> str:
+        return str(path)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_source(rev: Optional[str] = None, repo: Path = Path("."), blobs: Optional[BlobCache] = None):
+    """
+    DiskSource when `rev` is None, otherwise the commit `rev` of `repo`
+    (read through `blobs` when given). Raises GitError for a bad revision.
+    """
+    if rev is None:
+        return DiskSource()
+    return GitCorpus(Path(repo), rev, blobs)
+
+
+def tutorial_files(repo_root: Path, name: str, source=None) -> List[Path]:
+    """
+    Every `tc-*/<name>` file: globbed under `repo_root`, or listed from
+    the tree of a commit source (paths relative to the repository root).
+    """
+    if source is None or source.writable:
+        return sorted(Path(repo_root).glob(f"tc-*/{name}"))
+    return [Path(tutorial, name) for tutorial in source.tutorials() if source.exists(f"{tutorial}/{name}")]
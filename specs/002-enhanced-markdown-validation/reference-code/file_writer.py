@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Transactional File Writes for the Fix Tools
+
+clean_markdown.py, guid_generator.py and fix_sidecar.py write their fixes
+through a WriteBatch, so a run either updates every file it fixed or none
+of them:
+
+    write_bytes / write_text / write_json
+        stage the new content as a temp file next to the target, fsynced,
+        with the target's permissions (the umask default for a new file).
+        Content identical to the file on disk is skipped: the file isn't
+        touched, so its mtime (and any cache keyed on it) stays valid.
+    commit()
+        renames every staged file over its target, then syncs the
+        folders. If a rename fails, targets already replaced are restored
+        from hard-linked backups and the error is raised.
+    abort()
+        deletes the staged files; no target has been touched.
+
+Used as a context manager, the batch commits when the block succeeds and
+aborts when it raises. Targets are replaced by rename, never written
+through, so a hard-linked copy (integration test work directories) is
+left as it was.
+
+Usage:
+    from file_writer import WriteBatch
+
+    with WriteBatch() as batch:
+        for path, content in fixed.items():
+            batch.write_text(path, content)
+    batch.written   # paths actually replaced
+"""
+
+import json
+import os
+import shutil
+import stat
+import tempfile
+from pathlib import Path
+from typing import Callable, Dict, List, Union
+
+PathLike = Union[str, Path]
+
+
+def _target_mode(path: str) -> int:
+    """Permissions for a replacement: the target's, or the umask default for a new file."""
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+def _fsync_dir(folder: str):
+    """Persist renames in `folder` (not supported on Windows; skipped there)."""
+    try:
+        fd = os.open(folder or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class WriteBatch:
+    """Files staged for one all-or-nothing replacement."""
+
+    def __init__(self):
+        self._staged: Dict[str, str] = {}   # target -> temp file, in staging order
+        self._callbacks: List[Callable[[], None]] = []
+        self.written: List[str] = []        # targets replaced by commit()
+        self.unchanged: List[str] = []      # writes skipped: same bytes on disk
+
+    def write_bytes(self, path: PathLike, data: bytes) -> bool:
+        """Stage `data` for `path`. Returns False if the file already holds it."""
+        path = str(path)
+        try:
+            with open(path, "rb") as f:
+                same = f.read() == data
+        except FileNotFoundError:
+            same = False
+        if same:
+            self._discard(path)
+            self.unchanged.append(path)
+            return False
+
+        folder, name = os.path.split(path)
+        fd, tmp_path = tempfile.mkstemp(dir=folder or ".", prefix=f".{name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                # mkstemp creates 0600; keep the mode the file had
+                if hasattr(os, "fchmod"):
+                    os.fchmod(f.fileno(), _target_mode(path))
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self._discard(path)
+        self._staged[path] = tmp_path
+        return True
+
+    def write_text(self, path: PathLike, text: str, encoding: str = "utf-8") -> bool:
+        return self.write_bytes(path, text.encode(encoding))
+
+    def write_json(self, path: PathLike, data, indent: int = 2, sort_keys: bool = False) -> bool:
+        """JSON with a trailing newline, as the tools have always written it."""
+        return self.write_text(path, json.dumps(data, indent=indent, sort_keys=sort_keys) + "\n")
+
+    def on_commit(self, callback: Callable[[], None]):
+        """Run `callback` once the files are in place (e.g. drop a cache entry)."""
+        self._callbacks.append(callback)
+
+    @property
+    def staged(self) -> List[str]:
+        return list(self._staged)
+
+    def _discard(self, path: str):
+        tmp_path = self._staged.pop(path, None)
+        if tmp_path:
+            os.unlink(tmp_path)
+
+    def commit(self) -> List[str]:
+        """Replace every staged target; restore them all if any rename fails."""
+        backups = {}   # target -> backup of the original (None: target was new)
+        done = []
+        try:
+            for path, tmp_path in self._staged.items():
+                backups[path] = None
+                if os.path.exists(path):
+                    backup = tmp_path[:-len(".tmp")] + ".bak"
+                    try:
+                        os.link(path, backup)
+                    except OSError:
+                        shutil.copy2(path, backup)
+                    backups[path] = backup
+                os.replace(tmp_path, path)
+                done.append(path)
+        except BaseException:
+            for path in reversed(done):
+                if backups[path]:
+                    os.replace(backups.pop(path), path)
+                else:
+                    os.unlink(path)
+            for backup in backups.values():
+                if backup:
+                    os.unlink(backup)
+            for path in done:
+                del self._staged[path]
+            self.abort()
+            raise
+
+        for folder in {os.path.dirname(path) for path in done}:
+            _fsync_dir(folder)
+        for backup in backups.values():
+            if backup:
+                os.unlink(backup)
+        self._staged.clear()
+        self.written.extend(done)
+        for callback in self._callbacks:
+            callback()
+        return done
+
+    def abort(self):
+        """Delete every staged file; targets are left untouched."""
+        for path in list(self._staged):
+            self._discard(path)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if exc_type is None:
+            self.commit()
+        else:
+            self.abort()
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Tutorial Corpus from Git Objects
+
+Reads ciscou-tutorial-content at any revision straight from the object
+database, so corpus tools need neither a full clone nor a clean
+checkout:
+
+- File lists come from one `git ls-tree -r` (no blob is read)
+- File contents come from one long-lived `git cat-file --batch` process,
+  through an in-memory cache keyed by blob id (BlobCache) that several
+  revisions can share: a file unchanged between base and head is read once
+- In a blobless partial clone, blobs that were never fetched (images)
+  are fetched on first read; prefetch() fetches many in one request
+
+clone_corpus() creates such a clone: `--filter=blob:none` plus a sparse
+checkout of markdown and sidecar files, so a fresh clone downloads only
+what validation reads. Existence checks (e.g. "does images/ exist?")
+are answered from the tree and never fetch anything.
+
+Usage:
+    # Blobless clone with markdown and sidecars checked out
+    python tools/git_corpus.py clone https://github.com/org/ciscou-tutorial-content.git content
+
+    # List tutorials at a revision (works on bare repositories too)
+    python tools/git_corpus.py list content --rev origin/main
+
+    # Print one file from a revision
+    python tools/git_corpus.py show content tc-example/step-1.md --rev HEAD~3
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import posixpath
+import subprocess
+import sys
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+
+SPARSE_PATTERNS = ("*.md", "sidecar.json", "guid_cache.json")
+
+TUTORIAL_PREFIX = "tc-"
+
+# Object ids per `git fetch` invocation when prefetching
+FETCH_BATCH = 1000
+
+# Bytes of blob contents kept in memory per BlobCache
+BLOB_CACHE_BYTES = 64 << 20
+
+
+class GitError(Exception):
+    """A git command failed or returned unexpected output."""
+
+
+def git(repo: Optional[Path], *args: str) -> str:
+    """Run git in `repo` (None: the current directory); return stdout."""
+    command = ["git", *(["-C", str(repo)] if repo else []), *args]
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise GitError(f"git {' '.join(args)}: {result.stderr.strip()}")
+    return result.stdout
+
+
+def hash_blob(data: bytes) -> str:
+    """Git's object id for `data` (what `git hash-object` prints)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+# =============================================================================
+# cat-file --batch
+# =============================================================================
+
+class CatFile:
+    """
+    One `git cat-file --batch` process serving any number of reads.
+
+    Each read is a request line and a size-prefixed response on the
+    same pipes, so reading a thousand files starts git once.
+    """
+
+    def __init__(self, repo: Path):
+        self.repo = Path(repo)
+        self.proc = subprocess.Popen(
+            ["git", "-C", str(self.repo), "cat-file", "--batch"],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+        )
+
+    def read(self, name: str) -> Optional[bytes]:
+        """Contents of an object (id or `rev:path`), or None if it doesn't exist."""
+        if "\n" in name:
+            raise ValueError(f"Object name contains a newline: {name!r}")
+        self.proc.stdin.write(name.encode("utf-8") + b"\n")
+        self.proc.stdin.flush()
+        header = self.proc.stdout.readline()
+        if not header:
+            raise GitError(f"git cat-file exited (status {self.proc.poll()}) reading {name}")
+        fields = header.split()
+        if len(fields) == 2 and fields[1] in (b"missing", b"ambiguous"):
+            return None
+        if len(fields) != 3:
+            raise GitError(f"Unexpected git cat-file header: {header!r}")
+        data = self.proc.stdout.read(int(fields[2]))
+        self.proc.stdout.read(1)  # Trailing newline
+        return data
+
+    def close(self):
+        if self.proc.poll() is None:
+            self.proc.stdin.close()
+            self.proc.wait()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BlobCache:
+    """
+    Blob contents by object id, read through one CatFile.
+
+    Blobs are immutable, so a cached blob never goes stale and any number
+    of GitCorpus objects (one per revision) can share one cache. Least
+    recently used blobs are dropped beyond `max_bytes`. Thread-safe: reads
+    on the shared pipe are serialized.
+    """
+
+    def __init__(self, repo: Path, max_bytes: int = BLOB_CACHE_BYTES):
+        self.repo = Path(repo)
+        self.max_bytes = max_bytes
+        self._blobs: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._cat: Optional[CatFile] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.reads = 0
+
+    def get(self, object_id: str) -> Optional[bytes]:
+        """Contents of a blob, or None if it doesn't exist (or can't be fetched)."""
+        with self._lock:
+            data = self._blobs.get(object_id)
+            if data is not None:
+                self._blobs.move_to_end(object_id)
+                self.hits += 1
+                return data
+            if self._cat is None:
+                self._cat = CatFile(self.repo)
+            data = self._cat.read(object_id)
+            self.reads += 1
+            if data is not None and len(data) <= self.max_bytes:
+                self._blobs[object_id] = data
+                self._size += len(data)
+                while self._size > self.max_bytes:
+                    _, evicted = self._blobs.popitem(last=False)
+                    self._size -= len(evicted)
+            return data
+
+    def stats(self) -> dict:
+        return {"hits": self.hits, "reads": self.reads, "cached": len(self._blobs), "bytes": self._size}
+
+    def close(self):
+        with self._lock:
+            if self._cat:
+                self._cat.close()
+                self._cat = None
+            self._blobs.clear()
+            self._size = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+# =============================================================================
+# Corpus
+# =============================================================================
+
+class GitCorpus:
+    """
+    The files of one commit, read without a working tree.
+
+    `repo` may be a normal clone, a sparse or blobless clone, or a bare
+    repository. Paths are repository-relative with forward slashes. Pass
+    a shared `blobs` cache to read several revisions through one process
+    (the caller closes it); otherwise the corpus opens its own.
+
+    This is also the read-only file source for a commit (see
+    file_source.py), so tools can validate it without a checkout.
+    """
+
+    # Commits are never written to: auto-fixes are reported only
+    writable = False
+
+    def __init__(self, repo: Path, rev: str = "HEAD", blobs: Optional[BlobCache] = None):
+        self.repo = Path(repo)
+        self.rev = rev
+        self.commit = git(self.repo, "rev-parse", "--verify", f"{rev}^{{commit}}").strip()
+        self._files: Optional[Dict[str, str]] = None
+        self._dirs: Optional[Set[str]] = None
+        self._owns_blobs = blobs is None
+        self.blobs = blobs if blobs is not None else BlobCache(self.repo)
+
+    def close(self):
+        if self._owns_blobs:
+            self.blobs.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def files(self) -> Dict[str, str]:
+        """{path: blob id} for every file in the commit."""
+        if self._files is None:
+            self._files, self._dirs = {}, set()
+            for entry in git(self.repo, "ls-tree", "-r", "-z", self.commit).split("\0"):
+                if not entry:
+                    continue
+                info, path = entry.split("\t", 1)
+                _, kind, object_id = info.split()
+                if kind == "blob":
+                    self._files[path] = object_id
+                    parts = path.split("/")[:-1]
+                    self._dirs.update("/".join(parts[:i]) for i in range(1, len(parts) + 1))
+        return self._files
+
+    def tutorials(self) -> List[str]:
+        """Names of the top-level tc-* folders."""
+        self.files
+        return sorted(d for d in self._dirs if "/" not in d and d.startswith(TUTORIAL_PREFIX))
+
+    def tutorial_trees(self) -> Dict[str, str]:
+        """{tc-* folder: tree id}, as recorded by the scan history."""
+        trees = {}
+        for entry in git(self.repo, "ls-tree", "-z", self.commit).split("\0"):
+            if entry:
+                info, name = entry.split("\t", 1)
+                _, kind, object_id = info.split()
+                if kind == "tree" and name.startswith(TUTORIAL_PREFIX):
+                    trees[name] = object_id
+        return trees
+
+    @staticmethod
+    def normalize(path: str) -> str:
+        """Repository-relative form of a path: "./tc-x/" -> "tc-x"."""
+        path = posixpath.normpath(str(path).replace("\\", "/"))
+        return "" if path == "." else path
+
+    def list_files(self, folder: str, pattern: str = "*") -> List[str]:
+        """Files directly inside `folder` whose name matches `pattern`."""
+        folder = self.normalize(folder)
+        prefix = folder + "/" if folder else ""
+        return sorted(
+            path for path in self.files
+            if path.startswith(prefix) and "/" not in path[len(prefix):]
+            and fnmatch.fnmatch(path[len(prefix):], pattern)
+        )
+
+    def list_dirs(self, folder: str, pattern: str = "*") -> List[str]:
+        """Folders directly inside `folder` whose name matches `pattern`."""
+        self.files
+        folder = self.normalize(folder)
+        prefix = folder + "/" if folder else ""
+        return sorted(
+            path for path in self._dirs
+            if path.startswith(prefix) and "/" not in path[len(prefix):]
+            and fnmatch.fnmatch(path[len(prefix):], pattern)
+        )
+
+    def exists(self, path: str) -> bool:
+        """True for files and folders in the commit; never fetches."""
+        path = self.normalize(path)
+        return path in self.files or path in self._dirs
+
+    def is_dir(self, path: str) -> bool:
+        self.files
+        path = self.normalize(path)
+        return path == "" or path in self._dirs
+
+    def describe(self, path: str) -> str:
+        """`rev:path`, for messages."""
+        return f"{self.rev}:{path}"
+
+    def blob_id(self, path: str) -> str:
+        try:
+            return self.files[self.normalize(path)]
+        except KeyError:
+            raise FileNotFoundError(f"{path} not in {self.commit[:12]}") from None
+
+    def read_blob(self, path: str) -> Tuple[str, bytes]:
+        """(blob id, contents); in a partial clone, git fetches a missing blob first."""
+        object_id = self.blob_id(path)
+        data = self.blobs.get(object_id)
+        if data is None:
+            raise GitError(f"Blob {object_id} for {path} is missing and could not be fetched")
+        return object_id, data
+
+    def read_bytes(self, path: str) -> bytes:
+        return self.read_blob(path)[1]
+
+    def read_text(self, path: str) -> str:
+        return self.read_bytes(path).decode("utf-8")
+
+    def missing_blobs(self) -> Set[str]:
+        """Blob ids of this commit not present locally (never fetched in a partial clone)."""
+        output = git(self.repo, "rev-list", "--objects", "--no-object-names", "--no-walk",
+                     "--missing=print", self.commit)
+        return {line[1:] for line in output.splitlines() if line.startswith("?")}
+
+    def prefetch(self, paths: Iterable[str]) -> int:
+        """
+        Fetch the missing blobs of `paths` in as few requests as possible
+        (one lazy fetch per blob otherwise). Returns the number fetched.
+        """
+        wanted = {self.blob_id(path) for path in paths}
+        if not wanted:
+            return 0
+        missing = sorted(wanted & self.missing_blobs())
+        for start in range(0, len(missing), FETCH_BATCH):
+            git(self.repo, "-c", "fetch.negotiationAlgorithm=noop", "fetch", "--quiet", "--no-tags",
+                "--no-write-fetch-head", "--recurse-submodules=no", "--filter=blob:none", "origin",
+                *missing[start:start + FETCH_BATCH])
+        return len(missing)
+
+
+# =============================================================================
+# Clone
+# =============================================================================
+
+def clone_corpus(url: str, dest: Path, rev: Optional[str] = None, sparse: bool = True) -> Path:
+    """
+    Blobless clone of `url` into `dest`.
+
+    With `sparse`, only markdown and sidecar files are checked out, so
+    only their blobs are downloaded; everything else is fetched when read.
+    """
+    dest = Path(dest)
+    git(None, "clone", "--quiet", "--filter=blob:none", "--no-checkout", url, str(dest))
+    if sparse:
+        git(dest, "sparse-checkout", "set", "--no-cone", *SPARSE_PATTERNS)
+    git(dest, "checkout", "--quiet", *([rev] if rev else []))
+    return dest
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Read tutorial content from git objects")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    clone = commands.add_parser("clone", help="Blobless, sparse clone of a tutorial repository")
+    clone.add_argument("url")
+    clone.add_argument("dest")
+    clone.add_argument("--rev", help="Revision to check out (default: remote HEAD)")
+    clone.add_argument("--full-checkout", action="store_true", help="Check out every file (still blobless)")
+
+    listing = commands.add_parser("list", help="List tutorials at a revision")
+    listing.add_argument("repo")
+    listing.add_argument("--rev", default="HEAD")
+
+    show = commands.add_parser("show", help="Print a file at a revision")
+    show.add_argument("repo")
+    show.add_argument("path")
+    show.add_argument("--rev", default="HEAD")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "clone":
+            dest = clone_corpus(args.url, Path(args.dest), args.rev, sparse=not args.full_checkout)
+            print(f"Cloned {args.url} into {dest}")
+        elif args.command == "list":
+            with GitCorpus(Path(args.repo), args.rev) as corpus:
+                for name in corpus.tutorials():
+                    print(name)
+        else:
+            with GitCorpus(Path(args.repo), args.rev) as corpus:
+                sys.stdout.buffer.write(corpus.read_bytes(args.path))
+    except (GitError, FileNotFoundError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Shared git helpers for the tests that run against real repositories.
+
+Loaded as a pytest plugin by conftest.py, so every test module gets the
+`make_repo` fixture; import `git` directly for commands inside a test:
+
+    from git_fixtures import git
+
+    def test_something(make_repo):
+        repo = make_repo({"tc-x/step-1.md": "# Step\\n"})
+        git(repo, "commit", "-q", "--allow-empty", "-m", "Empty")
+"""
+
+import subprocess
+from pathlib import Path
+from typing import Dict, Union
+
+import pytest
+
+
+def git(repo, *args) -> str:
+    """Run git in `repo` with a fixed test identity; return stdout."""
+    return subprocess.run(
+        ["git", "-C", str(repo), "-c", "user.name=Test", "-c", "user.email=test@example.com", *args],
+        check=True, capture_output=True, text=True,
+    ).stdout
+
+
+@pytest.fixture
+def make_repo(tmp_path):
+    """
+    Factory: make_repo({path: text or bytes}, folder="content") writes the
+    files under tmp_path / folder, then inits a repository there (branch
+    main) and commits them as "Initial". Returns the repository path.
+    """
+    def make(files: Dict[str, Union[str, bytes]], folder: str = "content") -> Path:
+        repo = tmp_path / folder
+        repo.mkdir(parents=True, exist_ok=True)
+        for path, data in files.items():
+            (repo / path).parent.mkdir(parents=True, exist_ok=True)
+            if isinstance(data, bytes):
+                (repo / path).write_bytes(data)
+            else:
+                (repo / path).write_text(data)
+        git(repo, "init", "-q", "-b", "main")
+        git(repo, "add", ".")
+        git(repo, "commit", "-q", "-m", "Initial")
+        return repo
+
+    return make
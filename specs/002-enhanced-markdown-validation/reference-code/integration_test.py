@@ -15,23 +15,44 @@ Usage:
     # Full test with XML conversion (requires tutorial_md2xml binary)
     python tests/integration_test.py --with-xml-conversion
 
+    # XML conversion with the native Python converter (no binaries needed)
+    python tests/integration_test.py --with-xml-conversion --native-xml
+
     # Test specific fixture
     python tests/integration_test.py --fixture tests/fixtures/integration
 
+    # Run every fixture under a directory in parallel, work dirs on tmpfs
+    python tests/integration_test.py --scenarios tests/fixtures --jobs 8 --tmpfs
+
+Work directories are populated with reflinks or hardlinks instead of full
+copies (--link-mode). clean_markdown.py replaces files it fixes rather than
+rewriting them, so only modified files get their own copy and the fixture
+is never touched.
+
 Requirements for XML conversion testing:
     - tutorial_md2xml binary in current directory or PATH
     - sol binary for Solomon XML validation (optional)
 """
 
 import os
+import io
 import sys
 import json
+import errno
 import shutil
 import tempfile
 import subprocess
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
 from pathlib import Path
 
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:
+    HAS_FCNTL = False
+
 # Add tools directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
 
@@ -42,25 +63,114 @@ from clean_markdown import (
 )
 
 
+# Rules the default integration fixture must trigger; a fixture can list
+# its own in expected_rules.json
+DEFAULT_EXPECTED_RULES = {
+    "HTML_TAG",
+    "LINK_NO_SPACE_BEFORE",
+    "LINK_NO_SPACE_AFTER",
+    "LINK_BROKEN",
+    "LIST_INDENT_INCONSISTENT",
+    "CODE_BLOCK_IN_LIST",
+    "DOUBLE_SPACE",
+}
+
+EXPECTED_RULES_FILE = "expected_rules.json"
+
+
+# =============================================================================
+# Fixture Materialization
+# =============================================================================
+
+LINK_MODES = {
+    "auto": ("reflink", "hardlink", "copy"),
+    "reflink": ("reflink", "copy"),
+    "hardlink": ("hardlink", "copy"),
+    "copy": ("copy",),
+}
+
+FICLONE = 0x40049409  # Linux ioctl: share the source file's extents
+
+
+def reflink_file(src: Path, dst: Path):
+    """Copy-on-write clone (btrfs, XFS); raises OSError where unsupported."""
+    if not HAS_FCNTL:
+        raise OSError(errno.EOPNOTSUPP, "reflinks need fcntl")
+    with open(src, "rb") as s, open(dst, "wb") as d:
+        try:
+            fcntl.ioctl(d.fileno(), FICLONE, s.fileno())
+        except OSError:
+            d.close()
+            os.unlink(dst)
+            raise
+
+
+LINK_FUNCTIONS = {
+    "reflink": reflink_file,
+    "hardlink": os.link,
+    "copy": shutil.copy2,
+}
+
+
+def materialize_fixture(src: Path, dest: Path, link_mode: str = "auto") -> dict:
+    """
+    Populate `dest` with the files of fixture `src` without copying data.
+
+    Each file is reflinked, hardlinked or copied, trying the methods of
+    `link_mode` in order; a method that fails once (wrong filesystem,
+    cross-device tmpfs) is not tried again. Returns a count per method.
+    """
+    src, dest = Path(src), Path(dest)
+    methods = list(LINK_MODES[link_mode])
+    counts = {method: 0 for method in methods}
+
+    for root, _dirs, files in os.walk(src):
+        target_dir = dest / Path(root).relative_to(src)
+        target_dir.mkdir(parents=True, exist_ok=True)
+        for name in files:
+            while True:
+                method = methods[0]
+                try:
+                    LINK_FUNCTIONS[method](Path(root) / name, target_dir / name)
+                    counts[method] += 1
+                    break
+                except OSError:
+                    if len(methods) == 1:
+                        raise
+                    methods.pop(0)
+    return counts
+
+
 class IntegrationTest:
     """Run integration tests for markdown validation pipeline."""
 
-    def __init__(self, fixture_path: str, work_dir: str = None):
+    def __init__(self, fixture_path: str, work_dir: str = None, native_xml: bool = False,
+                 link_mode: str = "auto", base_dir: str = None):
         self.fixture_path = Path(fixture_path)
         self.work_dir = Path(work_dir) if work_dir else None
+        self.native_xml = native_xml
+        self.link_mode = link_mode
+        self.base_dir = base_dir
         self.results = {}
 
+        rules_file = self.fixture_path / EXPECTED_RULES_FILE
+        if rules_file.exists():
+            self.expected_rules = set(json.loads(rules_file.read_text()))
+        else:
+            self.expected_rules = DEFAULT_EXPECTED_RULES
+
     def setup_work_directory(self) -> Path:
-        """Copy fixtures to a temporary work directory."""
+        """Materialize the fixture in a fresh work directory."""
         if self.work_dir:
             work_path = self.work_dir
             if work_path.exists():
                 shutil.rmtree(work_path)
         else:
-            work_path = Path(tempfile.mkdtemp(prefix="md_integration_"))
+            work_path = Path(tempfile.mkdtemp(prefix="md_integration_", dir=self.base_dir))
 
-        shutil.copytree(self.fixture_path, work_path, dirs_exist_ok=True)
-        print(f"Work directory: {work_path}")
+        counts = materialize_fixture(self.fixture_path, work_path, self.link_mode)
+        methods = ", ".join(f"{count} {method}" for method, count in counts.items() if count)
+        print(f"Work directory: {work_path} ({methods or 'empty'})")
         return work_path
 
     def run_validation(self, folder: Path, auto_fix: bool = False) -> ValidationResult:
@@ -75,6 +185,9 @@ class IntegrationTest:
         Returns:
             Tuple of (success, output/error message)
         """
+        if self.native_xml:
+            return self.run_native_xml_conversion(folder)
+
         # Look for tutorial_md2xml binary
         md2xml_paths = [
             Path("./tutorial_md2xml"),
@@ -113,6 +226,24 @@ class IntegrationTest:
         except Exception as e:
             return False, f"XML conversion failed: {e}"
 
+    def run_native_xml_conversion(self, folder: Path) -> tuple[bool, str]:
+        """
+        Convert with the native md2xml module and check the output.
+
+        Returns:
+            Tuple of (success, output/error message)
+        """
+        from md2xml import convert_one
+        from xml_checker import format_error
+
+        result = convert_one(folder, check=True)
+        if result["error"]:
+            return False, f"XML conversion failed: {result['error']}"
+        report = "\n".join(format_error(e) for e in result["xml_errors"])
+        if any(e["severity"] == "blocking" for e in result["xml_errors"]):
+            return False, report
+        return True, report or f"Converted to {result['output']}"
+
     def run_solomon_lint(self, xml_file: Path) -> tuple[bool, str]:
         """
         Run Solomon XML linting on the converted XML.
@@ -149,16 +280,7 @@ class IntegrationTest:
 
         result = self.run_validation(work_dir, auto_fix=False)
 
-        # Expected issues in step-2.md
-        expected_rules = {
-            "HTML_TAG",
-            "LINK_NO_SPACE_BEFORE",
-            "LINK_NO_SPACE_AFTER",
-            "LINK_BROKEN",
-            "LIST_INDENT_INCONSISTENT",
-            "CODE_BLOCK_IN_LIST",
-            "DOUBLE_SPACE",
-        }
+        expected_rules = self.expected_rules
 
         detected_rules = {i.rule_id for i in result.issues}
 
@@ -260,7 +382,8 @@ class IntegrationTest:
                 print(f"Output file: {xml_file}")
                 print(f"File size: {xml_file.stat().st_size} bytes")
 
-                # Optionally run Solomon lint
+            # Optionally run Solomon lint (the native converter has no sol step)
+            if xml_file.exists() and not self.native_xml:
                 sol_success, sol_output = self.run_solomon_lint(xml_file)
                 if sol_success:
                     print("Solomon lint: PASSED")
@@ -325,6 +448,63 @@ class IntegrationTest:
                 print(f"(Set KEEP_WORK_DIR=1 to preserve work directory)")
 
 
+# =============================================================================
+# Parallel Scenario Runner
+# =============================================================================
+
+def find_scenarios(root: Path) -> list:
+    """Fixture directories (containing markdown) directly under `root`."""
+    return sorted(
+        path for path in Path(root).iterdir()
+        if path.is_dir() and any(path.glob("*.md"))
+    )
+
+
+def tmpfs_dir() -> str:
+    """A RAM-backed temp directory when the platform has one."""
+    return "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def run_scenario(fixture: str, with_xml: bool = False, native_xml: bool = False,
+                 link_mode: str = "auto", base_dir: str = None) -> dict:
+    """Run all tests for one fixture in its own work directory, capturing output."""
+    scenario_dir = tempfile.mkdtemp(prefix="md_scenario_", dir=base_dir)
+    log = io.StringIO()
+    try:
+        with redirect_stdout(log):
+            test = IntegrationTest(fixture, native_xml=native_xml,
+                                   link_mode=link_mode, base_dir=scenario_dir)
+            passed = test.run_all_tests(with_xml=with_xml)
+    except Exception as e:
+        test, passed = None, False
+        log.write(f"\nScenario crashed: {e}\n")
+    finally:
+        if os.environ.get("KEEP_WORK_DIR") != "1":
+            shutil.rmtree(scenario_dir, ignore_errors=True)
+
+    return {
+        "fixture": str(fixture),
+        "passed": passed,
+        "tests": {name: r.get("passed") for name, r in test.results.items()} if test else {},
+        "log": log.getvalue(),
+    }
+
+
+def run_parallel(fixtures: list, jobs: int = None, **options) -> list:
+    """Run many fixture scenarios at once in isolated work directories."""
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        futures = [pool.submit(run_scenario, str(f), **options) for f in fixtures]
+        return [future.result() for future in futures]
+
+
+def resolve_path(path: str) -> Path:
+    """Find a path as given, relative to this script, or to the repo root."""
+    for candidate in (Path(path), Path(__file__).parent / path, Path(__file__).parent.parent / path):
+        if candidate.exists():
+            return candidate
+    return None
+
+
 def main():
     parser = argparse.ArgumentParser(description="Integration test for markdown validation")
     parser.add_argument(
@@ -332,34 +512,80 @@ def main():
         default="tests/fixtures/integration",
         help="Path to test fixture directory"
     )
+    parser.add_argument(
+        "--scenarios",
+        help="Directory of fixture directories to run in parallel"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        default=os.cpu_count(),
+        help="Parallel scenarios (default: CPU count)"
+    )
     parser.add_argument(
         "--with-xml-conversion",
         action="store_true",
         help="Run XML conversion test (requires tutorial_md2xml binary)"
     )
+    parser.add_argument(
+        "--native-xml",
+        action="store_true",
+        help="Use the native Python converter (md2xml.py) instead of tutorial_md2xml"
+    )
+    parser.add_argument(
+        "--link-mode",
+        choices=sorted(LINK_MODES),
+        default="auto",
+        help="How fixture files are materialized (default: reflink, then hardlink, then copy)"
+    )
+    parser.add_argument(
+        "--tmpfs",
+        action="store_true",
+        help="Put work directories on /dev/shm (files are copied: links cannot cross filesystems)"
+    )
     parser.add_argument(
         "--work-dir",
         help="Specific work directory (default: temp directory)"
     )
 
     args = parser.parse_args()
+    base_dir = tmpfs_dir() if args.tmpfs else None
+
+    if args.scenarios:
+        scenarios_path = resolve_path(args.scenarios)
+        if not scenarios_path:
+            print(f"Error: Scenarios directory not found: {args.scenarios}")
+            sys.exit(1)
+
+        fixtures = find_scenarios(scenarios_path)
+        results = run_parallel(
+            fixtures, args.jobs,
+            with_xml=args.with_xml_conversion, native_xml=args.native_xml,
+            link_mode=args.link_mode, base_dir=base_dir,
+        )
+        for result in results:
+            status = "✅ PASS" if result["passed"] else "❌ FAIL"
+            tests = ", ".join(f"{name}={'ok' if ok else 'FAIL'}" for name, ok in result["tests"].items())
+            print(f"{status}  {Path(result['fixture']).name}  {tests}")
+            if not result["passed"] and os.environ.get("SHOW_LOGS") == "1":
+                print(result["log"])
+
+        failed = sum(1 for r in results if not r["passed"])
+        print(f"\n{len(results)} scenario(s), {failed} failed (set SHOW_LOGS=1 for failure logs)")
+        sys.exit(1 if failed else 0)
 
     # Find fixture path
-    fixture_path = Path(args.fixture)
-    if not fixture_path.exists():
-        # Try relative to script
-        fixture_path = Path(__file__).parent / args.fixture
-    if not fixture_path.exists():
-        # Try relative to repo root
-        fixture_path = Path(__file__).parent.parent / args.fixture
-
-    if not fixture_path.exists():
+    fixture_path = resolve_path(args.fixture)
+    if not fixture_path:
         print(f"Error: Fixture not found: {args.fixture}")
         sys.exit(1)
 
     test = IntegrationTest(
         fixture_path=str(fixture_path),
-        work_dir=args.work_dir
+        work_dir=args.work_dir,
+        native_xml=args.native_xml,
+        link_mode=args.link_mode,
+        base_dir=base_dir
     )
 
     success = test.run_all_tests(with_xml=args.with_xml_conversion)
@@ -0,0 +1,498 @@
+#!/usr/bin/env python3
+"""
+Native Markdown to Solomon XML Converter
+
+Pure-Python stand-in for the tutorial_md2xml binary, used for fast
+pre-flight checks. It produces the element structure our pipeline sees in
+data.xml (ParaBlock, ItemBlock/Item/ItemPara, SubList, Code, headings) and
+streams it through an incremental writer, so a whole corpus converts in
+one process without launching the binary per tutorial.
+
+The converter deliberately reproduces the known failure modes of the real
+converter instead of repairing them:
+
+- Inline HTML tags and bare `&` are passed through verbatim
+  (research.md: "br line 103 and ParaBlock").
+- List items the real converter mis-closes are written as
+  `<ItemPara>...</ParaBlock>` (003 learnings 2, 2b, 2d and spec lesson 7):
+  items starting with bold text, items after a blank line, items with
+  local file links, and ordered items whose number is out of sequence
+  (including a list that does not start at 1).
+
+Feeding the output to any XML parser therefore predicts the
+"Opening and ending tag mismatch" failures CI would report; xml_checker.py
+does that and maps each failure back to the step file and line through
+the source map written next to the output (`data.xml.map`).
+
+Usage:
+    python md2xml.py <tutorial_folder> [--output data.xml] [--check]
+    python md2xml.py --corpus <repo_root> [--out-dir DIR] [--check]
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, TextIO
+
+from sidecar_model import load_sidecar
+from xml_checker import SourceMap, check_xml, format_error, source_map_path
+
+
+# =============================================================================
+# Incremental XML Writer
+# =============================================================================
+
+def escape_xml(text: str) -> str:
+    """Escape character data for XML."""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+
+def escape_attr(text: str) -> str:
+    return escape_xml(text).replace('"', "&quot;")
+
+
+class XmlWriter:
+    """
+    Write XML to a stream as elements are opened and closed.
+
+    Block elements start on their own line; inline elements are written in
+    place. `line` is the current output line; `map_source` records it
+    against the markdown line that produced it.
+    """
+
+    def __init__(self, stream: TextIO, indent: str = "  ", source_map: Optional[SourceMap] = None):
+        self.stream = stream
+        self.indent = indent
+        self.source_map = source_map
+        self.line = 1
+        self._stack: List[list] = []  # [name, block, has_block_children]
+
+    def _write(self, text: str):
+        self.stream.write(text)
+        self.line += text.count("\n")
+
+    def _tag(self, name: str, attrs: Optional[Dict[str, str]], close: str) -> str:
+        attr_text = "".join(
+            f' {key}="{escape_attr(str(value))}"'
+            for key, value in (attrs or {}).items() if value is not None
+        )
+        return f"<{name}{attr_text}{close}>"
+
+    def _block_prefix(self) -> str:
+        if self._stack:
+            self._stack[-1][2] = True
+        return "\n" + self.indent * len(self._stack)
+
+    def declaration(self):
+        self._write('<?xml version="1.0" encoding="UTF-8"?>')
+
+    def start(self, name: str, attrs: Optional[Dict[str, str]] = None, inline: bool = False):
+        prefix = "" if inline else self._block_prefix()
+        self._write(prefix + self._tag(name, attrs, ""))
+        self._stack.append([name, not inline, False])
+
+    def end(self, name: Optional[str] = None):
+        """
+        Close the innermost open element.
+
+        Passing a different `name` writes that end tag instead; this is how
+        the converter reproduces tutorial_md2xml's malformed output.
+        """
+        open_name, block, has_block_children = self._stack.pop()
+        prefix = "\n" + self.indent * len(self._stack) if block and has_block_children else ""
+        self._write(f"{prefix}</{name or open_name}>")
+
+    def empty(self, name: str, attrs: Optional[Dict[str, str]] = None, inline: bool = False):
+        prefix = "" if inline else self._block_prefix()
+        self._write(prefix + self._tag(name, attrs, "/"))
+
+    def text(self, text: str):
+        self._write(escape_xml(text))
+
+    def map_source(self, source_line: int, span: int = 1):
+        """Map the current output line (and `span - 1` after it) to markdown."""
+        if self.source_map is not None:
+            self.source_map.add(self.line, source_line, span)
+
+    def raw(self, text: str):
+        self._write(text)
+
+    @property
+    def depth(self) -> int:
+        return len(self._stack)
+
+    def close(self):
+        """Close every open element and end the document."""
+        while self._stack:
+            self.end()
+        self._write("\n")
+
+
+# =============================================================================
+# Inline Conversion
+# =============================================================================
+
+INLINE_PATTERN = re.compile(
+    r'(?P<code>`+)(?P<code_text>.+?)(?P=code)'
+    r'|!\[(?P<alt>[^\]]*)\]\((?P<src>[^)\s]+)(?:\s+"[^"]*")?\)'
+    r'|\[(?P<link_text>[^\]]+)\]\((?P<href>[^)\s]+)(?:\s+"[^"]*")?\)'
+    r'|\*\*(?P<bold>.+?)\*\*|__(?P<bold2>.+?)__'
+    r'|\*(?P<italic>[^*\s](?:[^*]*[^*\s])?)\*|(?<!\w)_(?P<italic2>[^_\s](?:[^_]*[^_\s])?)_(?!\w)'
+    r'|(?P<html></?[A-Za-z][\w-]*(?:\s[^<>]*)?/?>)',
+    re.DOTALL,
+)
+
+
+def write_prose(writer: XmlWriter, text: str):
+    """Write markdown prose: `<` and `>` are escaped, `&` is not."""
+    writer.raw(text.replace("<", "&lt;").replace(">", "&gt;"))
+
+
+def write_inline(writer: XmlWriter, text: str):
+    """Convert inline markdown (code, images, links, emphasis, raw HTML)."""
+    pos = 0
+    for match in INLINE_PATTERN.finditer(text):
+        write_prose(writer, text[pos:match.start()])
+        pos = match.end()
+        groups = match.groupdict()
+        if groups["code"]:
+            writer.start("InlineCode", inline=True)
+            writer.text(groups["code_text"])
+            writer.end()
+        elif groups["src"]:
+            writer.empty("Image", {"src": groups["src"], "alt": groups["alt"]}, inline=True)
+        elif groups["href"]:
+            writer.start("Link", {"href": groups["href"]}, inline=True)
+            write_inline(writer, groups["link_text"])
+            writer.end()
+        elif groups["bold"] or groups["bold2"]:
+            writer.start("Bold", inline=True)
+            write_inline(writer, groups["bold"] or groups["bold2"])
+            writer.end()
+        elif groups["italic"] or groups["italic2"]:
+            writer.start("Italic", inline=True)
+            write_inline(writer, groups["italic"] or groups["italic2"])
+            writer.end()
+        else:
+            # Raw HTML goes through untouched, as it does in tutorial_md2xml
+            writer.raw(groups["html"])
+    write_prose(writer, text[pos:])
+
+
+# =============================================================================
+# Block Conversion
+# =============================================================================
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.*?)\s*#*\s*$')
+FENCE_PATTERN = re.compile(r'^(\s*)(`{3,}|~{3,})\s*([\w+#.-]*)')
+LIST_ITEM_PATTERN = re.compile(r'^(\s*)([-*+]|(\d+)[.)])\s+(.*)$')
+IMAGE_LINE_PATTERN = re.compile(r'^\s*!\[([^\]]*)\]\(([^)\s]+)(?:\s+"[^"]*")?\)\s*$')
+RULE_PATTERN = re.compile(r'^\s*([-*_])(\s*\1){2,}\s*$')
+LOCAL_LINK_PATTERN = re.compile(r'(?<!!)\[[^\]]+\]\((?!https?://|mailto:|#)[^)\s]+\)')
+
+
+@dataclass
+class ListLevel:
+    """One open list level: its marker indent and ordered numbering."""
+    indent: int
+    ordered: bool
+    next_number: int = 1
+    item_open: bool = False
+
+
+@dataclass
+class Paragraph:
+    """Buffered paragraph text; item paragraphs belong to the open list item."""
+    lines: List[str] = field(default_factory=list)
+    start: int = 1
+    in_item: bool = False
+    mismatched: bool = False
+
+
+class StepConverter:
+    """
+    Convert one step file's markdown into Solomon block elements.
+
+    The converter is a single pass over the lines; paragraphs are buffered
+    only until the next blank line or block, so memory stays proportional
+    to the largest paragraph rather than the document.
+    """
+
+    def __init__(self, writer: XmlWriter):
+        self.writer = writer
+        self.lists: List[ListLevel] = []
+        self.para: Optional[Paragraph] = None
+        self.blank_seen = False
+        self.line_number = 0
+
+    # -- paragraphs ---------------------------------------------------------
+
+    def flush_paragraph(self):
+        para, self.para = self.para, None
+        if not para or not para.lines:
+            return
+        text = "\n".join(line.strip() for line in para.lines)
+        self.writer.start("ItemPara" if para.in_item else "ParaBlock")
+        self.writer.map_source(para.start, len(para.lines))
+        write_inline(self.writer, text)
+        self.writer.end("ParaBlock" if para.mismatched else None)
+
+    # -- lists --------------------------------------------------------------
+
+    def close_item(self, level: ListLevel):
+        if level.item_open:
+            self.writer.end()  # Item
+            level.item_open = False
+
+    def close_lists(self, indent: int = -1):
+        """Close list levels nested deeper than `indent` (-1 closes all)."""
+        self.flush_paragraph()
+        while self.lists and self.lists[-1].indent > indent:
+            self.close_item(self.lists.pop())
+            self.writer.end()  # ItemBlock / SubList
+
+    def list_item(self, indent: int, number: Optional[str], text: str):
+        self.flush_paragraph()
+        ordered = number is not None
+        blank_before = self.blank_seen
+
+        if self.lists and indent > self.lists[-1].indent and self.lists[-1].item_open:
+            self.writer.start("SubList", {"type": "ordered" if ordered else "bullet"})
+            self.writer.map_source(self.line_number)
+            self.lists.append(ListLevel(indent, ordered))
+        else:
+            self.close_lists(indent)
+            if self.lists and self.lists[-1].ordered != ordered:
+                self.close_lists(self.lists[-1].indent - 1)
+            if not self.lists or self.lists[-1].indent < indent:
+                name = "SubList" if self.lists else "ItemBlock"
+                self.writer.start(name, {"type": "ordered" if ordered else "bullet"})
+                self.writer.map_source(self.line_number)
+                self.lists.append(ListLevel(indent, ordered))
+
+        level = self.lists[-1]
+        mismatched = (
+            text.startswith(("**", "__"))
+            or bool(LOCAL_LINK_PATTERN.search(text))
+            or (blank_before and level.item_open)
+            or (ordered and int(number) != level.next_number)
+        )
+        self.close_item(level)
+        self.writer.start("Item")
+        self.writer.map_source(self.line_number)
+        level.item_open = True
+        if ordered:
+            level.next_number += 1
+        self.para = Paragraph([text], self.line_number, in_item=True, mismatched=mismatched)
+
+    def item_content_indent(self) -> int:
+        return self.lists[-1].indent + 2 if self.lists else 0
+
+    # -- block elements -----------------------------------------------------
+
+    def heading(self, level: int, text: str):
+        self.close_lists()
+        self.writer.start("Heading", {"level": str(level)})
+        self.writer.map_source(self.line_number)
+        write_inline(self.writer, text)
+        self.writer.end()
+
+    def image(self, alt: str, src: str):
+        self.flush_paragraph()
+        self.writer.empty("Image", {"src": src, "alt": alt})
+        self.writer.map_source(self.line_number)
+
+    def code_block(self, language: str, lines: List[str], fence_line: int):
+        self.writer.start("Code", {"language": language or None})
+        self.writer.map_source(fence_line + 1, len(lines))
+        self.writer.text("\n".join(lines))
+        self.writer.end()
+
+    # -- driver -------------------------------------------------------------
+
+    def convert(self, text: str):
+        """Convert a whole markdown document."""
+        fence = None  # (marker, indent, language, lines, fence line)
+
+        for self.line_number, line in enumerate(text.splitlines(), 1):
+            if fence:
+                marker, fence_indent, language, code_lines, fence_line = fence
+                if line.strip().startswith(marker) and not line.strip().strip(marker[0]):
+                    self.code_block(language, code_lines, fence_line)
+                    fence = None
+                else:
+                    code_lines.append(line[fence_indent:] if line[:fence_indent].isspace() else line.lstrip())
+                continue
+
+            stripped = line.strip()
+            indent = len(line) - len(line.lstrip())
+
+            if not stripped:
+                self.flush_paragraph()
+                self.blank_seen = True
+                continue
+
+            in_item = bool(self.lists) and (indent >= self.item_content_indent() or not self.blank_seen)
+
+            fence_match = FENCE_PATTERN.match(line)
+            if fence_match:
+                if self.lists and indent > 0:
+                    # Code inside a list item: Solomon rejects it, but the
+                    # converter still emits it in place
+                    self.flush_paragraph()
+                else:
+                    self.close_lists()
+                fence = (fence_match.group(2), indent, fence_match.group(3), [], self.line_number)
+                self.blank_seen = False
+                continue
+
+            heading = HEADING_PATTERN.match(line)
+            item = LIST_ITEM_PATTERN.match(line)
+            image = IMAGE_LINE_PATTERN.match(line)
+
+            if heading and indent < 4:
+                self.heading(len(heading.group(1)), heading.group(2))
+            elif item and not RULE_PATTERN.match(line):
+                self.list_item(len(item.group(1)), item.group(3), item.group(4))
+            elif RULE_PATTERN.match(line):
+                self.close_lists()
+            elif image and not (self.para and not self.blank_seen):
+                if not in_item:
+                    self.close_lists()
+                self.image(image.group(1), image.group(2))
+            elif self.para and not self.blank_seen:
+                self.para.lines.append(line)
+            elif in_item:
+                self.flush_paragraph()
+                self.para = Paragraph([line], self.line_number, in_item=True)
+            else:
+                self.close_lists()
+                self.para = Paragraph([line], self.line_number)
+            self.blank_seen = False
+
+        if fence:
+            self.code_block(fence[2], fence[3], fence[4])
+        self.close_lists()
+
+
+# =============================================================================
+# Tutorial and Corpus Conversion
+# =============================================================================
+
+def convert_tutorial(folder: Path, stream: TextIO, source_map: Optional[SourceMap] = None):
+    """Write one tutorial's XML, steps in sidecar order, to `stream`."""
+    folder = Path(folder)
+    sidecar = load_sidecar(folder / "sidecar.json")
+    writer = XmlWriter(stream, source_map=source_map)
+    writer.declaration()
+    writer.start("Tutorial", {"id": sidecar.id, "title": sidecar.get("title")})
+    for step in sidecar.files:
+        if source_map is not None:
+            source_map.begin_file(step.file)
+        writer.start("Step", {"file": step.file, "label": step.label, "xy-guid": step.xy_guid})
+        writer.map_source(1)
+        step_path = folder / step.file
+        if step_path.exists():
+            StepConverter(writer).convert(step_path.read_text(encoding="utf-8"))
+        writer.end()
+    writer.close()
+
+
+def convert_tutorial_file(folder: Path, output: Optional[Path] = None) -> Path:
+    """
+    Convert a tutorial folder to data.xml (next to sidecar.json by default).
+
+    The source map is written alongside as `<output>.map`.
+    """
+    output = Path(output) if output else Path(folder) / "data.xml"
+    source_map = SourceMap()
+    with open(output, "w", encoding="utf-8") as stream:
+        convert_tutorial(folder, stream, source_map)
+    source_map.save(source_map_path(output))
+    return output
+
+
+def convert_one(folder: Path, output: Optional[Path] = None, check: bool = False) -> dict:
+    """Convert one tutorial, collecting load/write errors instead of raising."""
+    result = {"tutorial": Path(folder).name, "output": None, "error": None}
+    try:
+        result["output"] = str(convert_tutorial_file(folder, output))
+        if check:
+            result["xml_errors"] = check_xml(Path(result["output"]), tutorial=Path(folder).name)
+    except (OSError, ValueError) as e:
+        result["error"] = str(e)
+    return result
+
+
+def find_tutorials(root: Path) -> List[Path]:
+    """Tutorial folders directly under `root` (or `root` itself)."""
+    root = Path(root)
+    if (root / "sidecar.json").exists():
+        return [root]
+    return sorted(p.parent for p in root.glob("*/sidecar.json"))
+
+
+def convert_corpus(root: Path, out_dir: Optional[Path] = None, check: bool = False) -> List[dict]:
+    """
+    Convert every tutorial under `root` in this process.
+
+    Each tutorial is written to `<folder>/data.xml`, or `<out_dir>/<id>.xml`
+    when `out_dir` is given.
+    """
+    if out_dir:
+        Path(out_dir).mkdir(parents=True, exist_ok=True)
+    return [
+        convert_one(folder, Path(out_dir) / f"{folder.name}.xml" if out_dir else None, check)
+        for folder in find_tutorials(root)
+    ]
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Convert tutorial markdown to Solomon XML (native pre-flight converter)"
+    )
+    parser.add_argument("folder", nargs="?", help="Tutorial folder containing sidecar.json")
+    parser.add_argument("--output", "-o", help="Output file (default: <folder>/data.xml)")
+    parser.add_argument("--corpus", metavar="REPO_ROOT", help="Convert every tutorial under REPO_ROOT")
+    parser.add_argument("--out-dir", help="Corpus mode: write <id>.xml files here instead of each folder")
+    parser.add_argument("--check", action="store_true", help="Check the generated XML with xml_checker")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+
+    args = parser.parse_args()
+
+    if args.corpus:
+        results = convert_corpus(Path(args.corpus), args.out_dir, check=args.check)
+    elif args.folder:
+        results = [convert_one(Path(args.folder), args.output, check=args.check)]
+    else:
+        parser.error("folder or --corpus is required")
+
+    def blocking(result: dict) -> list:
+        return [e for e in result.get("xml_errors") or [] if e["severity"] == "blocking"]
+
+    failed = [r for r in results if r["error"] or blocking(r)]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for r in results:
+            if r["error"]:
+                print(f"❌ {r['tutorial']}: {r['error']}")
+                continue
+            print(f"{'❌' if blocking(r) else '✅'} {r['output']}")
+            for error in r.get("xml_errors") or []:
+                print(f"  {format_error(error)}")
+        print(f"\n{len(results)} tutorial(s) converted, {len(failed)} failed")
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for collapsing repeated issues into line ranges (clean_markdown.py).
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+import clean_markdown
+from clean_markdown import (
+    aggregate_issues,
+    format_json_output,
+    format_text_output,
+    generate_pr_comment,
+    validate_folder,
+)
+
+
+# Trailing whitespace on lines 3-5 and 7, two <br> tags on line 9
+STEP = "# Step\n\na   \nb   \nc   \n\nd   \n\nx<br>y<br>\n"
+
+
+@pytest.fixture
+def result(tmp_path):
+    folder = tmp_path / "tc-example"
+    folder.mkdir()
+    (folder / "step-1.md").write_text(STEP)
+    return validate_folder(str(folder), auto_fix=False)
+
+
+class TestAggregation:
+    """Repeats of a rule in a file become one record with line ranges"""
+
+    def test_runs_of_lines(self, result):
+        groups = aggregate_issues(result.issues)
+        assert [(g.rule_id, g.ranges, g.count) for g in groups] == [
+            ("HTML_TAG", [(9, 9)], 2),
+            ("TRAILING_WHITESPACE", [(3, 5), (7, 7)], 4),
+        ]
+        assert groups[1].message == "Lines 3-5, 7: Trailing whitespace detected. (4 issues)"
+        # Full detail stays available on the group
+        assert [i.line_number for i in groups[1].issues] == [3, 4, 5, 7]
+
+    def test_single_issue_keeps_its_message(self, result):
+        issue = result.issues[0]
+        group, = aggregate_issues([issue])
+        assert group.message == issue.message and group.format_lines() == str(issue.line_number)
+
+    def test_fixed_and_unfixed_are_separate(self, result):
+        issues = [i for i in result.issues if i.rule_id == "TRAILING_WHITESPACE"]
+        issues[0].fixed = True
+        assert [(g.fixed, g.ranges) for g in aggregate_issues(issues)] == [(True, [(3, 3)]), (False, [(4, 5), (7, 7)])]
+
+    def test_collapsed_while_validating(self, result):
+        folder = os.path.dirname(result.files_scanned[0])
+        compact = validate_folder(folder, auto_fix=False, expand=False)
+        assert compact.issues == [] and [g.issues for g in compact.groups] == [[], []]
+        assert [(g.rule_id, g.ranges, g.count) for g in compact.groups] == [
+            ("HTML_TAG", [(9, 9)], 2),
+            ("TRAILING_WHITESPACE", [(3, 5), (7, 7)], 4),
+        ]
+        assert format_json_output(compact) == format_json_output(result)
+        assert format_text_output(compact, use_color=False) == format_text_output(result, use_color=False)
+
+    def test_outputs(self, result):
+        records = json.loads(format_json_output(result))["issues"]
+        assert [(r["rule_id"], r["lines"], r["count"]) for r in records] == [
+            ("HTML_TAG", [[9, 9]], 2),
+            ("TRAILING_WHITESPACE", [[3, 5], [7, 7]], 4),
+        ]
+        assert len(json.loads(format_json_output(result, expand=True))["issues"]) == 6
+
+        text = format_text_output(result, use_color=False)
+        assert text.count("●") == 2 and "Found 6 issue(s)" in text
+        assert format_text_output(result, use_color=False, expand=True).count("●") == 6
+
+        assert "**step-1.md:9** - Line 9: HTML tag `<br>`" in generate_pr_comment(result, [])
+
+    def test_cli_expand(self, result, monkeypatch, capsys):
+        folder = os.path.dirname(result.files_scanned[0])
+        monkeypatch.setattr(sys, "argv", ["clean_markdown.py", folder, "--no-fix", "--json-output", "--expand"])
+        with pytest.raises(SystemExit):
+            clean_markdown.main()
+        output = json.loads(capsys.readouterr().out)
+        assert [i["line"] for i in output["issues"] if i["rule_id"] == "HTML_TAG"] == [9, 9]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
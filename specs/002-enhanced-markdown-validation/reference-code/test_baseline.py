@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""
+Unit tests for baselines of known issues (clean_markdown.py --baseline).
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+import clean_markdown
+from clean_markdown import apply_baseline, issue_fingerprint, load_baseline, validate_folder, write_baseline
+
+
+STEP = "# Step\n\nOld  text.\nMore   \n\nSame  line\nSame  line\n"
+
+
+@pytest.fixture
+def tutorial(tmp_path):
+    folder = tmp_path / "tc-example"
+    folder.mkdir()
+    (folder / "step-1.md").write_text(STEP)
+    return folder
+
+
+def scan(folder):
+    return validate_folder(str(folder), auto_fix=False)
+
+
+class TestBaseline:
+    """Known issues are suppressed; new ones are reported"""
+
+    def test_round_trip(self, tutorial, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        assert write_baseline(path, scan(tutorial)) == 4
+
+        result = apply_baseline(scan(tutorial), load_baseline(path))
+        assert result.issues == []
+        assert result.baseline_suppressed == 4
+        assert "4 known issue(s) suppressed by baseline" in result.summary
+
+    def test_survives_line_shifts_and_checkouts(self, tutorial, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        write_baseline(path, scan(tutorial))
+
+        moved = tmp_path / "elsewhere" / "tc-example"
+        moved.mkdir(parents=True)
+        (moved / "step-1.md").write_text("# Step\n\nNew<br>intro.\n\n" + STEP.split("\n", 2)[2] + "Same  line\n")
+        result = apply_baseline(scan(moved), load_baseline(path))
+
+        # The <br> and the third copy of a known line are new
+        assert [(i.rule_id, i.line_number) for i in result.issues] == [("HTML_TAG", 3), ("DOUBLE_SPACE", 10)]
+        assert (result.blocking_count, result.warning_count) == (1, 1)
+
+    def test_fingerprint(self, tutorial):
+        issue = next(i for i in scan(tutorial).issues if i.rule_id == "DOUBLE_SPACE")
+        file_key, rule_id, digest = issue_fingerprint(issue)
+        assert (file_key, rule_id, len(digest)) == ("tc-example/step-1.md", "DOUBLE_SPACE", 12)
+
+    def test_same_keys_from_inside_the_tutorial(self, tutorial, tmp_path, monkeypatch):
+        path = str(tmp_path / "baseline.json")
+        write_baseline(path, scan(tutorial))
+        monkeypatch.chdir(tutorial)
+        result = apply_baseline(scan("."), load_baseline(path))
+        assert result.issues == [] and result.baseline_suppressed == 4
+
+    def test_corpus_root_and_per_tutorial_updates(self, tutorial, tmp_path, monkeypatch, capsys):
+        other = tmp_path / "tc-other"
+        other.mkdir()
+        (other / "step-1.md").write_text("Line<br>break\n")
+        path = str(tmp_path / "baseline.json")
+        monkeypatch.chdir(tmp_path)
+        for argv in ([".", "--no-fix", "--write-baseline", path],
+                     ["tc-example", "--no-fix", "--write-baseline", path]):
+            monkeypatch.setattr(sys, "argv", ["clean_markdown.py", *argv])
+            with pytest.raises(SystemExit):
+                clean_markdown.main()
+        assert "Recorded 5 known issue(s)" in capsys.readouterr().out.split("\n")[0]
+
+        # Re-recording tc-example kept tc-other's entry
+        with open(path) as f:
+            assert sorted(json.load(f)["issues"]) == ["tc-example/step-1.md", "tc-other/step-1.md"]
+
+    def test_applied_while_validating(self, tutorial, tmp_path):
+        path = str(tmp_path / "baseline.json")
+        write_baseline(path, scan(tutorial))
+        (tutorial / "step-1.md").write_text(STEP + "Same  line\n")
+
+        # One Counter is used up across files; only the groups are kept
+        result = validate_folder(str(tutorial), auto_fix=False, baseline=load_baseline(path), expand=False)
+        assert result.issues == [] and result.baseline_suppressed == 4
+        assert [(g.rule_id, g.ranges) for g in result.groups] == [("DOUBLE_SPACE", [(8, 8)])]
+        with pytest.raises(ValueError):
+            write_baseline(path, result)
+
+    def test_rejects_other_files(self, tmp_path):
+        path = tmp_path / "snapshot.json"
+        path.write_text(json.dumps({"version": 99, "tutorials": {}}))
+        with pytest.raises(ValueError):
+            load_baseline(str(path))
+
+    def test_cli(self, tutorial, tmp_path, monkeypatch, capsys):
+        path = str(tmp_path / "baseline.json")
+        for argv in ([str(tutorial), "--no-fix", "--write-baseline", path],
+                     [str(tutorial), "--no-fix", "--baseline", path, "--json-output", "--strict"]):
+            monkeypatch.setattr(sys, "argv", ["clean_markdown.py", *argv])
+            with pytest.raises(SystemExit) as exit_info:
+                clean_markdown.main()
+            assert exit_info.value.code == 0
+        output = json.loads(capsys.readouterr().out.split("\n", 1)[1])
+        assert output["issues"] == [] and output["baseline_suppressed"] == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Unit tests for diff-scoped validation (clean_markdown.py --changed-only).
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+import clean_markdown
+from clean_markdown import (
+    changed_lines,
+    changed_windows,
+    detect_changed_issues,
+    detect_issues,
+    parse_changed_lines,
+    validate_folder,
+)
+from file_source import GitCorpus
+from git_fixtures import git
+
+
+MESSY = """# Title
+
+1. Step one
+```
+code
+```
+2. Step two  with  spaces
+   - nested
+     - deeper
+      - odd<br>
+
+Para [link](http://x)text and<br> more
+[broken
+link](http://y)
+
+```
+<br> in code
+```
+- item
+  ```bash
+  ok
+  ```
+
+End
+"""
+
+
+def on_lines(issues, first, last):
+    return [i for i in issues if i.line_number <= last and first <= i.line_number + i.match.count('\n')]
+
+
+def summary(issues):
+    return sorted((i.rule_id, i.line_number, i.message) for i in issues)
+
+
+class TestWindows:
+    """Rules run over the blocks around a change, with the same results"""
+
+    def test_matches_full_scan_for_every_line(self):
+        full = detect_issues(MESSY, "step-1.md")
+        lines = len(MESSY.split('\n'))
+        for first in range(1, lines + 1):
+            for last in (first, min(first + 3, lines)):
+                expected = on_lines(full, first, last)
+                assert summary(detect_changed_issues(MESSY, "step-1.md", [(first, last)])) == summary(expected)
+
+    def test_window_is_the_enclosing_block(self):
+        paragraphs = ["Paragraph {} line one\nline two".format(n) for n in range(500)]
+        lines = "\n\n".join(paragraphs).split('\n')
+        # Line 1000 starts paragraph 333: the window is it and its blank line
+        assert changed_windows(lines, [(1000, 1000)]) == [(999, 1002)]
+
+    def test_code_blocks_are_not_split(self):
+        lines = MESSY.split('\n')
+        # A change inside the fenced block at lines 16-18 starts at its fence and
+        # runs through the list that follows it up to the next paragraph
+        assert changed_windows(lines, [(17, 17)]) == [(15, 23)]
+
+    def test_link_broken_across_blocks(self):
+        content = "Intro\n\nSee [the\n\nguide](http://x) here.\n\nEnd\n"
+        # Line 5 starts its own block; the link begins two lines above it
+        issues = detect_changed_issues(content, "step-1.md", [(5, 5)])
+        assert [(i.rule_id, i.line_number) for i in issues] == [("LINK_BROKEN", 3)]
+        assert summary(issues) == summary(on_lines(detect_issues(content, "step-1.md"), 5, 5))
+
+    def test_parse_hunks(self):
+        diff = "\n".join([
+            "diff --git a/tc-x/step-1.md b/tc-x/step-1.md",
+            "index 7898192..82e8631 100644",
+            "--- a/tc-x/step-1.md",
+            "+++ b/tc-x/step-1.md",
+            "@@ -3 +3 @@",
+            "-old",
+            "+new",
+            "@@ -10,2 +10,4 @@ heading",
+            "+++ added line starting with ++",
+            "@@ -20,3 +21,0 @@",
+            "diff --git a/tc-x/step-2.md b/tc-x/step-2.md",
+            "deleted file mode 100644",
+            "--- a/tc-x/step-2.md",
+            "+++ /dev/null",
+            "@@ -1,5 +0,0 @@",
+        ])
+        assert parse_changed_lines(diff) == {"tc-x/step-1.md": [(3, 3), (10, 13), (21, 22)]}
+
+    def test_parse_quoted_paths(self):
+        diff = "\n".join([
+            'diff --git "a/tc x/str\\303\\266m.md" "b/tc x/str\\303\\266m.md"',
+            '--- "a/tc x/str\\303\\266m.md"\t',
+            '+++ "b/tc x/str\\303\\266m.md"\t',
+            "@@ -1 +1 @@",
+            "diff --git a/tc x/step 1.md b/tc x/step 1.md",
+            "--- a/tc x/step 1.md\t",
+            "+++ b/tc x/step 1.md\t",
+            "@@ -2 +2 @@",
+            'diff --git "a/tc-x/say \\"hi\\".md" "b/tc-x/say \\"hi\\".md"',
+            '+++ "b/tc-x/say \\"hi\\".md"',
+            "@@ -3 +3 @@",
+        ])
+        assert parse_changed_lines(diff) == {
+            "tc x/str\u00f6m.md": [(1, 1)],
+            "tc x/step 1.md": [(2, 2)],
+            'tc-x/say "hi".md': [(3, 3)],
+        }
+
+
+@pytest.fixture
+def repo(make_repo):
+    """A committed tutorial with pre-existing warnings on every step."""
+    return make_repo({f"tc-x/step-{step}.md": "# Step\n\nOld  text.\nMore   \n\nUnchanged.\n" for step in (1, 2)})
+
+
+class TestChangedOnly:
+    """Only issues the diff introduced are reported"""
+
+    def edit(self, repo):
+        (repo / "tc-x" / "step-1.md").write_text("# Step\n\nOld  text.\nMore   \n\nNew<br>line.\n")
+        (repo / "tc-x" / "step-3.md").write_text("Brand  new\n")
+
+    def test_working_tree(self, repo, monkeypatch):
+        self.edit(repo)
+        monkeypatch.chdir(repo)
+        changes = changed_lines("tc-x", "HEAD")
+        assert changes[os.path.join("tc-x", "step-1.md")] == [(6, 6)]
+
+        result = validate_folder("tc-x", source=None, changes=changes)
+        assert [(i.file_path, i.rule_id) for i in result.issues] == [
+            (os.path.join("tc-x", "step-1.md"), "HTML_TAG"),
+            (os.path.join("tc-x", "step-3.md"), "DOUBLE_SPACE"),
+        ]
+        # Unchanged files aren't read, and nothing is fixed
+        assert os.path.join("tc-x", "step-2.md") not in result.files_scanned
+        assert "<br>" in (repo / "tc-x" / "step-1.md").read_text()
+
+    def test_between_commits(self, repo):
+        self.edit(repo)
+        git(repo, "add", ".")
+        git(repo, "commit", "-q", "-m", "Edit")
+        with GitCorpus(repo) as head:
+            changes = changed_lines("./tc-x", "HEAD~1", head)
+            result = validate_folder("tc-x", source=head, changes=changes)
+        assert [(i.file_path, i.line_number) for i in result.issues] == [
+            ("tc-x/step-1.md", 6), ("tc-x/step-3.md", 1),
+        ]
+
+    def test_cli(self, repo, monkeypatch, capsys):
+        self.edit(repo)
+        monkeypatch.chdir(repo)
+        monkeypatch.setattr(sys, "argv", ["clean_markdown.py", "tc-x", "--changed-only", "HEAD", "--json-output"])
+        with pytest.raises(SystemExit) as exit_info:
+            clean_markdown.main()
+        assert exit_info.value.code == 1
+        output = capsys.readouterr().out
+        assert '"HTML_TAG"' in output and '"TRAILING_WHITESPACE"' not in output
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+Unit tests for patch output of fixes (clean_markdown.py --emit-patch).
+"""
+
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+import clean_markdown
+from clean_markdown import format_patch, patch_root, validate_folder
+from file_source import GitCorpus
+from git_fixtures import git
+
+
+STEPS = {
+    "step-1.md": "# One\n\nTrailing   \nLine<br>break\n",
+    "step-2.md": "# Two\n\nClean.\n",
+    "step-3.md": "# Three\n\nDouble  space",  # No final newline
+}
+
+
+@pytest.fixture
+def repo(make_repo):
+    return make_repo({f"tc-x/{name}": text for name, text in STEPS.items()})
+
+
+def fixed_by_validate_file(tmp_path):
+    """What the per-file writer produces, for comparison."""
+    folder = tmp_path / "copy"
+    folder.mkdir()
+    for name, text in STEPS.items():
+        (folder / name).write_text(text)
+    validate_folder(str(folder), auto_fix=True, skip_ai=True)
+    return {name: (folder / name).read_text() for name in STEPS}
+
+
+class TestEmitPatch:
+    """Fixes are collected into one patch; no file is written"""
+
+    def test_patch_applies_to_the_same_result(self, repo, tmp_path, monkeypatch):
+        monkeypatch.chdir(repo)
+        patch = {}
+        result = validate_folder("tc-x", auto_fix=True, skip_ai=True, patch=patch)
+
+        assert sorted(patch) == [os.path.join("tc-x", "step-1.md"), os.path.join("tc-x", "step-3.md")]
+        assert result.files_modified == sorted(patch)
+        assert git(repo, "status", "--porcelain") == ""
+
+        (tmp_path / "fixes.patch").write_text(format_patch(patch))
+        git(repo, "apply", "--check", str(tmp_path / "fixes.patch"))
+        git(repo, "apply", str(tmp_path / "fixes.patch"))
+        expected = fixed_by_validate_file(tmp_path)
+        assert {name: (repo / "tc-x" / name).read_text() for name in STEPS} == expected
+
+    def test_fixes_a_commit(self, repo):
+        with GitCorpus(repo) as head:
+            patch = {}
+            result = validate_folder("tc-x", auto_fix=True, skip_ai=True, source=head, patch=patch)
+        assert result.auto_fix_enabled
+        text = format_patch(patch)
+        assert text.startswith("diff --git a/tc-x/step-1.md b/tc-x/step-1.md\n--- a/tc-x/step-1.md\n")
+        assert "-Double  space\n\\ No newline at end of file\n+Double space\n\\ No newline" in text
+
+    @pytest.mark.parametrize("where", ["absolute", "inside"])
+    def test_paths_are_repository_relative(self, repo, tmp_path, monkeypatch, where):
+        folder = str(repo / "tc-x")
+        if where == "inside":
+            monkeypatch.chdir(repo / "tc-x")
+            folder = "."
+        patch = {}
+        validate_folder(folder, auto_fix=True, skip_ai=True, patch=patch)
+        text = format_patch(patch, patch_root(folder))
+        assert text.startswith("diff --git a/tc-x/step-1.md b/tc-x/step-1.md\n")
+
+        (tmp_path / "fixes.patch").write_text(text)
+        git(repo, "apply", str(tmp_path / "fixes.patch"))
+        assert "<br>" not in (repo / "tc-x" / "step-1.md").read_text()
+
+    def test_empty_when_nothing_to_fix(self):
+        assert format_patch({}) == ""
+
+    def test_cli(self, repo, monkeypatch, capsys):
+        monkeypatch.chdir(repo)
+        monkeypatch.setattr(sys, "argv", ["clean_markdown.py", "tc-x", "--no-ai-fix", "--emit-patch", "--json-output"])
+        with pytest.raises(SystemExit) as exit_info:
+            clean_markdown.main()
+        assert exit_info.value.code == 0
+        out, err = capsys.readouterr()
+        assert out.startswith("diff --git") and json.loads(err)["success"]
+        assert git(repo, "status", "--porcelain") == ""
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Unit tests for file_source.py - validating files read from git commits.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+import clean_markdown
+from clean_markdown import validate_file, validate_folder
+from file_source import BlobCache, DiskSource, GitCorpus, open_source, tutorial_files
+from git_fixtures import git
+
+
+@pytest.fixture
+def repo(make_repo):
+    """Two commits: the head fixes step-1 and leaves step-2 unchanged."""
+    repo = make_repo({
+        "tc-alpha/step-1.md": "# Alpha\n\nLine<br>break\n",
+        "tc-alpha/step-2.md": "# Two\n\nTrailing   \n",
+        "tc-alpha/sidecar.json": '{"id": "tc-alpha"}',
+    })
+    (repo / "tc-alpha" / "step-1.md").write_text("# Alpha\n\nLine break\n")
+    git(repo, "commit", "-q", "-am", "Fix step 1")
+    return repo
+
+
+@pytest.fixture(autouse=True)
+def detection_cache(monkeypatch):
+    monkeypatch.setattr(clean_markdown, "_detection_cache", {})
+
+
+class TestGitSource:
+    """Tests for validating commits without a checkout"""
+
+    def test_base_and_head_share_one_cache(self, repo):
+        with BlobCache(repo) as blobs:
+            base = open_source("HEAD~1", repo, blobs)
+            head = open_source("HEAD", repo, blobs)
+            before = validate_folder("tc-alpha", auto_fix=True, source=base)
+            after = validate_folder("./tc-alpha/", auto_fix=True, source=head)
+
+            # step-2.md is the same blob in both commits: read and checked once
+            assert blobs.stats()["reads"] == 3
+            assert len(clean_markdown._detection_cache) == 3
+
+        assert before.files_scanned == ["tc-alpha/step-1.md", "tc-alpha/step-2.md"]
+        assert [i.rule_id for i in before.issues] == ["HTML_TAG", "TRAILING_WHITESPACE"]
+        assert [i.rule_id for i in after.issues] == ["TRAILING_WHITESPACE"]
+        # Commits are never written to
+        assert not before.auto_fix_enabled and not before.files_modified
+        assert "<br>" not in (repo / "tc-alpha" / "step-1.md").read_text()
+
+    def test_missing_files_and_folders(self, repo):
+        with GitCorpus(repo) as head:
+            assert validate_folder("tc-beta", source=head).issues[0].rule_id == "FOLDER_ERROR"
+            assert validate_file("tc-alpha/step-9.md", source=head).issues[0].rule_id == "FILE_ERROR"
+
+    def test_tutorial_files(self, repo):
+        with GitCorpus(repo) as head:
+            assert [p.as_posix() for p in tutorial_files(repo, "sidecar.json", head)] == ["tc-alpha/sidecar.json"]
+        assert tutorial_files(repo, "sidecar.json") == [repo / "tc-alpha" / "sidecar.json"]
+
+
+class TestDetectionCache:
+    """Unchanged content is checked once, whichever path it is read from"""
+
+    def test_copies_name_each_file(self, tmp_path):
+        for name in ("a.md", "b.md"):
+            (tmp_path / name).write_text("Line<br>break\n")
+        first = validate_file(str(tmp_path / "a.md"), auto_fix=False)
+        second = validate_file(str(tmp_path / "b.md"), auto_fix=False)
+        assert len(clean_markdown._detection_cache) == 1
+        assert second.issues[0].file_path == str(tmp_path / "b.md")
+        assert first.issues[0] is not second.issues[0]
+
+    def test_disk_source_keeps_paths(self, tmp_path):
+        (tmp_path / "step-1.md").write_text("# One\n")
+        (tmp_path / "notes.txt").write_text("")
+        folder = str(tmp_path)
+        assert DiskSource().list_files(folder, "*.md") == [os.path.join(folder, "step-1.md")]
+
+
+def test_cli_rev(repo, monkeypatch, capsys):
+    monkeypatch.chdir(repo)
+    monkeypatch.setattr(sys, "argv", ["clean_markdown.py", "tc-alpha", "--rev", "HEAD~1", "--json-output"])
+    with pytest.raises(SystemExit) as exit_info:
+        clean_markdown.main()
+    assert exit_info.value.code == 1
+    assert '"HTML_TAG"' in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
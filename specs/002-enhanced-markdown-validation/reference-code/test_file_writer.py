@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Unit tests for file_writer.py - all-or-nothing writes of fixed files.
+"""
+
+import os
+import stat
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+import file_writer
+from clean_markdown import validate_folder
+from file_writer import WriteBatch
+
+
+def leftovers(folder):
+    return sorted(p.name for p in folder.iterdir() if p.name.startswith('.'))
+
+
+@pytest.fixture
+def files(tmp_path):
+    for name in ("a.md", "b.md", "c.md"):
+        (tmp_path / name).write_text(f"old {name}\n")
+    return tmp_path
+
+
+class TestWriteBatch:
+    """Staged files replace their targets together, or not at all"""
+
+    def test_commit_writes_changed_files_only(self, files):
+        untouched = (files / "b.md").stat().st_mtime_ns
+        with WriteBatch() as batch:
+            assert batch.write_text(files / "a.md", "new a\n")
+            assert not batch.write_text(files / "b.md", "old b.md\n")
+            assert batch.write_json(files / "d.json", {"x": 1})
+            # Nothing is replaced before the commit
+            assert (files / "a.md").read_text() == "old a.md\n"
+
+        assert batch.written == [str(files / "a.md"), str(files / "d.json")]
+        assert batch.unchanged == [str(files / "b.md")]
+        assert (files / "a.md").read_text() == "new a\n"
+        assert (files / "d.json").read_text() == '{\n  "x": 1\n}\n'
+        assert (files / "b.md").stat().st_mtime_ns == untouched
+        assert leftovers(files) == []
+
+    def test_exception_aborts(self, files):
+        with pytest.raises(RuntimeError):
+            with WriteBatch() as batch:
+                batch.write_text(files / "a.md", "new a\n")
+                raise RuntimeError("crash mid-run")
+        assert (files / "a.md").read_text() == "old a.md\n"
+        assert leftovers(files) == []
+
+    def test_failed_rename_rolls_back(self, files, monkeypatch):
+        real_replace = os.replace
+        calls = []
+
+        def failing_replace(src, dst):
+            calls.append(dst)
+            if len(calls) == 3:
+                raise OSError("disk full")
+            real_replace(src, dst)
+
+        batch = WriteBatch()
+        for name in ("a.md", "b.md", "c.md", "new.md"):
+            batch.write_text(files / name, f"new {name}\n")
+        monkeypatch.setattr(file_writer.os, "replace", failing_replace)
+        with pytest.raises(OSError):
+            batch.commit()
+        monkeypatch.setattr(file_writer.os, "replace", real_replace)
+
+        assert [(files / n).read_text() for n in ("a.md", "b.md", "c.md")] == ["old a.md\n", "old b.md\n", "old c.md\n"]
+        assert not (files / "new.md").exists()
+        assert batch.written == [] and leftovers(files) == []
+
+    @pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+    def test_keeps_file_mode(self, files):
+        os.chmod(files / "a.md", 0o644)
+        os.chmod(files / "b.md", 0o755)
+        umask = os.umask(0o022)
+        try:
+            with WriteBatch() as batch:
+                for name in ("a.md", "b.md", "new.md"):
+                    batch.write_text(files / name, "new\n")
+        finally:
+            os.umask(umask)
+        modes = [stat.S_IMODE((files / n).stat().st_mode) for n in ("a.md", "b.md", "new.md")]
+        assert modes == [0o644, 0o755, 0o644]
+
+    def test_hardlinks_are_not_written_through(self, files):
+        os.link(files / "a.md", files / "copy.md")
+        with WriteBatch() as batch:
+            batch.write_text(files / "a.md", "new a\n")
+        assert (files / "copy.md").read_text() == "old a.md\n"
+
+
+class TestValidateFolder:
+    """A folder's fixes land together"""
+
+    def test_write_error_leaves_every_file(self, files, monkeypatch):
+        for name in ("a.md", "b.md"):
+            (files / name).write_text("Trailing   \n")
+        real_write = WriteBatch.write_bytes
+
+        def failing_write(self, path, data):
+            if str(path).endswith("b.md"):
+                raise OSError("read-only file")
+            return real_write(self, path, data)
+
+        monkeypatch.setattr(WriteBatch, "write_bytes", failing_write)
+        result = validate_folder(str(files), auto_fix=True, skip_ai=True)
+
+        assert [i.file_path for i in result.issues if i.rule_id == "WRITE_ERROR"] == [str(files / "b.md")]
+        assert result.files_modified == []
+        assert (files / "a.md").read_text() == "Trailing   \n"
+        assert leftovers(files) == []
+
+    def test_fixes_are_written(self, files):
+        (files / "a.md").write_text("Trailing   \n")
+        result = validate_folder(str(files), auto_fix=True, skip_ai=True)
+        assert result.files_modified == [str(files / "a.md")]
+        assert (files / "a.md").read_text() == "Trailing\n"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for git_corpus.py - reading tutorials from git objects.
+
+Every test runs against a local bare repository, served over file:// so
+partial clones behave as they do against GitHub.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+from git_corpus import CatFile, GitCorpus, GitError, clone_corpus
+from git_fixtures import git
+
+
+IMAGE = bytes(range(256)) * 40
+
+
+@pytest.fixture
+def bare_repo(tmp_path, make_repo):
+    """Bare repository with two tutorials, tools/ and images; allows partial clones."""
+    work = make_repo({
+        "tc-alpha/sidecar.json": '{"id": "tc-alpha"}',
+        "tc-alpha/step-1.md": "# Alpha\n\nLine<br>break\n",
+        "tc-alpha/step-2.md": "# Two\n",
+        "tc-alpha/images/topology.png": IMAGE,
+        "tc-beta/sidecar.json": '{"id": "tc-beta"}',
+        "tc-beta/step-1.md": "# Beta\n",
+        "tc-beta/images/diagram.png": IMAGE[::-1],
+        "tools/clean_markdown.py": "# tool\n",
+    }, "work")
+    (work / "tc-alpha" / "step-1.md").write_text("# Alpha\n\nLine break\n")
+    git(work, "commit", "-q", "-am", "Fix tc-alpha")
+
+    bare = tmp_path / "content.git"
+    git(tmp_path, "clone", "-q", "--bare", str(work), str(bare))
+    git(bare, "config", "uploadpack.allowFilter", "true")
+    return bare
+
+
+class TestCatFile:
+    """Tests for the persistent cat-file process"""
+
+    def test_many_reads_one_process(self, bare_repo):
+        with CatFile(bare_repo) as cat:
+            assert cat.read("main:tc-beta/step-1.md") == b"# Beta\n"
+            assert cat.read("main:tc-alpha/images/topology.png") == IMAGE
+            assert cat.read("main:no-such-file") is None
+            assert cat.read("main~1:tc-alpha/step-1.md") == b"# Alpha\n\nLine<br>break\n"
+
+    def test_rejects_newlines(self, bare_repo):
+        with CatFile(bare_repo) as cat:
+            with pytest.raises(ValueError):
+                cat.read("main:a\nb")
+
+
+class TestGitCorpus:
+    """Tests for tree listing and reads from a bare repository"""
+
+    def test_listing(self, bare_repo):
+        with GitCorpus(bare_repo, "main") as corpus:
+            assert corpus.tutorials() == ["tc-alpha", "tc-beta"]
+            assert corpus.list_files("tc-alpha", "*.md") == ["tc-alpha/step-1.md", "tc-alpha/step-2.md"]
+            assert corpus.exists("tc-alpha/images") and corpus.is_dir("tc-alpha/images/")
+            assert not corpus.exists("tc-alpha/assets")
+            assert set(corpus.tutorial_trees()) == {"tc-alpha", "tc-beta"}
+
+    def test_reads_any_revision(self, bare_repo):
+        with GitCorpus(bare_repo, "main~1") as old, GitCorpus(bare_repo, "main") as new:
+            assert "<br>" in old.read_text("tc-alpha/step-1.md")
+            assert "<br>" not in new.read_text("tc-alpha/step-1.md")
+            assert old.blob_id("tc-beta/step-1.md") == new.blob_id("tc-beta/step-1.md")
+            assert old.tutorial_trees()["tc-beta"] == new.tutorial_trees()["tc-beta"]
+
+    def test_errors(self, bare_repo):
+        with pytest.raises(GitError):
+            GitCorpus(bare_repo, "no-such-branch")
+        with GitCorpus(bare_repo, "main") as corpus:
+            with pytest.raises(FileNotFoundError):
+                corpus.read_bytes("tc-alpha/step-9.md")
+
+
+class TestPartialClone:
+    """Blobless, sparse clones fetch images only when read"""
+
+    def test_sparse_checkout_has_markdown_only(self, bare_repo, tmp_path):
+        dest = clone_corpus(bare_repo.as_uri(), tmp_path / "clone")
+        checked_out = sorted(p.relative_to(dest).as_posix() for p in dest.rglob("*")
+                             if p.is_file() and ".git" not in p.parts)
+        assert checked_out == ["tc-alpha/sidecar.json", "tc-alpha/step-1.md", "tc-alpha/step-2.md",
+                               "tc-beta/sidecar.json", "tc-beta/step-1.md"]
+
+        with GitCorpus(dest) as corpus:
+            images = {corpus.blob_id("tc-alpha/images/topology.png"), corpus.blob_id("tc-beta/images/diagram.png")}
+            assert images <= corpus.missing_blobs()
+            # Existence checks come from the tree: nothing is fetched
+            assert corpus.exists("tc-alpha/images/topology.png")
+            assert images <= corpus.missing_blobs()
+
+    def test_lazy_fetch_on_read(self, bare_repo, tmp_path):
+        dest = clone_corpus(bare_repo.as_uri(), tmp_path / "clone")
+        with GitCorpus(dest) as corpus:
+            assert corpus.read_bytes("tc-alpha/images/topology.png") == IMAGE
+            assert corpus.blob_id("tc-alpha/images/topology.png") not in corpus.missing_blobs()
+            assert corpus.blob_id("tc-beta/images/diagram.png") in corpus.missing_blobs()
+
+    def test_prefetch_in_one_request(self, bare_repo, tmp_path):
+        dest = clone_corpus(bare_repo.as_uri(), tmp_path / "clone")
+        with GitCorpus(dest) as corpus:
+            images = ["tc-alpha/images/topology.png", "tc-beta/images/diagram.png"]
+            assert corpus.prefetch(images) == 2
+            assert corpus.prefetch(images) == 0
+            assert not {corpus.blob_id(p) for p in images} & corpus.missing_blobs()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
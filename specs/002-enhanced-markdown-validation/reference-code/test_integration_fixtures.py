@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Unit tests for integration_test.py fixture materialization and the
+parallel scenario runner.
+
+The key property: work directories share file data with the fixture, yet
+auto-fix never modifies the fixture itself.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+import integration_test
+from integration_test import (
+    IntegrationTest,
+    find_scenarios,
+    materialize_fixture,
+    run_parallel,
+)
+
+
+BROKEN_STEP = "# Step\n\nLine one<br>Line two\n\nSome  double  spaces here.\n"
+
+
+def make_fixture(root: Path, name: str = "fixture", rules=None) -> Path:
+    fixture = root / name
+    (fixture / "images").mkdir(parents=True)
+    (fixture / "images" / "diagram.png").write_bytes(b"\x89PNG")
+    (fixture / "step-1.md").write_text(BROKEN_STEP)
+    (fixture / "sidecar.json").write_text(json.dumps({"id": name, "files": [{"file": "step-1.md"}]}))
+    if rules is not None:
+        (fixture / "expected_rules.json").write_text(json.dumps(rules))
+    return fixture
+
+
+class TestMaterializeFixture:
+    """Tests for link-based work directory setup"""
+
+    def test_hardlinks_share_inodes(self, tmp_path):
+        fixture = make_fixture(tmp_path)
+        counts = materialize_fixture(fixture, tmp_path / "work", "hardlink")
+        assert counts == {"hardlink": 3, "copy": 0}
+        assert (tmp_path / "work" / "step-1.md").stat().st_ino == (fixture / "step-1.md").stat().st_ino
+        assert (tmp_path / "work" / "images" / "diagram.png").exists()
+
+    def test_falls_back_to_copy(self, tmp_path, monkeypatch):
+        def no_links(src, dst):
+            raise OSError("cross-device link")
+
+        monkeypatch.setitem(integration_test.LINK_FUNCTIONS, "hardlink", no_links)
+        fixture = make_fixture(tmp_path)
+        counts = materialize_fixture(fixture, tmp_path / "work", "hardlink")
+        assert counts == {"hardlink": 0, "copy": 3}
+        assert (tmp_path / "work" / "step-1.md").read_text() == BROKEN_STEP
+
+    def test_auto_mode(self, tmp_path):
+        fixture = make_fixture(tmp_path)
+        counts = materialize_fixture(fixture, tmp_path / "work")
+        assert sum(counts.values()) == 3
+
+    def test_autofix_copies_on_write(self, tmp_path):
+        fixture = make_fixture(tmp_path)
+        test = IntegrationTest(str(fixture), link_mode="hardlink", base_dir=str(tmp_path))
+        work_dir = test.setup_work_directory()
+
+        result = test.run_validation(work_dir, auto_fix=True)
+
+        assert result.files_modified
+        assert (fixture / "step-1.md").read_text() == BROKEN_STEP
+        assert (work_dir / "step-1.md").read_text() != BROKEN_STEP
+        assert (work_dir / "step-1.md").stat().st_ino != (fixture / "step-1.md").stat().st_ino
+        # Untouched files stay linked
+        assert (work_dir / "sidecar.json").stat().st_ino == (fixture / "sidecar.json").stat().st_ino
+
+
+class TestParallelRunner:
+    """Tests for running many scenarios at once"""
+
+    def test_find_scenarios(self, tmp_path):
+        make_fixture(tmp_path, "b")
+        make_fixture(tmp_path, "a")
+        (tmp_path / "not-a-fixture").mkdir()
+        assert [p.name for p in find_scenarios(tmp_path)] == ["a", "b"]
+
+    def test_run_parallel(self, tmp_path):
+        scenarios = tmp_path / "scenarios"
+        make_fixture(scenarios, "tc-pass", rules=["HTML_TAG"])
+        make_fixture(scenarios, "tc-fail", rules=["LINK_BROKEN"])
+        work_root = tmp_path / "work"
+        work_root.mkdir()
+
+        results = run_parallel(find_scenarios(scenarios), jobs=2, base_dir=str(work_root))
+
+        by_name = {Path(r["fixture"]).name: r for r in results}
+        assert by_name["tc-pass"]["passed"]
+        assert not by_name["tc-fail"]["passed"]
+        assert by_name["tc-fail"]["tests"]["detection"] is False
+        assert "Detection test FAILED" in by_name["tc-fail"]["log"]
+        # Fixtures untouched, work directories removed
+        assert (scenarios / "tc-pass" / "step-1.md").read_text() == BROKEN_STEP
+        assert list(work_root.iterdir()) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
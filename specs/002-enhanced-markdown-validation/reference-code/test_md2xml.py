@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Unit tests for md2xml.py - the native Markdown to Solomon XML converter.
+
+Well-formed markdown must produce well-formed XML, and the patterns that
+break tutorial_md2xml must produce the same tag mismatches.
+"""
+
+import io
+import json
+import sys
+import os
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+from md2xml import (
+    StepConverter,
+    XmlWriter,
+    convert_corpus,
+    convert_tutorial_file,
+)
+
+
+def convert(markdown: str) -> str:
+    stream = io.StringIO()
+    writer = XmlWriter(stream)
+    writer.start("Step")
+    StepConverter(writer).convert(markdown)
+    writer.close()
+    return stream.getvalue()
+
+
+def parse(markdown: str) -> ET.Element:
+    return ET.fromstring(convert(markdown))
+
+
+def mismatch_line(markdown: str):
+    """Output line of the first XML error, or None if well-formed."""
+    try:
+        ET.fromstring(convert(markdown))
+    except ET.ParseError as e:
+        return e.position[0]
+    return None
+
+
+def make_tutorial(root: Path, name: str, steps: dict) -> Path:
+    folder = root / name
+    folder.mkdir()
+    for file_name, text in steps.items():
+        (folder / file_name).write_text(text)
+    (folder / "sidecar.json").write_text(json.dumps({
+        "id": name,
+        "files": [{"file": f, "label": f.split(".")[0]} for f in steps],
+    }))
+    return folder
+
+
+class TestXmlWriter:
+    """Tests for the incremental writer"""
+
+    def test_escaping_and_lines(self):
+        stream = io.StringIO()
+        writer = XmlWriter(stream)
+        writer.declaration()
+        writer.start("Tutorial", {"id": 'a"b'})
+        writer.start("ParaBlock")
+        writer.text("x < y & z")
+        writer.end()
+        assert writer.line == 3
+        writer.close()
+        root = ET.fromstring(stream.getvalue())
+        assert root.get("id") == 'a"b'
+        assert root.find("ParaBlock").text == "x < y & z"
+
+    def test_end_with_other_name(self):
+        stream = io.StringIO()
+        writer = XmlWriter(stream)
+        writer.start("ItemPara")
+        writer.end("ParaBlock")
+        assert stream.getvalue().strip() == "<ItemPara></ParaBlock>"
+
+
+class TestBlocks:
+    """Tests for block structure"""
+
+    def test_headings_paragraphs_code(self):
+        step = parse("# Title\n\nSome **bold** and `code`.\nSecond line.\n\n```bash\necho <hi> && ls\n```\n")
+        assert [e.tag for e in step] == ["Heading", "ParaBlock", "Code"]
+        assert step[0].get("level") == "1"
+        assert step[1].find("Bold").text == "bold"
+        assert step[1].find("InlineCode").text == "code"
+        assert step[2].get("language") == "bash"
+        assert step[2].text == "echo <hi> && ls"
+
+    def test_nested_list(self):
+        step = parse("- one\n  - sub a\n  - sub b\n- two\n\nAfter.\n")
+        block = step.find("ItemBlock")
+        assert [i.find("ItemPara").text for i in block.findall("Item")] == ["one", "two"]
+        sub = block.find("Item/SubList")
+        assert [i.find("ItemPara").text for i in sub.findall("Item")] == ["sub a", "sub b"]
+        assert step[-1].tag == "ParaBlock"
+
+    def test_ordered_list_and_continuation(self):
+        step = parse("1. First\n   continued\n2. Second\n")
+        block = step.find("ItemBlock")
+        assert block.get("type") == "ordered"
+        assert block.find("Item/ItemPara").text == "First\ncontinued"
+
+    def test_images_and_links(self):
+        step = parse("![Topology](images/topo.png)\n\nSee [docs](https://cisco.com).\n")
+        assert step[0].tag == "Image" and step[0].get("src") == "images/topo.png"
+        assert step[1].find("Link").get("href") == "https://cisco.com"
+
+    def test_list_like_lines_in_code(self):
+        step = parse("```\n- not a list\n1. nor this\n```\n")
+        assert [e.tag for e in step] == ["Code"]
+
+
+class TestPredictedFailures:
+    """Patterns that break tutorial_md2xml break this converter the same way"""
+
+    def test_br_tag(self):
+        assert mismatch_line("Download the<br>\nfile here.\n") is not None
+
+    def test_escaped_br_is_fine(self):
+        assert mismatch_line("Use `<br>` in HTML.\n") is None
+
+    def test_bare_ampersand(self):
+        assert mismatch_line("Cisco & friends\n") is not None
+        assert mismatch_line("Cisco &amp; friends\n") is None
+
+    @pytest.mark.parametrize("markdown", [
+        "- **Hub:** The main device\n",
+        "- First item\n\n- Second item\n",
+        "- [DMVPN YAML File](./assets/DMVPN.yaml)\n",
+        "1. First step\n\nExplanation.\n\n4. Fourth step\n",
+    ])
+    def test_item_para_mismatch(self, markdown):
+        assert mismatch_line(markdown) is not None
+        assert "</ParaBlock>" in convert(markdown)
+
+    @pytest.mark.parametrize("markdown", [
+        "- Hub: The main device\n",
+        "- First item\n- Second item\n",
+        "- [Cisco](https://cisco.com) docs\n",
+        "1. First\n2. Second\n3. Third\n",
+    ])
+    def test_fixed_patterns_are_wellformed(self, markdown):
+        assert mismatch_line(markdown) is None
+
+
+class TestTutorialConversion:
+    """Tests for tutorial and corpus conversion"""
+
+    def test_steps_in_sidecar_order(self, tmp_path):
+        folder = make_tutorial(tmp_path, "tc-one", {"step-2.md": "# Two\n", "step-1.md": "# One\n"})
+        output = convert_tutorial_file(folder)
+        assert output == folder / "data.xml"
+        root = ET.parse(output).getroot()
+        assert root.get("id") == "tc-one"
+        assert [s.get("file") for s in root.findall("Step")] == ["step-2.md", "step-1.md"]
+
+    def test_corpus_with_check(self, tmp_path):
+        make_tutorial(tmp_path, "tc-good", {"step-1.md": "# Fine\n\n- a\n- b\n"})
+        make_tutorial(tmp_path, "tc-bad", {"step-1.md": "# Broken\n\nLine<br>break\n"})
+        results = {r["tutorial"]: r for r in convert_corpus(tmp_path, tmp_path / "out", check=True)}
+
+        assert results["tc-good"]["xml_errors"] == []
+        assert [e["type"] for e in results["tc-bad"]["xml_errors"]] == ["solomon_lint", "xml_error"]
+        assert Path(results["tc-bad"]["output"]) == tmp_path / "out" / "tc-bad.xml"
+        assert (tmp_path / "out" / "tc-bad.xml.map").exists()
+
+    def test_unreadable_sidecar_reported(self, tmp_path):
+        (tmp_path / "tc-broken").mkdir()
+        (tmp_path / "tc-broken" / "sidecar.json").write_text("{")
+        results = convert_corpus(tmp_path)
+        assert results[0]["error"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
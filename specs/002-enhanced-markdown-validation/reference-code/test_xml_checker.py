@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Unit tests for xml_checker.py - streaming Solomon XML checks and source maps.
+
+Tutorials are converted with md2xml.py so every error can be traced back
+to the markdown line that caused it.
+"""
+
+import json
+import sys
+import os
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
+
+from md2xml import convert_tutorial_file
+from xml_checker import SourceMap, check_xml, source_map_path
+
+
+def make_tutorial(root: Path, steps: dict, name: str = "tc-check") -> Path:
+    folder = root / name
+    folder.mkdir()
+    for file_name, text in steps.items():
+        (folder / file_name).write_text(text)
+    (folder / "sidecar.json").write_text(json.dumps({
+        "id": name,
+        "files": [{"file": f} for f in steps],
+    }))
+    return folder
+
+
+def check_markdown(tmp_path: Path, steps: dict) -> list:
+    return check_xml(convert_tutorial_file(make_tutorial(tmp_path, steps)))
+
+
+class TestSourceMap:
+    """Tests for the line mapping written during conversion"""
+
+    def test_lookup_spans(self):
+        source_map = SourceMap()
+        source_map.begin_file("step-1.md")
+        source_map.add(3, 1)
+        source_map.add(5, 10, span=3)
+        source_map.begin_file("step-2.md")
+        source_map.add(20, 4)
+
+        assert source_map.lookup(1) is None
+        assert source_map.lookup(4) == ("step-1.md", 1)
+        assert source_map.lookup(6) == ("step-1.md", 11)
+        assert source_map.lookup(9) == ("step-1.md", 12)
+        assert source_map.lookup(25) == ("step-2.md", 4)
+
+    def test_round_trip(self, tmp_path):
+        folder = make_tutorial(tmp_path, {"step-1.md": "# One\n\nText\n"})
+        output = convert_tutorial_file(folder)
+        source_map = SourceMap.load(source_map_path(output))
+        assert source_map.files == ["step-1.md"]
+        lines = output.read_text().splitlines()
+        paragraph = next(n for n, line in enumerate(lines, 1) if "<ParaBlock>" in line)
+        assert source_map.lookup(paragraph) == ("step-1.md", 3)
+
+
+class TestWellFormedness:
+    """Syntax errors map back to the step file and line"""
+
+    def test_clean_tutorial(self, tmp_path):
+        assert check_markdown(tmp_path, {"step-1.md": "# Title\n\n- one\n- two\n\nText.\n"}) == []
+
+    def test_item_para_mismatch(self, tmp_path):
+        errors = check_markdown(tmp_path, {
+            "step-1.md": "# Intro\n\nFine.\n",
+            "step-2.md": "# Setup\n\nYou need:\n\n- Router\n- **Hub:** The main device\n",
+        })
+        assert len(errors) == 1
+        error = errors[0]
+        assert error["type"] == "xml_error" and error["severity"] == "blocking"
+        assert error["message"].startswith("Opening and ending tag mismatch: ItemPara line ")
+        assert error["message"].endswith(" and ParaBlock")
+        assert (error["file"], error["line"]) == ("tc-check/step-2.md", 6)
+        assert "fix_suggestion" in error
+
+    def test_br_in_multiline_paragraph(self, tmp_path):
+        errors = check_markdown(tmp_path, {"step-1.md": "# T\n\nFirst line\nDownload the<br>\nfile here.\n"})
+        # The unclosed <br> is also an unknown element; the syntax error comes last
+        assert [e["type"] for e in errors] == ["solomon_lint", "xml_error"]
+        errors = errors[1:]
+        assert errors[0]["message"].startswith("Opening and ending tag mismatch: br line ")
+        # expat reports the error at </ParaBlock>, which closes the last paragraph line
+        assert errors[0]["line"] == 5
+        assert "HTML" in errors[0]["fix_suggestion"]
+
+    def test_bare_ampersand(self, tmp_path):
+        errors = check_markdown(tmp_path, {"step-1.md": "# T\n\nCisco & friends\n"})
+        assert len(errors) == 1
+        assert (errors[0]["type"], errors[0]["line"]) == ("xml_error", 3)
+        assert "&amp;" in errors[0]["fix_suggestion"]
+
+    def test_without_source_map(self, tmp_path):
+        xml_path = tmp_path / "plain.xml"
+        xml_path.write_text("<Tutorial>\n<Step>\n<ParaBlock>x</ItemPara>\n</Step>\n</Tutorial>\n")
+        errors = check_xml(xml_path)
+        assert errors[0]["xml_line"] == 3
+        assert "file" not in errors[0]
+
+
+class TestNestingRules:
+    """Well-formed XML that Solomon still rejects"""
+
+    def test_code_in_list_item(self, tmp_path):
+        errors = check_markdown(tmp_path, {"step-1.md": "1. Run this:\n\n    ```\n    show version\n    ```\n"})
+        assert [(e["type"], e["severity"], e["line"]) for e in errors] == [("solomon_lint", "warning", 4)]
+        assert "Code" in errors[0]["message"]
+
+    def test_self_closing_html(self, tmp_path):
+        errors = check_markdown(tmp_path, {"step-1.md": "Line one<br/>Line two\n"})
+        assert errors[0]["message"] == "unknown element: br"
+
+    def test_streams_large_document(self, tmp_path):
+        steps = {f"step-{i}.md": "# Step\n\n" + "- item\n" * 2000 for i in range(1, 6)}
+        assert check_markdown(tmp_path, steps) == []
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,282 @@
+#!/usr/bin/env python3
+"""
+Streaming Solomon XML Checker
+
+Checks a converted tutorial (data.xml) for well-formedness and for the
+Solomon nesting rules, and maps every failure back to the step file and
+line that produced it. The document is parsed with expat in chunks and
+only the stack of open elements is kept, so memory stays constant
+regardless of tutorial size.
+
+Locations come from the source map md2xml.py writes next to its output
+(`data.xml.map`). Without a map, errors carry only the XML position.
+
+Errors are emitted as ValidationError dicts (004-pr-comment-enhancements
+data model): `xml_error` for well-formedness failures (blocking) and
+`solomon_lint` for nesting problems (warning).
+
+Usage:
+    python xml_checker.py <data.xml> [<data.xml> ...] [--json]
+"""
+
+import argparse
+import bisect
+import json
+import re
+import sys
+import xml.parsers.expat
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+
+SOURCE = "xml_check"
+
+# =============================================================================
+# Source Map
+# =============================================================================
+
+class SourceMap:
+    """
+    Output line to (step file, source line) mapping for one XML document.
+
+    Each entry covers `span` consecutive XML lines that advance one source
+    line per XML line (paragraph text, code). Lines past the span map to
+    the last line of the entry, which is where closing tags end up.
+    """
+
+    VERSION = 1
+
+    def __init__(self, files: Optional[List[str]] = None, mappings: Optional[List[list]] = None):
+        self.files: List[str] = files or []
+        self.mappings: List[list] = mappings or []  # [xml_line, file_index, source_line, span]
+        self._xml_lines: Optional[List[int]] = None
+
+    def begin_file(self, name: str):
+        """Subsequent entries belong to step file `name`."""
+        self.files.append(name)
+
+    def add(self, xml_line: int, source_line: int, span: int = 1):
+        entry = [xml_line, len(self.files) - 1, source_line, max(span, 1)]
+        if self.mappings and self.mappings[-1][0] == xml_line:
+            self.mappings[-1] = entry
+        else:
+            self.mappings.append(entry)
+        self._xml_lines = None
+
+    def lookup(self, xml_line: int) -> Optional[Tuple[str, int]]:
+        """(step file, source line) for an XML line, or None before the first step."""
+        if self._xml_lines is None:
+            self._xml_lines = [m[0] for m in self.mappings]
+        index = bisect.bisect_right(self._xml_lines, xml_line) - 1
+        if index < 0:
+            return None
+        start, file_index, source_line, span = self.mappings[index]
+        return self.files[file_index], source_line + min(xml_line - start, span - 1)
+
+    def save(self, path: Path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"version": self.VERSION, "files": self.files, "mappings": self.mappings},
+                      f, separators=(",", ":"))
+
+    @classmethod
+    def load(cls, path: Path) -> "SourceMap":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != cls.VERSION:
+            raise ValueError(f"Unsupported source map version: {data.get('version')}")
+        return cls(data["files"], data["mappings"])
+
+
+def source_map_path(xml_path: Path) -> Path:
+    return Path(str(xml_path) + ".map")
+
+
+# =============================================================================
+# Solomon Nesting Rules
+# =============================================================================
+
+INLINE = {"Bold", "Italic", "InlineCode", "Link", "Image"}
+
+ALLOWED_CHILDREN: Dict[str, set] = {
+    "Tutorial": {"Step"},
+    "Step": {"Heading", "ParaBlock", "ItemBlock", "Code", "Image"},
+    "ItemBlock": {"Item"},
+    "SubList": {"Item"},
+    "Item": {"ItemPara", "SubList", "Image"},
+    "ParaBlock": INLINE,
+    "ItemPara": INLINE,
+    "Heading": INLINE - {"Image"},
+    "Link": INLINE - {"Link"},
+    "Bold": INLINE,
+    "Italic": INLINE,
+    "InlineCode": set(),
+    "Code": set(),
+    "Image": set(),
+}
+
+ROOT_ELEMENT = "Tutorial"
+
+FIX_SUGGESTIONS = {
+    ("ItemPara", "ParaBlock"): "Simplify the list item: remove leading bold text and local file links, "
+                               "remove blank lines between items, and number ordered lists sequentially",
+    ("br", None): "Remove HTML tags; use a blank line for a paragraph break",
+    ("Code", "Item"): "Move the code block out of the list; Solomon cannot render code inside list items",
+    ("Item", None): "Check list indentation; nested lists must use consistent indentation",
+    ("SubList", None): "Check list indentation; nested lists must use consistent indentation",
+    ("entity", None): "Escape `&` as `&amp;`",
+}
+
+HTML_ELEMENTS = {"br", "p", "div", "span", "hr", "img", "b", "i", "a", "sup", "sub", "code", "pre", "table"}
+
+# expat points at the end tag's name (column offsets are in bytes)
+END_TAG_PATTERN = re.compile(r'(?:</)?([\w:.-]+)')
+
+
+def fix_suggestion(opened: str, found: Optional[str]) -> Optional[str]:
+    if opened in HTML_ELEMENTS or found in HTML_ELEMENTS:
+        return FIX_SUGGESTIONS[("br", None)]
+    return FIX_SUGGESTIONS.get((opened, found)) or FIX_SUGGESTIONS.get((opened, None))
+
+
+# =============================================================================
+# Checker
+# =============================================================================
+
+def read_line(path: Path, line_number: int) -> bytes:
+    """Read one line without loading the whole file."""
+    with open(path, "rb") as f:
+        for number, line in enumerate(f, 1):
+            if number == line_number:
+                return line.rstrip(b"\n")
+    return b""
+
+
+class XmlChecker:
+    """Expat handlers for one document; keeps only the open-element stack."""
+
+    def __init__(self, xml_path: Path, source_map: Optional[SourceMap] = None, tutorial: str = ""):
+        self.xml_path = Path(xml_path)
+        self.source_map = source_map
+        self.tutorial = tutorial
+        self.stack: List[Tuple[str, int]] = []
+        self.errors: List[dict] = []
+        self.parser = xml.parsers.expat.ParserCreate()
+        self.parser.StartElementHandler = self.start_element
+        self.parser.EndElementHandler = self.end_element
+
+    def error(self, error_type: str, severity: str, message: str, xml_line: int,
+              column: Optional[int] = None, suggestion: Optional[str] = None):
+        error = {
+            "type": error_type,
+            "source": SOURCE,
+            "message": message,
+            "severity": severity,
+            "xml_line": xml_line,
+        }
+        if column is not None:
+            error["column"] = column + 1
+        location = self.source_map.lookup(xml_line) if self.source_map else None
+        if location:
+            step_file, line = location
+            error["file"] = f"{self.tutorial}/{step_file}" if self.tutorial else step_file
+            error["line"] = line
+        if suggestion:
+            error["fix_suggestion"] = suggestion
+        self.errors.append(error)
+
+    def start_element(self, name: str, attrs: dict):
+        line = self.parser.CurrentLineNumber
+        if self.stack:
+            parent = self.stack[-1][0]
+            allowed = ALLOWED_CHILDREN.get(parent)
+            if name not in ALLOWED_CHILDREN:
+                self.error("solomon_lint", "warning", f"unknown element: {name}", line,
+                           self.parser.CurrentColumnNumber, fix_suggestion(name, None))
+            elif allowed is not None and name not in allowed:
+                self.error("solomon_lint", "warning", f"element {name} not allowed in {parent}", line,
+                           self.parser.CurrentColumnNumber, fix_suggestion(name, parent))
+        elif name != ROOT_ELEMENT:
+            self.error("solomon_lint", "warning", f"unexpected root element: {name}", line)
+        self.stack.append((name, line))
+
+    def end_element(self, name: str):
+        self.stack.pop()
+
+    def syntax_error(self, e: xml.parsers.expat.ExpatError):
+        message = xml.parsers.expat.ErrorString(e.code)
+        suggestion = None
+        if e.code == xml.parsers.expat.errors.codes[xml.parsers.expat.errors.XML_ERROR_TAG_MISMATCH]:
+            rest = read_line(self.xml_path, e.lineno)[e.offset:].decode("utf-8", "replace")
+            match = END_TAG_PATTERN.match(rest)
+            found = match.group(1) if match else "?"
+            if self.stack:
+                opened, opened_line = self.stack[-1]
+                message = f"Opening and ending tag mismatch: {opened} line {opened_line} and {found}"
+                suggestion = fix_suggestion(opened, found)
+        elif e.code in (
+            xml.parsers.expat.errors.codes[xml.parsers.expat.errors.XML_ERROR_INVALID_TOKEN],
+            xml.parsers.expat.errors.codes[xml.parsers.expat.errors.XML_ERROR_UNDEFINED_ENTITY],
+        ):
+            suggestion = FIX_SUGGESTIONS[("entity", None)]
+        self.error("xml_error", "blocking", message, e.lineno, e.offset, suggestion)
+
+    def run(self) -> List[dict]:
+        try:
+            with open(self.xml_path, "rb") as f:
+                self.parser.ParseFile(f)
+        except xml.parsers.expat.ExpatError as e:
+            self.syntax_error(e)
+        return self.errors
+
+
+def check_xml(xml_path: Path, source_map: Optional[SourceMap] = None, tutorial: Optional[str] = None) -> List[dict]:
+    """
+    Check one XML file; return ValidationError dicts.
+
+    The source map defaults to `<xml_path>.map` when present, and the
+    tutorial name (prefix for `file`) to the map's parent folder.
+    """
+    xml_path = Path(xml_path)
+    map_path = source_map_path(xml_path)
+    if source_map is None and map_path.exists():
+        source_map = SourceMap.load(map_path)
+    if tutorial is None:
+        tutorial = xml_path.parent.name if xml_path.name == "data.xml" else xml_path.stem
+    return XmlChecker(xml_path, source_map, tutorial).run()
+
+
+# =============================================================================
+# CLI
+# =============================================================================
+
+def format_error(error: dict) -> str:
+    location = f"{error['file']}:{error['line']}" if "file" in error else f"-:{error['xml_line']}"
+    text = f"{location}: {error['severity'].upper()}: {error['message']}"
+    if error.get("fix_suggestion"):
+        text += f"\n    Fix: {error['fix_suggestion']}"
+    return text
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check converted Solomon XML and map errors to markdown")
+    parser.add_argument("xml_files", nargs="+", help="XML files produced by md2xml.py")
+    parser.add_argument("--json", action="store_true", help="Output ValidationError JSON")
+
+    args = parser.parse_args()
+
+    results = {path: check_xml(Path(path)) for path in args.xml_files}
+    blocking = sum(1 for errors in results.values() for e in errors if e["severity"] == "blocking")
+
+    if args.json:
+        print(json.dumps([e for errors in results.values() for e in errors], indent=2))
+    else:
+        for path, errors in results.items():
+            print(f"{'❌' if errors else '✅'} {path}")
+            for error in errors:
+                print(f"  {format_error(error)}")
+
+    sys.exit(1 if blocking else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,3 @@
+"""Shared fixtures for the reference-code tests (git_fixtures.py lives with the 002 tools)."""
+
+pytest_plugins = ["git_fixtures"]
@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+Reading-time estimator for sidecar.json step durations.
+
+Step durations are hand-entered or split evenly when a tutorial is created,
+so they often don't reflect the content. This tool estimates minutes per
+step from four features counted in one pass over each step's markdown:
+
+- prose words (outside code blocks)
+- code-block lines
+- commands (code lines in shell blocks, or lines starting with a prompt)
+- images
+
+    minutes = intercept + words*w + code_lines*c + commands*k + images*i
+
+The coefficients can be calibrated by a least-squares fit over the whole
+corpus (NumPy when installed, otherwise the normal equations in plain
+Python). Steps whose declared duration is far from the estimate are flagged.
+
+Usage:
+    # Check one tutorial with the default (or a saved) model
+    python tools/duration_estimator.py tc-example
+    python tools/duration_estimator.py tc-example --model tools/duration_model.json
+
+    # Calibrate over the corpus and save the model
+    python tools/duration_estimator.py /path/to/repo --calibrate --save-model tools/duration_model.json
+
+    # Flag steps across the whole corpus
+    python tools/duration_estimator.py /path/to/repo --json
+
+Exit codes:
+    0 - No steps flagged (or calibration succeeded)
+    1 - Steps flagged
+    2 - Error (folder not found, not enough data to calibrate, etc.)
+"""
+
+import argparse
+import json
+import re
+import sys
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from sidecar_model import load_sidecar
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
+
+FEATURES = ('intercept', 'words', 'code_lines', 'commands', 'images')
+
+# Uncalibrated defaults: two minutes of per-step overhead, ~200 wpm reading,
+# a few seconds per code line, a minute per command to run and check it,
+# a quarter minute per screenshot.
+DEFAULT_COEFFICIENTS = {
+    'intercept': 2.0,
+    'words': 0.005,
+    'code_lines': 0.05,
+    'commands': 1.0,
+    'images': 0.25,
+}
+
+DEFAULT_TOLERANCE = 2.0   # flag when declared/estimated is off by this factor
+MIN_DIFF_MINUTES = 2.0    # ...and by at least this many minutes
+
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)\s*([\w+-]*)')
+IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\([^)]*\)')
+LINK_TARGET_PATTERN = re.compile(r'\]\([^)]*\)')
+WORD_PATTERN = re.compile(r"[A-Za-z0-9][\w'-]*")
+# Shell prompt ($ ...), PowerShell (PS C:\> ...) or IOS (Router#, Switch(config)#)
+PROMPT_PATTERN = re.compile(r'^\s*(?:\$|PS [^>]*>|[\w.-]+(?:\([\w-]+\))?[#>])\s*\S')
+
+SHELL_LANGUAGES = {'bash', 'sh', 'shell', 'console', 'zsh', 'powershell', 'ps', 'cmd', 'terminal'}
+
+
+@dataclass
+class StepFeatures:
+    """Content features of one step's markdown."""
+    words: int = 0
+    code_lines: int = 0
+    commands: int = 0
+    images: int = 0
+
+    def vector(self) -> List[float]:
+        """Row of the design matrix, in FEATURES order."""
+        return [1.0, self.words, self.code_lines, self.commands, self.images]
+
+
+def extract_features(text: str) -> StepFeatures:
+    """Count words, code lines, commands and images in one pass over the lines."""
+    features = StepFeatures()
+    in_code = False
+    shell_block = False
+
+    for line in text.splitlines():
+        fence = FENCE_PATTERN.match(line)
+        if fence:
+            if in_code:
+                in_code = False
+            else:
+                in_code = True
+                shell_block = fence.group(2).lower() in SHELL_LANGUAGES
+            continue
+
+        if in_code:
+            if line.strip():
+                features.code_lines += 1
+                if shell_block or PROMPT_PATTERN.match(line):
+                    features.commands += 1
+            continue
+
+        images = IMAGE_PATTERN.findall(line)
+        if images:
+            features.images += len(images)
+            line = IMAGE_PATTERN.sub(' ', line)
+        features.words += len(WORD_PATTERN.findall(LINK_TARGET_PATTERN.sub(']', line)))
+
+    return features
+
+
+def estimate_minutes(features: StepFeatures, coefficients: Dict[str, float]) -> float:
+    """Apply the linear model; never below zero."""
+    value = sum(coefficients[name] * x for name, x in zip(FEATURES, features.vector()))
+    return max(value, 0.0)
+
+
+# =============================================================================
+# Calibration
+# =============================================================================
+
+def _solve_normal_equations(rows: List[List[float]], targets: List[float]) -> List[float]:
+    """Least squares via (X^T X) b = X^T y with Gaussian elimination."""
+    n = len(rows[0])
+    xtx = [[sum(r[i] * r[j] for r in rows) for j in range(n)] for i in range(n)]
+    xty = [sum(r[i] * y for r, y in zip(rows, targets)) for i in range(n)]
+
+    # Augmented matrix, partial pivoting
+    m = [xtx[i] + [xty[i]] for i in range(n)]
+    for col in range(n):
+        pivot = max(range(col, n), key=lambda r: abs(m[r][col]))
+        if abs(m[pivot][col]) < 1e-9:
+            raise ValueError("Not enough variation in the data to fit every coefficient")
+        m[col], m[pivot] = m[pivot], m[col]
+        for r in range(col + 1, n):
+            factor = m[r][col] / m[col][col]
+            for c in range(col, n + 1):
+                m[r][c] -= factor * m[col][c]
+
+    solution = [0.0] * n
+    for i in reversed(range(n)):
+        solution[i] = (m[i][n] - sum(m[i][j] * solution[j] for j in range(i + 1, n))) / m[i][i]
+    return solution
+
+
+def fit_coefficients(features: List[StepFeatures], minutes: List[float]) -> Dict[str, float]:
+    """
+    Least-squares fit of the model to declared step durations.
+
+    Raises ValueError if there are fewer steps than coefficients or the
+    features don't vary enough (e.g. no step has an image).
+    """
+    if len(features) < len(FEATURES):
+        raise ValueError(f"Need at least {len(FEATURES)} steps to calibrate, got {len(features)}")
+
+    rows = [f.vector() for f in features]
+    if HAS_NUMPY:
+        x = np.array(rows, dtype=float)
+        y = np.array(minutes, dtype=float)
+        solution, _, rank, _ = np.linalg.lstsq(x, y, rcond=None)
+        if rank < len(FEATURES):
+            raise ValueError("Not enough variation in the data to fit every coefficient")
+        solution = solution.tolist()
+    else:
+        solution = _solve_normal_equations(rows, list(minutes))
+
+    return dict(zip(FEATURES, solution))
+
+
+def fit_quality(features: List[StepFeatures], minutes: List[float],
+                coefficients: Dict[str, float]) -> dict:
+    """R^2 and mean absolute error of the model on the given steps."""
+    estimates = [estimate_minutes(f, coefficients) for f in features]
+    mean = sum(minutes) / len(minutes)
+    ss_res = sum((y - e) ** 2 for y, e in zip(minutes, estimates))
+    ss_tot = sum((y - mean) ** 2 for y in minutes)
+    return {
+        'r_squared': round(1 - ss_res / ss_tot, 3) if ss_tot else None,
+        'mean_abs_error_minutes': round(sum(abs(y - e) for y, e in zip(minutes, estimates)) / len(minutes), 2)
+    }
+
+
+# =============================================================================
+# Tutorials
+# =============================================================================
+
+def load_steps(folder: Path) -> List[Tuple[str, float, StepFeatures]]:
+    """(file, declared minutes, features) for each step listed in sidecar.json."""
+    sidecar = load_sidecar(Path(folder) / 'sidecar.json')
+    steps = []
+    for entry in sidecar.files:
+        md_path = Path(folder) / entry.file
+        if not md_path.exists():
+            continue
+        text = md_path.read_text(encoding='utf-8', errors='replace')
+        steps.append((entry.file, entry.seconds / 60, extract_features(text)))
+    return steps
+
+
+def check_tutorial(folder: Path, coefficients: Dict[str, float],
+                   tolerance: float = DEFAULT_TOLERANCE) -> List[dict]:
+    """Estimate every step; flag those whose declared duration is far off."""
+    results = []
+    for file_name, declared, features in load_steps(folder):
+        estimated = estimate_minutes(features, coefficients)
+        low, high = sorted((declared, estimated))
+        flagged = high - low >= MIN_DIFF_MINUTES and (low == 0 or high / low > tolerance)
+        results.append({
+            'tutorial': Path(folder).name,
+            'file': file_name,
+            'declared_minutes': round(declared, 1),
+            'estimated_minutes': round(estimated, 1),
+            'flagged': flagged,
+            'features': asdict(features)
+        })
+    return results
+
+
+def find_tutorials(path: Path) -> List[Path]:
+    """A tutorial folder, or every tc-* folder with a sidecar under a repo root."""
+    path = Path(path)
+    if (path / 'sidecar.json').exists():
+        return [path]
+    return [p.parent for p in sorted(path.glob('tc-*/sidecar.json'))]
+
+
+def calibrate_corpus(folders: List[Path]) -> dict:
+    """
+    Fit the model to every step with a declared duration.
+
+    Returns the coefficients plus a calibration report.
+    """
+    features = []
+    minutes = []
+    for folder in folders:
+        for _, declared, step_features in load_steps(folder):
+            if declared > 0:
+                features.append(step_features)
+                minutes.append(declared)
+
+    coefficients = fit_coefficients(features, minutes)
+    report = {
+        'tutorials': len(folders),
+        'steps': len(features),
+        'coefficients': {k: round(v, 5) for k, v in coefficients.items()},
+        'backend': 'numpy' if HAS_NUMPY else 'python'
+    }
+    report.update(fit_quality(features, minutes, coefficients))
+    return report
+
+
+def load_model(path: Optional[Path]) -> Dict[str, float]:
+    """Coefficients from a saved model file, or the defaults."""
+    if not path:
+        return dict(DEFAULT_COEFFICIENTS)
+    with open(path) as f:
+        data = json.load(f)
+    coefficients = data.get('coefficients', data)
+    return {name: float(coefficients[name]) for name in FEATURES}
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Estimate step durations from content and flag mismatches",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("path", type=Path, help="Tutorial folder or repo root with tc-* folders")
+    parser.add_argument("--model", type=Path, help="Saved model (coefficients) to use")
+    parser.add_argument("--calibrate", action="store_true", help="Fit coefficients over all tutorials found")
+    parser.add_argument("--save-model", type=Path, help="With --calibrate: write the fitted model here")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Flag steps off by more than this factor (default: 2.0)")
+    parser.add_argument("--json", action="store_true", help="Output as JSON")
+
+    args = parser.parse_args()
+
+    if not args.path.exists():
+        print(f"Error: Path not found: {args.path}", file=sys.stderr)
+        sys.exit(2)
+
+    folders = find_tutorials(args.path)
+    if not folders:
+        print(f"Error: No tutorials found in {args.path}", file=sys.stderr)
+        sys.exit(2)
+
+    try:
+        if args.calibrate:
+            report = calibrate_corpus(folders)
+            if args.save_model:
+                with open(args.save_model, 'w') as f:
+                    json.dump(report, f, indent=2)
+                    f.write('\n')
+            if args.json:
+                print(json.dumps(report, indent=2))
+            else:
+                print(f"Calibrated on {report['steps']} step(s) from {report['tutorials']} tutorial(s) "
+                      f"({report['backend']})")
+                for name, value in report['coefficients'].items():
+                    print(f"  {name:<12} {value:>10.5f}")
+                print(f"  R^2 = {report['r_squared']}, mean abs error = "
+                      f"{report['mean_abs_error_minutes']} min")
+                if args.save_model:
+                    print(f"\nModel written to {args.save_model}")
+            sys.exit(0)
+
+        coefficients = load_model(args.model)
+        results = []
+        for folder in folders:
+            results.extend(check_tutorial(folder, coefficients, args.tolerance))
+
+    except (ValueError, IOError, KeyError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    flagged = [r for r in results if r['flagged']]
+    if args.json:
+        print(json.dumps({'steps': len(results), 'flagged': flagged}, indent=2))
+    else:
+        print(f"Checked {len(results)} step(s) in {len(folders)} tutorial(s)")
+        if flagged:
+            print(f"\n{len(flagged)} step(s) with durations far from the estimate:\n")
+            for r in flagged:
+                print(f"  - {r['tutorial']}/{r['file']}: declared {r['declared_minutes']} min, "
+                      f"estimated {r['estimated_minutes']} min")
+        else:
+            print("All step durations are plausible.")
+
+    sys.exit(1 if flagged else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -11,6 +11,13 @@ Usage:
     python tools/fix_sidecar.py <folder_path> [--dry-run]
     python tools/fix_sidecar.py tc-example --dry-run  # Preview changes
     python tools/fix_sidecar.py tc-example            # Apply fixes
+
+    # Corpus mode: table of every tutorial whose total != sum of steps;
+    # exits 1 while mismatches remain (unless --fix-all fixed them all)
+    python tools/fix_sidecar.py --corpus /path/to/repo [--stats] [--fix-all]
+
+    # ...as of a git revision, read from git objects (report only)
+    python tools/fix_sidecar.py --corpus /path/to/repo --rev origin/main
 """
 
 import os
@@ -18,11 +25,20 @@ import sys
 import json
 import uuid
 import argparse
-import re
 from pathlib import Path
 from dataclasses import dataclass
 from typing import List, Optional, Tuple
 
+from file_source import GitError, open_source, tutorial_files
+from file_writer import WriteBatch
+from sidecar_model import Sidecar, load_sidecar, parse_duration_seconds, write_sidecar
+
+try:
+    import numpy as np
+    HAS_NUMPY = True
+except ImportError:
+    HAS_NUMPY = False
+
 
 @dataclass
 class SidecarFix:
@@ -42,31 +58,7 @@ def parse_duration_to_seconds(duration_str: str) -> int:
     - "XmXXs" (e.g., "30m00s")
     - "XhXXmXXs" (e.g., "1h30m00s")
     """
-    if not duration_str:
-        return 0
-
-    # Step format: "MM:SS"
-    if ':' in duration_str:
-        parts = duration_str.split(':')
-        if len(parts) == 2:
-            return int(parts[0]) * 60 + int(parts[1])
-        elif len(parts) == 3:
-            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
-
-    # Total format: "XhXXmXXs" or "XXmXXs"
-    total = 0
-    h_match = re.search(r'(\d+)h', duration_str)
-    m_match = re.search(r'(\d+)m', duration_str)
-    s_match = re.search(r'(\d+)s', duration_str)
-
-    if h_match:
-        total += int(h_match.group(1)) * 3600
-    if m_match:
-        total += int(m_match.group(1)) * 60
-    if s_match:
-        total += int(s_match.group(1))
-
-    return total
+    return parse_duration_seconds(duration_str)
 
 
 def seconds_to_total_duration(seconds: int) -> str:
@@ -83,27 +75,21 @@ def seconds_to_total_duration(seconds: int) -> str:
         return f"{minutes}m{secs:02d}s"
 
 
-def check_duration_mismatch(sidecar: dict) -> Optional[Tuple[int, int, str]]:
+def check_duration_mismatch(sidecar: Sidecar) -> Optional[Tuple[int, int, str]]:
     """
     Check if total duration matches sum of step durations.
 
+    Uses the model's total_seconds and step_seconds, parsed once per load.
+
     Returns:
         Tuple of (expected_seconds, actual_seconds, expected_format) or None if no mismatch
     """
-    if 'duration' not in sidecar or 'files' not in sidecar:
+    if 'duration' not in sidecar.data or 'files' not in sidecar.data:
         return None
 
-    total_duration = sidecar['duration']
-    total_seconds = parse_duration_to_seconds(total_duration)
-
-    step_seconds = 0
-    for file_entry in sidecar.get('files', []):
-        step_duration = file_entry.get('duration', '0:00')
-        step_seconds += parse_duration_to_seconds(step_duration)
-
-    if total_seconds != step_seconds:
-        expected_format = seconds_to_total_duration(step_seconds)
-        return (step_seconds, total_seconds, expected_format)
+    if sidecar.total_seconds != sidecar.step_seconds:
+        expected_format = seconds_to_total_duration(sidecar.step_seconds)
+        return (sidecar.step_seconds, sidecar.total_seconds, expected_format)
 
     return None
 
@@ -138,15 +124,15 @@ def is_valid_uuid(s: str) -> bool:
         return False
 
 
-def fix_duration(sidecar: dict) -> Optional[SidecarFix]:
-    """Fix duration mismatch by updating total to match step sum."""
+def fix_duration(sidecar: Sidecar, data: dict) -> Optional[SidecarFix]:
+    """Fix duration mismatch by updating the total in `data` (a copy of sidecar) to the step sum."""
     mismatch = check_duration_mismatch(sidecar)
     if not mismatch:
         return None
 
     expected_seconds, actual_seconds, expected_format = mismatch
-    old_value = sidecar['duration']
-    sidecar['duration'] = expected_format
+    old_value = sidecar.duration
+    data['duration'] = expected_format
 
     return SidecarFix(
         field='duration',
@@ -187,13 +173,14 @@ def fix_guids(sidecar: dict) -> List[SidecarFix]:
     return fixes
 
 
-def fix_sidecar(folder_path: str, dry_run: bool = False) -> dict:
+def fix_sidecar(folder_path: str, dry_run: bool = False, batch: Optional[WriteBatch] = None) -> dict:
     """
     Fix all issues in a sidecar.json file.
 
     Args:
         folder_path: Path to tutorial folder containing sidecar.json
         dry_run: If True, only report what would be fixed
+        batch: Stage the fixed file here instead of writing it now
 
     Returns:
         Dictionary with fix results
@@ -203,13 +190,14 @@ def fix_sidecar(folder_path: str, dry_run: bool = False) -> dict:
     if not sidecar_path.exists():
         return {'error': f'sidecar.json not found in {folder_path}'}
 
-    with open(sidecar_path, 'r') as f:
-        sidecar = json.load(f)
+    # Shared, cached parse (sidecar_model); fixes are applied to a copy
+    loaded = load_sidecar(sidecar_path)
+    sidecar = loaded.to_dict()
 
     all_fixes = []
 
     # Fix duration mismatch
-    duration_fix = fix_duration(sidecar)
+    duration_fix = fix_duration(loaded, sidecar)
     if duration_fix:
         all_fixes.append(duration_fix)
 
@@ -225,22 +213,212 @@ def fix_sidecar(folder_path: str, dry_run: bool = False) -> dict:
     }
 
     if all_fixes and not dry_run:
-        with open(sidecar_path, 'w') as f:
-            json.dump(sidecar, f, indent=2)
-        result['fixed'] = True
+        result['fixed'] = write_sidecar(sidecar_path, sidecar, batch)
+
+    return result
+
+
+# =============================================================================
+# Corpus mode
+# =============================================================================
+
+PERCENTILES = (10, 25, 50, 75, 90)
+
+
+@dataclass
+class DurationArrays:
+    """Durations (seconds) for a whole corpus, one row per tutorial."""
+    folders: List[Path]
+    declared: list       # declared total per tutorial
+    step_totals: list    # sum of step durations per tutorial
+    steps: list          # every step duration, flattened
+
+
+def load_corpus_durations(repo_root: Path, source=None) -> Tuple[DurationArrays, List[dict]]:
+    """
+    Load every tc-*/sidecar.json and collect durations as arrays.
+
+    With a commit `source` (file_source.py), sidecars are read from its
+    tree and folders are repository-relative. Returns (arrays, errors).
+    Step totals are summed in one vectorized pass when NumPy is available.
+    """
+    folders = []
+    declared = []
+    steps = []
+    owners = []  # tutorial row of each step
+    errors = []
+
+    for sidecar_path in tutorial_files(repo_root, 'sidecar.json', source):
+        try:
+            sidecar = load_sidecar(sidecar_path, source)
+            if 'duration' not in sidecar.data or 'files' not in sidecar.data:
+                continue
+            step_seconds = [f.seconds for f in sidecar.files]
+            total = sidecar.total_seconds
+        except (ValueError, IOError, GitError) as e:
+            errors.append({'folder': str(sidecar_path.parent), 'error': str(e)})
+            continue
+        row = len(folders)
+        folders.append(sidecar_path.parent)
+        declared.append(total)
+        steps.extend(step_seconds)
+        owners.extend([row] * len(step_seconds))
+
+    if HAS_NUMPY:
+        declared = np.array(declared, dtype=np.int64)
+        steps = np.array(steps, dtype=np.int64)
+        step_totals = np.bincount(np.array(owners, dtype=np.int64), weights=steps,
+                                  minlength=len(folders)).astype(np.int64)
+    else:
+        step_totals = [0] * len(folders)
+        for row, seconds in zip(owners, steps):
+            step_totals[row] += seconds
+
+    return DurationArrays(folders, declared, step_totals, steps), errors
 
+
+def find_duration_mismatches(arrays: DurationArrays) -> List[dict]:
+    """Every tutorial whose declared total differs from the sum of its steps."""
+    if HAS_NUMPY:
+        rows = np.nonzero(arrays.declared != arrays.step_totals)[0].tolist()
+    else:
+        rows = [i for i, (a, b) in enumerate(zip(arrays.declared, arrays.step_totals)) if a != b]
+
+    mismatches = []
+    for row in rows:
+        declared = int(arrays.declared[row])
+        step_total = int(arrays.step_totals[row])
+        mismatches.append({
+            'folder': str(arrays.folders[row]),
+            'declared': seconds_to_total_duration(declared),
+            'steps': seconds_to_total_duration(step_total),
+            'diff_seconds': step_total - declared
+        })
+    return mismatches
+
+
+def percentiles(values, points=PERCENTILES) -> dict:
+    """Linear-interpolated percentiles (same method as numpy.percentile)."""
+    if len(values) == 0:
+        return {}
+    if HAS_NUMPY:
+        return {f"p{p}": float(v) for p, v in zip(points, np.percentile(values, points))}
+
+    ordered = sorted(values)
+    result = {}
+    for p in points:
+        position = (len(ordered) - 1) * p / 100
+        lower = int(position)
+        upper = min(lower + 1, len(ordered) - 1)
+        fraction = position - lower
+        result[f"p{p}"] = float(ordered[lower] + (ordered[upper] - ordered[lower]) * fraction)
+    return result
+
+
+def duration_stats(arrays: DurationArrays) -> dict:
+    """Step length and tutorial length distributions, in minutes."""
+    def minutes(values):
+        return {k: round(v / 60, 1) for k, v in percentiles(values).items()}
+
+    return {
+        'tutorials': len(arrays.folders),
+        'steps': len(arrays.steps),
+        'step_minutes': minutes(arrays.steps),
+        'tutorial_minutes': minutes(arrays.step_totals)
+    }
+
+
+def reconcile_corpus(repo_root: Path, fix_all: bool = False, with_stats: bool = False, source=None) -> dict:
+    """
+    Report (and optionally fix) duration mismatches across the corpus.
+
+    Fixes reuse fix_sidecar(), whose load is served from the sidecar cache,
+    and are written together once all are staged: every mismatch is fixed
+    or, if the run fails, none is. A commit `source` is report-only.
+    """
+    arrays, errors = load_corpus_durations(repo_root, source)
+    mismatches = find_duration_mismatches(arrays)
+
+    result = {
+        'tutorials': len(arrays.folders),
+        'mismatches': mismatches,
+        'errors': errors,
+        'fixed': 0
+    }
+    if fix_all and (source is None or source.writable):
+        with WriteBatch() as batch:
+            for mismatch in mismatches:
+                if fix_sidecar(mismatch['folder'], batch=batch).get('fixed'):
+                    result['fixed'] += 1
+    if with_stats:
+        result['stats'] = duration_stats(arrays)
     return result
 
 
+def print_corpus_report(result: dict):
+    """Print the corpus mismatch table and optional stats."""
+    mismatches = result['mismatches']
+    print(f"Checked {result['tutorials']} tutorial(s): {len(mismatches)} duration mismatch(es)")
+
+    if mismatches:
+        width = max(len(Path(m['folder']).name) for m in mismatches)
+        print(f"\n  {'Tutorial':<{width}}  {'Declared':>10}  {'Steps':>10}  {'Diff':>8}")
+        for m in mismatches:
+            diff = f"{m['diff_seconds'] // 60:+d}m" if m['diff_seconds'] % 60 == 0 else f"{m['diff_seconds']:+d}s"
+            print(f"  {Path(m['folder']).name:<{width}}  {m['declared']:>10}  {m['steps']:>10}  {diff:>8}")
+
+    for error in result['errors']:
+        print(f"  Error: {error['folder']}: {error['error']}")
+
+    if result['fixed']:
+        print(f"\nFixed {result['fixed']} sidecar(s).")
+
+    stats = result.get('stats')
+    if stats:
+        print(f"\n{stats['steps']} step(s) across {stats['tutorials']} tutorial(s), minutes:")
+        for label, key in [("Step length", 'step_minutes'), ("Tutorial length", 'tutorial_minutes')]:
+            cells = "  ".join(f"{p}={v:g}" for p, v in stats[key].items())
+            print(f"  {label:<16} {cells}")
+
+
 def main():
     parser = argparse.ArgumentParser(description='Auto-fix sidecar.json issues')
-    parser.add_argument('folder', help='Path to tutorial folder or tc-* name')
+    parser.add_argument('folder', nargs='?', help='Path to tutorial folder or tc-* name')
     parser.add_argument('--dry-run', action='store_true', help='Preview changes without applying')
     parser.add_argument('--fix-guids', action='store_true', help='Also fix missing/invalid GUIDs')
     parser.add_argument('--json', action='store_true', help='Output as JSON')
+    parser.add_argument('--corpus', metavar='REPO_ROOT',
+                        help='Check durations of every tc-* tutorial under REPO_ROOT')
+    parser.add_argument('--fix-all', action='store_true', help='With --corpus: fix every mismatch')
+    parser.add_argument('--stats', action='store_true',
+                        help='With --corpus: step and tutorial length percentiles')
+    parser.add_argument('--rev', help='With --corpus: read sidecars as of this git revision (report only)')
 
     args = parser.parse_args()
 
+    if args.corpus:
+        if not Path(args.corpus).is_dir():
+            print(f"Error: Folder not found: {args.corpus}", file=sys.stderr)
+            sys.exit(1)
+        if args.rev and args.fix_all:
+            parser.error('--fix-all cannot be combined with --rev')
+        try:
+            with open_source(args.rev, Path(args.corpus)) as source:
+                result = reconcile_corpus(Path(args.corpus), fix_all=args.fix_all, with_stats=args.stats,
+                                          source=source)
+        except GitError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+        if args.json:
+            print(json.dumps(result, indent=2))
+        else:
+            print_corpus_report(result)
+        unfixed = len(result['mismatches']) - result['fixed']
+        sys.exit(1 if result['errors'] or unfixed else 0)
+
+    if not args.folder:
+        parser.error('folder is required unless --corpus is given')
+
     # Resolve folder path
     folder_path = Path(args.folder)
     if not folder_path.exists():
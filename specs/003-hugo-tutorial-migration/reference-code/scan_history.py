@@ -0,0 +1,442 @@
+#!/usr/bin/env python3
+"""
+Scan history database for test_real_tutorials.py.
+
+Every corpus scan is recorded in a local SQLite database: run metadata,
+per-tutorial and per-rule counts, and the issue fingerprints used by
+golden snapshots. A run is written with bulk inserts in one transaction,
+so an interrupted scan never leaves a partial run behind.
+
+Each tutorial's row also keeps the git tree hash of its folder at scan
+time. An incremental scan rescans only folders whose tree changed and
+carries the other tutorials' rows over from the previous run.
+
+The database answers trend questions (how did HTML_TAG change over the
+last ten runs?) and renders scan-results-snapshot.md directly, with
+before/after columns taken from two recorded runs instead of console
+output copied by hand.
+"""
+
+import json
+import sqlite3
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at TEXT NOT NULL,
+    corpus TEXT NOT NULL,
+    label TEXT,
+    rules_version TEXT,
+    tutorials INTEGER NOT NULL,
+    errors INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_runs_corpus ON runs (corpus, id);
+
+CREATE TABLE IF NOT EXISTS tutorial_counts (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    tutorial TEXT NOT NULL,
+    blocking INTEGER NOT NULL,
+    warnings INTEGER NOT NULL,
+    rules TEXT NOT NULL,
+    tree TEXT,
+    PRIMARY KEY (run_id, tutorial)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_tutorial_counts_tutorial ON tutorial_counts (tutorial, run_id);
+
+CREATE TABLE IF NOT EXISTS rule_counts (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    rule TEXT NOT NULL,
+    severity TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (run_id, rule)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_rule_counts_rule ON rule_counts (rule, run_id);
+
+CREATE TABLE IF NOT EXISTS fingerprints (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    tutorial TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    rule TEXT NOT NULL,
+    file TEXT NOT NULL,
+    line INTEGER,
+    severity TEXT,
+    message TEXT,
+    PRIMARY KEY (run_id, tutorial, fingerprint)
+) WITHOUT ROWID;
+"""
+
+# Columns added after the first release: {table: {column: type}}
+ADDED_COLUMNS = {
+    "tutorial_counts": {"tree": "TEXT"},
+    "fingerprints": {"severity": "TEXT", "message": "TEXT"},
+}
+
+
+class ScanHistory:
+    """
+    Recorded scan runs for one or more corpora.
+
+    Runs are identified by an increasing integer id; "previous run" always
+    means the previous run of the same corpus.
+    """
+
+    def __init__(self, path, timeout: float = 30.0):
+        self.path = Path(path)
+        if str(path) != ":memory:":
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), timeout=timeout)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        self._add_columns()
+
+    def _add_columns(self):
+        for table, columns in ADDED_COLUMNS.items():
+            existing = {row["name"] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+            for column, column_type in columns.items():
+                if column not in existing:
+                    self.conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_type}")
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # -------------------------------------------------------------------------
+    # Writing
+    # -------------------------------------------------------------------------
+
+    def record_run(self, issues_by_tutorial: dict, corpus: str, fingerprints: Optional[dict] = None,
+                   label: Optional[str] = None, rules_version: Optional[str] = None,
+                   errors: int = 0, started_at: Optional[str] = None, trees: Optional[dict] = None,
+                   carry_from: Optional[int] = None, carried: tuple = ()) -> int:
+        """
+        Record one scan in a single transaction; returns the run id.
+
+        `issues_by_tutorial` maps tutorial name to issue dicts (rule,
+        severity, ...); tutorials without issues are recorded as clean.
+        `fingerprints` is the snapshot's {tutorial: {key: issue}} mapping
+        and `trees` the {tutorial: git tree hash} at scan time.
+
+        Tutorials named in `carried` were not rescanned: their rows are
+        copied from run `carry_from`, which must have recorded fingerprints.
+        """
+        started_at = started_at or datetime.now(timezone.utc).isoformat(timespec="seconds")
+        trees = trees or {}
+        carried = sorted(set(carried) - issues_by_tutorial.keys())
+        tutorial_rows, rule_counts, severities = [], Counter(), {}
+        for name, issues in sorted(issues_by_tutorial.items()):
+            blocking = sum(1 for i in issues if i["severity"] == "BLOCKING")
+            rules = ",".join(sorted({i["rule"] for i in issues}))
+            tutorial_rows.append((name, blocking, len(issues) - blocking, rules, trees.get(name)))
+            for issue in issues:
+                rule_counts[issue["rule"]] += 1
+                severities.setdefault(issue["rule"], issue["severity"])
+        fingerprint_rows = [
+            (name, key, issue["rule"], issue["file"], issue.get("line"), severities.get(issue["rule"]),
+             issue.get("message"))
+            for name, prints in sorted((fingerprints or {}).items())
+            for key, issue in prints.items()
+        ]
+
+        with self.conn:
+            run_id = self.conn.execute(
+                "INSERT INTO runs (started_at, corpus, label, rules_version, tutorials, errors) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (started_at, str(corpus), label, rules_version, len(tutorial_rows) + len(carried), errors)
+            ).lastrowid
+            self.conn.executemany(
+                "INSERT INTO tutorial_counts (run_id, tutorial, blocking, warnings, rules, tree) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in tutorial_rows]
+            )
+            self.conn.executemany(
+                "INSERT INTO fingerprints (run_id, tutorial, fingerprint, rule, file, line, severity, message) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(run_id,) + row for row in fingerprint_rows]
+            )
+            if carried:
+                self._carry_over(carry_from, run_id, carried, rule_counts, severities)
+            self.conn.executemany(
+                "INSERT INTO rule_counts (run_id, rule, severity, count) VALUES (?, ?, ?, ?)",
+                [(run_id, rule, severities[rule], count) for rule, count in sorted(rule_counts.items())]
+            )
+        return run_id
+
+    def _carry_over(self, source_id: int, run_id: int, tutorials: list, rule_counts: Counter, severities: dict):
+        """Copy tutorial and fingerprint rows; add their issues to `rule_counts`."""
+        names = json.dumps(tutorials)
+        selected = "run_id = ? AND tutorial IN (SELECT value FROM json_each(?))"
+        copied = self.conn.execute(
+            "INSERT INTO tutorial_counts (run_id, tutorial, blocking, warnings, rules, tree) "
+            f"SELECT ?, tutorial, blocking, warnings, rules, tree FROM tutorial_counts WHERE {selected}",
+            (run_id, source_id, names)
+        ).rowcount
+        if copied != len(tutorials):
+            raise ValueError(f"Run {source_id} has no results for some carried tutorials")
+        self.conn.execute(
+            "INSERT INTO fingerprints (run_id, tutorial, fingerprint, rule, file, line, severity, message) "
+            "SELECT ?, tutorial, fingerprint, rule, file, line, severity, message "
+            f"FROM fingerprints WHERE {selected}",
+            (run_id, source_id, names)
+        )
+        for row in self.conn.execute(
+            f"SELECT rule, MAX(severity) AS severity, COUNT(*) AS n FROM fingerprints WHERE {selected} GROUP BY rule",
+            (run_id, names)
+        ):
+            rule_counts[row["rule"]] += row["n"]
+            severities.setdefault(row["rule"], row["severity"])
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def get_run(self, run_id: int) -> Optional[dict]:
+        row = self.conn.execute("SELECT * FROM runs WHERE id = ?", (run_id,)).fetchone()
+        return dict(row) if row else None
+
+    def runs(self, corpus: Optional[str] = None, limit: int = 20) -> list:
+        """Most recent runs, newest first."""
+        if corpus is None:
+            rows = self.conn.execute("SELECT * FROM runs ORDER BY id DESC LIMIT ?", (limit,))
+        else:
+            rows = self.conn.execute(
+                "SELECT * FROM runs WHERE corpus = ? ORDER BY id DESC LIMIT ?", (str(corpus), limit)
+            )
+        return [dict(row) for row in rows]
+
+    def latest_run(self, corpus: str, rules_version: Optional[str] = None) -> Optional[int]:
+        """Id of the newest run of `corpus`, optionally made with the same rules."""
+        query = "SELECT id FROM runs WHERE corpus = ?"
+        params = [str(corpus)]
+        if rules_version is not None:
+            query += " AND rules_version = ?"
+            params.append(rules_version)
+        row = self.conn.execute(query + " ORDER BY id DESC LIMIT 1", params).fetchone()
+        return row[0] if row else None
+
+    def previous_run(self, run_id: int) -> Optional[int]:
+        """Id of the run before `run_id` on the same corpus."""
+        row = self.conn.execute(
+            "SELECT p.id FROM runs r JOIN runs p ON p.corpus = r.corpus AND p.id < r.id "
+            "WHERE r.id = ? ORDER BY p.id DESC LIMIT 1", (run_id,)
+        ).fetchone()
+        return row[0] if row else None
+
+    def summary(self, run_id: int) -> dict:
+        """Totals for one run, as in the snapshot's Summary table."""
+        row = self.conn.execute(
+            "SELECT COUNT(*) AS tutorials, "
+            "       COALESCE(SUM(blocking > 0), 0) AS tutorials_with_blocking, "
+            "       COALESCE(SUM(blocking = 0 AND warnings = 0), 0) AS clean, "
+            "       COALESCE(SUM(blocking), 0) AS blocking, "
+            "       COALESCE(SUM(warnings), 0) AS warnings "
+            "FROM tutorial_counts WHERE run_id = ?", (run_id,)
+        ).fetchone()
+        summary = dict(row)
+        summary["total_issues"] = summary["blocking"] + summary["warnings"]
+        summary["blocking_rate"] = (
+            summary["tutorials_with_blocking"] / summary["tutorials"] * 100 if summary["tutorials"] else 0.0
+        )
+        return summary
+
+    def rule_counts(self, run_id: int) -> dict:
+        """{rule: {"severity": ..., "count": n}} for one run."""
+        rows = self.conn.execute("SELECT rule, severity, count FROM rule_counts WHERE run_id = ?", (run_id,))
+        return {row["rule"]: {"severity": row["severity"], "count": row["count"]} for row in rows}
+
+    def tutorial_counts(self, run_id: int) -> list:
+        rows = self.conn.execute(
+            "SELECT tutorial, blocking, warnings, rules FROM tutorial_counts WHERE run_id = ? ORDER BY tutorial",
+            (run_id,)
+        )
+        return [dict(row, rules=row["rules"].split(",") if row["rules"] else []) for row in rows]
+
+    def tutorial_trees(self, run_id: int) -> dict:
+        """{tutorial: git tree hash} recorded for a run (None where unknown)."""
+        rows = self.conn.execute("SELECT tutorial, tree FROM tutorial_counts WHERE run_id = ?", (run_id,))
+        return {row["tutorial"]: row["tree"] for row in rows}
+
+    def fingerprints(self, run_id: int) -> dict:
+        """The snapshot mapping {tutorial: {key: issue}} recorded for a run."""
+        prints = {t["tutorial"]: {} for t in self.tutorial_counts(run_id)}
+        for row in self.conn.execute(
+            "SELECT tutorial, fingerprint, rule, file, line, message FROM fingerprints WHERE run_id = ?", (run_id,)
+        ):
+            prints[row["tutorial"]][row["fingerprint"]] = {
+                "rule": row["rule"], "file": row["file"], "line": row["line"], "message": row["message"],
+            }
+        return prints
+
+    def rule_trend(self, rule: str, corpus: str, limit: int = 20) -> list:
+        """[(run id, started_at, count)] for the last `limit` runs, oldest first."""
+        rows = self.conn.execute(
+            "SELECT r.id, r.started_at, COALESCE(c.count, 0) FROM runs r "
+            "LEFT JOIN rule_counts c ON c.run_id = r.id AND c.rule = ? "
+            "WHERE r.corpus = ? ORDER BY r.id DESC LIMIT ?", (rule, str(corpus), limit)
+        ).fetchall()
+        return [tuple(row) for row in reversed(rows)]
+
+    def tutorial_trend(self, tutorial: str, limit: int = 20) -> list:
+        """[(run id, started_at, blocking, warnings)] for runs that scanned `tutorial`, oldest first."""
+        rows = self.conn.execute(
+            "SELECT r.id, r.started_at, t.blocking, t.warnings FROM tutorial_counts t "
+            "JOIN runs r ON r.id = t.run_id WHERE t.tutorial = ? ORDER BY t.run_id DESC LIMIT ?",
+            (tutorial, limit)
+        ).fetchall()
+        return [tuple(row) for row in reversed(rows)]
+
+    def fingerprint_changes(self, baseline_id: int, run_id: int) -> dict:
+        """{rule: {"added": n, "removed": n}} between two runs, for tutorials in both."""
+        query = (
+            "SELECT rule, COUNT(*) FROM ("
+            "  SELECT tutorial, fingerprint, rule FROM fingerprints WHERE run_id = ? "
+            "  AND tutorial IN (SELECT tutorial FROM tutorial_counts WHERE run_id = ?) "
+            "  EXCEPT SELECT tutorial, fingerprint, rule FROM fingerprints WHERE run_id = ?"
+            ") GROUP BY rule"
+        )
+        changes = {}
+        for key, (new, old) in (("added", (run_id, baseline_id)), ("removed", (baseline_id, run_id))):
+            for rule, count in self.conn.execute(query, (new, old, old)):
+                changes.setdefault(rule, {"added": 0, "removed": 0})[key] = count
+        return dict(sorted(changes.items()))
+
+
+# =============================================================================
+# Snapshot Markdown
+# =============================================================================
+
+def format_change(before, after, unit: str = "%") -> str:
+    """Change column: "-" when equal, percent (or percentage points) otherwise."""
+    if before == after:
+        return "-"
+    if unit == "pp":
+        return f"{after - before:+.0f}pp"
+    if not before:
+        return "new"
+    return f"{(after - before) / before * 100:+.0f}%"
+
+
+def _run_title(run: dict) -> str:
+    title = f"{run['started_at'][:10]} (run #{run['id']}"
+    return title + (f", {run['label']})" if run["label"] else ")")
+
+
+def render_snapshot_markdown(history: ScanHistory, run_id: int, baseline_id: Optional[int] = None) -> str:
+    """
+    Render scan-results-snapshot.md for `run_id`.
+
+    With a baseline, the Summary and Issues by Rule tables get Before,
+    After and Change columns, and fingerprint changes are listed per rule.
+    """
+    run = history.get_run(run_id)
+    if run is None:
+        raise ValueError(f"No such run: {run_id}")
+    baseline = history.get_run(baseline_id) if baseline_id is not None else None
+    after = history.summary(run_id)
+    before = history.summary(baseline_id) if baseline else None
+    corpus = Path(run["corpus"]).name or run["corpus"]
+
+    lines = [
+        "# Validation Scan Results Snapshot",
+        "",
+        f"**Scan Date**: {_run_title(run)}",
+    ]
+    if baseline:
+        lines.append(f"**Baseline**: {_run_title(baseline)}")
+    lines += [
+        f"**Tool Version**: clean_markdown.py (rules {run['rules_version'] or 'unknown'})",
+        "",
+        "This document is generated from the scan history database by "
+        "`test_real_tutorials.py --render-snapshot`. Counts reflect the source markdown at scan time.",
+        "",
+        "---",
+        "",
+        "## Summary",
+        "",
+        f"### {corpus} ({after['tutorials']} tutorials)",
+        "",
+    ]
+
+    metrics = [
+        ("Total tutorials scanned", "tutorials"),
+        ("Tutorials with blocking issues", "tutorials_with_blocking"),
+        ("Total issues", "total_issues"),
+        ("Blocking issues", "blocking"),
+        ("Warnings", "warnings"),
+        ("**Blocking rate**", "blocking_rate"),
+        ("Clean tutorials", "clean"),
+    ]
+
+    def value(summary, key):
+        return f"{summary[key]:.1f}%" if key == "blocking_rate" else f"{summary[key]:,}"
+
+    if before:
+        lines += ["| Metric | Before | After | Change |", "|--------|--------|-------|--------|"]
+        for title, key in metrics:
+            unit = "pp" if key == "blocking_rate" else "%"
+            lines.append(f"| {title} | {value(before, key)} | {value(after, key)} | "
+                         f"{format_change(before[key], after[key], unit)} |")
+    else:
+        lines += ["| Metric | Count |", "|--------|-------|"]
+        lines += [f"| {title} | {value(after, key)} |" for title, key in metrics]
+    if run["errors"]:
+        lines += ["", f"{run['errors']} tutorial(s) could not be scanned."]
+
+    lines += ["", "---", "", "## Issues by Rule", ""]
+    rules_after = history.rule_counts(run_id)
+    rules_before = history.rule_counts(baseline_id) if baseline else {}
+    order = sorted(rules_after.keys() | rules_before.keys(),
+                   key=lambda r: (-rules_after.get(r, {}).get("count", 0), r))
+    if not order:
+        lines.append("No issues found.")
+    elif before:
+        lines += ["| Rule | Before | After | Change | Severity |",
+                  "|------|--------|-------|--------|----------|"]
+        for rule in order:
+            old = rules_before.get(rule, {}).get("count", 0)
+            new = rules_after.get(rule, {}).get("count", 0)
+            severity = (rules_after.get(rule) or rules_before[rule])["severity"]
+            lines.append(f"| {rule} | {old:,} | {new:,} | {format_change(old, new)} | {severity} |")
+    else:
+        lines += ["| Rule | Count | Severity |", "|------|-------|----------|"]
+        lines += [f"| {rule} | {rules_after[rule]['count']:,} | {rules_after[rule]['severity']} |" for rule in order]
+
+    if baseline:
+        changes = history.fingerprint_changes(baseline_id, run_id)
+        lines += ["", "### Issue Changes Since Baseline", ""]
+        if changes:
+            lines += ["| Rule | New | Resolved |", "|------|-----|----------|"]
+            lines += [f"| {rule} | {c['added']:,} | {c['removed']:,} |" for rule, c in changes.items()]
+        else:
+            lines.append("No issues added or resolved in tutorials scanned by both runs.")
+
+    tutorials = history.tutorial_counts(run_id)
+    blocking = sorted((t for t in tutorials if t["blocking"]), key=lambda t: (-t["blocking"], t["tutorial"]))
+    lines += ["", "---", "", f"## Tutorials with Blocking Issues ({len(blocking)})", ""]
+    if blocking:
+        lines += ["| Tutorial | Blocking | Warnings | Issue Types |",
+                  "|----------|----------|----------|-------------|"]
+        lines += [f"| {t['tutorial']} | {t['blocking']} | {t['warnings']} | {', '.join(t['rules'])} |"
+                  for t in blocking]
+    else:
+        lines.append("None.")
+
+    clean = [t["tutorial"] for t in tutorials if not t["blocking"] and not t["warnings"]]
+    lines += ["", "---", "", "## Clean Tutorials", ""]
+    if clean:
+        lines += [f"These {len(clean)} tutorials passed all validation checks:", ""]
+        lines += [f"- {name}" for name in clean]
+    else:
+        lines.append("No tutorials passed all validation checks.")
+
+    return "\n".join(lines) + "\n"
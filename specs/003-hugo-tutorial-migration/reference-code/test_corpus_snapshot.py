@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Tests for the golden-snapshot mode of test_real_tutorials.py.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import clean_markdown
+import test_real_tutorials
+from git_corpus import GitCorpus
+from test_real_tutorials import (
+    build_snapshot,
+    diff_snapshots,
+    find_tutorials,
+    fingerprint_issues,
+    load_snapshot,
+    rules_version,
+    scan_corpus,
+    write_snapshot,
+)
+
+
+FIXTURES = Path(__file__).parent / "test-fixtures"
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Two copies of the integration fixture plus a clean tutorial."""
+    for name in ("tc-alpha", "tc-beta"):
+        folder = tmp_path / name
+        folder.mkdir()
+        for step in FIXTURES.glob("*.md"):
+            (folder / step.name).write_text(step.read_text())
+    (tmp_path / "tc-clean").mkdir()
+    (tmp_path / "tc-clean" / "step-1.md").write_text("# Clean\n\nNothing to see here.\n")
+    return tmp_path
+
+
+def issue(rule, line, match="", file="step-1.md", message=None):
+    return {"rule": rule, "file": file, "line": line, "severity": "BLOCKING",
+            "message": message or f"Line {line}: problem", "match": match}
+
+
+class TestScanCorpus:
+    """Tests for parallel, cached scanning"""
+
+    def test_matches_validate_folder(self, corpus, tmp_path):
+        tutorials = find_tutorials(corpus)
+        issues, _ = scan_corpus(tutorials, jobs=2, cache_path=tmp_path / "cache.json")
+        for tutorial in tutorials:
+            expected = clean_markdown.validate_folder(str(tutorial), auto_fix=False, skip_ai=True)
+            assert sorted((i.rule_id, i.line_number) for i in expected.issues) == \
+                sorted((i["rule"], i["line"]) for i in issues[tutorial.name])
+        assert issues["tc-clean"] == []
+
+    def test_second_run_is_cached(self, corpus, tmp_path):
+        cache = tmp_path / "cache.json"
+        tutorials = find_tutorials(corpus)
+        first, stats = scan_corpus(tutorials, cache_path=cache)
+        assert stats.get("cached", 0) == 0
+        second, stats = scan_corpus(tutorials, cache_path=cache)
+        assert stats == {"cached": stats["cached"]} and stats["cached"] > 0
+        assert build_snapshot(first) == build_snapshot(second)
+
+    def test_cache_keyed_on_rules_source(self, corpus, tmp_path, monkeypatch):
+        """Any edit to clean_markdown.py, even a helper, re-runs every check."""
+        cache = tmp_path / "cache.json"
+        tutorials = find_tutorials(corpus)
+        scan_corpus(tutorials, jobs=1, cache_path=cache)
+        _, stats = scan_corpus(tutorials, jobs=1, cache_path=cache)
+        assert "checked" not in stats
+        version = rules_version()
+
+        edited = tmp_path / "clean_markdown.py"
+        edited.write_text(Path(clean_markdown.__file__).read_text() + "\n# helper edited\n")
+        monkeypatch.setattr(clean_markdown, "__file__", str(edited))
+        assert rules_version() != version
+        _, stats = scan_corpus(tutorials, jobs=1, cache_path=cache)
+        assert "cached" not in stats and stats["checked"] > 0
+
+    def test_scan_from_git_objects(self, corpus, tmp_path):
+        git = ["git", "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q", str(corpus)], check=True)
+        subprocess.run(git + ["-C", str(corpus), "add", "."], check=True)
+        subprocess.run(git + ["-C", str(corpus), "commit", "-q", "-m", "Corpus"], check=True)
+        bare = tmp_path / "corpus.git"
+        subprocess.run(git + ["clone", "-q", "--bare", str(corpus), str(bare)], check=True)
+
+        cache = tmp_path / "cache.json"
+        on_disk, _ = scan_corpus(find_tutorials(corpus), jobs=1, cache_path=cache)
+        with GitCorpus(bare) as git_corpus:
+            tutorials = [bare / name for name in git_corpus.tutorials()]
+            from_git, _ = scan_corpus(tutorials, jobs=1, cache_path=None, corpus=git_corpus)
+        assert build_snapshot(from_git) == build_snapshot(on_disk)
+
+        # Cache keys are blob ids, so the disk scan's results are reused without reading blobs
+        with GitCorpus(bare) as git_corpus:
+            _, stats = scan_corpus(tutorials, jobs=1, cache_path=cache, corpus=git_corpus)
+            assert "checked" not in stats and git_corpus.blobs.reads == 0
+
+
+class TestFingerprints:
+    """Fingerprints ignore line shifts but not content"""
+
+    def test_stable_across_line_shifts(self):
+        a = fingerprint_issues([issue("HTML_TAG", 10, "<br>")])
+        b = fingerprint_issues([issue("HTML_TAG", 14, "<br>")])
+        assert a.keys() == b.keys()
+
+    def test_repeats_are_counted(self):
+        prints = fingerprint_issues([issue("HTML_TAG", 3, "<br>"), issue("HTML_TAG", 9, "<br>")])
+        assert len(prints) == 2
+        assert any(key.endswith("#2") for key in prints)
+
+    def test_message_without_line_numbers(self):
+        a = fingerprint_issues([issue("LIST_INDENT_INCONSISTENT", 4, message="Lines 4-9: Nested list")])
+        b = fingerprint_issues([issue("LIST_INDENT_INCONSISTENT", 7, message="Lines 7-12: Nested list")])
+        assert a.keys() == b.keys()
+
+
+class TestDiff:
+    """Tests for snapshot comparison"""
+
+    def test_round_trip_and_diff(self, tmp_path):
+        old = build_snapshot({
+            "tc-a": [issue("HTML_TAG", 3, "<br>"), issue("DOUBLE_SPACE", 5, "  ")],
+            "tc-gone": [],
+        })
+        path = tmp_path / "golden.json"
+        write_snapshot(path, old)
+        assert load_snapshot(path) == old
+
+        new = build_snapshot({
+            "tc-a": [issue("HTML_TAG", 4, "<br>"), issue("LINK_BROKEN", 8, "[x](\ny)")],
+            "tc-new": [],
+        })
+        diff = diff_snapshots(load_snapshot(path), new)
+        assert [i["rule"] for i in diff["added"]] == ["LINK_BROKEN"]
+        assert [i["rule"] for i in diff["removed"]] == ["DOUBLE_SPACE"]
+        assert diff["by_rule"] == {
+            "DOUBLE_SPACE": {"added": 0, "removed": 1},
+            "LINK_BROKEN": {"added": 1, "removed": 0},
+        }
+        assert diff["tutorials_added"] == ["tc-new"]
+        assert diff["tutorials_removed"] == ["tc-gone"]
+
+    def test_cli_diff_exit_code(self, corpus, tmp_path, monkeypatch, capsys):
+        golden = tmp_path / "golden.json"
+        cache = tmp_path / "cache.json"
+        args = ["test_real_tutorials.py", str(corpus), "--cache", str(cache), "-j", "1", "--no-history"]
+
+        monkeypatch.setattr(sys, "argv", args + ["--snapshot", str(golden)])
+        test_real_tutorials.main()
+
+        monkeypatch.setattr(sys, "argv", args + ["--diff", str(golden)])
+        with pytest.raises(SystemExit) as exit_info:
+            test_real_tutorials.main()
+        assert exit_info.value.code == 0
+
+        (corpus / "tc-clean" / "step-1.md").write_text("# Clean\n\nNot<br>clean.\n")
+        with pytest.raises(SystemExit) as exit_info:
+            test_real_tutorials.main()
+        assert exit_info.value.code == 1
+        assert "tc-clean/step-1.md:" in capsys.readouterr().out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
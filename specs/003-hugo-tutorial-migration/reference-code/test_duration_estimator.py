@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Tests for duration_estimator.py - content-based step duration estimates.
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import duration_estimator
+from duration_estimator import (
+    DEFAULT_COEFFICIENTS,
+    StepFeatures,
+    calibrate_corpus,
+    check_tutorial,
+    extract_features,
+    find_tutorials,
+    fit_coefficients,
+)
+
+
+FIXTURES = Path(__file__).parent / "test-fixtures"
+
+BACKENDS = [False] + ([True] if duration_estimator.HAS_NUMPY else [])
+
+TRUE_COEFFICIENTS = {'intercept': 1.0, 'words': 0.004, 'code_lines': 0.1, 'commands': 0.6, 'images': 0.3}
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda numpy: "numpy" if numpy else "python")
+def backend(request, monkeypatch):
+    monkeypatch.setattr(duration_estimator, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def make_step(words: int, code_lines: int, commands: int, images: int) -> str:
+    """Markdown with exactly the given feature counts."""
+    parts = ["# Title", " ".join(["word"] * max(words - 1, 0))]
+    parts += [f"![Shot {i}](images/shot-{i}.png)" for i in range(images)]
+    if commands:
+        parts += ["```bash"] + [f"show run {i}" for i in range(commands)] + ["```"]
+    if code_lines - commands:
+        parts += ["```json"] + ['{"key": 1}'] * (code_lines - commands) + ["```"]
+    return "\n\n".join(parts) + "\n"
+
+
+def make_corpus(root: Path, tutorials: int = 6, steps: int = 4, seed: int = 1) -> Path:
+    """Tutorials whose declared durations follow TRUE_COEFFICIENTS exactly."""
+    rng = random.Random(seed)
+    for t in range(tutorials):
+        folder = root / f"tc-t{t}"
+        folder.mkdir()
+        files = []
+        for s in range(1, steps + 1):
+            words, commands = rng.randint(50, 800), rng.randint(0, 6)
+            code_lines, images = commands + rng.randint(0, 20), rng.randint(0, 4)
+            (folder / f"step-{s}.md").write_text(make_step(words, code_lines, commands, images))
+            minutes = sum(TRUE_COEFFICIENTS[k] * v for k, v in zip(
+                duration_estimator.FEATURES, [1, words, code_lines, commands, images]))
+            seconds = round(minutes * 60)
+            files.append({"file": f"step-{s}.md", "duration": f"{seconds // 60}:{seconds % 60:02d}"})
+        (folder / "sidecar.json").write_text(json.dumps({"id": folder.name, "files": files}))
+    return root
+
+
+class TestExtractFeatures:
+    """Tests for the single tokenization pass."""
+
+    def test_counts(self):
+        text = (
+            "# Configure the router\n\n"
+            "Open a [terminal](https://example.com/long/url) and log in.\n\n"
+            "![Topology](images/topology.png)\n\n"
+            "```\nRouter# show ip int brief\nRouter(config)# hostname R1\ninterface Gi0/0\n```\n\n"
+            "```bash\nssh admin@10.0.0.1\n\nexit\n```\n"
+        )
+        features = extract_features(text)
+        assert features.images == 1
+        assert features.code_lines == 5
+        assert features.commands == 4
+        # Prose only: URLs, image markup and code are not counted
+        assert features.words == 9
+
+    def test_make_step_helper(self):
+        assert extract_features(make_step(100, 7, 3, 2)) == StepFeatures(100, 7, 3, 2)
+
+    def test_fixture_tutorial(self):
+        features = extract_features((FIXTURES / "step-2.md").read_text())
+        assert features.words > 100
+        assert features.code_lines > 0
+
+
+class TestFit:
+    """Tests for least-squares calibration."""
+
+    def test_recovers_known_coefficients(self, tmp_path, backend):
+        report = calibrate_corpus(find_tutorials(make_corpus(tmp_path)))
+        assert report['steps'] == 24
+        for name, value in TRUE_COEFFICIENTS.items():
+            assert report['coefficients'][name] == pytest.approx(value, abs=0.02)
+        assert report['r_squared'] > 0.99
+
+    def test_too_few_steps(self, backend):
+        with pytest.raises(ValueError):
+            fit_coefficients([StepFeatures(10, 0, 0, 0)], [1.0])
+
+    def test_no_variation(self, backend):
+        features = [StepFeatures(w, 0, 0, 0) for w in range(100, 700, 100)]
+        with pytest.raises(ValueError):
+            fit_coefficients(features, [1.0] * len(features))
+
+
+class TestCheckTutorial:
+    """Tests for flagging implausible step durations."""
+
+    def test_flags_far_off_step(self, tmp_path):
+        folder = tmp_path / "tc-check"
+        folder.mkdir()
+        (folder / "step-1.md").write_text(make_step(200, 0, 0, 0))
+        (folder / "step-2.md").write_text(make_step(2000, 40, 20, 8))
+        (folder / "sidecar.json").write_text(json.dumps({"files": [
+            {"file": "step-1.md", "duration": "2:00"},
+            {"file": "step-2.md", "duration": "2:00"},
+        ]}))
+
+        results = check_tutorial(folder, DEFAULT_COEFFICIENTS)
+        assert [r['flagged'] for r in results] == [False, True]
+        assert results[1]['estimated_minutes'] > 20
+
+    def test_milliseconds_per_tutorial(self, tmp_path):
+        folders = find_tutorials(make_corpus(tmp_path, tutorials=10))
+        start = time.perf_counter()
+        for folder in folders:
+            check_tutorial(folder, DEFAULT_COEFFICIENTS)
+        assert (time.perf_counter() - start) / len(folders) < 0.05
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Tests for fix_sidecar.py - duration reconciliation, single folder and corpus.
+
+Corpus tests run with the pure-Python fallback and, when NumPy is
+installed, with the vectorized path as well.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import fix_sidecar
+from file_source import GitCorpus
+from fix_sidecar import (
+    check_duration_mismatch,
+    duration_stats,
+    fix_sidecar as fix_folder,
+    load_corpus_durations,
+    parse_duration_to_seconds,
+    percentiles,
+    reconcile_corpus,
+)
+from sidecar_model import Sidecar
+
+
+BACKENDS = [False] + ([True] if fix_sidecar.HAS_NUMPY else [])
+
+
+@pytest.fixture(params=BACKENDS, ids=lambda numpy: "numpy" if numpy else "python")
+def backend(request, monkeypatch):
+    monkeypatch.setattr(fix_sidecar, "HAS_NUMPY", request.param)
+    return request.param
+
+
+def write_sidecar(root: Path, name: str, total: str, steps: list) -> Path:
+    folder = root / name
+    folder.mkdir()
+    sidecar = {
+        "id": name,
+        "duration": total,
+        "files": [{"file": f"step-{i}.md", "duration": d} for i, d in enumerate(steps, 1)],
+    }
+    (folder / "sidecar.json").write_text(json.dumps(sidecar, indent=2))
+    return folder
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """tc-good matches; tc-long and tc-short don't."""
+    write_sidecar(tmp_path, "tc-good", "10m00s", ["5:00", "5:00"])
+    write_sidecar(tmp_path, "tc-long", "1h00m00s", ["10:00", "20:00"])
+    write_sidecar(tmp_path, "tc-short", "5m00s", ["5:00", "2:30"])
+    return tmp_path
+
+
+class TestParseDuration:
+    """Tests for duration parsing."""
+
+    def test_formats(self):
+        assert parse_duration_to_seconds("5:00") == 300
+        assert parse_duration_to_seconds("30m00s") == 1800
+        assert parse_duration_to_seconds("1h30m00s") == 5400
+
+
+class TestSingleFolder:
+    """Tests for fixing one folder."""
+
+    def test_fixes_total(self, tmp_path):
+        folder = write_sidecar(tmp_path, "tc-one", "1h00m00s", ["10:00", "20:00"])
+        result = fix_folder(str(folder))
+        assert result['fixed']
+        assert json.loads((folder / "sidecar.json").read_text())['duration'] == "30m00s"
+
+    def test_mismatch_from_model(self):
+        sidecar = Sidecar({"duration": "1h00m00s", "files": [{"duration": "10:00"}, {"file": "step-2.md"}]})
+        assert check_duration_mismatch(sidecar) == (600, 3600, "10m00s")
+        assert check_duration_mismatch(Sidecar({"duration": "10m00s"})) is None
+
+    def test_dry_run_leaves_file(self, tmp_path):
+        folder = write_sidecar(tmp_path, "tc-one", "1h00m00s", ["10:00", "20:00"])
+        result = fix_folder(str(folder), dry_run=True)
+        assert result['fixes'] and not result['fixed']
+        assert json.loads((folder / "sidecar.json").read_text())['duration'] == "1h00m00s"
+
+
+class TestCorpus:
+    """Tests for corpus-wide reconciliation."""
+
+    def test_step_totals(self, corpus, backend):
+        arrays, errors = load_corpus_durations(corpus)
+        assert errors == []
+        assert [f.name for f in arrays.folders] == ["tc-good", "tc-long", "tc-short"]
+        assert [int(v) for v in arrays.step_totals] == [600, 1800, 450]
+        assert len(arrays.steps) == 6
+
+    def test_mismatch_table(self, corpus, backend):
+        result = reconcile_corpus(corpus)
+        assert [(Path(m['folder']).name, m['declared'], m['steps'], m['diff_seconds'])
+                for m in result['mismatches']] == [
+            ("tc-long", "1h00m00s", "30m00s", -1800),
+            ("tc-short", "5m00s", "7m30s", 150),
+        ]
+        assert result['fixed'] == 0
+
+    def test_fix_all(self, corpus, backend):
+        result = reconcile_corpus(corpus, fix_all=True)
+        assert result['fixed'] == 2
+        assert reconcile_corpus(corpus)['mismatches'] == []
+
+    def test_bad_duration_reported(self, corpus, backend):
+        write_sidecar(corpus, "tc-bad", "10m00s", ["ab:cd"])
+        result = reconcile_corpus(corpus)
+        assert [Path(e['folder']).name for e in result['errors']] == ["tc-bad"]
+        assert result['tutorials'] == 3
+
+    def test_reads_a_git_revision(self, corpus, backend):
+        git = ["git", "-C", str(corpus), "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "Corpus"], check=True)
+        reconcile_corpus(corpus, fix_all=True)
+
+        with GitCorpus(corpus) as head:
+            result = reconcile_corpus(corpus, fix_all=True, source=head)
+        # The committed sidecars still mismatch, and a commit is never fixed
+        assert [m['folder'] for m in result['mismatches']] == ["tc-long", "tc-short"]
+        assert result['fixed'] == 0
+
+    def test_cli_exit_code(self, corpus, monkeypatch):
+        """Mismatches fail the run until --fix-all fixes them."""
+        codes = []
+        for extra in ([], ["--fix-all"], []):
+            monkeypatch.setattr(sys, "argv", ["fix_sidecar.py", "--corpus", str(corpus), "--json", *extra])
+            with pytest.raises(SystemExit) as exit_info:
+                fix_sidecar.main()
+            codes.append(exit_info.value.code)
+        assert codes == [1, 0, 0]
+
+    def test_stats(self, corpus, backend):
+        stats = duration_stats(load_corpus_durations(corpus)[0])
+        assert stats['tutorials'] == 3
+        assert stats['steps'] == 6
+        assert stats['step_minutes']['p50'] == 5.0
+        assert stats['tutorial_minutes']['p50'] == 10.0
+
+
+class TestPercentiles:
+    """The fallback matches numpy.percentile's linear interpolation."""
+
+    def test_linear_interpolation(self, backend):
+        assert percentiles([1, 2, 3, 4], points=(0, 50, 100)) == {"p0": 1.0, "p50": 2.5, "p100": 4.0}
+        assert percentiles([10], points=(25,)) == {"p25": 10.0}
+        assert percentiles([]) == {}
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
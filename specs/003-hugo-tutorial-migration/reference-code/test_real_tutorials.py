@@ -20,19 +20,49 @@ Usage:
 
     # Output as JSON for analysis
     python tests/test_real_tutorials.py /path/to/ciscou-tutorial-content --json > results.json
+
+    # Record a golden snapshot of every issue, then diff a rule change against it
+    python tests/test_real_tutorials.py /path/to/ciscou-tutorial-content --snapshot golden.json
+    python tests/test_real_tutorials.py /path/to/ciscou-tutorial-content --diff golden.json
+
+    # Trends and the snapshot document from the scan history database
+    python tests/test_real_tutorials.py --runs
+    python tests/test_real_tutorials.py /path/to/ciscou-tutorial-content --trend HTML_TAG
+    python tests/test_real_tutorials.py --render-snapshot scan-results-snapshot.md
+
+    # Nightly: rescan only tutorials whose git tree changed since the last run
+    python tests/test_real_tutorials.py /path/to/ciscou-tutorial-content --incremental
+
+    # Snapshot a revision straight from git objects (no checkout; works on
+    # bare and blobless clones, see tools/git_corpus.py)
+    python tests/test_real_tutorials.py /path/to/ciscou-tutorial-content --rev origin/main --snapshot main.json
+
+Snapshot and diff runs check files in parallel (--jobs) and cache results
+per file content and rule (--cache). The cache is keyed on the blob id of
+clean_markdown.py, so any edit to it re-runs every check.
+
+Every scan is recorded in a SQLite history database (--history, see
+scan_history.py) unless --no-history is given.
 """
 
 import os
+import re
 import sys
 import json
+import hashlib
 import argparse
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+from scan_history import ScanHistory, render_snapshot_markdown
 
 # Add tools directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'tools'))
 
-from clean_markdown import validate_folder, Severity
+import clean_markdown
+from clean_markdown import validate_folder, Severity, DETECTION_CHECKS
+from git_corpus import GitCorpus, GitError, git, hash_blob
 
 
 def find_tutorials(repo_path: Path) -> list[Path]:
@@ -46,10 +76,13 @@ def find_tutorials(repo_path: Path) -> list[Path]:
     return sorted(tutorials)
 
 
-def analyze_tutorials(tutorials: list[Path], dry_run_fix: bool = False) -> dict:
+def analyze_tutorials(tutorials: list[Path], dry_run_fix: bool = False, issues_by_tutorial: dict = None) -> dict:
     """
     Analyze all tutorials and collect issue statistics.
 
+    If `issues_by_tutorial` is given, each scanned tutorial's issues are
+    added to it as issue dicts (see issue_to_dict) for the scan history.
+
     Returns:
         Dictionary with analysis results
     """
@@ -70,6 +103,8 @@ def analyze_tutorials(tutorials: list[Path], dry_run_fix: bool = False) -> dict:
 
         try:
             result = validate_folder(str(tutorial_path), auto_fix=False, skip_ai=True)
+            if issues_by_tutorial is not None:
+                issues_by_tutorial[tutorial_path.name] = [issue_to_dict(i) for i in result.issues]
 
             tutorial_info = {
                 "name": tutorial_path.name,
@@ -169,12 +204,406 @@ def print_report(results: dict):
             print("✅ Blocking rate looks reasonable")
 
 
+# =============================================================================
+# Golden Snapshots
+# =============================================================================
+
+SNAPSHOT_VERSION = 1
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "tutorial-testing"
+
+DEFAULT_CACHE = CACHE_DIR / "scan-cache.json"
+
+LINE_REFERENCE = re.compile(r'\bLines? \d+(?:-\d+)?:?\s*')
+
+
+def rules_source_hash() -> str:
+    """
+    Git blob id of clean_markdown.py, the key for cached check results.
+
+    Any edit to the module re-runs every check: coarser than tracking what
+    each check reaches, but a helper or class a check depends on can never
+    be missed.
+    """
+    with open(clean_markdown.__file__, "rb") as f:
+        return hash_blob(f.read())
+
+
+def issue_to_dict(issue) -> dict:
+    return {
+        "rule": issue.rule_id,
+        "file": os.path.basename(issue.file_path),
+        "line": issue.line_number,
+        "severity": issue.severity.value,
+        "message": issue.message,
+        "match": issue.match,
+    }
+
+
+def check_file(file_path: str, check_names: list, content: str = None) -> dict:
+    """Run the named checks on one file: {check name: [issue dicts]}."""
+    if content is None:
+        with open(file_path, "r", encoding="utf-8") as f:
+            content = f.read()
+    return {
+        name: [issue_to_dict(i) for i in getattr(clean_markdown, name)(content, file_path)]
+        for name in check_names
+    }
+
+
+def load_cache(cache_path) -> dict:
+    if not cache_path or not Path(cache_path).exists():
+        return {}
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_cache(cache_path, cache: dict):
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(cache, f, separators=(",", ":"))
+    os.replace(tmp_path, cache_path)
+
+
+def scan_corpus(tutorials: list, jobs: int = None, cache_path=DEFAULT_CACHE, corpus: GitCorpus = None) -> tuple:
+    """
+    Run every detection check on every markdown file of `tutorials`.
+
+    Results are cached by (file blob id, check name, clean_markdown.py
+    blob id); files with missing entries are checked in a process pool.
+    With a GitCorpus, files are listed from its tree and only uncached
+    blobs are read. Returns
+    ({tutorial name: [issue dicts]}, {"cached": n, "checked": n}).
+    """
+    rules = rules_source_hash()
+    names = [check.__name__ for check in DETECTION_CHECKS]
+    cache = load_cache(cache_path)
+    issues = defaultdict(list)
+    pending = []  # (tutorial, path, blob id, missing check names)
+    stats = Counter()
+
+    for tutorial in tutorials:
+        issues[tutorial.name]  # Clean tutorials still appear in the snapshot
+        if corpus:
+            files = [(Path(p), corpus.blob_id(p)) for p in corpus.list_files(tutorial.name, "*.md")]
+        else:
+            files = [(p, hash_blob(p.read_bytes())) for p in sorted(tutorial.glob("*.md"))]
+        for path, digest in files:
+            missing = []
+            for name in names:
+                cached = cache.get(f"{digest}:{name}:{rules}")
+                if cached is None:
+                    missing.append(name)
+                else:
+                    # Same content may live under another name elsewhere
+                    issues[tutorial.name].extend(dict(i, file=path.name) for i in cached)
+                    stats["cached"] += 1
+            if missing:
+                pending.append((tutorial.name, path, digest, missing))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(check_file, str(path), missing, corpus.read_text(path.as_posix()) if corpus else None)
+                for _, path, _, missing in pending
+            ]
+            for (tutorial_name, _, digest, _), future in zip(pending, futures):
+                for name, found in future.result().items():
+                    cache[f"{digest}:{name}:{rules}"] = found
+                    issues[tutorial_name].extend(found)
+                    stats["checked"] += 1
+        if cache_path:
+            save_cache(cache_path, cache)
+
+    return dict(issues), dict(stats)
+
+
+def fingerprint_issues(issues: list) -> dict:
+    """
+    Stable fingerprints for one tutorial's issues.
+
+    A fingerprint is rule + file + normalized matched text; line numbers
+    are left out so edits elsewhere in a file don't churn the snapshot.
+    Repeats of the same text get an occurrence suffix.
+    """
+    fingerprints = {}
+    seen = Counter()
+    for issue in sorted(issues, key=lambda i: (i["file"], i["line"], i["rule"], i["message"])):
+        text = issue["match"] or LINE_REFERENCE.sub("", issue["message"])
+        text = " ".join(text.split())
+        digest = hashlib.sha1(f"{issue['rule']}\0{issue['file']}\0{text}".encode("utf-8")).hexdigest()[:12]
+        key = f"{issue['rule']}:{issue['file']}:{digest}"
+        seen[key] += 1
+        if seen[key] > 1:
+            key += f"#{seen[key]}"
+        fingerprints[key] = {k: issue[k] for k in ("rule", "file", "line", "message")}
+    return fingerprints
+
+
+def build_snapshot(issues_by_tutorial: dict) -> dict:
+    return {
+        "version": SNAPSHOT_VERSION,
+        "tutorials": {name: fingerprint_issues(issues) for name, issues in sorted(issues_by_tutorial.items())},
+    }
+
+
+def write_snapshot(path, snapshot: dict):
+    with open(path, "w") as f:
+        json.dump(snapshot, f, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+def load_snapshot(path) -> dict:
+    with open(path) as f:
+        snapshot = json.load(f)
+    if snapshot.get("version") != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {snapshot.get('version')}")
+    return snapshot
+
+
+def diff_snapshots(old: dict, new: dict) -> dict:
+    """
+    Issues added and removed between two snapshots.
+
+    Only tutorials present in both are compared; the rest are listed as
+    added or removed tutorials.
+    """
+    old_tutorials, new_tutorials = old["tutorials"], new["tutorials"]
+    added, removed = [], []
+    for name in sorted(old_tutorials.keys() & new_tutorials.keys()):
+        before, after = old_tutorials[name], new_tutorials[name]
+        added += [dict(after[k], tutorial=name) for k in sorted(after.keys() - before.keys())]
+        removed += [dict(before[k], tutorial=name) for k in sorted(before.keys() - after.keys())]
+
+    by_rule = defaultdict(lambda: {"added": 0, "removed": 0})
+    for issue in added:
+        by_rule[issue["rule"]]["added"] += 1
+    for issue in removed:
+        by_rule[issue["rule"]]["removed"] += 1
+
+    return {
+        "added": added,
+        "removed": removed,
+        "by_rule": dict(sorted(by_rule.items())),
+        "tutorials_added": sorted(new_tutorials.keys() - old_tutorials.keys()),
+        "tutorials_removed": sorted(old_tutorials.keys() - new_tutorials.keys()),
+    }
+
+
+def print_diff(diff: dict, limit: int = 50):
+    """Print a per-rule table and the changed issues by file."""
+    print("\n" + "=" * 70)
+    print("SNAPSHOT DIFF")
+    print("=" * 70)
+
+    if not diff["added"] and not diff["removed"]:
+        print("\n✅ No issue changes")
+    else:
+        print(f"\n{'RULE':<30} {'ADDED':>8} {'REMOVED':>8}")
+        for rule, counts in diff["by_rule"].items():
+            print(f"{rule:<30} {counts['added']:>8} {counts['removed']:>8}")
+
+        changes = [("+", i) for i in diff["added"]] + [("-", i) for i in diff["removed"]]
+        changes.sort(key=lambda c: (c[1]["tutorial"], c[1]["file"], c[1]["line"]))
+        print("\n" + "-" * 70)
+        current = None
+        for sign, issue in changes[:limit]:
+            location = f"{issue['tutorial']}/{issue['file']}"
+            if location != current:
+                print(f"{location}:")
+                current = location
+            print(f"  {sign} {issue['rule']} line {issue['line']}: {issue['message'][:80]}")
+        if len(changes) > limit:
+            print(f"  ... and {len(changes) - limit} more")
+
+    for label in ("tutorials_added", "tutorials_removed"):
+        if diff[label]:
+            print(f"\n{label.replace('_', ' ').capitalize()}: {', '.join(diff[label])}")
+
+
+# =============================================================================
+# Scan History
+# =============================================================================
+
+DEFAULT_HISTORY = CACHE_DIR / "scan-history.db"
+
+
+def rules_version() -> str:
+    """Short blob id of clean_markdown.py, the rules a run was made with."""
+    return rules_source_hash()[:12]
+
+
+def record_history(history_path, corpus: Path, issues_by_tutorial: dict, label: str = None, errors: int = 0,
+                   trees: dict = None) -> int:
+    """
+    Record one scan (counts, fingerprints and git trees) in the history
+    database. `trees` defaults to those of the corpus checkout.
+    """
+    with ScanHistory(history_path) as history:
+        return history.record_run(
+            issues_by_tutorial,
+            corpus=str(corpus),
+            fingerprints=build_snapshot(issues_by_tutorial)["tutorials"],
+            label=label,
+            rules_version=rules_version(),
+            errors=errors,
+            trees=current_trees(corpus) if trees is None else trees,
+        )
+
+
+def results_from_history(history: ScanHistory, run_id: int, corpus: Path) -> dict:
+    """A recorded run in analyze_tutorials() form, for print_report and --json."""
+    results = {
+        "total_tutorials": 0,
+        "tutorials_with_issues": 0,
+        "tutorials_with_blocking": 0,
+        "total_issues": 0,
+        "total_blocking": 0,
+        "total_warnings": 0,
+        "issues_by_rule": {rule: c["count"] for rule, c in history.rule_counts(run_id).items()},
+        "tutorials_by_status": defaultdict(list),
+        "tutorial_details": [],
+    }
+    for tutorial in history.tutorial_counts(run_id):
+        name, blocking, warnings = tutorial["tutorial"], tutorial["blocking"], tutorial["warnings"]
+        results["total_tutorials"] += 1
+        results["tutorials_with_issues"] += bool(blocking or warnings)
+        results["tutorials_with_blocking"] += bool(blocking)
+        results["total_issues"] += blocking + warnings
+        results["total_blocking"] += blocking
+        results["total_warnings"] += warnings
+        status = "blocking" if blocking else "warnings_only" if warnings else "clean"
+        results["tutorials_by_status"][status].append(name)
+        results["tutorial_details"].append({
+            "name": name,
+            "path": str(corpus / name),
+            "issues": blocking + warnings,
+            "blocking": blocking,
+            "warnings": warnings,
+            "issue_types": tutorial["rules"],
+        })
+    return results
+
+
+def print_runs(history: ScanHistory, corpus: str = None):
+    print(f"{'RUN':>5}  {'STARTED':<25} {'TUTORIALS':>9} {'BLOCKING':>9} {'WARNINGS':>9}  CORPUS")
+    for run in history.runs(corpus):
+        summary = history.summary(run["id"])
+        label = f" ({run['label']})" if run["label"] else ""
+        print(f"{run['id']:>5}  {run['started_at']:<25} {run['tutorials']:>9} "
+              f"{summary['blocking']:>9} {summary['warnings']:>9}  {run['corpus']}{label}")
+
+
+def print_trend(history: ScanHistory, name: str, corpus: str):
+    """Per-run counts for a rule, or for a tutorial when `name` is a tc-* folder."""
+    if name.startswith("tc-"):
+        print(f"{'RUN':>5}  {'STARTED':<25} {'BLOCKING':>9} {'WARNINGS':>9}")
+        for run_id, started_at, blocking, warnings in history.tutorial_trend(name):
+            print(f"{run_id:>5}  {started_at:<25} {blocking:>9} {warnings:>9}")
+    else:
+        print(f"{'RUN':>5}  {'STARTED':<25} {name:>9}")
+        for run_id, started_at, count in history.rule_trend(name, corpus):
+            print(f"{run_id:>5}  {started_at:<25} {count:>9}")
+
+
+def render_snapshot(history_path, output: str, run_id: int = None, baseline_id: int = None):
+    """Write the snapshot markdown for a run (default: latest) against a baseline (default: previous run)."""
+    with ScanHistory(history_path) as history:
+        if run_id is None:
+            latest = history.runs(limit=1)
+            if not latest:
+                raise ValueError(f"No runs recorded in {history_path}")
+            run_id = latest[0]["id"]
+        if baseline_id is None:
+            baseline_id = history.previous_run(run_id)
+        markdown = render_snapshot_markdown(history, run_id, baseline_id)
+    if output == "-":
+        sys.stdout.write(markdown)
+    else:
+        Path(output).write_text(markdown)
+        print(f"Snapshot markdown written: {output} (run #{run_id})")
+
+
+# =============================================================================
+# Incremental Scans
+# =============================================================================
+
+def git_tree_hashes(corpus: Path) -> dict:
+    """
+    {tc-* folder: git tree hash at HEAD} for the folders of `corpus`.
+
+    Uses plumbing only (GitCorpus.tutorial_trees, diff-index, ls-files),
+    so nothing is checked out. Folders with uncommitted or untracked
+    files are left out: their HEAD tree doesn't describe what a scan
+    would see.
+    """
+    try:
+        git(corpus, "update-index", "-q", "--refresh")
+    except GitError:
+        pass  # Stale stat info only makes diff-index report extra folders
+    with GitCorpus(corpus) as head:
+        trees = head.tutorial_trees()
+
+    dirty = git(corpus, "diff-index", "-z", "--name-only", "--relative", "HEAD", "--")
+    dirty += git(corpus, "ls-files", "-z", "--others", "--exclude-standard")
+    for changed_path in dirty.split("\0"):
+        if changed_path:
+            trees.pop(changed_path.split("/")[0], None)
+    return trees
+
+
+def current_trees(corpus: Path) -> dict:
+    """git_tree_hashes(), or {} when `corpus` isn't in a git work tree."""
+    try:
+        return git_tree_hashes(corpus)
+    except (OSError, GitError):
+        return {}
+
+
+def incremental_scan(corpus: Path, tutorials: list, history_path, jobs: int = None,
+                     cache_path=DEFAULT_CACHE, label: str = None) -> tuple:
+    """
+    Rescan only tutorials whose git tree changed since the last run.
+
+    The previous run is the newest run of `corpus` made with the same
+    rules; without one, every tutorial is scanned. Unchanged tutorials
+    are carried over from it into the new run. Returns (run id, names of
+    the rescanned tutorials).
+    """
+    trees = git_tree_hashes(corpus)
+    version = rules_version()
+    with ScanHistory(history_path) as history:
+        previous = history.latest_run(str(corpus), version)
+        old_trees = history.tutorial_trees(previous) if previous else {}
+        changed = [t for t in tutorials if trees.get(t.name) is None or old_trees.get(t.name) != trees[t.name]]
+        unchanged = {t.name for t in tutorials} - {t.name for t in changed}
+
+        issues, _ = scan_corpus(changed, jobs, cache_path)
+        run_id = history.record_run(
+            issues,
+            corpus=str(corpus),
+            fingerprints=build_snapshot(issues)["tutorials"],
+            label=label,
+            rules_version=version,
+            trees=trees,
+            carry_from=previous,
+            carried=unchanged,
+        )
+    return run_id, [t.name for t in changed]
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Test markdown validation against real tutorials"
     )
     parser.add_argument(
         "path",
+        nargs="?",
         help="Path to tutorial repository or specific tc-* folder"
     )
     parser.add_argument(
@@ -192,17 +621,122 @@ def main():
         type=int,
         help="Limit number of tutorials to scan"
     )
+    parser.add_argument(
+        "--snapshot",
+        metavar="FILE",
+        help="Write a golden snapshot of every issue fingerprint to FILE"
+    )
+    parser.add_argument(
+        "--diff",
+        metavar="FILE",
+        help="Compare current issues against a snapshot; exit 1 on any change"
+    )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Worker processes for snapshot/diff (default: CPU count)"
+    )
+    parser.add_argument(
+        "--cache",
+        default=str(DEFAULT_CACHE),
+        help=f"Per-file result cache (default: {DEFAULT_CACHE})"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Check every file without reading or writing the cache"
+    )
+    parser.add_argument(
+        "--history",
+        default=str(DEFAULT_HISTORY),
+        help=f"Scan history database (default: {DEFAULT_HISTORY})"
+    )
+    parser.add_argument(
+        "--no-history",
+        action="store_true",
+        help="Don't record this scan in the history database"
+    )
+    parser.add_argument(
+        "--label",
+        help="Label for this run in the history database (e.g. 'after false positive fixes')"
+    )
+    parser.add_argument(
+        "--runs",
+        action="store_true",
+        help="List recorded runs (for PATH's corpus if given) and exit"
+    )
+    parser.add_argument(
+        "--trend",
+        metavar="RULE_OR_TUTORIAL",
+        help="Show per-run counts for a rule in PATH's corpus, or for a tc-* tutorial, and exit"
+    )
+    parser.add_argument(
+        "--render-snapshot",
+        metavar="FILE",
+        help="Render scan-results-snapshot.md from the history database ('-' for stdout) and exit"
+    )
+    parser.add_argument(
+        "--run",
+        type=int,
+        help="Run to render (default: latest)"
+    )
+    parser.add_argument(
+        "--baseline",
+        type=int,
+        help="Run to compare against when rendering (default: previous run of the same corpus)"
+    )
+    parser.add_argument(
+        "--rev",
+        help="With --snapshot/--diff: scan this git revision of PATH from the object database, without a checkout"
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Rescan only tutorials whose git tree changed since the last recorded run"
+    )
 
     args = parser.parse_args()
 
-    path = Path(args.path).resolve()
+    if args.render_snapshot:
+        try:
+            render_snapshot(args.history, args.render_snapshot, args.run, args.baseline)
+        except ValueError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        return
+
+    path = Path(args.path).resolve() if args.path else None
+    if args.runs or args.trend:
+        if args.trend and not args.trend.startswith("tc-") and path is None:
+            parser.error("--trend RULE needs the corpus PATH")
+        with ScanHistory(args.history) as history:
+            if args.runs:
+                print_runs(history, str(path) if path else None)
+            else:
+                print_trend(history, args.trend, str(path))
+        return
+
+    if path is None:
+        parser.error("PATH is required unless --runs, --trend or --render-snapshot is given")
 
     if not path.exists():
         print(f"Error: Path not found: {path}")
         sys.exit(1)
 
+    git_corpus = None
+    if args.rev:
+        if not (args.snapshot or args.diff):
+            parser.error("--rev works with --snapshot and --diff")
+        repo = path.parent if path.name.startswith("tc-") else path
+        try:
+            git_corpus = GitCorpus(repo, args.rev)
+            names = [path.name] if path.name.startswith("tc-") else git_corpus.tutorials()
+        except GitError as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        tutorials = [repo / name for name in names]
     # Determine if this is a single tutorial or a repo
-    if path.name.startswith("tc-"):
+    elif path.name.startswith("tc-"):
         tutorials = [path]
     else:
         tutorials = find_tutorials(path)
@@ -216,7 +750,52 @@ def main():
 
     print(f"Found {len(tutorials)} tutorial(s) to scan")
 
-    results = analyze_tutorials(tutorials, dry_run_fix=args.dry_run_fix)
+    if args.incremental:
+        if args.no_history:
+            parser.error("--incremental needs the history database")
+        try:
+            run_id, rescanned = incremental_scan(path, tutorials, args.history, args.jobs,
+                                                 None if args.no_cache else args.cache, args.label)
+        except (OSError, GitError) as e:
+            print(f"Error: incremental scan needs a git work tree: {path} ({e})")
+            sys.exit(1)
+        print(f"Rescanned {len(rescanned)} changed tutorial(s), "
+              f"{len(tutorials) - len(rescanned)} unchanged; recorded run #{run_id}")
+        with ScanHistory(args.history) as history:
+            snapshot = {"version": SNAPSHOT_VERSION, "tutorials": history.fingerprints(run_id)}
+            results = results_from_history(history, run_id, path)
+
+    elif args.snapshot or args.diff:
+        issues, stats = scan_corpus(tutorials, args.jobs, None if args.no_cache else args.cache, git_corpus)
+        snapshot = build_snapshot(issues)
+        print(f"Checks: {stats.get('checked', 0)} run, {stats.get('cached', 0)} cached")
+        if not args.no_history:
+            trees = git_corpus.tutorial_trees() if git_corpus else None
+            run_id = record_history(args.history, path, issues, args.label, trees=trees)
+            print(f"Recorded run #{run_id} in {args.history}")
+
+    if args.snapshot or args.diff:
+        if args.snapshot:
+            write_snapshot(args.snapshot, snapshot)
+            total = sum(len(v) for v in snapshot["tutorials"].values())
+            print(f"Snapshot written: {args.snapshot} ({total} issues)")
+
+        if args.diff:
+            diff = diff_snapshots(load_snapshot(args.diff), snapshot)
+            if args.json:
+                print(json.dumps(diff, indent=2))
+            else:
+                print_diff(diff)
+            changed = diff["added"] or diff["removed"] or diff["tutorials_added"] or diff["tutorials_removed"]
+            sys.exit(1 if changed else 0)
+        return
+
+    if not args.incremental:
+        issues = {}
+        results = analyze_tutorials(tutorials, dry_run_fix=args.dry_run_fix, issues_by_tutorial=issues)
+        if not args.no_history:
+            errors = sum(1 for t in results["tutorial_details"] if "error" in t)
+            record_history(args.history, path, issues, args.label, errors)
 
     if args.json:
         # Convert defaultdicts to regular dicts for JSON
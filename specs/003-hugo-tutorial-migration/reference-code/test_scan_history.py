@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Tests for scan_history.py and the history options of test_real_tutorials.py.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import test_real_tutorials
+from git_fixtures import git
+from scan_history import ScanHistory, format_change, render_snapshot_markdown
+from test_real_tutorials import build_snapshot, find_tutorials, git_tree_hashes, incremental_scan, scan_corpus
+
+
+CORPUS = "/repo/ciscou-tutorial-content"
+
+
+def issue(rule, line, match="", severity="BLOCKING", file="step-1.md"):
+    return {"rule": rule, "file": file, "line": line, "severity": severity,
+            "message": f"Line {line}: problem", "match": match}
+
+
+BEFORE = {
+    "tc-a": [issue("HTML_TAG", 3, "<br>"), issue("CODE_BLOCK_IN_LIST", 7, "```"),
+             issue("DOUBLE_SPACE", 9, "  ", "WARNING")],
+    "tc-b": [issue("CODE_BLOCK_IN_LIST", 4, "```")],
+    "tc-c": [],
+}
+
+AFTER = {
+    "tc-a": [issue("HTML_TAG", 5, "<br>"), issue("DOUBLE_SPACE", 9, "  ", "WARNING")],
+    "tc-b": [],
+    "tc-c": [],
+}
+
+
+def record(history, issues, **kwargs):
+    return history.record_run(issues, CORPUS, fingerprints=build_snapshot(issues)["tutorials"], **kwargs)
+
+
+@pytest.fixture
+def history(tmp_path):
+    with ScanHistory(tmp_path / "history.db") as history:
+        yield history
+
+
+class TestRecording:
+    """Tests for writing runs"""
+
+    def test_counts(self, history):
+        run_id = record(history, BEFORE, label="before fixes", rules_version="abc")
+        assert history.get_run(run_id)["label"] == "before fixes"
+        assert history.summary(run_id) == {
+            "tutorials": 3, "tutorials_with_blocking": 2, "clean": 1,
+            "blocking": 3, "warnings": 1, "total_issues": 4, "blocking_rate": pytest.approx(66.67, 0.01),
+        }
+        assert history.rule_counts(run_id)["CODE_BLOCK_IN_LIST"] == {"severity": "BLOCKING", "count": 2}
+        assert history.tutorial_counts(run_id)[0] == {
+            "tutorial": "tc-a", "blocking": 2, "warnings": 1,
+            "rules": ["CODE_BLOCK_IN_LIST", "DOUBLE_SPACE", "HTML_TAG"],
+        }
+
+    def test_failed_write_leaves_no_run(self, history):
+        issues = {"tc-a": [issue("HTML_TAG", 3, "<br>")]}
+        # The last insert fails after the run and count rows were written
+        fingerprints = {"tc-a": {"HTML_TAG:step-1.md:x": dict(issues["tc-a"][0], line=object())}}
+        with pytest.raises(sqlite3.Error):
+            history.record_run(issues, CORPUS, fingerprints=fingerprints)
+        assert history.runs() == []
+        assert history.conn.execute("SELECT COUNT(*) FROM rule_counts").fetchone()[0] == 0
+
+
+class TestQueries:
+    """Tests for trends and run lookup"""
+
+    def test_trends(self, history):
+        first = record(history, BEFORE)
+        history.record_run({"tc-x": []}, "/other/corpus")
+        second = record(history, AFTER)
+
+        assert history.previous_run(second) == first
+        assert [count for _, _, count in history.rule_trend("CODE_BLOCK_IN_LIST", CORPUS)] == [2, 0]
+        assert [row[2:] for row in history.tutorial_trend("tc-a")] == [(2, 1), (1, 1)]
+        assert [run["id"] for run in history.runs(CORPUS)] == [second, first]
+
+    def test_fingerprint_changes_ignore_line_shifts(self, history):
+        first = record(history, BEFORE)
+        second = record(history, AFTER)
+        assert history.fingerprint_changes(first, second) == {"CODE_BLOCK_IN_LIST": {"added": 0, "removed": 2}}
+
+    def test_trend_queries_use_indexes(self, history):
+        plan = " ".join(row[-1] for row in history.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM tutorial_counts WHERE tutorial = ?", ("tc-a",)))
+        assert "idx_tutorial_counts_tutorial" in plan
+        plan = " ".join(row[-1] for row in history.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM runs WHERE corpus = ? ORDER BY id DESC", (CORPUS,)))
+        assert "idx_runs_corpus" in plan
+
+
+class TestSnapshotMarkdown:
+    """Tests for rendering scan-results-snapshot.md"""
+
+    def test_format_change(self):
+        assert format_change(52, 19) == "-63%"
+        assert format_change(12, 24) == "+100%"
+        assert format_change(138, 138) == "-"
+        assert format_change(0, 3) == "new"
+        assert format_change(37.7, 13.8, "pp") == "-24pp"
+
+    def test_before_and_after(self, history):
+        first = record(history, BEFORE, label="before fixes")
+        second = record(history, AFTER, label="after fixes", rules_version="abc123")
+        markdown = render_snapshot_markdown(history, second, first)
+
+        assert markdown.startswith("# Validation Scan Results Snapshot\n")
+        assert "**Tool Version**: clean_markdown.py (rules abc123)" in markdown
+        assert "### ciscou-tutorial-content (3 tutorials)" in markdown
+        assert "| Tutorials with blocking issues | 2 | 1 | -50% |" in markdown
+        assert "| **Blocking rate** | 66.7% | 33.3% | -33pp |" in markdown
+        assert "| CODE_BLOCK_IN_LIST | 2 | 0 | -100% | BLOCKING |" in markdown
+        assert "| CODE_BLOCK_IN_LIST | 0 | 2 |" in markdown  # Issue changes table
+        assert "| tc-a | 1 | 1 | DOUBLE_SPACE, HTML_TAG |" in markdown
+        assert "These 2 tutorials passed all validation checks:\n\n- tc-b\n- tc-c\n" in markdown
+
+    def test_without_baseline(self, history):
+        markdown = render_snapshot_markdown(history, record(history, BEFORE))
+        assert "| Total issues | 4 |" in markdown
+        assert "| HTML_TAG | 1 | BLOCKING |" in markdown
+        assert "Baseline" not in markdown
+
+
+class TestCli:
+    """History recording and rendering through test_real_tutorials.main()"""
+
+    def run_main(self, monkeypatch, *args):
+        monkeypatch.setattr(sys, "argv", ["test_real_tutorials.py", *args])
+        test_real_tutorials.main()
+
+    def test_scan_then_render(self, tmp_path, monkeypatch, capsys):
+        corpus = tmp_path / "corpus"
+        (corpus / "tc-one").mkdir(parents=True)
+        (corpus / "tc-one" / "step-1.md").write_text("# One\n\nLine<br>break\n")
+        (corpus / "tc-two").mkdir()
+        (corpus / "tc-two" / "step-1.md").write_text("# Two\n\nClean.\n")
+        db = str(tmp_path / "history.db")
+
+        self.run_main(monkeypatch, str(corpus), "--history", db, "--label", "before")
+        (corpus / "tc-one" / "step-1.md").write_text("# One\n\nLine break\n")
+        self.run_main(monkeypatch, str(corpus), "--history", db, "--snapshot", str(tmp_path / "golden.json"),
+                      "--no-cache", "-j", "1")
+        capsys.readouterr()
+
+        self.run_main(monkeypatch, "--history", db, "--trend", "HTML_TAG", str(corpus))
+        assert [line.split()[-1] for line in capsys.readouterr().out.splitlines()[1:]] == ["1", "0"]
+
+        output = tmp_path / "snapshot.md"
+        self.run_main(monkeypatch, "--history", db, "--render-snapshot", str(output))
+        markdown = output.read_text()
+        assert "**Baseline**:" in markdown and ", before)" in markdown
+        assert "| HTML_TAG | 1 | 0 | -100% | BLOCKING |" in markdown
+
+    def test_path_required_for_scan(self, tmp_path, monkeypatch):
+        with pytest.raises(SystemExit):
+            self.run_main(monkeypatch, "--history", str(tmp_path / "history.db"))
+
+
+@pytest.fixture
+def repo(make_repo):
+    """A git repository with three committed tutorials."""
+    return make_repo({
+        "tc-one/step-1.md": "# One\n\nLine<br>break\n",
+        "tc-two/step-1.md": "# Two\n\nSome  spaces.\n",
+        "tc-three/step-1.md": "# Three\n\nClean.\n",
+        "README.md": "# Content\n",
+    })
+
+
+class TestIncremental:
+    """Rescans driven by git tree hashes"""
+
+    def scan(self, repo, db):
+        return incremental_scan(repo, find_tutorials(repo), db, jobs=1, cache_path=None)
+
+    def test_tree_hashes_skip_dirty_folders(self, repo):
+        trees = git_tree_hashes(repo)
+        assert sorted(trees) == ["tc-one", "tc-three", "tc-two"]
+        (repo / "tc-two" / "step-1.md").write_text("# Two\n\nEdited.\n")
+        (repo / "tc-three" / "notes.md").write_text("untracked\n")
+        assert sorted(git_tree_hashes(repo)) == ["tc-one"]
+
+    def test_rescans_only_changed_trees(self, repo, tmp_path):
+        db = tmp_path / "history.db"
+        first, rescanned = self.scan(repo, db)
+        assert rescanned == ["tc-one", "tc-three", "tc-two"]
+
+        (repo / "tc-one" / "step-1.md").write_text("# One\n\nLine break\n")
+        git(repo, "commit", "-q", "-am", "Fix tc-one")
+        second, rescanned = self.scan(repo, db)
+        assert rescanned == ["tc-one"]
+
+        # The merged run matches a full scan
+        issues, _ = scan_corpus(find_tutorials(repo), jobs=1, cache_path=None)
+        with ScanHistory(db) as history:
+            assert history.fingerprints(second) == build_snapshot(issues)["tutorials"]
+            assert history.summary(second)["blocking"] == 0
+            assert history.rule_counts(second) == {"DOUBLE_SPACE": {"severity": "WARNING", "count": 1}}
+            assert history.get_run(second)["tutorials"] == 3
+
+        _, rescanned = self.scan(repo, db)
+        assert rescanned == []
+
+    def test_uncommitted_changes_are_rescanned(self, repo, tmp_path):
+        db = tmp_path / "history.db"
+        self.scan(repo, db)
+        (repo / "tc-three" / "step-1.md").write_text("# Three\n\nNot<br>clean.\n")
+        run_id, rescanned = self.scan(repo, db)
+        assert rescanned == ["tc-three"]
+        with ScanHistory(db) as history:
+            assert history.tutorial_trees(run_id)["tc-three"] is None
+        # Still dirty: rescanned again next time
+        assert self.scan(repo, db)[1] == ["tc-three"]
+
+    def test_rule_change_forces_full_scan(self, repo, tmp_path, monkeypatch):
+        db = tmp_path / "history.db"
+        self.scan(repo, db)
+        monkeypatch.setattr(test_real_tutorials, "rules_version", lambda: "changed")
+        assert len(self.scan(repo, db)[1]) == 3
+
+    def test_cli(self, repo, tmp_path, monkeypatch, capsys):
+        db = str(tmp_path / "history.db")
+        monkeypatch.setattr(sys, "argv", ["test_real_tutorials.py", str(repo), "--history", db, "--no-cache"])
+        test_real_tutorials.main()
+        monkeypatch.setattr(sys, "argv", ["test_real_tutorials.py", str(repo), "--history", db, "--no-cache",
+                                          "--incremental", "--json"])
+        test_real_tutorials.main()
+        out = capsys.readouterr().out
+        assert "Rescanned 0 changed tutorial(s), 3 unchanged" in out
+        assert '"total_blocking": 1' in out
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
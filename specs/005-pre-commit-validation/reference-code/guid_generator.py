@@ -15,9 +15,27 @@ Usage:
     # JSON output for CI integration
     python tools/guid_generator.py tc-my-tutorial/sidecar.json --json
 
+    # The default cache is the index tools/guid_cache.db (see guid_index.py),
+    # created from tools/guid_cache.json on first use. With --fix, new GUIDs
+    # are reserved in the index, so parallel CI jobs can't collide.
+    python tools/guid_generator.py tc-my-tutorial/sidecar.json --cache tools/guid_cache.db --fix
+
+    # Batch mode: many sidecars (or a repo root) in one process, one report
+    python tools/guid_generator.py tc-*/sidecar.json --fix --json
+    python tools/guid_generator.py /path/to/repo --fix
+
+    # Corpus mode: report GUID collisions between all tc-* tutorials
+    python tools/guid_generator.py --corpus /path/to/ciscou-tutorial-content
+
+    # ...and regenerate guid_cache.json from the corpus
+    python tools/guid_generator.py --corpus /path/to/repo --write-cache tools/guid_cache.json
+
+    # ...as of a git revision, read from git objects without a checkout
+    python tools/guid_generator.py --corpus /path/to/repo --rev origin/main
+
 Exit codes:
     0 - All GUIDs valid (or fixed with --fix)
-    1 - GUID issues found (check-only mode)
+    1 - GUID issues found (check-only mode), or collisions found (--corpus)
     2 - Error (file not found, invalid JSON, etc.)
 """
 
@@ -27,9 +45,15 @@ import os
 import re
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+from file_source import GitError, open_source, tutorial_files
+from file_writer import WriteBatch
+from guid_index import GuidIndex, is_index_path, sync_json_cache
+from sidecar_model import Sidecar, load_sidecar, write_sidecar
+
 
 # UUID regex pattern (lowercase, with optional braces)
 UUID_PATTERN = re.compile(
@@ -76,6 +100,11 @@ def is_valid_guid(value: Optional[str]) -> bool:
     return bool(UUID_PATTERN.match(value.strip()))
 
 
+def normalize_guid(value: str) -> str:
+    """Canonical form for comparing GUIDs: lowercase, no braces or whitespace."""
+    return value.strip().strip('{}').lower()
+
+
 def is_placeholder_guid(value: Optional[str]) -> bool:
     """Check if a value looks like a placeholder (not a real GUID)."""
     if not value or not isinstance(value, str):
@@ -108,54 +137,89 @@ def load_guid_cache(cache_path: Path) -> set:
         with open(cache_path) as f:
             data = json.load(f)
             if isinstance(data, list):
-                return set(g.lower() for g in data if isinstance(g, str))
+                return set(normalize_guid(g) for g in data if isinstance(g, str))
     except (json.JSONDecodeError, IOError):
         pass
 
     return set()
 
 
-def extract_guids_from_sidecar(sidecar: dict) -> dict:
-    """Extract all GUID fields from sidecar.json."""
-    guids = {}
+def open_guid_cache(cache_path: Path):
+    """
+    Open a GUID cache for membership checks.
+
+    A GuidIndex database (.db) is queried per lookup without loading it,
+    and is created if it doesn't exist yet, so GUIDs generated by --fix are
+    always reserved. The guid_cache.json next to it is imported first when
+    it changed since the last import, so GUIDs the sync job brought in from
+    production are known. A guid_cache.json list is loaded into a set as
+    before.
+    """
+    if is_index_path(cache_path):
+        if not Path(cache_path).exists():
+            print(f"Note: creating GUID index {cache_path}", file=sys.stderr)
+        index = GuidIndex(cache_path)
+        json_path = Path(cache_path).with_suffix('.json')
+        try:
+            sync_json_cache(json_path, index)
+        except (json.JSONDecodeError, IOError, ValueError) as e:
+            print(f"Warning: could not import {json_path}: {e}", file=sys.stderr)
+        return index
+    return load_guid_cache(cache_path)
 
-    # Top-level GUIDs
-    if 'ia-guid' in sidecar:
-        guids['ia-guid'] = sidecar['ia-guid']
-    if 'lesson-guid' in sidecar:
-        guids['lesson-guid'] = sidecar['lesson-guid']
 
-    # File-level GUIDs (xy-guid)
-    for file_entry in sidecar.get('files', []):
-        file_name = file_entry.get('file', 'unknown')
-        if 'xy-guid' in file_entry:
-            guids[f"files/{file_name}/xy-guid"] = file_entry['xy-guid']
+def guid_owner(sidecar: dict, sidecar_path: Path) -> str:
+    """Source recorded in a GuidIndex for GUIDs reserved for this sidecar."""
+    return sidecar.get('id') or str(sidecar_path)
+
 
-    return guids
+def extract_guids_from_sidecar(sidecar: dict) -> dict:
+    """Extract all GUID fields from sidecar.json."""
+    return Sidecar(sidecar).guid_map
 
 
-def check_guids(sidecar_path: Path, cache_path: Optional[Path] = None) -> list:
+def check_guids(sidecar_path: Path, cache_path: Optional[Path] = None,
+                known_guids: Optional[set] = None,
+                claimed: Optional[set] = None) -> list:
     """
     Check sidecar.json for GUID issues.
 
+    ``cache_path`` may be a guid_cache.json list or a GuidIndex database.
+    Pass ``known_guids`` (e.g. from a single ``open_guid_cache`` call) to
+    check many sidecars without re-opening the cache each time; it takes
+    precedence over ``cache_path``.
+
+    ``claimed`` is a set of GUIDs already used by earlier sidecars in a
+    batch. GUIDs found in it are duplicates, and this sidecar's valid GUIDs
+    are added to it.
+
+    A GUID in a GuidIndex whose recorded source is this sidecar (reserved
+    for it by an earlier --fix) is its own, not a duplicate.
+
     Returns list of GuidIssue objects.
     """
     issues = []
 
-    # Load sidecar
+    # Load sidecar (parsed once per process, see sidecar_model)
     try:
-        with open(sidecar_path) as f:
-            sidecar = json.load(f)
-    except (json.JSONDecodeError, IOError) as e:
+        sidecar = load_sidecar(sidecar_path).data
+    except (ValueError, IOError) as e:
         raise RuntimeError(f"Failed to load sidecar: {e}")
 
     # Load cache for uniqueness checking
-    known_guids = set()
-    if cache_path:
-        known_guids = load_guid_cache(cache_path)
+    if known_guids is None:
+        known_guids = set()
+        if cache_path:
+            known_guids = open_guid_cache(cache_path)
+
+    # Track GUIDs in this file (and batch) for internal duplicate detection
+    seen_guids = claimed if claimed is not None else set()
+    owner = guid_owner(sidecar, sidecar_path)
 
-    # Track GUIDs in this file for internal duplicate detection
-    seen_guids = set()
+    def taken(guid: str) -> bool:
+        if guid not in known_guids:
+            return False
+        return not (isinstance(known_guids, GuidIndex) and known_guids.source_of(guid) == owner)
 
     # Check top-level GUIDs
     for field in ['ia-guid', 'lesson-guid']:
@@ -168,10 +232,10 @@ def check_guids(sidecar_path: Path, cache_path: Optional[Path] = None) -> list:
         elif not is_valid_guid(value):
             issues.append(GuidIssue(field, 'invalid', value))
         else:
-            normalized = value.lower().strip()
+            normalized = normalize_guid(value)
             if normalized in seen_guids:
                 issues.append(GuidIssue(field, 'duplicate', value))
-            elif normalized in known_guids:
+            elif taken(normalized):
                 issues.append(GuidIssue(field, 'duplicate', value))
             else:
                 seen_guids.add(normalized)
@@ -188,10 +252,10 @@ def check_guids(sidecar_path: Path, cache_path: Optional[Path] = None) -> list:
         elif not is_valid_guid(value):
             issues.append(GuidIssue('xy-guid', 'invalid', value, file_name=file_name))
         else:
-            normalized = value.lower().strip()
+            normalized = normalize_guid(value)
             if normalized in seen_guids:
                 issues.append(GuidIssue('xy-guid', 'duplicate', value, file_name=file_name))
-            elif normalized in known_guids:
+            elif taken(normalized):
                 issues.append(GuidIssue('xy-guid', 'duplicate', value, file_name=file_name))
             else:
                 seen_guids.add(normalized)
@@ -199,20 +263,46 @@ def check_guids(sidecar_path: Path, cache_path: Optional[Path] = None) -> list:
     return issues
 
 
-def fix_guids(sidecar_path: Path, issues: list) -> dict:
+def generate_unique_guid(*exclude) -> str:
+    """Generate a GUID not present in any of the given sets (or indexes)."""
+    while True:
+        new_guid = generate_guid()
+        if not any(new_guid in taken for taken in exclude):
+            return new_guid
+
+
+def fix_guids(sidecar_path: Path, issues: list, known_guids: Optional[set] = None,
+              claimed: Optional[set] = None, batch: Optional[WriteBatch] = None) -> dict:
     """
     Fix GUID issues by generating new UUIDs.
 
+    New GUIDs are guaranteed not to be in ``known_guids`` or ``claimed``;
+    each one is added to ``claimed`` so later sidecars in a batch can't
+    receive it either. When ``known_guids`` is a GuidIndex, each new GUID
+    is reserved in the index as it is generated (check and reserve in one
+    transaction), so concurrent runs sharing the index can't hand out the
+    same GUID.
+
+    With a ``batch``, the sidecar is staged there and written when the
+    batch commits; otherwise it is written atomically right away.
+
     Returns dict with changes made.
     """
-    # Load sidecar
-    with open(sidecar_path) as f:
-        sidecar = json.load(f)
+    # Copy of the cached sidecar from check_guids(); no second parse
+    sidecar = load_sidecar(sidecar_path).to_dict()
 
+    known_guids = known_guids if known_guids is not None else set()
+    claimed = claimed if claimed is not None else set()
     changes = []
 
+    source = guid_owner(sidecar, sidecar_path)
+
     for issue in issues:
-        new_guid = generate_guid()
+        if isinstance(known_guids, GuidIndex):
+            new_guid = known_guids.allocate(source=source, exclude=claimed)
+        else:
+            new_guid = generate_unique_guid(known_guids, claimed)
+        claimed.add(new_guid)
         issue.new_value = new_guid
 
         if issue.field in ['ia-guid', 'lesson-guid']:
@@ -236,13 +326,140 @@ def fix_guids(sidecar_path: Path, issues: list) -> dict:
                     break
 
     # Write updated sidecar
-    with open(sidecar_path, 'w') as f:
-        json.dump(sidecar, f, indent=2)
-        f.write('\n')  # Trailing newline
+    write_sidecar(sidecar_path, sidecar, batch)
 
     return {'changes': changes, 'file': str(sidecar_path)}
 
 
+# =============================================================================
+# Corpus mode
+# =============================================================================
+
+def load_sidecar_file(sidecar_path: Path, source=None) -> tuple:
+    """Read one sidecar; returns (path, sidecar dict or None, error or None)."""
+    try:
+        return sidecar_path, load_sidecar(sidecar_path, source).data, None
+    except (ValueError, IOError, GitError) as e:
+        return sidecar_path, None, str(e)
+
+
+def load_corpus_sidecars(repo_root: Path, max_workers: int = 8, source=None) -> list:
+    """
+    Load every tc-*/sidecar.json under repo_root in parallel.
+
+    With a commit `source` (file_source.py) they are read from its tree
+    through one shared git process. Returns (path, sidecar, error) tuples
+    in path order.
+    """
+    paths = tutorial_files(repo_root, 'sidecar.json', source)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(lambda path: load_sidecar_file(path, source), paths))
+
+
+def iter_sidecar_guids(sidecar: dict):
+    """Yield (field, file_name, value) for every GUID field in a sidecar."""
+    for field in ['ia-guid', 'lesson-guid']:
+        yield field, None, sidecar.get(field)
+    for file_entry in sidecar.get('files', []):
+        yield 'xy-guid', file_entry.get('file', 'unknown'), file_entry.get('xy-guid')
+
+
+def build_corpus_guid_map(sidecars: list) -> dict:
+    """
+    Index every valid GUID in the loaded sidecars.
+
+    Returns {normalized GUID: [location, ...]} where each location is a dict
+    with tutorial, field and file_name (xy-guid only).
+    """
+    guid_map = {}
+    for sidecar_path, sidecar, error in sidecars:
+        if sidecar is None:
+            continue
+        tutorial = sidecar_path.parent.name
+        for field, file_name, value in iter_sidecar_guids(sidecar):
+            if not is_valid_guid(value):
+                continue
+            guid_map.setdefault(normalize_guid(value), []).append({
+                'tutorial': tutorial,
+                'field': field,
+                'file_name': file_name
+            })
+    return guid_map
+
+
+def find_guid_collisions(guid_map: dict) -> dict:
+    """GUIDs used in more than one place, sorted by GUID."""
+    return {guid: locations for guid, locations in sorted(guid_map.items()) if len(locations) > 1}
+
+
+def write_guid_cache(guids, cache_path: Path) -> int:
+    """
+    Regenerate a GUID cache from an iterable of normalized GUIDs.
+
+    Writes a sorted guid_cache.json list atomically, or adds to a GuidIndex
+    when cache_path is a .db file. Returns the number of GUIDs written.
+    """
+    guids = sorted(guids)
+    if is_index_path(cache_path):
+        with GuidIndex(cache_path) as index:
+            index.add_many(guids)
+        return len(guids)
+
+    with WriteBatch() as batch:
+        batch.write_json(cache_path, guids, indent=2)
+    return len(guids)
+
+
+def format_location(location: dict) -> str:
+    """tc-example/ia-guid or tc-example/step-1.md/xy-guid."""
+    if location.get('file_name'):
+        return f"{location['tutorial']}/{location['file_name']}/{location['field']}"
+    return f"{location['tutorial']}/{location['field']}"
+
+
+def run_corpus_check(repo_root: Path, write_cache: Optional[Path] = None,
+                     as_json: bool = False, source=None) -> int:
+    """Report GUID collisions across the corpus; returns the exit code."""
+    sidecars = load_corpus_sidecars(repo_root, source=source)
+    guid_map = build_corpus_guid_map(sidecars)
+    collisions = find_guid_collisions(guid_map)
+    errors = [{'file': str(path), 'error': error} for path, _, error in sidecars if error]
+
+    written = None
+    if write_cache:
+        written = write_guid_cache(guid_map.keys(), write_cache)
+
+    if as_json:
+        print(json.dumps({
+            'tutorials': len(sidecars),
+            'guids': len(guid_map),
+            'collisions': [
+                {'guid': guid, 'locations': locations}
+                for guid, locations in collisions.items()
+            ],
+            'errors': errors,
+            'cache_written': str(write_cache) if write_cache else None
+        }, indent=2))
+    else:
+        print(f"Scanned {len(sidecars)} sidecar(s), {len(guid_map)} unique GUID(s)")
+        for error in errors:
+            print(f"  - {error['file']}: ERROR ({error['error']})")
+        if collisions:
+            print(f"\nFound {len(collisions)} GUID collision(s):\n")
+            for guid, locations in collisions.items():
+                print(f"  - {guid}")
+                for location in locations:
+                    print(f"      {format_location(location)}")
+        else:
+            print("No GUID collisions.")
+        if write_cache:
+            print(f"\nWrote {written} GUID(s) to {write_cache}")
+
+    if errors:
+        return 2
+    return 1 if collisions else 0
+
+
 def print_issues(issues: list, verbose: bool = False):
     """Print GUID issues in human-readable format."""
     if not issues:
@@ -267,6 +484,137 @@ def print_issues(issues: list, verbose: bool = False):
             print(f"    -> Generated: {issue.new_value}")
 
 
+# =============================================================================
+# Batch mode
+# =============================================================================
+
+def expand_sidecar_paths(paths: list) -> list:
+    """
+    Resolve CLI arguments to sidecar.json files.
+
+    Each argument may be a sidecar.json, a tutorial folder, or a repo root
+    (every tc-*/sidecar.json below it). Duplicates are dropped, order kept.
+    Paths that don't exist are returned as-is so the caller can report them.
+    """
+    sidecars = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            if (path / 'sidecar.json').exists():
+                sidecars.append(path / 'sidecar.json')
+            else:
+                sidecars.extend(sorted(path.glob('tc-*/sidecar.json')))
+        else:
+            sidecars.append(path)
+
+    seen = set()
+    unique = []
+    for sidecar_path in sidecars:
+        key = sidecar_path.resolve()
+        if key not in seen:
+            seen.add(key)
+            unique.append(sidecar_path)
+    return unique
+
+
+def find_default_cache(sidecar_path: Path) -> Optional[Path]:
+    """
+    The GUID cache in tools/ next to the tutorial folder: the index
+    guid_cache.db, which open_guid_cache() creates from guid_cache.json
+    on first use, so GUIDs generated by --fix are always reserved. None
+    if tools/ has neither file.
+    """
+    tools_dir = sidecar_path.parent.parent / 'tools'
+    index_path = tools_dir / 'guid_cache.db'
+    if index_path.exists() or (tools_dir / 'guid_cache.json').exists():
+        return index_path
+    return None
+
+
+def process_sidecar(sidecar_path: Path, known_guids, claimed: set, fix: bool = False,
+                    batch: Optional[WriteBatch] = None) -> tuple:
+    """Check (and optionally fix) one sidecar; returns (issues, result dict)."""
+    issues = check_guids(sidecar_path, known_guids=known_guids, claimed=claimed)
+
+    result = {
+        'file': str(sidecar_path),
+        'issues_found': len(issues),
+        'issues': [i.to_dict() for i in issues],
+        'fixed': False,
+        'changes': []
+    }
+
+    if issues and fix:
+        fix_result = fix_guids(sidecar_path, issues, known_guids, claimed, batch)
+        result['fixed'] = True
+        result['changes'] = fix_result['changes']
+        result['issues'] = [i.to_dict() for i in issues]
+
+    return issues, result
+
+
+def run_batch(sidecar_paths: list, known_guids, fix: bool = False) -> dict:
+    """
+    Check many sidecars against one loaded cache.
+
+    GUIDs are unique across the whole batch: a GUID already used by an
+    earlier sidecar is a duplicate, and generated GUIDs never repeat.
+    Sidecars that fail to load are reported and skipped.
+
+    Fixed sidecars are staged and replaced together at the end, so an
+    interrupted run leaves every sidecar as it was.
+    """
+    claimed = set()
+    results = []
+    errors = []
+
+    with WriteBatch() as batch:
+        for sidecar_path in sidecar_paths:
+            try:
+                _, result = process_sidecar(sidecar_path, known_guids, claimed, fix, batch)
+            except (RuntimeError, IOError, ValueError) as e:
+                errors.append({'file': str(sidecar_path), 'error': str(e)})
+                continue
+            results.append(result)
+
+    issues_found = sum(r['issues_found'] for r in results)
+    return {
+        'files_checked': len(results),
+        'issues_found': issues_found,
+        'fixed': fix and issues_found > 0,
+        'results': results,
+        'errors': errors
+    }
+
+
+def print_batch_report(report: dict, fix: bool = False):
+    """Print a batch report in human-readable format."""
+    for result in report['results']:
+        if not result['issues_found']:
+            continue
+        print(f"{result['file']}:")
+        for issue in result['issues']:
+            location = issue['field']
+            if issue['file_name']:
+                location = f"{issue['file_name']}/{issue['field']}"
+            detail = f" ({issue['current_value']})" if issue['current_value'] else ""
+            print(f"  - {location}: {issue['issue_type'].upper()}{detail}")
+            if issue['new_value']:
+                print(f"    -> Generated: {issue['new_value']}")
+
+    for error in report['errors']:
+        print(f"{error['file']}: ERROR ({error['error']})")
+
+    affected = sum(1 for r in report['results'] if r['issues_found'])
+    print(f"\nChecked {report['files_checked']} sidecar(s): "
+          f"{report['issues_found']} issue(s) in {affected} file(s)")
+    if report['issues_found']:
+        if fix:
+            print(f"Fixed {report['issues_found']} issue(s).")
+        else:
+            print("Run with --fix to auto-generate new GUIDs.")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Check and auto-generate GUIDs for tutorial sidecar.json files",
@@ -274,9 +622,11 @@ def main():
         epilog=__doc__
     )
     parser.add_argument(
-        "sidecar_path",
+        "sidecar_paths",
         type=Path,
-        help="Path to sidecar.json file"
+        nargs="*",
+        metavar="sidecar_path",
+        help="sidecar.json file(s), tutorial folder(s), or a repo root"
     )
     parser.add_argument(
         "--fix",
@@ -291,7 +641,24 @@ def main():
     parser.add_argument(
         "--cache",
         type=Path,
-        help="Path to guid_cache.json for uniqueness checking"
+        help="Path to guid_cache.json or guid_cache.db index for uniqueness checking "
+             "(default: tools/guid_cache.db, created from tools/guid_cache.json)"
+    )
+    parser.add_argument(
+        "--corpus",
+        type=Path,
+        metavar="REPO_ROOT",
+        help="Check all tc-*/sidecar.json files for GUID collisions between tutorials"
+    )
+    parser.add_argument(
+        "--write-cache",
+        type=Path,
+        metavar="CACHE",
+        help="With --corpus: regenerate guid_cache.json (or a .db index) from the corpus"
+    )
+    parser.add_argument(
+        "--rev",
+        help="With --corpus: read sidecars as of this git revision of REPO_ROOT"
     )
     parser.add_argument(
         "--set-output",
@@ -301,50 +668,62 @@ def main():
 
     args = parser.parse_args()
 
-    # Validate input
-    if not args.sidecar_path.exists():
-        print(f"Error: File not found: {args.sidecar_path}", file=sys.stderr)
+    if args.corpus:
+        if not args.corpus.is_dir():
+            print(f"Error: Directory not found: {args.corpus}", file=sys.stderr)
+            sys.exit(2)
+        try:
+            with open_source(args.rev, args.corpus) as source:
+                sys.exit(run_corpus_check(args.corpus, args.write_cache, args.json, source))
+        except GitError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(2)
+
+    if not args.sidecar_paths:
+        parser.error("sidecar_path is required unless --corpus is given")
+
+    sidecar_paths = expand_sidecar_paths(args.sidecar_paths)
+    if not sidecar_paths:
+        print("Error: No sidecar.json files found", file=sys.stderr)
         sys.exit(2)
 
-    # Find cache file if not specified
-    cache_path = args.cache
-    if not cache_path:
-        # Look for cache in tools/ relative to sidecar
-        tools_dir = args.sidecar_path.parent.parent / 'tools'
-        if tools_dir.exists():
-            potential_cache = tools_dir / 'guid_cache.json'
-            if potential_cache.exists():
-                cache_path = potential_cache
+    # Validate input
+    for sidecar_path in sidecar_paths:
+        if not sidecar_path.exists():
+            print(f"Error: File not found: {sidecar_path}", file=sys.stderr)
+            sys.exit(2)
+
+    # Find cache file if not specified; it is opened once for the whole batch
+    cache_path = args.cache or find_default_cache(sidecar_paths[0])
+    known_guids = open_guid_cache(cache_path) if cache_path else set()
 
     try:
-        # Check for issues
-        issues = check_guids(args.sidecar_path, cache_path)
-
-        result = {
-            'file': str(args.sidecar_path),
-            'issues_found': len(issues),
-            'issues': [i.to_dict() for i in issues],
-            'fixed': False,
-            'changes': []
-        }
-
-        if issues and args.fix:
-            fix_result = fix_guids(args.sidecar_path, issues)
-            result['fixed'] = True
-            result['changes'] = fix_result['changes']
+        if len(sidecar_paths) == 1:
+            sidecar_path = sidecar_paths[0]
+            issues, result = process_sidecar(sidecar_path, known_guids, set(), args.fix)
 
-        # Output
-        if args.json:
-            print(json.dumps(result, indent=2))
-        else:
-            if issues:
-                print_issues(issues)
-                if args.fix:
-                    print(f"\nFixed {len(issues)} issue(s) in {args.sidecar_path}")
+            # Output
+            if args.json:
+                print(json.dumps(result, indent=2))
+            else:
+                if issues:
+                    print_issues(issues)
+                    if args.fix:
+                        print(f"\nFixed {len(issues)} issue(s) in {sidecar_path}")
+                    else:
+                        print(f"\nRun with --fix to auto-generate new GUIDs.")
                 else:
-                    print(f"\nRun with --fix to auto-generate new GUIDs.")
+                    print(f"All GUIDs are valid in {sidecar_path}")
+            issues_found = len(issues)
+            errors = []
+        else:
+            result = run_batch(sidecar_paths, known_guids, args.fix)
+            if args.json:
+                print(json.dumps(result, indent=2))
             else:
-                print(f"All GUIDs are valid in {args.sidecar_path}")
+                print_batch_report(result, args.fix)
+            issues_found = result['issues_found']
+            errors = result['errors']
 
         # GitHub Actions output
         if args.set_output:
@@ -352,10 +731,12 @@ def main():
             if github_output:
                 with open(github_output, 'a') as f:
                     f.write(f"guids_updated={'true' if result['fixed'] else 'false'}\n")
-                    f.write(f"issues_found={len(issues)}\n")
+                    f.write(f"issues_found={issues_found}\n")
 
         # Exit code
-        if issues and not args.fix:
+        if errors:
+            sys.exit(2)
+        if issues_found and not args.fix:
             sys.exit(1)
         sys.exit(0)
 
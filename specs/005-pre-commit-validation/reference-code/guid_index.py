@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Persistent, indexed GUID cache backed by SQLite.
+
+guid_cache.json is a flat list that has to be parsed and hashed in full
+for every check. GuidIndex stores each GUID as a 16-byte key in a
+WITHOUT ROWID table, so a membership check is a single indexed lookup and
+adding GUIDs from a merged tutorial is an incremental upsert. Nothing is
+loaded into memory up front.
+
+guid_generator.py accepts the index anywhere it accepts guid_cache.json
+(pass a .db file to --cache). The sync job keeps refreshing
+guid_cache.json from production, so opening the index through
+guid_generator.open_guid_cache() re-imports the .json file next to it
+whenever that file has changed since the last import (sync_json_cache).
+
+Concurrency: reserve() claims a GUID with a single INSERT OR IGNORE, so
+the uniqueness check and the write are one atomic operation. allocate()
+generates GUIDs until one reserves. Each reservation commits immediately,
+so parallel CI jobs sharing the index see each other's new GUIDs; writers
+wait on SQLite's lock for up to ``timeout`` seconds instead of failing.
+
+Usage:
+    # Convert the existing JSON cache
+    python tools/guid_index.py tools/guid_cache.db --import-json tools/guid_cache.json
+
+    # Add the GUIDs of a merged tutorial
+    python tools/guid_index.py tools/guid_cache.db --add tc-my-tutorial/sidecar.json
+
+    # Membership check
+    python tools/guid_index.py tools/guid_cache.db --contains 17a101eb-70b0-444a-9852-0667563ecc52
+
+    # Allocate (generate + reserve) new GUIDs
+    python tools/guid_index.py tools/guid_cache.db --allocate 3 --source tc-my-tutorial
+
+    # Export back to the JSON list format
+    python tools/guid_index.py tools/guid_cache.db --export-json tools/guid_cache.json
+
+Exit codes:
+    0 - Success (or GUID found with --contains)
+    1 - GUID not found with --contains
+    2 - Error (file not found, invalid JSON, etc.)
+"""
+
+import argparse
+import json
+import sqlite3
+import sys
+import time
+import uuid
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+INDEX_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS guids (
+    guid BLOB PRIMARY KEY,
+    source TEXT,
+    added_at REAL NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+
+def guid_key(value) -> Optional[bytes]:
+    """Normalize a GUID string (any case, optional braces) to its 16-byte key."""
+    if not isinstance(value, str):
+        return None
+    try:
+        return uuid.UUID(value.strip().strip('{}')).bytes
+    except ValueError:
+        return None
+
+
+def is_index_path(path: Path) -> bool:
+    """True if path names a GuidIndex database rather than a JSON cache."""
+    return Path(path).suffix.lower() in INDEX_SUFFIXES
+
+
+class GuidIndex:
+    """
+    Set-like GUID store: supports ``in``, ``len()`` and iteration.
+
+    Membership checks go straight to the primary-key index; add() and
+    add_many() upsert, keeping the first recorded source.
+    """
+
+    def __init__(self, path: Path, timeout: float = 30.0):
+        self.path = Path(path)
+        self.conn = sqlite3.connect(str(self.path), timeout=timeout)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __contains__(self, value) -> bool:
+        key = guid_key(value)
+        if key is None:
+            return False
+        row = self.conn.execute("SELECT 1 FROM guids WHERE guid = ?", (key,)).fetchone()
+        return row is not None
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM guids").fetchone()[0]
+
+    def __iter__(self):
+        for (key,) in self.conn.execute("SELECT guid FROM guids ORDER BY guid"):
+            yield str(uuid.UUID(bytes=key))
+
+    def add(self, value: str, source: Optional[str] = None) -> bool:
+        """Add one GUID; returns True if it was not already present."""
+        return self.add_many([value], source) == 1
+
+    def add_many(self, values: Iterable[str], source: Optional[str] = None) -> int:
+        """
+        Upsert GUIDs in one transaction.
+
+        Invalid values are skipped. Returns the number of GUIDs newly added.
+        """
+        rows = [(key, source, time.time()) for key in map(guid_key, values) if key is not None]
+        with self.conn:
+            before = self.conn.total_changes
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO guids (guid, source, added_at) VALUES (?, ?, ?)", rows
+            )
+            added = self.conn.total_changes - before
+            if source is not None:
+                # Fill in provenance for GUIDs that were imported without one
+                self.conn.executemany(
+                    "UPDATE guids SET source = ? WHERE guid = ? AND source IS NULL",
+                    [(source, row[0]) for row in rows]
+                )
+        return added
+
+    def reserve(self, value: str, source: Optional[str] = None) -> bool:
+        """
+        Atomically claim a GUID.
+
+        Returns True if the GUID was free and is now recorded, False if it
+        was already taken. Raises ValueError for an invalid GUID.
+        """
+        key = guid_key(value)
+        if key is None:
+            raise ValueError(f"Invalid GUID: {value!r}")
+        with self.conn:
+            cursor = self.conn.execute(
+                "INSERT OR IGNORE INTO guids (guid, source, added_at) VALUES (?, ?, ?)",
+                (key, source, time.time())
+            )
+        return cursor.rowcount == 1
+
+    def allocate(self, source: Optional[str] = None, exclude=()) -> str:
+        """Generate a new GUID and reserve it; skips anything in ``exclude``."""
+        while True:
+            value = str(uuid.uuid4())
+            if value in exclude:
+                continue
+            if self.reserve(value, source):
+                return value
+
+    def source_of(self, value: str) -> Optional[str]:
+        """Where a GUID was first recorded from, if known."""
+        key = guid_key(value)
+        if key is None:
+            return None
+        row = self.conn.execute("SELECT source FROM guids WHERE guid = ?", (key,)).fetchone()
+        return row[0] if row else None
+
+    def export_json(self, json_path: Path):
+        """Write the index as a sorted guid_cache.json-style list."""
+        with open(json_path, 'w') as f:
+            json.dump(list(self), f, indent=2)
+            f.write('\n')
+
+
+def import_json_cache(json_path: Path, index: GuidIndex) -> int:
+    """Load a guid_cache.json list into the index; returns GUIDs added."""
+    with open(json_path) as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"{json_path} is not a JSON list")
+    return index.add_many((g for g in data if isinstance(g, str)), source=str(json_path))
+
+
+def sync_json_cache(json_path: Path, index: GuidIndex) -> int:
+    """
+    Import a guid_cache.json list if it changed since the index last did.
+
+    The file's mtime is recorded in the meta table; add_many() is an
+    upsert, so importing again only adds GUIDs new in the file. Returns
+    GUIDs added (0 when the file is missing or unchanged).
+    """
+    json_path = Path(json_path)
+    try:
+        mtime = str(json_path.stat().st_mtime_ns)
+    except FileNotFoundError:
+        return 0
+    key = f"json_mtime:{json_path.resolve()}"
+    row = index.conn.execute("SELECT value FROM meta WHERE key = ?", (key,)).fetchone()
+    if row and row[0] == mtime:
+        return 0
+    added = import_json_cache(json_path, index)
+    with index.conn:
+        index.conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, mtime))
+    return added
+
+
+def sidecar_guids(sidecar: dict) -> list:
+    """All ia-guid, lesson-guid and xy-guid values in a sidecar dict."""
+    values = [sidecar.get('ia-guid'), sidecar.get('lesson-guid')]
+    values.extend(entry.get('xy-guid') for entry in sidecar.get('files', []))
+    return [v for v in values if v]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Indexed GUID cache (SQLite)",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("index", type=Path, help="Path to the index database (e.g. tools/guid_cache.db)")
+    parser.add_argument("--import-json", type=Path, help="Import GUIDs from a guid_cache.json list")
+    parser.add_argument("--add", type=Path, nargs="+", metavar="SIDECAR",
+                        help="Add all GUIDs from sidecar.json file(s)")
+    parser.add_argument("--contains", metavar="GUID", help="Check whether a GUID is in the index")
+    parser.add_argument("--allocate", type=int, metavar="N", help="Generate and reserve N new GUIDs")
+    parser.add_argument("--source", help="Source recorded with --allocate (e.g. the tutorial id)")
+    parser.add_argument("--export-json", type=Path, help="Export the index as a JSON list")
+
+    args = parser.parse_args()
+
+    with GuidIndex(args.index) as index:
+        try:
+            if args.import_json:
+                added = import_json_cache(args.import_json, index)
+                print(f"Imported {added} GUID(s) from {args.import_json}")
+
+            for sidecar_path in args.add or []:
+                with open(sidecar_path) as f:
+                    sidecar = json.load(f)
+                added = index.add_many(sidecar_guids(sidecar), source=sidecar.get('id') or str(sidecar_path))
+                print(f"Added {added} new GUID(s) from {sidecar_path}")
+
+            for _ in range(args.allocate or 0):
+                print(index.allocate(source=args.source))
+
+            if args.export_json:
+                index.export_json(args.export_json)
+                print(f"Exported {len(index)} GUID(s) to {args.export_json}")
+
+            if args.contains:
+                found = args.contains in index
+                print(f"{args.contains}: {'found' if found else 'not found'}")
+                sys.exit(0 if found else 1)
+
+        except (json.JSONDecodeError, IOError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,491 @@
+#!/usr/bin/env python3
+"""
+Concurrent, cached URL checker for tutorial content validation.
+
+Replaces the one-URL-at-a-time broken links check with an asyncio checker:
+- Keep-alive connections are pooled and reused per host
+- Per-host concurrency limits and a politeness delay between requests
+- HEAD first, falling back to GET when a server rejects or fails HEAD
+- Redirects are followed and the final URL is recorded
+- Results are stored in a persistent cache with a TTL, so the same
+  Cisco docs URLs are not re-fetched on every push
+
+Only the standard library is used (http.client + asyncio), so it runs in CI
+and locally without extra dependencies.
+
+Usage:
+    # Check all links in a tutorial
+    python tools/link_checker.py tc-my-tutorial/
+
+    # JSON output for CI integration
+    python tools/link_checker.py tc-my-tutorial/ --json
+
+    # Use a specific cache file and TTL
+    python tools/link_checker.py tc-my-tutorial/ --cache tools/link_cache.json --ttl-hours 24
+
+Exit codes:
+    0 - All links OK
+    1 - Broken links found
+    2 - Error (folder not found, etc.)
+"""
+
+import argparse
+import asyncio
+import http.client
+import json
+import os
+import re
+import ssl
+import sys
+import tempfile
+import threading
+import time
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional
+from urllib.parse import urljoin, urlsplit
+
+
+# Markdown links/images and bare URLs; trailing punctuation is stripped later
+URL_PATTERN = re.compile(r'https?://[^\s<>"\'`\)\]]+')
+TRAILING_PUNCTUATION = '.,;:!?*_'
+# Local image references: ![alt](images/file.png)
+IMAGE_PATTERN = re.compile(r'!\[[^\]]*\]\(([^)\s]+)')
+
+REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+DEFAULT_CACHE_TTL = 24 * 3600
+DEFAULT_USER_AGENT = "CiscoU-Tutorial-LinkChecker/1.0"
+
+
+@dataclass
+class LinkOccurrence:
+    """A URL found in a markdown file."""
+    url: str
+    file: str
+    line: int
+
+
+@dataclass
+class LinkResult:
+    """Outcome of checking a single URL."""
+    url: str
+    ok: bool
+    status: int = 0
+    final_url: str = ""
+    error: str = ""
+    checked_at: float = 0.0
+    from_cache: bool = False
+
+    def is_cacheable(self) -> bool:
+        """Only cache definitive answers; retry timeouts, 429s and 5xx next run."""
+        return self.status != 0 and self.status != 429 and self.status < 500
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+
+# =============================================================================
+# URL Extraction
+# =============================================================================
+
+def extract_urls(text: str, file_name: str = "") -> List[LinkOccurrence]:
+    """Extract http(s) URLs with line numbers, skipping fenced code blocks."""
+    occurrences = []
+    in_code_block = False
+
+    for line_num, line in enumerate(text.split('\n'), 1):
+        if line.strip().startswith('```'):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+
+        for match in URL_PATTERN.finditer(line):
+            url = match.group().rstrip(TRAILING_PUNCTUATION)
+            occurrences.append(LinkOccurrence(url=url, file=file_name, line=line_num))
+
+    return occurrences
+
+
+def extract_image_refs(text: str, file_name: str = "") -> List[LinkOccurrence]:
+    """Extract local (non-http) image paths with line numbers."""
+    occurrences = []
+    in_code_block = False
+
+    for line_num, line in enumerate(text.split('\n'), 1):
+        if line.strip().startswith('```'):
+            in_code_block = not in_code_block
+            continue
+        if in_code_block:
+            continue
+
+        for match in IMAGE_PATTERN.finditer(line):
+            target = match.group(1)
+            if not target.startswith(('http://', 'https://', 'data:')):
+                occurrences.append(LinkOccurrence(url=target, file=file_name, line=line_num))
+
+    return occurrences
+
+
+def extract_folder_urls(folder: Path) -> List[LinkOccurrence]:
+    """Extract URLs from every markdown file in a tutorial folder."""
+    occurrences = []
+    for md_file in sorted(Path(folder).glob('*.md')):
+        text = md_file.read_text(encoding='utf-8', errors='replace')
+        occurrences.extend(extract_urls(text, md_file.name))
+    return occurrences
+
+
+# =============================================================================
+# Result Cache
+# =============================================================================
+
+class LinkCache:
+    """
+    Persistent URL result cache backed by a JSON file.
+
+    Entries older than ``ttl`` seconds are treated as missing. Call save()
+    to write changes back; the file is replaced atomically.
+    """
+
+    def __init__(self, path: Optional[Path] = None, ttl: float = DEFAULT_CACHE_TTL):
+        self.path = Path(path) if path else None
+        self.ttl = ttl
+        self.entries: Dict[str, dict] = {}
+        self.dirty = False
+
+        if self.path and self.path.exists():
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    self.entries = data
+            except (json.JSONDecodeError, IOError):
+                pass
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[LinkResult]:
+        """Return a fresh cached result for url, or None."""
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+        now = time.time() if now is None else now
+        if now - entry.get('checked_at', 0) > self.ttl:
+            return None
+        result = LinkResult(**{k: v for k, v in entry.items() if k in LinkResult.__dataclass_fields__})
+        result.from_cache = True
+        return result
+
+    def put(self, result: LinkResult):
+        """Store a result if it is worth caching."""
+        if not result.is_cacheable():
+            return
+        entry = result.to_dict()
+        entry.pop('from_cache', None)
+        self.entries[result.url] = entry
+        self.dirty = True
+
+    def save(self):
+        """Write the cache file if anything changed."""
+        if not self.path or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix='.link_cache.')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+                f.write('\n')
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        self.dirty = False
+
+
+# =============================================================================
+# Connection Pool
+# =============================================================================
+
+class ConnectionPool:
+    """Idle keep-alive connections, keyed by (scheme, host, port)."""
+
+    def __init__(self, timeout: float = 10.0):
+        self.timeout = timeout
+        self._idle: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+        self._ssl_context = ssl.create_default_context()
+
+    def acquire(self, key: tuple) -> tuple:
+        """Return (connection, reused) for the given key."""
+        with self._lock:
+            idle = self._idle.get(key)
+            if idle:
+                return idle.pop(), True
+
+        scheme, host, port = key
+        if scheme == 'https':
+            conn = http.client.HTTPSConnection(host, port, timeout=self.timeout, context=self._ssl_context)
+        else:
+            conn = http.client.HTTPConnection(host, port, timeout=self.timeout)
+        return conn, False
+
+    def release(self, key: tuple, conn):
+        """Return a connection to the pool for reuse."""
+        with self._lock:
+            self._idle.setdefault(key, []).append(conn)
+
+    def close(self):
+        """Close every idle connection."""
+        with self._lock:
+            for conns in self._idle.values():
+                for conn in conns:
+                    conn.close()
+            self._idle.clear()
+
+
+# =============================================================================
+# Checker
+# =============================================================================
+
+class LinkChecker:
+    """
+    Asyncio URL checker with per-host limits and a shared result cache.
+
+    Blocking http.client requests run in worker threads; asyncio handles
+    scheduling, per-host semaphores and politeness delays.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[LinkCache] = None,
+        per_host_limit: int = 4,
+        max_concurrency: int = 16,
+        politeness_delay: float = 0.0,
+        timeout: float = 10.0,
+        max_redirects: int = 5,
+        user_agent: str = DEFAULT_USER_AGENT,
+    ):
+        self.cache = cache
+        self.per_host_limit = per_host_limit
+        self.max_concurrency = max_concurrency
+        self.politeness_delay = politeness_delay
+        self.max_redirects = max_redirects
+        self.user_agent = user_agent
+        self.pool = ConnectionPool(timeout=timeout)
+
+        self._global_limit: Optional[asyncio.Semaphore] = None
+        self._host_limits: Dict[str, asyncio.Semaphore] = {}
+        self._host_locks: Dict[str, asyncio.Lock] = {}
+        self._host_last_request: Dict[str, float] = {}
+
+    # -- Blocking request (runs in a worker thread) ---------------------------
+
+    def _request(self, method: str, url: str) -> tuple:
+        """Issue one request on a pooled connection; return (status, location)."""
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        port = parts.port or (443 if scheme == 'https' else 80)
+        key = (scheme, parts.hostname, port)
+        path = parts.path or '/'
+        if parts.query:
+            path += '?' + parts.query
+        headers = {'User-Agent': self.user_agent, 'Accept': '*/*'}
+
+        for _ in range(2):
+            conn, reused = self.pool.acquire(key)
+            try:
+                conn.request(method, path, headers=headers)
+                response = conn.getresponse()
+                # Drain small bodies so the connection can be reused
+                response.read(65536)
+                status = response.status
+                location = response.getheader('Location', '')
+                if response.isclosed() and not response.will_close:
+                    self.pool.release(key, conn)
+                else:
+                    conn.close()
+                return status, location
+            except (http.client.HTTPException, ConnectionError) as e:
+                conn.close()
+                # A reused keep-alive socket may have been closed by the server
+                if not reused:
+                    raise e
+            except Exception:
+                conn.close()
+                raise
+
+        raise ConnectionError(f"Connection to {parts.hostname} failed")
+
+    # -- Async orchestration --------------------------------------------------
+
+    async def _polite_request(self, method: str, url: str) -> tuple:
+        """Run a request under the global and per-host limits."""
+        host = (urlsplit(url).hostname or '').lower()
+        host_limit = self._host_limits.setdefault(host, asyncio.Semaphore(self.per_host_limit))
+        host_lock = self._host_locks.setdefault(host, asyncio.Lock())
+
+        async with self._global_limit, host_limit:
+            if self.politeness_delay > 0:
+                async with host_lock:
+                    last = self._host_last_request.get(host)
+                    if last is not None:
+                        wait = last + self.politeness_delay - time.monotonic()
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                    self._host_last_request[host] = time.monotonic()
+            return await asyncio.to_thread(self._request, method, url)
+
+    async def _fetch(self, url: str) -> tuple:
+        """HEAD the URL, falling back to GET when HEAD fails or is rejected."""
+        try:
+            status, location = await self._polite_request('HEAD', url)
+            if status < 400:
+                return status, location
+        except (OSError, http.client.HTTPException):
+            pass
+        return await self._polite_request('GET', url)
+
+    async def check_url(self, url: str) -> LinkResult:
+        """Check one URL, following redirects."""
+        if self.cache is not None:
+            cached = self.cache.get(url)
+            if cached is not None:
+                return cached
+
+        result = LinkResult(url=url, ok=False, final_url=url)
+        current = url
+        try:
+            for _ in range(self.max_redirects + 1):
+                status, location = await self._fetch(current)
+                result.status = status
+                result.final_url = current
+                if status in REDIRECT_STATUSES and location:
+                    current = urljoin(current, location)
+                    continue
+                result.ok = 200 <= status < 400
+                if not result.ok:
+                    result.error = f"HTTP {status}"
+                break
+            else:
+                result.error = f"Too many redirects (>{self.max_redirects})"
+        except (OSError, http.client.HTTPException, ValueError) as e:
+            result.status = 0
+            result.error = str(e) or e.__class__.__name__
+
+        result.checked_at = time.time()
+        if self.cache is not None:
+            self.cache.put(result)
+        return result
+
+    async def check_urls(self, urls) -> Dict[str, LinkResult]:
+        """Check each unique URL once; returns {url: LinkResult}."""
+        self._global_limit = asyncio.Semaphore(self.max_concurrency)
+        self._host_limits.clear()
+        self._host_locks.clear()
+
+        unique = list(dict.fromkeys(urls))
+        try:
+            results = await asyncio.gather(*(self.check_url(u) for u in unique))
+        finally:
+            self.pool.close()
+        return dict(zip(unique, results))
+
+
+def check_urls(urls, cache: Optional[LinkCache] = None, **kwargs) -> Dict[str, LinkResult]:
+    """Synchronous wrapper: check URLs and persist the cache."""
+    checker = LinkChecker(cache=cache, **kwargs)
+    results = asyncio.run(checker.check_urls(urls))
+    if cache is not None:
+        cache.save()
+    return results
+
+
+def check_folder_links(folder: Path, cache: Optional[LinkCache] = None, **kwargs) -> List[dict]:
+    """
+    Check every link and local image reference in a tutorial folder.
+
+    Returns a list of broken-link dicts with file/line provenance, in the
+    shape used for broken_url/missing_image errors in PR comments.
+    """
+    folder = Path(folder)
+    occurrences = extract_folder_urls(folder)
+    results = check_urls([o.url for o in occurrences], cache=cache, **kwargs)
+
+    broken = []
+    for md_file in sorted(folder.glob('*.md')):
+        text = md_file.read_text(encoding='utf-8', errors='replace')
+        for ref in extract_image_refs(text, md_file.name):
+            if not (folder / ref.url).exists():
+                broken.append({
+                    'type': 'missing_image',
+                    'file': ref.file,
+                    'line': ref.line,
+                    'value': ref.url,
+                    'status': 0,
+                    'message': f"Broken Image: {ref.url}",
+                })
+
+    for occ in occurrences:
+        result = results[occ.url]
+        if not result.ok:
+            broken.append({
+                'type': 'broken_url',
+                'file': occ.file,
+                'line': occ.line,
+                'value': occ.url,
+                'status': result.status,
+                'message': f"Broken URL: {occ.url} ({result.error})",
+            })
+    return broken
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Check links in tutorial markdown files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("folder", type=Path, help="Path to tutorial folder")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+    parser.add_argument(
+        "--cache",
+        type=Path,
+        default=Path(__file__).parent / "link_cache.json",
+        help="Path to the link result cache (default: tools/link_cache.json)"
+    )
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and don't update the cache")
+    parser.add_argument("--ttl-hours", type=float, default=DEFAULT_CACHE_TTL / 3600,
+                        help="How long cached results stay valid (default: 24)")
+    parser.add_argument("--per-host", type=int, default=4, help="Concurrent requests per host")
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Politeness delay between requests to the same host (seconds)")
+    parser.add_argument("--timeout", type=float, default=10.0, help="Request timeout (seconds)")
+
+    args = parser.parse_args()
+
+    if not args.folder.is_dir():
+        print(f"Error: Folder not found: {args.folder}", file=sys.stderr)
+        sys.exit(2)
+
+    cache = None if args.no_cache else LinkCache(args.cache, ttl=args.ttl_hours * 3600)
+    broken = check_folder_links(
+        args.folder,
+        cache=cache,
+        per_host_limit=args.per_host,
+        politeness_delay=args.delay,
+        timeout=args.timeout,
+    )
+
+    if args.json:
+        print(json.dumps({'folder': str(args.folder), 'broken': broken}, indent=2))
+    elif broken:
+        print(f"Found {len(broken)} broken link(s):\n")
+        for item in broken:
+            print(f"  - {item['file']}:{item['line']} {item['message']}")
+    else:
+        print(f"All links OK in {args.folder}")
+
+    sys.exit(1 if broken else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Corpus-wide link index and shared link-status store.
+
+The same developer.cisco.com, docs and GitHub URLs appear hundreds of times
+across the tutorial corpus. This tool scans every tc-* folder once, records
+each link with file/line provenance, and checks each unique URL once. Results
+(status, redirect target, last-checked time) live in a local SQLite store.
+
+Per-tutorial validation then becomes a lookup: LinkStore can be passed to
+link_checker as its cache, so only URLs that are new or stale hit the network.
+Nightly runs refresh entries older than --max-age-hours, and retry transient
+failures (timeouts, 429s, 5xx) every run.
+
+Concurrency: parallel validation workers share the store. It runs in WAL
+mode, so readers never block, and put() commits each result on its own,
+so a worker holds the write lock for one row rather than for a whole
+tutorial's network checks. Writers wait up to ``timeout`` seconds.
+
+Usage:
+    # Scan the corpus and check every unique URL not checked in the last 24h
+    python tools/link_index.py /path/to/ciscou-tutorial-content
+
+    # Nightly refresh of stale entries only (no rescan)
+    python tools/link_index.py --no-scan --max-age-hours 24
+
+    # Report broken links for one tutorial from the store
+    python tools/link_index.py /path/to/repo --no-check --tutorial tc-example --json
+
+Exit codes:
+    0 - No broken links
+    1 - Broken links found
+    2 - Error (path not found, etc.)
+"""
+
+import argparse
+import asyncio
+import json
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from link_checker import (
+    DEFAULT_CACHE_TTL,
+    LinkChecker,
+    LinkOccurrence,
+    LinkResult,
+    extract_urls,
+)
+
+
+DEFAULT_DB = Path(__file__).parent / "link_status.db"
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS links (
+    url TEXT PRIMARY KEY,
+    ok INTEGER NOT NULL,
+    status INTEGER NOT NULL,
+    final_url TEXT NOT NULL DEFAULT '',
+    error TEXT NOT NULL DEFAULT '',
+    checked_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS occurrences (
+    url TEXT NOT NULL,
+    tutorial TEXT NOT NULL,
+    file TEXT NOT NULL,
+    line INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_occurrences_tutorial ON occurrences(tutorial);
+CREATE INDEX IF NOT EXISTS idx_occurrences_url ON occurrences(url);
+CREATE INDEX IF NOT EXISTS idx_links_checked_at ON links(checked_at);
+"""
+
+
+class LinkStore:
+    """
+    SQLite-backed link status store.
+
+    Implements the same get/put/save interface as link_checker.LinkCache, so
+    it can be handed to LinkChecker or check_folder_links as the cache.
+    """
+
+    def __init__(self, path: Path = DEFAULT_DB, ttl: float = DEFAULT_CACHE_TTL, timeout: float = 30.0):
+        self.path = Path(path)
+        self.ttl = ttl
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(self.path), timeout=timeout)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    # -- LinkCache interface --------------------------------------------------
+
+    def get(self, url: str, now: Optional[float] = None) -> Optional[LinkResult]:
+        """Return a fresh, definitive result for url, or None."""
+        row = self.conn.execute(
+            "SELECT url, ok, status, final_url, error, checked_at FROM links WHERE url = ?",
+            (url,)
+        ).fetchone()
+        if not row:
+            return None
+        result = _row_to_result(row)
+        now = time.time() if now is None else now
+        if now - result.checked_at > self.ttl or not result.is_cacheable():
+            return None
+        result.from_cache = True
+        return result
+
+    def put(self, result: LinkResult):
+        """Record a check result (transient failures too, for reporting); commits at once."""
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO links (url, ok, status, final_url, error, checked_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (result.url, int(result.ok), result.status, result.final_url,
+                 result.error, result.checked_at or time.time())
+            )
+
+    def save(self):
+        """Nothing to flush: put() commits each result."""
+        self.conn.commit()
+
+    # -- Index ----------------------------------------------------------------
+
+    def replace_occurrences(self, occurrences_by_tutorial: Dict[str, List[LinkOccurrence]]):
+        """Replace the recorded links of the given tutorials in one transaction."""
+        with self.conn:
+            for tutorial, occurrences in occurrences_by_tutorial.items():
+                self.conn.execute("DELETE FROM occurrences WHERE tutorial = ?", (tutorial,))
+                self.conn.executemany(
+                    "INSERT INTO occurrences (url, tutorial, file, line) VALUES (?, ?, ?, ?)",
+                    [(o.url, tutorial, o.file, o.line) for o in occurrences]
+                )
+
+    def prune_tutorials(self, keep: set):
+        """Drop occurrences of tutorials that no longer exist."""
+        with self.conn:
+            known = {row[0] for row in self.conn.execute("SELECT DISTINCT tutorial FROM occurrences")}
+            for tutorial in known - keep:
+                self.conn.execute("DELETE FROM occurrences WHERE tutorial = ?", (tutorial,))
+
+    def urls_needing_check(self, max_age: float, now: Optional[float] = None) -> List[str]:
+        """
+        Indexed URLs never checked, last checked more than max_age seconds
+        ago, or whose last check failed transiently (timeout, 429, 5xx):
+        like LinkResult.is_cacheable, those are retried on the next run.
+        """
+        now = time.time() if now is None else now
+        rows = self.conn.execute(
+            "SELECT DISTINCT o.url FROM occurrences o LEFT JOIN links l ON l.url = o.url "
+            "WHERE l.url IS NULL OR l.checked_at < ? "
+            "OR l.status = 0 OR l.status = 429 OR l.status >= 500 ORDER BY o.url",
+            (now - max_age,)
+        )
+        return [row[0] for row in rows]
+
+    def broken_links(self, tutorial: Optional[str] = None) -> List[dict]:
+        """Broken links with provenance, optionally for a single tutorial."""
+        query = (
+            "SELECT o.tutorial, o.file, o.line, o.url, l.status, l.error, l.checked_at "
+            "FROM occurrences o JOIN links l ON l.url = o.url WHERE l.ok = 0"
+        )
+        params = ()
+        if tutorial:
+            query += " AND o.tutorial = ?"
+            params = (tutorial,)
+        query += " ORDER BY o.tutorial, o.file, o.line"
+        return [
+            {
+                'type': 'broken_url',
+                'tutorial': row[0],
+                'file': row[1],
+                'line': row[2],
+                'value': row[3],
+                'status': row[4],
+                'message': f"Broken URL: {row[3]} ({row[5]})",
+                'checked_at': row[6],
+            }
+            for row in self.conn.execute(query, params)
+        ]
+
+    def stats(self) -> dict:
+        """Counts for the summary line."""
+        occurrences, unique = self.conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT url) FROM occurrences"
+        ).fetchone()
+        checked = self.conn.execute("SELECT COUNT(*) FROM links").fetchone()[0]
+        return {'occurrences': occurrences, 'unique_urls': unique, 'checked_urls': checked}
+
+
+def _row_to_result(row) -> LinkResult:
+    url, ok, status, final_url, error, checked_at = row
+    return LinkResult(url=url, ok=bool(ok), status=status, final_url=final_url,
+                      error=error, checked_at=checked_at)
+
+
+def scan_corpus(repo_root: Path) -> Dict[str, List[LinkOccurrence]]:
+    """Extract every link from every tc-* folder, keyed by tutorial name."""
+    index = {}
+    for folder in sorted(Path(repo_root).glob('tc-*')):
+        if not folder.is_dir():
+            continue
+        occurrences = []
+        for md_file in sorted(folder.glob('*.md')):
+            text = md_file.read_text(encoding='utf-8', errors='replace')
+            occurrences.extend(extract_urls(text, md_file.name))
+        index[folder.name] = occurrences
+    return index
+
+
+def refresh_store(store: LinkStore, max_age: float, **checker_kwargs) -> int:
+    """
+    Check every indexed URL that is unchecked or older than max_age.
+
+    Each unique URL is requested once no matter how many tutorials use it.
+    Returns the number of URLs checked.
+    """
+    urls = store.urls_needing_check(max_age)
+    if not urls:
+        return 0
+
+    checker = LinkChecker(cache=None, **checker_kwargs)
+    results = asyncio.run(checker.check_urls(urls))
+    for result in results.values():
+        store.put(result)
+    return len(urls)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Corpus-wide link index and link-status store",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("repo", type=Path, nargs="?", help="Repository root containing tc-* folders")
+    parser.add_argument("--db", type=Path, default=DEFAULT_DB,
+                        help="SQLite store (default: tools/link_status.db)")
+    parser.add_argument("--max-age-hours", type=float, default=DEFAULT_CACHE_TTL / 3600,
+                        help="Re-check URLs last checked longer ago than this (default: 24)")
+    parser.add_argument("--no-scan", action="store_true", help="Don't rescan the corpus; use the stored index")
+    parser.add_argument("--no-check", action="store_true", help="Don't check any URLs; report from the store")
+    parser.add_argument("--tutorial", help="Only report broken links for this tc-* folder")
+    parser.add_argument("--per-host", type=int, default=4, help="Concurrent requests per host")
+    parser.add_argument("--delay", type=float, default=0.0,
+                        help="Politeness delay between requests to the same host (seconds)")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+
+    args = parser.parse_args()
+
+    if not args.no_scan:
+        if not args.repo or not args.repo.is_dir():
+            print(f"Error: Repository not found: {args.repo}", file=sys.stderr)
+            sys.exit(2)
+
+    store = LinkStore(args.db, ttl=args.max_age_hours * 3600)
+    try:
+        if not args.no_scan:
+            index = scan_corpus(args.repo)
+            store.replace_occurrences(index)
+            store.prune_tutorials(set(index))
+
+        checked = 0
+        if not args.no_check:
+            checked = refresh_store(
+                store, args.max_age_hours * 3600,
+                per_host_limit=args.per_host, politeness_delay=args.delay,
+            )
+
+        broken = store.broken_links(args.tutorial)
+        stats = store.stats()
+        stats['checked_this_run'] = checked
+    finally:
+        store.close()
+
+    if args.json:
+        print(json.dumps({'stats': stats, 'broken': broken}, indent=2))
+    else:
+        print(f"{stats['occurrences']} link(s), {stats['unique_urls']} unique URL(s), "
+              f"{checked} checked this run")
+        if broken:
+            print(f"\nFound {len(broken)} broken link(s):\n")
+            for item in broken:
+                print(f"  - {item['tutorial']}/{item['file']}:{item['line']} {item['message']}")
+        else:
+            print("No broken links.")
+
+    sys.exit(1 if broken else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Shared, cached model of a tutorial's sidecar.json.
+
+guid_generator.py, validate_tutorial.py and fix_sidecar.py all read
+sidecar.json. Loading it through load_sidecar() parses each file once per
+process: results are cached on (resolved path, mtime, size), so a later
+load of an unchanged file is a dictionary lookup. Derived values (step
+list, durations in seconds, GUID map) are computed on first access.
+
+The cached Sidecar is shared and must be treated as read-only. Tools that
+modify a sidecar take a copy with to_dict(), then save it with
+write_sidecar(), which replaces the file atomically and drops the cache
+entry. Pass a file_writer.WriteBatch to stage several sidecars and
+replace them all at once (or none, if the batch is aborted).
+
+load_sidecar() also reads from a git commit when given a read-only file
+source (GitCorpus, see file_source.py); those sidecars are cached by blob
+id, so one unchanged between two revisions is parsed once.
+
+Usage:
+    from sidecar_model import load_sidecar, write_sidecar
+
+    sidecar = load_sidecar(Path("tc-example/sidecar.json"))
+    sidecar.total_seconds, sidecar.step_seconds, sidecar.guid_map
+
+    data = sidecar.to_dict()
+    data['duration'] = '30m00s'
+    write_sidecar(sidecar.path, data)
+"""
+
+import copy
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from file_writer import WriteBatch
+
+
+# One pass over "1h30m00s"-style durations; first value per unit wins
+DURATION_UNIT_PATTERN = re.compile(r'(\d+)\s*([hms])')
+
+UNIT_SECONDS = {'h': 3600, 'm': 60, 's': 1}
+
+
+def parse_duration_seconds(duration_str: Optional[str]) -> int:
+    """
+    Parse a sidecar duration to seconds.
+
+    Supports "MM:SS" and "H:MM:SS" (step format) and "XhXXmXXs" / "XXmXXs"
+    (total format).
+    """
+    if not duration_str:
+        return 0
+
+    # Step format: "MM:SS"
+    if ':' in duration_str:
+        parts = duration_str.split(':')
+        if len(parts) == 2:
+            return int(parts[0]) * 60 + int(parts[1])
+        elif len(parts) == 3:
+            return int(parts[0]) * 3600 + int(parts[1]) * 60 + int(parts[2])
+
+    # Total format: "XhXXmXXs" or "XXmXXs"
+    units = {}
+    for value, unit in DURATION_UNIT_PATTERN.findall(duration_str):
+        units.setdefault(unit, int(value))
+    return sum(value * UNIT_SECONDS[unit] for unit, value in units.items())
+
+
+class SidecarFile:
+    """One entry of the sidecar's "files" list."""
+
+    __slots__ = ('index', 'data', '_seconds')
+
+    def __init__(self, index: int, data: dict):
+        self.index = index
+        self.data = data
+        self._seconds = None
+
+    @property
+    def file(self) -> str:
+        return self.data.get('file', 'unknown')
+
+    @property
+    def label(self) -> Optional[str]:
+        return self.data.get('label')
+
+    @property
+    def duration(self) -> Optional[str]:
+        return self.data.get('duration')
+
+    @property
+    def xy_guid(self) -> Optional[str]:
+        return self.data.get('xy-guid')
+
+    @property
+    def seconds(self) -> int:
+        """Step duration in seconds (missing duration counts as 0:00)."""
+        if self._seconds is None:
+            self._seconds = parse_duration_seconds(self.data.get('duration', '0:00'))
+        return self._seconds
+
+    def __repr__(self):
+        return f"SidecarFile({self.file})"
+
+
+class Sidecar:
+    """Parsed sidecar.json with lazily derived fields."""
+
+    __slots__ = ('path', 'data', '_files', '_total_seconds', '_step_seconds', '_guid_map')
+
+    def __init__(self, data: dict, path: Optional[Path] = None):
+        if not isinstance(data, dict):
+            raise ValueError("sidecar.json must contain a JSON object")
+        self.path = Path(path) if path else None
+        self.data = data
+        self._files = None
+        self._total_seconds = None
+        self._step_seconds = None
+        self._guid_map = None
+
+    def get(self, key: str, default=None):
+        return self.data.get(key, default)
+
+    @property
+    def id(self) -> Optional[str]:
+        return self.data.get('id')
+
+    @property
+    def duration(self) -> Optional[str]:
+        return self.data.get('duration')
+
+    @property
+    def ia_guid(self) -> Optional[str]:
+        return self.data.get('ia-guid')
+
+    @property
+    def lesson_guid(self) -> Optional[str]:
+        return self.data.get('lesson-guid')
+
+    @property
+    def files(self) -> List[SidecarFile]:
+        if self._files is None:
+            self._files = [SidecarFile(i, entry) for i, entry in enumerate(self.data.get('files', []))]
+        return self._files
+
+    @property
+    def total_seconds(self) -> int:
+        """The declared total "duration" in seconds."""
+        if self._total_seconds is None:
+            self._total_seconds = parse_duration_seconds(self.data.get('duration'))
+        return self._total_seconds
+
+    @property
+    def step_seconds(self) -> int:
+        """Sum of the step durations in seconds."""
+        if self._step_seconds is None:
+            self._step_seconds = sum(f.seconds for f in self.files)
+        return self._step_seconds
+
+    @property
+    def guid_map(self) -> Dict[str, str]:
+        """GUID fields by location: ia-guid, lesson-guid, files/<file>/xy-guid."""
+        if self._guid_map is None:
+            guids = {}
+            for field in ['ia-guid', 'lesson-guid']:
+                if field in self.data:
+                    guids[field] = self.data[field]
+            for entry in self.files:
+                if 'xy-guid' in entry.data:
+                    guids[f"files/{entry.file}/xy-guid"] = entry.data['xy-guid']
+            self._guid_map = guids
+        return self._guid_map
+
+    def to_dict(self) -> dict:
+        """A deep copy of the raw data, safe to modify."""
+        return copy.deepcopy(self.data)
+
+    def __repr__(self):
+        return f"Sidecar({self.id or self.path})"
+
+
+# (resolved path) -> (mtime_ns, size, Sidecar); "blob id:path" -> (None, None, Sidecar)
+_cache: Dict[str, tuple] = {}
+_cache_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0}
+
+
+def load_sidecar(path: Path, source=None) -> Sidecar:
+    """
+    Load sidecar.json, parsing it only if it changed since the last load.
+
+    With a read-only `source` (a commit), `path` is repository-relative
+    and the file is read from the commit's objects.
+
+    Raises IOError if the file can't be read, ValueError (including
+    json.JSONDecodeError) if it isn't a JSON object.
+    """
+    path = Path(path)
+    if source is not None and not source.writable:
+        return _load_blob(path, source)
+
+    key = str(path.resolve())
+    stat = os.stat(key)
+    signature = (stat.st_mtime_ns, stat.st_size)
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached and cached[:2] == signature:
+            _stats['hits'] += 1
+            return cached[2]
+
+    with open(key) as f:
+        sidecar = Sidecar(json.load(f), path)
+
+    with _cache_lock:
+        _stats['misses'] += 1
+        _cache[key] = (signature[0], signature[1], sidecar)
+    return sidecar
+
+
+def _load_blob(path: Path, source) -> Sidecar:
+    """load_sidecar() from a commit; blobs never change, so there is no signature."""
+    key = f"{source.blob_id(path.as_posix())}:{path.as_posix()}"
+
+    with _cache_lock:
+        cached = _cache.get(key)
+        if cached:
+            _stats['hits'] += 1
+            return cached[2]
+
+    sidecar = Sidecar(json.loads(source.read_bytes(path.as_posix())), path)
+
+    with _cache_lock:
+        _stats['misses'] += 1
+        _cache[key] = (None, None, sidecar)
+    return sidecar
+
+
+def invalidate(path: Optional[Path] = None):
+    """Drop one cached sidecar, or the whole cache when path is None."""
+    with _cache_lock:
+        if path is None:
+            _cache.clear()
+        else:
+            _cache.pop(str(Path(path).resolve()), None)
+
+
+def cache_stats() -> dict:
+    """Cache hits and misses (parses) so far in this process."""
+    with _cache_lock:
+        return dict(_stats)
+
+
+def write_sidecar(path: Path, data: dict, batch: Optional[WriteBatch] = None) -> bool:
+    """
+    Write sidecar.json atomically (fsynced temp file in the same folder +
+    rename), or stage it in `batch` to be written when the batch commits.
+    An unchanged file is not rewritten. Returns whether it will change.
+    """
+    path = Path(path)
+    if batch is None:
+        with WriteBatch() as own:
+            return write_sidecar(path, data, own)
+    changed = batch.write_json(path, data, indent=2)
+    if changed:
+        batch.on_commit(lambda: invalidate(path))
+    return changed
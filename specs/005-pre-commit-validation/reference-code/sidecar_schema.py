@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+In-process JSON Schema validation for sidecar.json.
+
+validate_tutorial.py used to run schema_validation.py as a subprocess for
+every tutorial and grep its output. This module compiles the sidecar schema
+once per process and validates any number of sidecars against the cached
+validator, returning structured errors with JSON pointers (RFC 6901) to the
+offending value. Validation uses jsonschema's validator for the schema's
+draft, with its format checks.
+
+Usage:
+    # One tutorial
+    python tools/sidecar_schema.py tc-my-tutorial/sidecar.json
+
+    # Whole corpus, JSON output
+    python tools/sidecar_schema.py /path/to/repo --json
+
+    # Explicit schema
+    python tools/sidecar_schema.py tc-my-tutorial --schema tools/schema.json
+
+Exit codes:
+    0 - All sidecars valid
+    1 - Schema errors found
+    2 - Error (schema or sidecar not found, invalid schema, etc.)
+"""
+
+import argparse
+import json
+import os
+import sys
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Optional
+
+import jsonschema
+
+from sidecar_model import load_sidecar
+
+
+DEFAULT_SCHEMA = Path(__file__).parent / "schema.json"
+
+
+@dataclass
+class SchemaError:
+    """One schema violation."""
+    pointer: str     # JSON pointer to the offending value ("" is the root)
+    message: str
+    keyword: str     # failing schema keyword, e.g. "required", "pattern"
+
+    def to_dict(self):
+        return asdict(self)
+
+    def __str__(self):
+        return f"{self.pointer or '/'}: {self.message}"
+
+
+def json_pointer(parts) -> str:
+    """RFC 6901 pointer for a sequence of keys/indexes."""
+    return ''.join('/' + str(p).replace('~', '~0').replace('/', '~1') for p in parts)
+
+
+# =============================================================================
+# Validator
+# =============================================================================
+
+class SidecarValidator:
+    """A compiled schema; validate() may be called any number of times."""
+
+    def __init__(self, schema: dict):
+        """Raises ValueError if `schema` is not a valid JSON Schema."""
+        self.schema = schema
+        cls = jsonschema.validators.validator_for(schema)
+        try:
+            cls.check_schema(schema)
+        except jsonschema.exceptions.SchemaError as e:
+            raise ValueError(f"Invalid schema: {e.message}") from e
+        self._validator = cls(schema, format_checker=cls.FORMAT_CHECKER)
+
+    def validate(self, instance) -> List[SchemaError]:
+        """All violations, ordered by JSON pointer."""
+        errors = [
+            SchemaError(json_pointer(e.absolute_path), e.message, str(e.validator))
+            for e in self._validator.iter_errors(instance)
+        ]
+        return sorted(errors, key=lambda e: e.pointer)
+
+
+@lru_cache(maxsize=8)
+def _compiled_validator(schema_path: str, mtime_ns: int, size: int) -> SidecarValidator:
+    with open(schema_path) as f:
+        return SidecarValidator(json.load(f))
+
+
+def get_validator(schema_path: Path = DEFAULT_SCHEMA) -> SidecarValidator:
+    """
+    The compiled validator for a schema file, built once per process.
+
+    Recompiled only if the schema file changes. Raises IOError if the
+    schema can't be read, ValueError if it is invalid.
+    """
+    schema_path = Path(schema_path).resolve()
+    stat = os.stat(schema_path)
+    return _compiled_validator(str(schema_path), stat.st_mtime_ns, stat.st_size)
+
+
+def validate_sidecar(sidecar_path: Path, validator: Optional[SidecarValidator] = None) -> List[SchemaError]:
+    """Validate one sidecar.json (loaded through the shared sidecar cache)."""
+    validator = validator or get_validator()
+    return validator.validate(load_sidecar(sidecar_path).data)
+
+
+def find_sidecars(paths: List[Path]) -> List[Path]:
+    """Resolve sidecar.json files, tutorial folders and repo roots to sidecars."""
+    sidecars = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            if (path / 'sidecar.json').exists():
+                sidecars.append(path / 'sidecar.json')
+            else:
+                sidecars.extend(sorted(path.glob('tc-*/sidecar.json')))
+        else:
+            sidecars.append(path)
+    return sidecars
+
+
+def validate_corpus(sidecar_paths: List[Path], validator: SidecarValidator) -> dict:
+    """
+    Validate many sidecars against one compiled validator.
+
+    Returns {sidecar path: [error dict, ...]}; unreadable sidecars get a
+    single error with keyword "load".
+    """
+    results = {}
+    for sidecar_path in sidecar_paths:
+        try:
+            errors = validate_sidecar(sidecar_path, validator)
+        except (ValueError, IOError) as e:
+            errors = [SchemaError('', f"Failed to load sidecar: {e}", 'load')]
+        results[str(sidecar_path)] = [e.to_dict() for e in errors]
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate sidecar.json files against the sidecar schema",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__
+    )
+    parser.add_argument("paths", type=Path, nargs="+",
+                        help="sidecar.json file(s), tutorial folder(s), or a repo root")
+    parser.add_argument("--schema", type=Path, default=DEFAULT_SCHEMA,
+                        help="Schema file (default: tools/schema.json)")
+    parser.add_argument("--json", action="store_true", help="Output results as JSON")
+
+    args = parser.parse_args()
+
+    try:
+        validator = get_validator(args.schema)
+    except (ValueError, IOError) as e:
+        print(f"Error: Cannot load schema {args.schema}: {e}", file=sys.stderr)
+        sys.exit(2)
+
+    sidecars = find_sidecars(args.paths)
+    missing = [p for p in sidecars if not p.exists()]
+    if missing or not sidecars:
+        print(f"Error: File not found: {missing[0] if missing else args.paths[0]}", file=sys.stderr)
+        sys.exit(2)
+
+    results = validate_corpus(sidecars, validator)
+    invalid = {path: errors for path, errors in results.items() if errors}
+
+    if args.json:
+        print(json.dumps({
+            'checked': len(results),
+            'invalid': len(invalid),
+            'results': invalid
+        }, indent=2))
+    else:
+        for path, errors in invalid.items():
+            print(f"{path}:")
+            for error in errors:
+                print(f"  - {error['pointer'] or '/'}: {error['message']}")
+        print(f"\nChecked {len(results)} sidecar(s): {len(invalid)} with schema errors")
+
+    sys.exit(1 if invalid else 0)
+
+
+if __name__ == "__main__":
+    main()
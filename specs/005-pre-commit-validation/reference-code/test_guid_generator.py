@@ -18,6 +18,7 @@ import pytest
 # Add tools directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
 
+import guid_generator
 from guid_generator import (
     is_valid_guid,
     is_placeholder_guid,
@@ -25,8 +26,16 @@ from guid_generator import (
     check_guids,
     fix_guids,
     load_guid_cache,
+    open_guid_cache,
+    load_corpus_sidecars,
+    build_corpus_guid_map,
+    find_guid_collisions,
+    run_corpus_check,
+    expand_sidecar_paths,
+    run_batch,
     GuidIssue
 )
+from guid_index import GuidIndex
 
 
 class TestGuidValidation:
@@ -264,6 +273,28 @@ class TestGuidCache:
         assert issues[0].field == 'ia-guid'
         assert issues[0].issue_type == 'duplicate'
 
+    def test_index_guids_reserved_by_fix_are_owned(self, tmp_path):
+        """A fixed sidecar passes the next check against the index it reserved in."""
+        sidecar_path = tmp_path / "tc-test" / "sidecar.json"
+        sidecar_path.parent.mkdir()
+        sidecar_path.write_text(json.dumps({"id": "tc-test", "files": [{"file": "step-1.md"}]}))
+        db_path = tmp_path / "guid_cache.db"
+
+        index = open_guid_cache(db_path)  # Created, not skipped
+        assert db_path.exists()
+        try:
+            fix_guids(sidecar_path, check_guids(sidecar_path, known_guids=index), index)
+            assert len(index) == 3
+            assert check_guids(sidecar_path, known_guids=index) == []
+
+            # Another sidecar reusing those GUIDs is still a duplicate
+            copy = tmp_path / "tc-copy" / "sidecar.json"
+            copy.parent.mkdir()
+            copy.write_text(sidecar_path.read_text().replace('"tc-test"', '"tc-copy"'))
+            assert {i.issue_type for i in check_guids(copy, known_guids=index)} == {'duplicate'}
+        finally:
+            index.close()
+
 
 class TestFixGuids:
     """Tests for GUID fixing/generation."""
@@ -447,5 +478,153 @@ class TestNewTutorialFlow:
         assert is_valid_guid(fixed['files'][1]['xy-guid'])
 
 
+class TestCorpusMode:
+    """Tests for corpus-wide collision detection."""
+
+    SHARED = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        """Three tutorials; tc-beta reuses tc-alpha's ia-guid as an xy-guid."""
+        def write(name, ia_guid, xy_guid):
+            folder = tmp_path / name
+            folder.mkdir()
+            sidecar = {
+                "id": name,
+                "ia-guid": ia_guid,
+                "lesson-guid": generate_guid(),
+                "files": [{"file": "step-1.md", "xy-guid": xy_guid}]
+            }
+            (folder / "sidecar.json").write_text(json.dumps(sidecar))
+
+        write("tc-alpha", self.SHARED, generate_guid())
+        write("tc-beta", generate_guid(), self.SHARED.upper())
+        write("tc-gamma", generate_guid(), "TODO")
+        return tmp_path
+
+    def test_loads_all_sidecars(self, corpus):
+        """Every tc-*/sidecar.json is loaded."""
+        sidecars = load_corpus_sidecars(corpus)
+        assert [p.parent.name for p, _, _ in sidecars] == ["tc-alpha", "tc-beta", "tc-gamma"]
+        assert all(error is None for _, _, error in sidecars)
+
+    def test_finds_cross_tutorial_collision(self, corpus):
+        """Collisions are found across fields and regardless of case."""
+        collisions = find_guid_collisions(build_corpus_guid_map(load_corpus_sidecars(corpus)))
+        assert list(collisions) == [self.SHARED]
+        assert collisions[self.SHARED] == [
+            {'tutorial': 'tc-alpha', 'field': 'ia-guid', 'file_name': None},
+            {'tutorial': 'tc-beta', 'field': 'xy-guid', 'file_name': 'step-1.md'},
+        ]
+
+    def test_invalid_guids_not_indexed(self, corpus):
+        """Placeholders are left to the per-tutorial check."""
+        guid_map = build_corpus_guid_map(load_corpus_sidecars(corpus))
+        assert "todo" not in guid_map
+        # 3 ia + 3 lesson + 2 valid xy, one of them shared
+        assert len(guid_map) == 7
+
+    def test_write_cache(self, corpus, tmp_path, capsys):
+        """--write-cache regenerates a sorted guid_cache.json."""
+        cache_path = tmp_path / "guid_cache.json"
+        exit_code = run_corpus_check(corpus, write_cache=cache_path)
+
+        assert exit_code == 1
+        cache = json.loads(cache_path.read_text())
+        assert cache == sorted(cache)
+        assert len(cache) == 7
+        assert load_guid_cache(cache_path) == set(cache)
+        assert "tc-beta/step-1.md/xy-guid" in capsys.readouterr().out
+
+    def test_no_collisions(self, tmp_path):
+        folder = tmp_path / "tc-only"
+        folder.mkdir()
+        (folder / "sidecar.json").write_text(json.dumps({
+            "ia-guid": generate_guid(), "lesson-guid": generate_guid(), "files": []
+        }))
+        assert run_corpus_check(tmp_path, as_json=True) == 0
+
+
+class TestBatchMode:
+    """Tests for checking and fixing many sidecars in one process."""
+
+    SHARED = "aaaaaaaa-bbbb-cccc-dddd-eeeeeeeeeeee"
+
+    @pytest.fixture
+    def repo(self, tmp_path):
+        """tc-one and tc-two share an ia-guid; tc-three is missing one."""
+        def write(name, ia_guid):
+            folder = tmp_path / name
+            folder.mkdir()
+            sidecar = {
+                "id": name,
+                "ia-guid": ia_guid,
+                "lesson-guid": generate_guid(),
+                "files": [{"file": "step-1.md", "xy-guid": generate_guid()}]
+            }
+            (folder / "sidecar.json").write_text(json.dumps(sidecar, indent=2) + "\n")
+
+        write("tc-one", self.SHARED)
+        write("tc-two", self.SHARED)
+        write("tc-three", "")
+        return tmp_path
+
+    def test_expands_repo_root_and_folders(self, repo):
+        """Repo roots, folders and files resolve to unique sidecar paths."""
+        paths = expand_sidecar_paths([repo, repo / "tc-one", repo / "tc-two" / "sidecar.json"])
+        assert [p.parent.name for p in paths] == ["tc-one", "tc-three", "tc-two"]
+
+    def test_duplicate_across_batch(self, repo):
+        """The second sidecar using a GUID is flagged, the first keeps it."""
+        report = run_batch(expand_sidecar_paths([repo]), known_guids=set())
+        by_name = {Path(r['file']).parent.name: r for r in report['results']}
+
+        assert by_name['tc-one']['issues_found'] == 0
+        assert [i['issue_type'] for i in by_name['tc-two']['issues']] == ['duplicate']
+        assert [i['issue_type'] for i in by_name['tc-three']['issues']] == ['missing']
+        assert report['issues_found'] == 2
+        assert report['errors'] == []
+
+    def test_fix_unique_across_batch(self, repo):
+        """After fixing, no GUID appears twice anywhere in the batch."""
+        paths = expand_sidecar_paths([repo])
+        cached = generate_guid()
+        report = run_batch(paths, known_guids={cached}, fix=True)
+        assert report['fixed']
+
+        all_guids = []
+        for path in paths:
+            sidecar = json.loads(path.read_text())
+            all_guids += [sidecar['ia-guid'], sidecar['lesson-guid']]
+            all_guids += [f['xy-guid'] for f in sidecar['files']]
+        assert len(all_guids) == len(set(all_guids))
+        assert cached not in all_guids
+        assert run_batch(paths, known_guids=set())['issues_found'] == 0
+
+    def test_atomic_write_leaves_no_temp_files(self, repo):
+        run_batch(expand_sidecar_paths([repo]), known_guids=set(), fix=True)
+        assert list(repo.glob("tc-*/*.tmp")) == []
+
+    def test_fix_reserves_in_default_index(self, repo, monkeypatch):
+        """Out of the box, --fix records new GUIDs in tools/guid_cache.db."""
+        (repo / "tools").mkdir()
+        (repo / "tools" / "guid_cache.json").write_text(json.dumps([self.SHARED]))
+        monkeypatch.setattr(sys, 'argv', ['guid_generator.py', str(repo / "tc-three"), '--fix'])
+        with pytest.raises(SystemExit) as exit_info:
+            guid_generator.main()
+        assert exit_info.value.code == 0
+
+        new_guid = json.loads((repo / "tc-three" / "sidecar.json").read_text())['ia-guid']
+        with GuidIndex(repo / "tools" / "guid_cache.db") as index:
+            assert self.SHARED in index  # Seeded from guid_cache.json
+            assert index.source_of(new_guid) == "tc-three"
+
+    def test_bad_sidecar_reported_not_fatal(self, repo):
+        (repo / "tc-two" / "sidecar.json").write_text("{not json")
+        report = run_batch(expand_sidecar_paths([repo]), known_guids=set())
+        assert [Path(e['file']).parent.name for e in report['errors']] == ["tc-two"]
+        assert report['files_checked'] == 2
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Tests for guid_index.py - indexed SQLite GUID cache.
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import uuid
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from guid_generator import check_guids, fix_guids, open_guid_cache
+from guid_index import GuidIndex, import_json_cache, is_index_path, sidecar_guids, sync_json_cache
+
+
+KNOWN_GUID = "17a101eb-70b0-444a-9852-0667563ecc52"
+
+
+def _allocate_worker(args):
+    """Stress-test worker: allocate GUIDs through its own connection."""
+    db_path, worker_id, count = args
+    with GuidIndex(db_path) as idx:
+        return [idx.allocate(source=f"worker-{worker_id}") for _ in range(count)]
+
+
+def _reserve_worker(args):
+    """Stress-test worker: race other workers for the same GUIDs."""
+    db_path, worker_id, guids = args
+    with GuidIndex(db_path) as idx:
+        return [g for g in guids if idx.reserve(g, source=f"worker-{worker_id}")]
+
+
+@pytest.fixture
+def index(tmp_path):
+    idx = GuidIndex(tmp_path / "guid_cache.db")
+    yield idx
+    idx.close()
+
+
+@pytest.fixture
+def json_cache(tmp_path):
+    path = tmp_path / "guid_cache.json"
+    path.write_text(json.dumps([KNOWN_GUID, str(uuid.uuid4()), "not-a-guid"]))
+    return path
+
+
+class TestGuidIndex:
+    """Tests for membership and incremental updates."""
+
+    def test_import_json_cache(self, index, json_cache):
+        """Valid GUIDs from the JSON list are imported, invalid ones skipped."""
+        assert import_json_cache(json_cache, index) == 2
+        assert len(index) == 2
+        assert KNOWN_GUID in index
+
+    def test_membership_normalizes(self, index):
+        """Lookups ignore case and surrounding braces."""
+        index.add(KNOWN_GUID)
+        assert KNOWN_GUID.upper() in index
+        assert "{" + KNOWN_GUID + "}" in index
+        assert str(uuid.uuid4()) not in index
+        assert "not-a-guid" not in index
+
+    def test_add_many_counts_new(self, index):
+        """Re-adding existing GUIDs is a no-op."""
+        new = str(uuid.uuid4())
+        assert index.add_many([KNOWN_GUID]) == 1
+        assert index.add_many([KNOWN_GUID, new, KNOWN_GUID.upper()]) == 1
+        assert len(index) == 2
+
+    def test_source_provenance(self, index):
+        """First recorded source is kept; missing sources are filled in."""
+        index.add(KNOWN_GUID)
+        index.add(KNOWN_GUID, source="tc-alpha")
+        index.add(KNOWN_GUID, source="tc-beta")
+        assert index.source_of(KNOWN_GUID) == "tc-alpha"
+
+    def test_export_round_trip(self, index, json_cache, tmp_path):
+        """Exported list re-imports to the same set."""
+        import_json_cache(json_cache, index)
+        out = tmp_path / "exported.json"
+        index.export_json(out)
+        assert set(json.loads(out.read_text())) == set(index)
+
+    def test_persists(self, tmp_path):
+        """GUIDs survive reopening the database."""
+        path = tmp_path / "guid_cache.db"
+        with GuidIndex(path) as idx:
+            idx.add(KNOWN_GUID)
+        with GuidIndex(path) as idx:
+            assert KNOWN_GUID in idx
+
+    def test_sidecar_guids(self):
+        """All three GUID kinds are collected."""
+        sidecar = {
+            "ia-guid": "a", "lesson-guid": "b",
+            "files": [{"xy-guid": "c"}, {"xy-guid": ""}],
+        }
+        assert sidecar_guids(sidecar) == ["a", "b", "c"]
+
+
+class TestGuidGeneratorIntegration:
+    """Tests for using the index as guid_generator's cache."""
+
+    def test_is_index_path(self):
+        assert is_index_path(Path("tools/guid_cache.db"))
+        assert not is_index_path(Path("tools/guid_cache.json"))
+
+    def test_missing_index_is_created(self, tmp_path):
+        with open_guid_cache(tmp_path / "missing.db") as index:
+            assert isinstance(index, GuidIndex) and len(index) == 0
+        assert (tmp_path / "missing.db").exists()
+
+    def test_json_cache_reimported_when_changed(self, tmp_path, json_cache):
+        """GUIDs the sync job adds to guid_cache.json reach an existing index."""
+        db = tmp_path / "guid_cache.db"
+        with open_guid_cache(db) as index:
+            assert KNOWN_GUID in index and len(index) == 2
+
+        new_guid = str(uuid.uuid4())
+        json_cache.write_text(json.dumps([KNOWN_GUID, new_guid]))
+        os.utime(json_cache, ns=(0, json_cache.stat().st_mtime_ns + 10**9))
+        with open_guid_cache(db) as index:
+            assert new_guid in index and len(index) == 3
+            assert sync_json_cache(json_cache, index) == 0  # Unchanged since
+
+    def test_check_guids_against_index(self, tmp_path):
+        """A GUID already in the index is reported as a duplicate."""
+        db = tmp_path / "guid_cache.db"
+        with GuidIndex(db) as idx:
+            idx.add(KNOWN_GUID)
+
+        sidecar = tmp_path / "sidecar.json"
+        sidecar.write_text(json.dumps({
+            "id": "tc-test",
+            "ia-guid": KNOWN_GUID,
+            "lesson-guid": str(uuid.uuid4()),
+            "files": [{"label": "Step 1", "markdown": "step-1.md", "xy-guid": str(uuid.uuid4())}],
+        }))
+
+        issues = check_guids(sidecar, cache_path=db)
+        assert [(i.field, i.issue_type) for i in issues] == [("ia-guid", "duplicate")]
+
+
+class TestReservation:
+    """Tests for atomic check-and-reserve."""
+
+    def test_reserve_once(self, index):
+        assert index.reserve(KNOWN_GUID, source="tc-alpha")
+        assert not index.reserve(KNOWN_GUID.upper(), source="tc-beta")
+        assert index.source_of(KNOWN_GUID) == "tc-alpha"
+
+    def test_reserve_rejects_invalid(self, index):
+        with pytest.raises(ValueError):
+            index.reserve("not-a-guid")
+
+    def test_allocate_records_guid(self, index):
+        value = index.allocate(source="tc-alpha")
+        assert value in index
+        assert index.source_of(value) == "tc-alpha"
+
+    def test_fix_guids_reserves_in_index(self, index, tmp_path):
+        """--fix against an index records each new GUID as it is generated."""
+        sidecar = tmp_path / "sidecar.json"
+        sidecar.write_text(json.dumps({"id": "tc-test", "ia-guid": "TODO", "files": []}))
+
+        issues = check_guids(sidecar, known_guids=index)
+        fix_guids(sidecar, issues, known_guids=index)
+
+        fixed = json.loads(sidecar.read_text())
+        assert fixed['ia-guid'] in index
+        assert fixed['lesson-guid'] in index
+        assert index.source_of(fixed['ia-guid']) == "tc-test"
+
+
+class TestConcurrentAllocation:
+    """Multi-process stress tests: no lost updates, no duplicates."""
+
+    WORKERS = 8
+
+    def test_parallel_allocate(self, tmp_path):
+        db_path = tmp_path / "guid_cache.db"
+        GuidIndex(db_path).close()
+
+        with multiprocessing.Pool(self.WORKERS) as pool:
+            results = pool.map(_allocate_worker, [(db_path, i, 50) for i in range(self.WORKERS)])
+
+        allocated = [g for batch in results for g in batch]
+        assert len(allocated) == self.WORKERS * 50
+        assert len(set(allocated)) == len(allocated)
+        with GuidIndex(db_path) as idx:
+            assert len(idx) == len(allocated)
+            assert set(idx) == set(allocated)
+
+    def test_contended_reserve(self, tmp_path):
+        """Every worker races for the same GUIDs; each is won exactly once."""
+        db_path = tmp_path / "guid_cache.db"
+        GuidIndex(db_path).close()
+        guids = [str(uuid.uuid4()) for _ in range(100)]
+
+        with multiprocessing.Pool(self.WORKERS) as pool:
+            results = pool.map(_reserve_worker, [(db_path, i, guids) for i in range(self.WORKERS)])
+
+        won = [g for batch in results for g in batch]
+        assert sorted(won) == sorted(guids)
+        with GuidIndex(db_path) as idx:
+            assert len(idx) == len(guids)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
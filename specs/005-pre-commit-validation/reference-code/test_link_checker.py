@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Tests for link_checker.py - concurrent, cached URL checking.
+
+All HTTP traffic goes to a local stand-in server started per test module,
+which simulates slow hosts, redirects, 404s and servers that reject HEAD.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from link_checker import (
+    LinkCache,
+    LinkResult,
+    check_folder_links,
+    check_urls,
+    extract_urls,
+)
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    """Routes: /ok, /missing, /redirect, /loop, /slow, /no-head, /error."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive
+
+    def log_message(self, *args):
+        pass
+
+    def _respond(self, status: int, body: bytes = b"", headers: dict = None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _handle(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, self.path, self.client_address[1]))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+        try:
+            if self.path == "/ok":
+                self._respond(200, b"fine")
+            elif self.path == "/missing":
+                self._respond(404, b"nope")
+            elif self.path == "/redirect":
+                self._respond(301, headers={"Location": "/ok"})
+            elif self.path == "/loop":
+                self._respond(302, headers={"Location": "/loop"})
+            elif self.path.startswith("/slow"):
+                time.sleep(0.2)
+                self._respond(200, b"slow")
+            elif self.path == "/no-head":
+                self._respond(405 if self.command == "HEAD" else 200, b"get only")
+            elif self.path == "/error":
+                self._respond(503, b"down")
+            else:
+                self._respond(404)
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    do_HEAD = _handle
+    do_GET = _handle
+
+
+@pytest.fixture(scope="module")
+def server():
+    """Run the stand-in server on an ephemeral localhost port."""
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StandInHandler)
+    httpd.daemon_threads = True
+    httpd.lock = threading.Lock()
+    httpd.requests = []
+    httpd.in_flight = 0
+    httpd.max_in_flight = 0
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+def base(server):
+    """Base URL of the stand-in server; resets request log per test."""
+    with server.lock:
+        server.requests.clear()
+        server.max_in_flight = 0
+    return f"http://127.0.0.1:{server.server_address[1]}"
+
+
+class TestExtractUrls:
+    """Tests for URL extraction from markdown."""
+
+    def test_extracts_with_line_numbers(self):
+        text = "Intro\nSee [docs](https://developer.cisco.com/docs).\nDone"
+        occ = extract_urls(text, "step-1.md")
+        assert len(occ) == 1
+        assert occ[0].url == "https://developer.cisco.com/docs"
+        assert occ[0].line == 2
+        assert occ[0].file == "step-1.md"
+
+    def test_skips_code_blocks(self):
+        text = "```\ncurl http://localhost:8080/api\n```\nhttps://cisco.com"
+        occ = extract_urls(text)
+        assert [o.url for o in occ] == ["https://cisco.com"]
+
+    def test_strips_trailing_punctuation(self):
+        occ = extract_urls("Visit https://cisco.com.")
+        assert occ[0].url == "https://cisco.com"
+
+
+class TestCheckUrls:
+    """Tests against the stand-in server."""
+
+    def test_ok_and_missing(self, base):
+        results = check_urls([f"{base}/ok", f"{base}/missing"])
+        assert results[f"{base}/ok"].ok
+        assert results[f"{base}/ok"].status == 200
+        assert not results[f"{base}/missing"].ok
+        assert results[f"{base}/missing"].status == 404
+
+    def test_follows_redirects(self, base):
+        result = check_urls([f"{base}/redirect"])[f"{base}/redirect"]
+        assert result.ok
+        assert result.final_url == f"{base}/ok"
+
+    def test_redirect_loop_is_broken(self, base):
+        result = check_urls([f"{base}/loop"], max_redirects=3)[f"{base}/loop"]
+        assert not result.ok
+        assert "redirects" in result.error
+
+    def test_head_rejected_falls_back_to_get(self, base, server):
+        result = check_urls([f"{base}/no-head"])[f"{base}/no-head"]
+        assert result.ok
+        methods = [m for m, path, _ in server.requests if path == "/no-head"]
+        assert methods == ["HEAD", "GET"]
+
+    def test_unreachable_host(self):
+        result = check_urls(["http://127.0.0.1:9/"], timeout=1)["http://127.0.0.1:9/"]
+        assert not result.ok
+        assert result.status == 0
+        assert result.error
+
+    def test_duplicate_urls_checked_once(self, base, server):
+        check_urls([f"{base}/ok"] * 5)
+        assert len([r for r in server.requests if r[1] == "/ok"]) == 1
+
+    def test_per_host_limit(self, base, server):
+        urls = [f"{base}/slow?{i}" for i in range(6)]
+        start = time.monotonic()
+        results = check_urls(urls, per_host_limit=2)
+        elapsed = time.monotonic() - start
+
+        assert all(r.ok for r in results.values())
+        assert server.max_in_flight <= 2
+        # 6 slow requests, 2 at a time, ~0.2s each
+        assert elapsed >= 0.5
+
+    def test_slow_host_runs_concurrently(self, base):
+        urls = [f"{base}/slow?{i}" for i in range(6)]
+        start = time.monotonic()
+        check_urls(urls, per_host_limit=6)
+        assert time.monotonic() - start < 1.0
+
+    def test_politeness_delay(self, base):
+        urls = [f"{base}/ok?{i}" for i in range(3)]
+        start = time.monotonic()
+        check_urls(urls, politeness_delay=0.15)
+        assert time.monotonic() - start >= 0.3
+
+    def test_keep_alive_reuses_connection(self, base, server):
+        urls = [f"{base}/ok?{i}" for i in range(5)]
+        check_urls(urls, per_host_limit=1)
+        client_ports = {port for _, _, port in server.requests}
+        assert len(client_ports) == 1
+
+
+class TestLinkCache:
+    """Tests for the persistent TTL cache."""
+
+    def test_cached_results_skip_network(self, base, server, tmp_path):
+        cache_path = tmp_path / "link_cache.json"
+        check_urls([f"{base}/ok", f"{base}/missing"], cache=LinkCache(cache_path))
+        assert len(server.requests) > 0
+
+        server.requests.clear()
+        results = check_urls([f"{base}/ok", f"{base}/missing"], cache=LinkCache(cache_path))
+        assert server.requests == []
+        assert results[f"{base}/ok"].from_cache
+        assert not results[f"{base}/missing"].ok
+
+    def test_expired_entries_are_rechecked(self, base, server, tmp_path):
+        cache_path = tmp_path / "link_cache.json"
+        check_urls([f"{base}/ok"], cache=LinkCache(cache_path))
+
+        server.requests.clear()
+        check_urls([f"{base}/ok"], cache=LinkCache(cache_path, ttl=0))
+        assert len(server.requests) == 1
+
+    def test_server_errors_not_cached(self, base, tmp_path):
+        cache_path = tmp_path / "link_cache.json"
+        check_urls([f"{base}/error"], cache=LinkCache(cache_path))
+        assert not cache_path.exists() or f"{base}/error" not in json.loads(cache_path.read_text())
+
+    def test_get_respects_ttl(self):
+        cache = LinkCache(ttl=60)
+        cache.put(LinkResult(url="https://cisco.com", ok=True, status=200, checked_at=1000.0))
+        assert cache.get("https://cisco.com", now=1030.0).ok
+        assert cache.get("https://cisco.com", now=1100.0) is None
+
+
+class TestCheckFolderLinks:
+    """Tests for tutorial folder checking."""
+
+    def test_reports_provenance(self, base, tmp_path):
+        (tmp_path / "images").mkdir()
+        (tmp_path / "images" / "ok.png").write_bytes(b"")
+        (tmp_path / "step-1.md").write_text(
+            f"Good [link]({base}/ok)\n\nBad [link]({base}/missing)\n"
+            "![Fine](images/ok.png)\n![Gone](images/gone.png)\n"
+        )
+
+        broken = check_folder_links(tmp_path)
+
+        assert [(b['type'], b['line']) for b in broken] == [
+            ("missing_image", 5),
+            ("broken_url", 3),
+        ]
+        assert broken[1]['file'] == "step-1.md"
+        assert broken[1]['value'] == f"{base}/missing"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Tests for link_index.py - corpus link index and SQLite link-status store.
+
+Network access is replaced by a fake request function, so these tests
+focus on deduplication, provenance and staleness handling.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import link_checker
+from link_checker import LinkResult, check_folder_links
+from link_index import LinkStore, refresh_store, scan_corpus
+
+
+SHARED_URL = "https://developer.cisco.com/docs"
+BROKEN_URL = "https://example.com/gone"
+
+
+@pytest.fixture
+def requests_made(monkeypatch):
+    """Replace HTTP with a fake: BROKEN_URL is 404, everything else 200."""
+    calls = []
+
+    def fake_request(self, method, url):
+        calls.append((method, url))
+        return (404, '') if url == BROKEN_URL else (200, '')
+
+    monkeypatch.setattr(link_checker.LinkChecker, '_request', fake_request)
+    return calls
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Three tutorials sharing one URL; one has a broken link."""
+    for name in ["tc-alpha", "tc-beta", "tc-gamma"]:
+        folder = tmp_path / name
+        folder.mkdir()
+        (folder / "step-1.md").write_text(f"See [docs]({SHARED_URL}).\n")
+    (tmp_path / "tc-beta" / "step-2.md").write_text(f"Intro\n\nOld [link]({BROKEN_URL})\n")
+    return tmp_path
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = LinkStore(tmp_path / "link_status.db")
+    yield s
+    s.close()
+
+
+class TestScanCorpus:
+    """Tests for the one-pass corpus scan."""
+
+    def test_provenance(self, corpus):
+        index = scan_corpus(corpus)
+        assert sorted(index) == ["tc-alpha", "tc-beta", "tc-gamma"]
+        beta = {(o.file, o.line, o.url) for o in index["tc-beta"]}
+        assert ("step-2.md", 3, BROKEN_URL) in beta
+        assert ("step-1.md", 1, SHARED_URL) in beta
+
+
+class TestLinkStore:
+    """Tests for indexing, dedup and refresh."""
+
+    def test_each_unique_url_checked_once(self, corpus, store, requests_made):
+        store.replace_occurrences(scan_corpus(corpus))
+        checked = refresh_store(store, max_age=3600)
+
+        assert checked == 2
+        assert sorted(url for method, url in requests_made if method == 'HEAD') == sorted([BROKEN_URL, SHARED_URL])
+        assert store.stats() == {'occurrences': 4, 'unique_urls': 2, 'checked_urls': 2}
+
+    def test_broken_links_with_provenance(self, corpus, store, requests_made):
+        store.replace_occurrences(scan_corpus(corpus))
+        refresh_store(store, max_age=3600)
+
+        broken = store.broken_links()
+        assert len(broken) == 1
+        assert broken[0]['tutorial'] == "tc-beta"
+        assert (broken[0]['file'], broken[0]['line']) == ("step-2.md", 3)
+        assert broken[0]['status'] == 404
+        assert store.broken_links("tc-alpha") == []
+
+    def test_refresh_only_stale(self, corpus, store, requests_made):
+        store.replace_occurrences(scan_corpus(corpus))
+        store.put(LinkResult(url=SHARED_URL, ok=True, status=200, checked_at=time.time()))
+        store.put(LinkResult(url=BROKEN_URL, ok=False, status=404, checked_at=time.time() - 7200))
+        store.save()
+
+        checked = refresh_store(store, max_age=3600)
+
+        assert checked == 1
+        assert {url for _, url in requests_made} == {BROKEN_URL}
+
+    @pytest.mark.parametrize("status", [0, 429, 503])
+    def test_transient_failures_rechecked(self, corpus, store, requests_made, status):
+        store.replace_occurrences(scan_corpus(corpus))
+        store.put(LinkResult(url=SHARED_URL, ok=True, status=200, checked_at=time.time()))
+        store.put(LinkResult(url=BROKEN_URL, ok=False, status=status, checked_at=time.time()))
+
+        assert store.urls_needing_check(max_age=3600) == [BROKEN_URL]
+        assert refresh_store(store, max_age=3600) == 1
+        assert store.broken_links()[0]['status'] == 404
+
+    def test_rescan_replaces_occurrences(self, corpus, store):
+        store.replace_occurrences(scan_corpus(corpus))
+        (corpus / "tc-beta" / "step-2.md").write_text("No links now\n")
+        store.replace_occurrences(scan_corpus(corpus))
+
+        assert store.stats()['occurrences'] == 3
+
+    def test_prune_removed_tutorials(self, corpus, store):
+        store.replace_occurrences(scan_corpus(corpus))
+        store.prune_tutorials({"tc-alpha"})
+        assert store.stats()['occurrences'] == 1
+
+    def test_store_as_checker_cache(self, corpus, store, requests_made):
+        """Per-tutorial validation is a lookup once the store is warm."""
+        store.replace_occurrences(scan_corpus(corpus))
+        refresh_store(store, max_age=3600)
+        requests_made.clear()
+
+        broken = check_folder_links(corpus / "tc-beta", cache=store)
+
+        assert requests_made == []
+        assert [b['value'] for b in broken] == [BROKEN_URL]
+
+    def test_persists_across_connections(self, corpus, tmp_path, requests_made):
+        db = tmp_path / "link_status.db"
+        first = LinkStore(db)
+        first.replace_occurrences(scan_corpus(corpus))
+        refresh_store(first, max_age=3600)
+        first.close()
+
+        second = LinkStore(db)
+        assert second.get(SHARED_URL).ok
+        assert second.urls_needing_check(max_age=3600) == []
+        second.close()
+
+    def test_writers_do_not_wait_for_each_other(self, tmp_path):
+        """Each put commits, so a second worker never hits the lock timeout."""
+        db = tmp_path / "link_status.db"
+        first = LinkStore(db)
+        second = LinkStore(db, timeout=0.1)
+        first.put(LinkResult(url=SHARED_URL, ok=True, status=200, checked_at=time.time()))
+        second.put(LinkResult(url=BROKEN_URL, ok=False, status=404, checked_at=time.time()))
+
+        assert second.get(SHARED_URL).ok
+        assert first.get(BROKEN_URL).status == 404
+        first.close()
+        second.close()
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
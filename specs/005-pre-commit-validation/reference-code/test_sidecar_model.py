@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Tests for sidecar_model.py - shared, cached sidecar.json model.
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import sidecar_model
+import validate_tutorial
+from file_source import GitCorpus
+from file_writer import WriteBatch
+from sidecar_model import (
+    Sidecar,
+    cache_stats,
+    load_sidecar,
+    parse_duration_seconds,
+    write_sidecar,
+)
+
+
+SIDECAR = {
+    "id": "tc-test",
+    "duration": "1h02m30s",
+    "ia-guid": "17a101eb-70b0-444a-9852-0667563ecc52",
+    "lesson-guid": "873fa67a-2cea-451d-a2d5-459798b68bb1",
+    "files": [
+        {"file": "step-1.md", "duration": "2:30", "xy-guid": "2efacb5f-6bd9-4891-a156-b3e712f8bebf"},
+        {"file": "step-2.md", "duration": "1:00:00"},
+    ],
+}
+
+
+@pytest.fixture
+def sidecar_path(tmp_path):
+    sidecar_model.invalidate()
+    path = tmp_path / "tc-test" / "sidecar.json"
+    path.parent.mkdir()
+    path.write_text(json.dumps(SIDECAR, indent=2))
+    return path
+
+
+def parses():
+    return cache_stats()['misses']
+
+
+class TestParseDuration:
+    """Tests for the shared duration parser."""
+
+    @pytest.mark.parametrize("value, seconds", [
+        ("5:00", 300),
+        ("1:02:03", 3723),
+        ("30m00s", 1800),
+        ("1h30m00s", 5400),
+        ("45s", 45),
+        ("", 0),
+        (None, 0),
+    ])
+    def test_formats(self, value, seconds):
+        assert parse_duration_seconds(value) == seconds
+
+
+class TestSidecar:
+    """Tests for derived fields."""
+
+    def test_derived_fields(self):
+        sidecar = Sidecar(SIDECAR)
+        assert sidecar.total_seconds == 3750
+        assert sidecar.step_seconds == 3750
+        assert [f.file for f in sidecar.files] == ["step-1.md", "step-2.md"]
+        assert sidecar.files[1].xy_guid is None
+        assert sidecar.guid_map == {
+            "ia-guid": SIDECAR["ia-guid"],
+            "lesson-guid": SIDECAR["lesson-guid"],
+            "files/step-1.md/xy-guid": SIDECAR["files"][0]["xy-guid"],
+        }
+
+    def test_slotted(self):
+        with pytest.raises(AttributeError):
+            Sidecar(SIDECAR).extra = 1
+
+    def test_rejects_non_object(self):
+        with pytest.raises(ValueError):
+            Sidecar([])
+
+    def test_to_dict_is_a_copy(self):
+        sidecar = Sidecar(json.loads(json.dumps(SIDECAR)))
+        data = sidecar.to_dict()
+        data["files"][0]["duration"] = "9:00"
+        assert sidecar.data["files"][0]["duration"] == "2:30"
+
+
+class TestLoadSidecar:
+    """Tests for the path + mtime keyed cache."""
+
+    def test_unchanged_file_parsed_once(self, sidecar_path):
+        before = parses()
+        first = load_sidecar(sidecar_path)
+        second = load_sidecar(sidecar_path.parent / ".." / "tc-test" / "sidecar.json")
+        assert first is second
+        assert parses() - before == 1
+
+    def test_modified_file_reparsed(self, sidecar_path):
+        first = load_sidecar(sidecar_path)
+        sidecar_path.write_text(json.dumps(dict(SIDECAR, id="tc-changed-id")))
+        assert load_sidecar(sidecar_path).id == "tc-changed-id"
+        assert first.id == "tc-test"
+
+    def test_write_sidecar_invalidates(self, sidecar_path):
+        data = load_sidecar(sidecar_path).to_dict()
+        data["duration"] = "5m00s"
+        write_sidecar(sidecar_path, data)
+
+        before = parses()
+        assert load_sidecar(sidecar_path).total_seconds == 300
+        assert parses() - before == 1
+        assert sidecar_path.read_text().endswith("}\n")
+        assert not sidecar_path.with_name("sidecar.json.tmp").exists()
+
+    def test_write_sidecar_in_batch(self, sidecar_path):
+        data = load_sidecar(sidecar_path).to_dict()
+        assert write_sidecar(sidecar_path, data)  # Adds the trailing newline
+        with WriteBatch() as batch:
+            assert not write_sidecar(sidecar_path, data, batch)
+            data["duration"] = "5m00s"
+            assert write_sidecar(sidecar_path, data, batch)
+            # Staged only: the file and its cached parse are unchanged
+            assert load_sidecar(sidecar_path).total_seconds == 3750
+        assert batch.written == [str(sidecar_path)]
+        assert load_sidecar(sidecar_path).total_seconds == 300
+
+    def test_invalid_json(self, tmp_path):
+        path = tmp_path / "sidecar.json"
+        path.write_text("{not json")
+        with pytest.raises(ValueError):
+            load_sidecar(path)
+
+
+    def test_from_git_revision(self, sidecar_path):
+        repo = sidecar_path.parent.parent
+        git = ["git", "-C", str(repo), "-c", "user.name=Test", "-c", "user.email=test@example.com"]
+        subprocess.run(git + ["init", "-q"], check=True)
+        subprocess.run(git + ["add", "."], check=True)
+        subprocess.run(git + ["commit", "-q", "-m", "Sidecar"], check=True)
+        sidecar_path.write_text(json.dumps(dict(SIDECAR, id="tc-working-tree")))
+
+        with GitCorpus(repo) as head, GitCorpus(repo, "HEAD", head.blobs) as again:
+            before = parses()
+            first = load_sidecar(Path("tc-test/sidecar.json"), head)
+            assert load_sidecar(Path("tc-test/sidecar.json"), again) is first
+            assert parses() - before == 1
+        assert first.id == "tc-test"
+        assert load_sidecar(sidecar_path).id == "tc-working-tree"
+
+
+class TestSingleParse:
+    """A full in-process GUID check + fix parses the sidecar once."""
+
+    def test_check_and_fix_parse_once(self, sidecar_path, monkeypatch):
+        monkeypatch.setattr(validate_tutorial, "_WORKER_STATE", {})
+        tools_dir = sidecar_path.parent.parent / "tools"
+        tools_dir.mkdir()
+        validate_tutorial.init_worker(tools_dir)
+
+        before = parses()
+        errors, warnings = validate_tutorial.validate_guids(sidecar_path.parent, fix=True)
+
+        assert errors == []
+        assert any("xy-guid" in w for w in warnings)
+        assert parses() - before == 1
+        assert load_sidecar(sidecar_path).files[1].xy_guid
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
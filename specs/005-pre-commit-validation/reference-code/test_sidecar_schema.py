@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for sidecar_schema.py - in-process sidecar schema validation.
+
+The schema here mirrors the sidecar.json requirements in the constitution;
+the production schema is owned by the UAT team and lives in tools/.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("jsonschema")
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+from sidecar_schema import (
+    SidecarValidator,
+    find_sidecars,
+    get_validator,
+    json_pointer,
+    validate_corpus,
+)
+
+
+SCHEMA = {
+    "$schema": "http://json-schema.org/draft-07/schema#",
+    "type": "object",
+    "required": ["id", "duration", "ia-guid", "lesson-guid", "files", "active"],
+    "properties": {
+        "id": {"type": "string", "pattern": "^[a-z0-9-]+$"},
+        "duration": {"type": "string", "pattern": "^(\\d+h)?\\d{1,2}m\\d{2}s$"},
+        "date": {"type": "string", "format": "date"},
+        "ia-guid": {"$ref": "#/definitions/guid"},
+        "lesson-guid": {"$ref": "#/definitions/guid"},
+        "active": {"const": True},
+        "skill-levels": {"enum": ["Beginner", "Intermediate", "Advanced", "Expert"]},
+        "files": {
+            "type": "array",
+            "minItems": 1,
+            "items": {
+                "type": "object",
+                "required": ["file", "duration", "xy-guid"],
+                "additionalProperties": False,
+                "properties": {
+                    "file": {"type": "string"},
+                    "label": {"type": "string"},
+                    "duration": {"type": "string", "pattern": "^\\d{1,3}:\\d{2}$"},
+                    "xy-guid": {"$ref": "#/definitions/guid"},
+                },
+            },
+        },
+    },
+    "definitions": {
+        "guid": {"type": "string", "pattern": "^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$"}
+    },
+}
+
+VALID = {
+    "id": "tc-example",
+    "duration": "10m00s",
+    "date": "2026-02-18",
+    "ia-guid": "17a101eb-70b0-444a-9852-0667563ecc52",
+    "lesson-guid": "873fa67a-2cea-451d-a2d5-459798b68bb1",
+    "active": True,
+    "skill-levels": "Beginner",
+    "files": [{"file": "step-1.md", "label": "Overview", "duration": "10:00",
+               "xy-guid": "2efacb5f-6bd9-4891-a156-b3e712f8bebf"}],
+}
+
+@pytest.fixture
+def validator():
+    return SidecarValidator(SCHEMA)
+
+
+@pytest.fixture
+def schema_path(tmp_path):
+    path = tmp_path / "schema.json"
+    path.write_text(json.dumps(SCHEMA))
+    return path
+
+
+def invalid_copy(**changes):
+    data = json.loads(json.dumps(VALID))
+    data.update(changes)
+    return data
+
+
+class TestValidate:
+    """Tests for structured errors."""
+
+    def test_valid(self, validator):
+        assert validator.validate(VALID) == []
+
+    def test_missing_required(self, validator):
+        data = invalid_copy()
+        del data["lesson-guid"]
+        errors = validator.validate(data)
+        assert [(e.pointer, e.keyword) for e in errors] == [("", "required")]
+        assert "lesson-guid" in errors[0].message
+
+    def test_pointer_into_files(self, validator):
+        data = invalid_copy()
+        data["files"][0]["duration"] = "10m"
+        data["files"][0]["xy-guid"] = "TODO"
+        errors = validator.validate(data)
+        assert [(e.pointer, e.keyword) for e in errors] == [
+            ("/files/0/duration", "pattern"),
+            ("/files/0/xy-guid", "pattern"),
+        ]
+
+    def test_enum_const_format(self, validator):
+        errors = validator.validate(invalid_copy(active=False, date="18/02/2026", **{"skill-levels": "Pro"}))
+        keywords = {e.pointer: e.keyword for e in errors}
+        assert keywords["/active"] == "const"
+        assert keywords["/skill-levels"] == "enum"
+
+    def test_additional_properties(self, validator):
+        data = invalid_copy()
+        data["files"][0]["extra"] = 1
+        errors = validator.validate(data)
+        assert [(e.pointer, e.keyword) for e in errors] == [("/files/0", "additionalProperties")]
+
+    def test_type_errors(self, validator):
+        errors = validator.validate(invalid_copy(files="step-1.md", id=5))
+        assert {(e.pointer, e.keyword) for e in errors} == {("/files", "type"), ("/id", "type")}
+
+
+class TestSchema:
+    """Tests for schema loading and pointers."""
+
+    def test_invalid_schema(self):
+        with pytest.raises(ValueError):
+            SidecarValidator({"type": "no-such-type"})
+
+    def test_pointer_escaping(self):
+        assert json_pointer(["a/b", "m~n", 0]) == "/a~1b/m~0n/0"
+
+
+class TestCachedValidator:
+    """Tests for compile-once behaviour and batch validation."""
+
+    def test_compiled_once(self, schema_path):
+        assert get_validator(schema_path) is get_validator(schema_path)
+
+    def test_recompiled_when_schema_changes(self, schema_path):
+        first = get_validator(schema_path)
+        schema_path.write_text(json.dumps(dict(SCHEMA, required=["id"])))
+        assert get_validator(schema_path) is not first
+
+    def test_validate_corpus(self, tmp_path, schema_path):
+        for name, data in [("tc-good", VALID), ("tc-bad", invalid_copy(id="Bad Id"))]:
+            (tmp_path / name).mkdir()
+            (tmp_path / name / "sidecar.json").write_text(json.dumps(data))
+        (tmp_path / "tc-broken").mkdir()
+        (tmp_path / "tc-broken" / "sidecar.json").write_text("{")
+
+        results = validate_corpus(find_sidecars([tmp_path]), get_validator(schema_path))
+        by_name = {Path(path).parent.name: errors for path, errors in results.items()}
+
+        assert by_name["tc-good"] == []
+        assert [e["pointer"] for e in by_name["tc-bad"]] == ["/id"]
+        assert [e["keyword"] for e in by_name["tc-broken"]] == ["load"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Tests for validate_tutorial.py batch mode.
+
+These tests build small tutorial folders in a temp directory and check the
+path expansion, per-tutorial report entries and the aggregated report. The
+content/schema stages report "not found" warnings when their scripts are
+absent, which is expected outside the tutorial-testing repo.
+"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add tools directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent / 'tools'))
+
+import validate_tutorial
+from validate_tutorial import (
+    expand_tutorial_paths,
+    init_worker,
+    run_batch,
+    validate_one,
+    STAGES,
+)
+
+
+def make_tutorial(root: Path, name: str, ia_guid: str = "17a101eb-70b0-444a-9852-0667563ecc52") -> Path:
+    """Create a minimal, structurally valid tutorial folder."""
+    folder = root / name
+    (folder / "images").mkdir(parents=True)
+    files = []
+    for i, guid in enumerate([
+        "2efacb5f-6bd9-4891-a156-b3e712f8bebf",
+        "f75ef5cd-4d2c-4bfe-a3b7-0be261be70cc",
+        "71d24778-08e0-4913-8911-e37a38d47487",
+    ], 1):
+        (folder / f"step-{i}.md").write_text(f"# Step {i}\n\nSome content.\n")
+        files.append({"file": f"step-{i}.md", "duration": "1:00", "xy-guid": guid})
+    sidecar = {
+        "id": name,
+        "duration": "3m00s",
+        "ia-guid": ia_guid,
+        "lesson-guid": "873fa67a-2cea-451d-a2d5-459798b68bb1",
+        "files": files,
+    }
+    (folder / "sidecar.json").write_text(json.dumps(sidecar, indent=2))
+    return folder
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Repo root with two tutorials and one non-tutorial folder."""
+    make_tutorial(tmp_path, "tc-alpha")
+    make_tutorial(tmp_path, "tc-beta")
+    (tmp_path / "tools").mkdir()
+    return tmp_path
+
+
+class TestExpandTutorialPaths:
+    """Tests for CLI path expansion."""
+
+    def test_glob_expands_to_folders(self, corpus):
+        paths = expand_tutorial_paths([str(corpus / "tc-*")])
+        assert [p.name for p in paths] == ["tc-alpha", "tc-beta"]
+
+    def test_repo_root_expands_to_tutorials(self, corpus):
+        paths = expand_tutorial_paths([corpus])
+        assert [p.name for p in paths] == ["tc-alpha", "tc-beta"]
+
+    def test_duplicates_removed(self, corpus):
+        paths = expand_tutorial_paths([corpus / "tc-alpha", str(corpus / "tc-a*")])
+        assert len(paths) == 1
+
+    def test_missing_path_kept_for_error_reporting(self, corpus):
+        paths = expand_tutorial_paths([corpus / "tc-missing"])
+        assert paths == [corpus / "tc-missing"]
+
+
+class TestValidateOne:
+    """Tests for single-tutorial report entries."""
+
+    def test_structure_failure_skips_later_stages(self, tmp_path):
+        folder = tmp_path / "tc-broken"
+        folder.mkdir()
+        entry = validate_one(folder)
+
+        assert not entry['passed']
+        assert entry['stages']['struct']['status'] == 'failed'
+        for _, label, _, _ in STAGES[1:]:
+            assert entry['stages'][label]['status'] == 'skipped'
+
+    def test_not_a_directory(self, tmp_path):
+        entry = validate_one(tmp_path / "tc-nowhere")
+        assert not entry['passed']
+        assert entry['errors'] == 1
+
+
+class TestRunBatch:
+    """Tests for the aggregated batch report."""
+
+    def test_report_counts(self, corpus):
+        report = run_batch(expand_tutorial_paths([corpus]), jobs=1)
+
+        assert report['total'] == 2
+        assert report['passed'] + report['failed'] == 2
+        assert [e['tutorial'] for e in report['tutorials']] == ["tc-alpha", "tc-beta"]
+        assert report['stages'] == [label for _, label, _, _ in STAGES]
+        json.dumps(report)  # Must be serializable
+
+    def test_cache_loaded_once_and_shared(self, corpus, monkeypatch):
+        """Both tutorials reuse ia-guid from the cache and are flagged."""
+        cache = ["17a101eb-70b0-444a-9852-0667563ecc52"]
+        (corpus / "tools" / "guid_cache.json").write_text(json.dumps(cache))
+
+        import guid_generator
+        calls = []
+        original = guid_generator.open_guid_cache
+
+        def counting_open(path):
+            calls.append(path)
+            return original(path)
+
+        monkeypatch.setattr(guid_generator, 'open_guid_cache', counting_open)
+        monkeypatch.setattr(validate_tutorial, 'init_worker',
+                            lambda tools_dir=None: init_worker(corpus / "tools"))
+
+        report = run_batch(expand_tutorial_paths([corpus]), jobs=1)
+
+        # The index is created from guid_cache.json
+        assert calls == [corpus / "tools" / "guid_cache.db"]
+        for entry in report['tutorials']:
+            assert entry['stages']['guids']['status'] == 'failed'
+            assert not entry['passed']
+
+    def test_ai_fixes_skipped_in_batch_only(self, corpus, monkeypatch):
+        import clean_markdown
+        calls = []
+        original = clean_markdown.validate_folder
+
+        def spy(folder, **kwargs):
+            calls.append(kwargs['skip_ai'])
+            return original(folder, auto_fix=False)
+
+        monkeypatch.setattr(clean_markdown, 'validate_folder', spy)
+        run_batch(expand_tutorial_paths([corpus]), fix=True, jobs=1)
+        assert calls == [True, True]
+
+        calls.clear()
+        monkeypatch.setattr(sys, 'argv', ['validate_tutorial.py', str(corpus / "tc-alpha"), '--fix', '--quick'])
+        with pytest.raises(SystemExit):
+            validate_tutorial.main()
+        assert calls == [False]
+
+    def test_parallel_matches_serial(self, corpus):
+        paths = expand_tutorial_paths([corpus])
+        serial = run_batch(paths, jobs=1)
+        parallel = run_batch(paths, jobs=2)
+
+        assert serial['tutorials'] == parallel['tutorials']
+
+
+class TestValidateContent:
+    """Tests for the link check in the content stage."""
+
+    def test_locked_store_falls_back_to_uncached_checks(self, tmp_path, monkeypatch):
+        import link_checker
+        folder = make_tutorial(tmp_path, "tc-alpha")
+        (folder / "step-1.md").write_text("# Step 1\n\nSee [docs](https://example.com/gone).\n")
+
+        class LockedStore:
+            def get(self, url):
+                raise sqlite3.OperationalError("database is locked")
+
+            def close(self):
+                pass
+
+        monkeypatch.setattr(validate_tutorial, 'open_link_cache', lambda tools_dir: LockedStore())
+        monkeypatch.setattr(link_checker.LinkChecker, '_request', lambda self, method, url: (404, ''))
+        errors, warnings = validate_tutorial.validate_content(folder)
+
+        assert errors == ["step-1.md:3 - Broken URL: https://example.com/gone (HTTP 404)"]
+        assert any("database is locked" in w for w in warnings)
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -12,12 +12,17 @@ Usage:
     # With auto-fix (markdown + GUIDs)
     python tools/validate_tutorial.py tc-my-tutorial/ --fix
 
-    # Quick mode (skip URL checking)
+    # Quick mode (skip URL checking; links are otherwise checked
+    # concurrently and cached in tools/link_cache.json)
     python tools/validate_tutorial.py tc-my-tutorial/ --quick
 
     # Auto-detect tutorial folder (run from within tc-* folder)
     python tools/validate_tutorial.py
 
+    # Batch mode: several folders or a glob, validated in parallel
+    python tools/validate_tutorial.py tc-one/ tc-two/ 'tc-aci-*'
+    python tools/validate_tutorial.py 'tc-*' --jobs 8 --json-report report.json
+
 Exit codes:
     0 - All validations passed
     1 - Validation failures found
@@ -25,13 +30,28 @@ Exit codes:
 """
 
 import argparse
+import glob
 import json
 import os
+import sqlite3
 import subprocess
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Optional
 
+try:
+    import link_checker
+    HAS_LINK_CHECKER = True
+except ImportError:
+    HAS_LINK_CHECKER = False
+
+try:
+    import sidecar_schema
+    HAS_SIDECAR_SCHEMA = True
+except ImportError:
+    HAS_SIDECAR_SCHEMA = False
+
 
 class Colors:
     """ANSI color codes for terminal output."""
@@ -89,20 +109,109 @@ def print_info(text: str):
     print(f"  {colorize('→', Colors.CYAN)} {text}")
 
 
+# Shared state for batch workers, loaded once per process by init_worker()
+_WORKER_STATE: dict = {}
+
+
+def init_worker(tools_dir: Optional[Path] = None, skip_ai: bool = True):
+    """
+    Load shared validation state once per batch worker process.
+
+    Imports guid_generator (opening the GUID index or cache) and clean_markdown (whose
+    rule patterns compile at import) so each tutorial is checked in-process
+    instead of re-spawning the scripts and reloading the cache every time.
+    Missing tools are skipped; those stages fall back to the subprocess path.
+
+    Batch workers skip AI markdown fixes; a single-tutorial run passes
+    skip_ai=False to keep them, as the clean_markdown.py subprocess did.
+    """
+    tools_dir = Path(tools_dir or Path(__file__).parent)
+    if str(tools_dir) not in sys.path:
+        sys.path.insert(0, str(tools_dir))
+
+    _WORKER_STATE.clear()
+    _WORKER_STATE['skip_ai'] = skip_ai
+
+    try:
+        import guid_generator
+        _WORKER_STATE['guid_generator'] = guid_generator
+        _WORKER_STATE['known_guids'] = guid_generator.open_guid_cache(find_guid_cache(tools_dir))
+    except ImportError:
+        pass
+
+    try:
+        import clean_markdown
+        _WORKER_STATE['clean_markdown'] = clean_markdown
+    except ImportError:
+        pass
+
+
+def find_guid_cache(tools_dir: Path) -> Path:
+    """
+    Return the GUID cache to check against: the SQLite index, created from
+    guid_cache.json on first open so --fix reserves its GUIDs, or the
+    (missing) guid_cache.json when tools_dir has neither file.
+    """
+    index_path = tools_dir / "guid_cache.db"
+    json_path = tools_dir / "guid_cache.json"
+    if index_path.exists() or json_path.exists():
+        return index_path
+    return json_path
+
+
 def find_tutorial_folder() -> Optional[Path]:
     """Auto-detect tutorial folder from current directory."""
+    folders = find_tutorial_folders()
+    if len(folders) == 1:
+        return folders[0]
+
+    return None
+
+
+def find_tutorial_folders() -> list:
+    """Auto-detect all tutorial folders from current directory."""
     cwd = Path.cwd()
 
     # Check if we're in a tc-* folder
     if cwd.name.startswith('tc-'):
-        return cwd
+        return [cwd]
 
     # Check if we're in the repo root with tc-* folders
-    tc_folders = list(cwd.glob('tc-*'))
-    if len(tc_folders) == 1:
-        return tc_folders[0]
+    return sorted(p for p in cwd.glob('tc-*') if p.is_dir())
+
+
+def expand_tutorial_paths(paths: list) -> list:
+    """
+    Expand CLI arguments into a list of tutorial folders.
+
+    Arguments containing glob characters are expanded (quoted globs work the
+    same on every shell); a repository root expands to its tc-* folders.
+    Duplicates are dropped while keeping the original order.
+    """
+    expanded = []
+    for raw in paths:
+        raw = str(raw)
+        if glob.has_magic(raw):
+            matches = sorted(Path(m) for m in glob.glob(raw))
+            expanded.extend(m for m in matches if m.is_dir())
+            continue
 
-    return None
+        path = Path(raw)
+        if path.is_dir() and not path.name.startswith('tc-'):
+            children = sorted(p for p in path.glob('tc-*') if p.is_dir())
+            if children:
+                expanded.extend(children)
+                continue
+        expanded.append(path)
+
+    seen = set()
+    unique = []
+    for path in expanded:
+        key = path.resolve()
+        if key not in seen:
+            seen.add(key)
+            unique.append(path)
+    return unique
 
 
 def validate_folder_structure(tutorial_path: Path) -> list:
@@ -134,6 +243,23 @@ def validate_folder_structure(tutorial_path: Path) -> list:
 def validate_schema(tutorial_path: Path) -> tuple:
     """Run schema validation on sidecar.json."""
     tools_dir = Path(__file__).parent
+    schema_path = tools_dir / "schema.json"
+
+    # In-process against the validator compiled once per process. A schema
+    # it can't compile falls through to schema_validation.py below.
+    validator = None
+    if HAS_SIDECAR_SCHEMA and schema_path.exists():
+        try:
+            validator = sidecar_schema.get_validator(schema_path)
+        except (ValueError, IOError):
+            validator = None
+    if validator is not None:
+        try:
+            errors = sidecar_schema.validate_sidecar(tutorial_path / "sidecar.json", validator)
+        except (ValueError, IOError) as e:
+            return [str(e)], []
+        return [str(e) for e in errors], []
+
     schema_script = tools_dir / "schema_validation.py"
 
     if not schema_script.exists():
@@ -162,16 +288,30 @@ def validate_schema(tutorial_path: Path) -> tuple:
 def validate_guids(tutorial_path: Path, fix: bool = False) -> tuple:
     """Check and optionally fix GUID issues."""
     tools_dir = Path(__file__).parent
+    sidecar_path = tutorial_path / "sidecar.json"
+
+    # Check in-process against the cache opened by init_worker()
+    guid_generator = _WORKER_STATE.get('guid_generator')
+    if guid_generator is not None:
+        try:
+            issues = guid_generator.check_guids(
+                sidecar_path, known_guids=_WORKER_STATE['known_guids']
+            )
+            if issues and fix:
+                guid_generator.fix_guids(sidecar_path, issues, _WORKER_STATE['known_guids'])
+        except (RuntimeError, IOError, ValueError) as e:
+            return [str(e)], []
+        return summarize_guid_issues([i.to_dict() for i in issues], fix)
+
     guid_script = tools_dir / "guid_generator.py"
 
     if not guid_script.exists():
         return [], ["guid_generator.py not found"]
 
-    sidecar_path = tutorial_path / "sidecar.json"
-    cache_path = tools_dir / "guid_cache.json"
+    cache_path = find_guid_cache(tools_dir)
 
     args = [sys.executable, str(guid_script), str(sidecar_path), "--json"]
-    if cache_path.exists():
+    if cache_path.exists() or cache_path.suffix == ".db":
         args.extend(["--cache", str(cache_path)])
     if fix:
         args.append("--fix")
@@ -180,38 +320,89 @@ def validate_guids(tutorial_path: Path, fix: bool = False) -> tuple:
 
     try:
         data = json.loads(result.stdout)
-        issues = data.get('issues', [])
-        errors = []
-        warnings = []
-
-        for issue in issues:
-            field = issue.get('field', '')
-            issue_type = issue.get('issue_type', '')
-            file_name = issue.get('file_name', '')
-            new_value = issue.get('new_value')
-
-            location = f"{file_name}/{field}" if file_name else field
-            msg = f"{location}: {issue_type.upper()}"
-
-            if fix and new_value:
-                warnings.append(f"{msg} -> Generated: {new_value[:8]}...")
-            else:
-                errors.append(msg)
-
-        return errors, warnings
+        return summarize_guid_issues(data.get('issues', []), fix)
     except json.JSONDecodeError:
         if result.returncode != 0:
             return [result.stdout.strip() or "GUID check failed"], []
         return [], []
 
 
+def summarize_guid_issues(issues: list, fix: bool = False) -> tuple:
+    """Turn guid_generator issue dicts into (errors, warnings) messages."""
+    errors = []
+    warnings = []
+
+    for issue in issues:
+        field = issue.get('field', '')
+        issue_type = issue.get('issue_type', '')
+        file_name = issue.get('file_name', '')
+        new_value = issue.get('new_value')
+
+        location = f"{file_name}/{field}" if file_name else field
+        msg = f"{location}: {issue_type.upper()}"
+
+        if fix and new_value:
+            warnings.append(f"{msg} -> Generated: {new_value[:8]}...")
+        else:
+            errors.append(msg)
+
+    return errors, warnings
+
+
 def validate_content(tutorial_path: Path, quick: bool = False) -> tuple:
-    """Run pytest validation checks."""
+    """Run pytest validation checks and the cached link check."""
     tools_dir = Path(__file__).parent
     pytest_script = tools_dir / "pytest_validation.py"
 
-    if not pytest_script.exists():
-        return [], ["pytest_validation.py not found"]
+    errors = []
+    warnings = []
+
+    if pytest_script.exists():
+        # The link checker replaces the slow sequential broken_links test
+        skip_links = quick or HAS_LINK_CHECKER
+        errors, warnings = run_pytest_validation(tutorial_path, pytest_script, skip_links)
+    else:
+        warnings.append("pytest_validation.py not found")
+
+    if not quick and HAS_LINK_CHECKER:
+        cache = None
+        try:
+            cache = open_link_cache(tools_dir)
+            broken = link_checker.check_folder_links(tutorial_path, cache=cache)
+        except sqlite3.OperationalError as e:
+            # Store locked by another writer past its timeout, or unreadable
+            warnings.append(f"Link store unavailable ({e}); checked links without it")
+            broken = link_checker.check_folder_links(tutorial_path, cache=None)
+        finally:
+            if hasattr(cache, 'close'):
+                cache.close()
+        for item in broken:
+            errors.append(f"{item['file']}:{item['line']} - {item['message']}")
+
+    return errors, warnings
+
+
+def open_link_cache(tools_dir: Path):
+    """
+    Open the link result cache for the content stage.
+
+    Uses the corpus link-status store (link_index.py) when it exists, so
+    URLs already checked by the nightly run are lookups; otherwise falls
+    back to the JSON cache.
+    """
+    store_path = tools_dir / "link_status.db"
+    if store_path.exists():
+        try:
+            import link_index
+            return link_index.LinkStore(store_path)
+        except ImportError:
+            pass
+    return link_checker.LinkCache(tools_dir / "link_cache.json")
+
+
+def run_pytest_validation(tutorial_path: Path, pytest_script: Path, skip_links: bool = False) -> tuple:
+    """Run pytest_validation.py for one tutorial and parse its output."""
+    tools_dir = pytest_script.parent
 
     # Set environment variables
     env = os.environ.copy()
@@ -222,7 +413,7 @@ def validate_content(tutorial_path: Path, quick: bool = False) -> tuple:
     # Build pytest args
     args = [sys.executable, "-m", "pytest", str(pytest_script), "-v", "--tb=no", "-q"]
 
-    if quick:
+    if skip_links:
         # Skip URL checking tests
         args.extend(["-k", "not broken_links"])
 
@@ -257,6 +448,14 @@ def validate_content(tutorial_path: Path, quick: bool = False) -> tuple:
 def validate_markdown(tutorial_path: Path, fix: bool = False) -> tuple:
     """Run markdown validation and optional cleanup."""
     tools_dir = Path(__file__).parent
+
+    # Batch workers reuse the rules compiled when clean_markdown was imported
+    clean_markdown = _WORKER_STATE.get('clean_markdown')
+    if clean_markdown is not None:
+        result = clean_markdown.validate_folder(str(tutorial_path), auto_fix=fix,
+                                                skip_ai=_WORKER_STATE.get('skip_ai', True))
+        return summarize_markdown_result(result, clean_markdown.Severity)
+
     clean_script = tools_dir / "clean_markdown.py"
 
     if not clean_script.exists():
@@ -312,6 +511,49 @@ def validate_markdown(tutorial_path: Path, fix: bool = False) -> tuple:
     return errors, warnings
 
 
+def summarize_markdown_result(result, severity) -> tuple:
+    """Turn a clean_markdown ValidationResult into (errors, warnings) messages."""
+    errors = []
+    warnings = []
+
+    for issue in result.issues:
+        file_name = os.path.basename(issue.file_path)
+        msg = f"{file_name}:{issue.line_number} - {issue.rule_id}"
+        if issue.fixed:
+            warnings.append(f"{msg} (auto-fixed)")
+        elif issue.severity == severity.BLOCKING:
+            errors.append(msg)
+        else:
+            warnings.append(msg)
+
+    return errors, warnings
+
+
+# Validation stages in run order: (title, short label, success message, fix hint)
+STAGES = [
+    ("Folder Structure", "struct", "Folder structure valid", None),
+    ("Schema Validation", "schema", "sidecar.json is valid", None),
+    ("GUID Check", "guids", "All GUIDs are valid and unique",
+     "Run with --fix to auto-generate new GUIDs"),
+    ("Content Validation", "content", "Content validation passed", None),
+    ("Markdown Quality", "markdown", "Markdown quality check passed",
+     "Run with --fix to auto-fix markdown issues"),
+]
+
+
+def run_stage(index: int, tutorial_path: Path, fix: bool = False, quick: bool = False) -> tuple:
+    """Run one validation stage (index into STAGES) and return (errors, warnings)."""
+    if index == 0:
+        return validate_folder_structure(tutorial_path), []
+    if index == 1:
+        return validate_schema(tutorial_path)
+    if index == 2:
+        return validate_guids(tutorial_path, fix=fix)
+    if index == 3:
+        return validate_content(tutorial_path, quick=quick)
+    return validate_markdown(tutorial_path, fix=fix)
+
+
 def run_validation(tutorial_path: Path, fix: bool = False, quick: bool = False) -> bool:
     """Run all validations and return True if passed."""
     print(f"\n{colorize('='*60, Colors.BOLD)}")
@@ -322,78 +564,24 @@ def run_validation(tutorial_path: Path, fix: bool = False, quick: bool = False)
     total_errors = 0
     total_warnings = 0
 
-    # Step 1: Folder Structure
-    print_header("[1/5] Folder Structure")
-    errors = validate_folder_structure(tutorial_path)
-    if errors:
-        for err in errors:
-            print_error(err)
-        all_passed = False
-        total_errors += len(errors)
-        print(f"\n{colorize('Stopping: Fix folder structure issues first.', Colors.RED)}")
-        return False
-    else:
-        print_success("Folder structure valid")
-
-    # Step 2: Schema Validation
-    print_header("[2/5] Schema Validation")
-    errors, warnings = validate_schema(tutorial_path)
-    if errors:
-        for err in errors:
-            print_error(err)
-        all_passed = False
-        total_errors += len(errors)
-    else:
-        print_success("sidecar.json is valid")
-    for warn in warnings:
-        print_warning(warn)
-        total_warnings += 1
-
-    # Step 3: GUID Check
-    print_header("[3/5] GUID Check")
-    errors, warnings = validate_guids(tutorial_path, fix=fix)
-    if errors:
-        for err in errors:
-            print_error(err)
-        all_passed = False
-        total_errors += len(errors)
-        if not fix:
-            print_info("Run with --fix to auto-generate new GUIDs")
-    else:
-        print_success("All GUIDs are valid and unique")
-    for warn in warnings:
-        print_warning(warn)
-        total_warnings += 1
-
-    # Step 4: Content Validation
-    print_header("[4/5] Content Validation")
-    errors, warnings = validate_content(tutorial_path, quick=quick)
-    if errors:
-        for err in errors:
-            print_error(err)
-        all_passed = False
-        total_errors += len(errors)
-    else:
-        print_success("Content validation passed")
-    for warn in warnings:
-        print_warning(warn)
-        total_warnings += 1
-
-    # Step 5: Markdown Quality
-    print_header("[5/5] Markdown Quality")
-    errors, warnings = validate_markdown(tutorial_path, fix=fix)
-    if errors:
-        for err in errors:
-            print_error(err)
-        all_passed = False
-        total_errors += len(errors)
-        if not fix:
-            print_info("Run with --fix to auto-fix markdown issues")
-    else:
-        print_success("Markdown quality check passed")
-    for warn in warnings:
-        print_warning(warn)
-        total_warnings += 1
+    for index, (title, _, success_msg, fix_hint) in enumerate(STAGES):
+        print_header(f"[{index + 1}/{len(STAGES)}] {title}")
+        errors, warnings = run_stage(index, tutorial_path, fix=fix, quick=quick)
+        if errors:
+            for err in errors:
+                print_error(err)
+            all_passed = False
+            total_errors += len(errors)
+            if index == 0:
+                print(f"\n{colorize('Stopping: Fix folder structure issues first.', Colors.RED)}")
+                return False
+            if fix_hint and not fix:
+                print_info(fix_hint)
+        else:
+            print_success(success_msg)
+        for warn in warnings:
+            print_warning(warn)
+            total_warnings += 1
 
     # Summary
     print(f"\n{colorize('='*60, Colors.BOLD)}")
@@ -414,6 +602,126 @@ def run_validation(tutorial_path: Path, fix: bool = False, quick: bool = False)
     return all_passed
 
 
+# =============================================================================
+# Batch Mode
+# =============================================================================
+
+def validate_one(tutorial_path: Path, fix: bool = False, quick: bool = False) -> dict:
+    """Run all stages for one tutorial without printing; return a report entry."""
+    entry = {
+        'tutorial': tutorial_path.name,
+        'path': str(tutorial_path),
+        'passed': True,
+        'errors': 0,
+        'warnings': 0,
+        'stages': {},
+    }
+
+    if not tutorial_path.is_dir():
+        entry['passed'] = False
+        entry['errors'] = 1
+        entry['stages']['struct'] = {
+            'status': 'failed',
+            'errors': [f"Path is not a directory: {tutorial_path}"],
+            'warnings': [],
+        }
+        return entry
+
+    for index, (_, label, _, _) in enumerate(STAGES):
+        try:
+            errors, warnings = run_stage(index, tutorial_path, fix=fix, quick=quick)
+        except Exception as e:
+            errors, warnings = [f"Stage crashed: {e}"], []
+
+        entry['stages'][label] = {
+            'status': 'failed' if errors else 'passed',
+            'errors': errors,
+            'warnings': warnings,
+        }
+        entry['errors'] += len(errors)
+        entry['warnings'] += len(warnings)
+
+        if errors:
+            entry['passed'] = False
+            if index == 0:
+                # Later stages assume the standard folder layout
+                for _, skipped, _, _ in STAGES[1:]:
+                    entry['stages'][skipped] = {'status': 'skipped', 'errors': [], 'warnings': []}
+                break
+
+    return entry
+
+
+def _validate_one_star(args: tuple) -> dict:
+    """Unpack (path, fix, quick) for ProcessPoolExecutor.map."""
+    return validate_one(*args)
+
+
+def run_batch(tutorial_paths: list, fix: bool = False, quick: bool = False,
+              jobs: Optional[int] = None) -> dict:
+    """
+    Validate many tutorials through a worker pool.
+
+    Each worker calls init_worker() once, so the GUID cache and markdown
+    rules are loaded per worker rather than per tutorial. Results keep the
+    input order. With jobs=1 everything runs in the current process.
+
+    Returns the aggregated report dictionary.
+    """
+    jobs = jobs or os.cpu_count() or 1
+    work = [(Path(p), fix, quick) for p in tutorial_paths]
+
+    if jobs == 1 or len(work) == 1:
+        init_worker()
+        entries = [_validate_one_star(item) for item in work]
+    else:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(work)), initializer=init_worker) as pool:
+            entries = list(pool.map(_validate_one_star, work))
+
+    passed = sum(1 for e in entries if e['passed'])
+    return {
+        'total': len(entries),
+        'passed': passed,
+        'failed': len(entries) - passed,
+        'fix': fix,
+        'quick': quick,
+        'stages': [label for _, label, _, _ in STAGES],
+        'tutorials': entries,
+    }
+
+
+def print_batch_matrix(report: dict):
+    """Print a compact pass/fail matrix, one row per tutorial."""
+    symbols = {
+        'passed': colorize('✓', Colors.GREEN),
+        'failed': colorize('✗', Colors.RED),
+        'skipped': colorize('-', Colors.DIM),
+    }
+    labels = report['stages']
+    name_width = max([len('Tutorial')] + [len(e['tutorial']) for e in report['tutorials']])
+    widths = [max(len(label), 1) for label in labels]
+
+    header = '  '.join([f"{'Tutorial':<{name_width}}"] + [f"{l:^{w}}" for l, w in zip(labels, widths)] + ['result'])
+    print(f"\n{colorize(header, Colors.BOLD)}")
+
+    for entry in report['tutorials']:
+        cells = []
+        for label, width in zip(labels, widths):
+            status = entry['stages'].get(label, {}).get('status', 'skipped')
+            # Pad around the raw symbol so ANSI codes don't skew alignment
+            left = (width - 1) // 2
+            cells.append(' ' * left + symbols[status] + ' ' * (width - 1 - left))
+        if entry['passed']:
+            result = colorize('PASS', Colors.GREEN)
+        else:
+            result = colorize(f"FAIL ({entry['errors']})", Colors.RED)
+        print('  '.join([f"{entry['tutorial']:<{name_width}}"] + cells + [result]))
+
+    summary = f"{report['passed']}/{report['total']} passed"
+    color = Colors.GREEN if report['failed'] == 0 else Colors.RED
+    print(f"\n{colorize(summary, color)}\n")
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Local validation tool for tutorial folders",
@@ -421,10 +729,9 @@ def main():
         epilog=__doc__
     )
     parser.add_argument(
-        "path",
-        type=Path,
-        nargs="?",
-        help="Path to tutorial folder (auto-detected if not provided)"
+        "paths",
+        nargs="*",
+        help="Tutorial folder(s), repo root or glob (auto-detected if not provided)"
     )
     parser.add_argument(
         "--fix",
@@ -441,6 +748,16 @@ def main():
         action="store_true",
         help="Disable colored output"
     )
+    parser.add_argument(
+        "--jobs", "-j",
+        type=int,
+        help="Worker processes for batch mode (default: CPU count)"
+    )
+    parser.add_argument(
+        "--json-report",
+        type=Path,
+        help="Write the aggregated batch report to this JSON file ('-' for stdout)"
+    )
 
     args = parser.parse_args()
 
@@ -449,27 +766,50 @@ def main():
     if args.no_color:
         USE_COLORS = False
 
-    # Find tutorial path
-    tutorial_path = args.path
-    if not tutorial_path:
-        tutorial_path = find_tutorial_folder()
-        if not tutorial_path:
+    # Find tutorial paths
+    if args.paths:
+        tutorial_paths = expand_tutorial_paths(args.paths)
+        if not tutorial_paths:
+            print(f"Error: No tutorial folders match: {' '.join(args.paths)}", file=sys.stderr)
+            sys.exit(2)
+    else:
+        tutorial_paths = find_tutorial_folders()
+        if not tutorial_paths:
             print("Error: Could not auto-detect tutorial folder.", file=sys.stderr)
             print("Please specify the path: python tools/validate_tutorial.py tc-my-tutorial/", file=sys.stderr)
             sys.exit(2)
 
-    # Validate path exists
-    if not tutorial_path.exists():
-        print(f"Error: Path does not exist: {tutorial_path}", file=sys.stderr)
-        sys.exit(2)
+    if len(tutorial_paths) == 1 and not args.json_report:
+        tutorial_path = tutorial_paths[0]
 
-    if not tutorial_path.is_dir():
-        print(f"Error: Path is not a directory: {tutorial_path}", file=sys.stderr)
-        sys.exit(2)
+        # Validate path exists
+        if not tutorial_path.exists():
+            print(f"Error: Path does not exist: {tutorial_path}", file=sys.stderr)
+            sys.exit(2)
+
+        if not tutorial_path.is_dir():
+            print(f"Error: Path is not a directory: {tutorial_path}", file=sys.stderr)
+            sys.exit(2)
 
-    # Run validation
-    passed = run_validation(tutorial_path, fix=args.fix, quick=args.quick)
-    sys.exit(0 if passed else 1)
+        # Run validation in-process (GUID index/cache opened once, no subprocess)
+        init_worker(skip_ai=False)
+        passed = run_validation(tutorial_path, fix=args.fix, quick=args.quick)
+        sys.exit(0 if passed else 1)
+
+    # Batch mode
+    report = run_batch(tutorial_paths, fix=args.fix, quick=args.quick, jobs=args.jobs)
+
+    if str(args.json_report) == '-':
+        print(json.dumps(report, indent=2))
+    else:
+        print_batch_matrix(report)
+        if args.json_report:
+            with open(args.json_report, 'w') as f:
+                json.dump(report, f, indent=2)
+                f.write('\n')
+            print_info(f"JSON report written to {args.json_report}")
+
+    sys.exit(0 if report['failed'] == 0 else 1)
 
 
 if __name__ == "__main__":